@@ -4,6 +4,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from openclaw.memory.embeddings import EmbeddingService, LocalEmbeddingProvider
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,23 +23,20 @@ class MemorySearchTool:
         self.db_path.mkdir(parents=True, exist_ok=True)
         self._db = None
         self._table = None
-        self._encoder = None
+        # Model runs off the event loop; concurrent searches share forward passes
+        self._embeddings = EmbeddingService(LocalEmbeddingProvider("all-MiniLM-L6-v2"))
 
     def _init_db(self):
-        """Initialize database and encoder"""
+        """Initialize database"""
         if self._db is not None:
             return
 
         try:
             import lancedb
-            from sentence_transformers import SentenceTransformer
 
             # Connect to LanceDB
             self._db = lancedb.connect(str(self.db_path))
 
-            # Load embedding model
-            self._encoder = SentenceTransformer("all-MiniLM-L6-v2")
-
             # Check if table exists
             table_name = "memory"
             if table_name not in self._db.table_names():
@@ -101,7 +100,7 @@ class MemorySearchTool:
                 }
 
             # Generate query embedding
-            query_embedding = self._encoder.encode(query).tolist()
+            query_embedding = await self._embeddings.embed(query)
 
             # Search
             results = self._table.search(query_embedding).limit(limit)
@@ -154,7 +153,7 @@ class MemorySearchTool:
             self._init_db()
 
             # Generate embedding
-            vector = self._encoder.encode(text).tolist()
+            vector = (await self._embeddings.embed(text)).tolist()
 
             # Add to database
             import json
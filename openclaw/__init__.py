@@ -23,15 +23,45 @@ Example usage:
 __version__ = "0.6.0"
 __author__ = "OpenClaw Contributors"
 
-from .agents import AgentRuntime, Session, SessionManager
-from .config import Settings, get_settings
-from .config.unified import ConfigBuilder, OpenClawConfig
-
-# Refactored modules (v0.6.0+)
-from .events import Event, EventBus, EventType, get_event_bus
-from .gateway.api import MethodRegistry, get_method_registry
-from .monitoring import get_health_check, get_metrics, setup_logging
-from .runtime_env import RuntimeEnv, RuntimeEnvManager, get_runtime_env_manager
+from typing import TYPE_CHECKING
+
+from .utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .agents import AgentRuntime, Session, SessionManager
+    from .config import Settings, get_settings
+    from .config.unified import ConfigBuilder, OpenClawConfig
+    from .events import Event, EventBus, EventType, get_event_bus
+    from .gateway.api import MethodRegistry, get_method_registry
+    from .monitoring import get_health_check, get_metrics, setup_logging
+    from .runtime_env import RuntimeEnv, RuntimeEnvManager, get_runtime_env_manager
+
+# Exports are resolved on first access so that `import openclaw` (and the
+# CLI) doesn't load provider SDKs, the gateway or monitoring up front
+_EXPORTS = {
+    "AgentRuntime": ".agents",
+    "Session": ".agents",
+    "SessionManager": ".agents",
+    "Settings": ".config",
+    "get_settings": ".config",
+    "ConfigBuilder": ".config.unified",
+    "OpenClawConfig": ".config.unified",
+    # Refactored modules (v0.6.0+)
+    "Event": ".events",
+    "EventBus": ".events",
+    "EventType": ".events",
+    "get_event_bus": ".events",
+    "MethodRegistry": ".gateway.api",
+    "get_method_registry": ".gateway.api",
+    "get_health_check": ".monitoring",
+    "get_metrics": ".monitoring",
+    "setup_logging": ".monitoring",
+    "RuntimeEnv": ".runtime_env",
+    "RuntimeEnvManager": ".runtime_env",
+    "get_runtime_env_manager": ".runtime_env",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Version
@@ -2,21 +2,48 @@
 Agent module for ClawdBot
 """
 
-from .context import ContextManager, ContextWindow
-from .errors import (
-    AgentError,
-    AuthenticationError,
-    ContextOverflowError,
-    ErrorRecovery,
-    NetworkError,
-    RateLimitError,
-    TimeoutError,
-    classify_error,
-    format_error_message,
-    is_retryable_error,
-)
-from .runtime import AgentEvent, AgentRuntime
-from .session import Message, Session, SessionManager
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .context import ContextManager, ContextWindow
+    from .errors import (
+        AgentError,
+        AuthenticationError,
+        ContextOverflowError,
+        ErrorRecovery,
+        NetworkError,
+        RateLimitError,
+        TimeoutError,
+        classify_error,
+        format_error_message,
+        is_retryable_error,
+    )
+    from .runtime import AgentEvent, AgentRuntime
+    from .session import Message, Session, SessionManager
+
+_EXPORTS = {
+    "AgentRuntime": ".runtime",
+    "AgentEvent": ".runtime",
+    "Session": ".session",
+    "SessionManager": ".session",
+    "Message": ".session",
+    "ContextManager": ".context",
+    "ContextWindow": ".context",
+    "AgentError": ".errors",
+    "ContextOverflowError": ".errors",
+    "RateLimitError": ".errors",
+    "AuthenticationError": ".errors",
+    "NetworkError": ".errors",
+    "TimeoutError": ".errors",
+    "ErrorRecovery": ".errors",
+    "classify_error": ".errors",
+    "is_retryable_error": ".errors",
+    "format_error_message": ".errors",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Runtime
@@ -184,6 +184,11 @@ class AgentLoop:
         self.options = options or AgentOptions()
         self.state = AgentState()
         
+        # Tool call id -> execution started while the response was streaming
+        self._early_tool_tasks: dict[str, asyncio.Task[ToolResult | None]] = {}
+        # Last started tool execution; the next one waits for it
+        self._last_tool_task: asyncio.Task[ToolResult | None] | None = None
+        
         # Set session ID if provided
         if self.options.session_id:
             self.state.session_id = self.options.session_id
@@ -431,6 +436,30 @@ class AgentLoop:
                         content="".join(content_parts)
                     ))
                 
+                elif event_type == "tool_call_ready":
+                    # One call's arguments are complete: start executing it while
+                    # the model streams the rest of the response
+                    for tc in response.tool_calls or []:
+                        tool_call_id = tc.get("id")
+                        if not tool_call_id or any(c["id"] == tool_call_id for c in tool_calls):
+                            continue
+                        tool_call = {
+                            "id": tool_call_id,
+                            "name": tc.get("name", ""),
+                            "params": tc.get("arguments", {}),
+                        }
+                        await self.event_emitter.emit(ToolCallStartEvent(
+                            tool_call_id=tool_call_id,
+                            tool_name=tool_call["name"]
+                        ))
+                        await self.event_emitter.emit(ToolCallEndEvent(
+                            tool_call_id=tool_call_id,
+                            tool_name=tool_call["name"],
+                            params=tool_call["params"]
+                        ))
+                        tool_calls.append(tool_call)
+                        self._early_tool_tasks[tool_call_id] = self._start_tool_execution(tool_call)
+                
                 elif event_type == "tool_call":
                     # Handle tool calls from response
                     if response.tool_calls:
@@ -439,6 +468,10 @@ class AgentLoop:
                             tool_name = tc.get("name", "")
                             params = tc.get("arguments", {})
                             
+                            # Already reported (and started) by tool_call_ready
+                            if any(c["id"] == tool_call_id for c in tool_calls):
+                                continue
+                            
                             # Emit tool call events
                             await self.event_emitter.emit(ToolCallStartEvent(
                                 tool_call_id=tool_call_id,
@@ -462,6 +495,7 @@ class AgentLoop:
         
         except Exception as e:
             logger.error(f"Error streaming response: {e}", exc_info=True)
+            self._cancel_early_tool_tasks()
             raise
         
         # Build final message
@@ -487,65 +521,28 @@ class AgentLoop:
     
     async def execute_tool_calls(self, tool_calls: list[dict[str, Any]]) -> None:
         """
-        Execute tool calls sequentially with progress tracking
+        Execute tool calls in order with progress tracking
+        
+        Calls started early (on tool_call_ready) are awaited instead of
+        being run again; the rest are started here. Either way each tool
+        starts only after the previous one finished, and not at all once a
+        steering message is queued.
         
         Args:
             tool_calls: List of tool calls to execute
         """
         for tool_call in tool_calls:
-            # Check for steering before each tool
-            if self.state.steering_queue:
-                logger.info("Steering detected, stopping tool execution")
-                break
-            
             tool_call_id = tool_call["id"]
-            tool_name = tool_call["name"]
-            params = tool_call.get("params", {})
-            
-            # Create progress callback for this tool execution
-            async def progress_callback(current: int, total: int, message: str = ""):
-                """Progress callback for long-running tools"""
-                await self.event_emitter.emit(ToolExecutionUpdateEvent(
-                    tool_call_id=tool_call_id,
-                    tool_name=tool_name,
-                    progress=current / total if total > 0 else 0,
-                    message=message
-                ))
-            
-            # Emit tool execution start
-            await self.event_emitter.emit(ToolExecutionStartEvent(
-                tool_name=tool_name,
-                tool_call_id=tool_call_id,
-                params=params
-            ))
+            task = self._early_tool_tasks.pop(tool_call_id, None)
+            if task is None:
+                task = self._start_tool_execution(tool_call)
             
             try:
-                # Get tool
-                tool = self.tools.get(tool_name)
-                if not tool:
-                    error_msg = f"Tool '{tool_name}' not found"
-                    logger.error(error_msg)
-                    
-                    # Emit error
-                    await self.event_emitter.emit(ToolExecutionEndEvent(
-                        tool_call_id=tool_call_id,
-                        success=False,
-                        error=error_msg
-                    ))
-                    
-                    # Add error result to messages
-                    self.state.messages.append(AgentMessage(
-                        role="toolResult",
-                        tool_call_id=tool_call_id,
-                        content=f"Error: {error_msg}"
-                    ))
-                    continue
-                
-                # Execute tool with progress callback if supported
-                if hasattr(tool, 'execute_with_progress'):
-                    result: ToolResult = await tool.execute_with_progress(params, progress_callback)
-                else:
-                    result: ToolResult = await tool.execute(params)
+                result = await task
+                if result is None:
+                    logger.info("Steering detected, stopping tool execution")
+                    self._cancel_early_tool_tasks()
+                    break
                 
                 # Emit tool execution end
                 await self.event_emitter.emit(ToolExecutionEndEvent(
@@ -581,6 +578,80 @@ class AgentLoop:
                     content=f"Error: {error_msg}"
                 ))
     
+    def _start_tool_execution(self, tool_call: dict[str, Any]) -> asyncio.Task[ToolResult | None]:
+        """
+        Run a tool call in a task, after the previously started one
+        
+        Args:
+            tool_call: Tool call (id, name, params)
+            
+        Returns:
+            Task resolving to the tool's result, or None if steering
+            arrived before the tool could start
+        """
+        task = asyncio.create_task(self._run_tool_call(self._last_tool_task, tool_call))
+        self._last_tool_task = task
+        return task
+    
+    async def _run_tool_call(
+        self,
+        previous: asyncio.Task[ToolResult | None] | None,
+        tool_call: dict[str, Any],
+    ) -> ToolResult | None:
+        """Wait for the previous call, check steering, then run the tool"""
+        if previous is not None:
+            # Calls may depend on earlier ones: keep the response's order
+            await asyncio.wait([previous])
+        if self.state.steering_queue:
+            return None
+        
+        tool_call_id = tool_call["id"]
+        tool_name = tool_call["name"]
+        params = tool_call.get("params", {})
+        
+        # Create progress callback for this tool execution
+        async def progress_callback(current: int, total: int, message: str = ""):
+            """Progress callback for long-running tools"""
+            await self.event_emitter.emit(ToolExecutionUpdateEvent(
+                tool_call_id=tool_call_id,
+                tool_name=tool_name,
+                progress=current / total if total > 0 else 0,
+                message=message
+            ))
+        
+        # Emit tool execution start
+        await self.event_emitter.emit(ToolExecutionStartEvent(
+            tool_name=tool_name,
+            tool_call_id=tool_call_id,
+            params=params
+        ))
+        
+        return await self._run_tool(tool_name, params, progress_callback)
+    
+    async def _run_tool(
+        self,
+        tool_name: str,
+        params: dict[str, Any],
+        progress_callback: Callable[..., Awaitable[None]],
+    ) -> ToolResult:
+        """Execute one tool with progress callback if supported"""
+        tool = self.tools.get(tool_name)
+        if not tool:
+            error_msg = f"Tool '{tool_name}' not found"
+            logger.error(error_msg)
+            return ToolResult(success=False, content="", error=error_msg)
+        
+        if hasattr(tool, 'execute_with_progress'):
+            return await tool.execute_with_progress(params, progress_callback)
+        return await tool.execute(params)
+    
+    def _cancel_early_tool_tasks(self) -> None:
+        """Cancel tools started for calls that won't be collected"""
+        for task in self._early_tool_tasks.values():
+            task.cancel()
+        self._early_tool_tasks.clear()
+        self._last_tool_task = None
+    
     def steer(self, message: str) -> None:
         """
         Add steering message (interrupts current execution)
@@ -8,6 +8,7 @@ import logging
 from collections.abc import Callable
 from datetime import datetime, timezone, timedelta
 import sys
+from typing import TYPE_CHECKING
 
 # Python 3.9 compatibility
 if sys.version_info >= (3, 11):
@@ -17,6 +18,9 @@ else:
 
 from .profile import AuthProfile, ProfileStore
 
+if TYPE_CHECKING:
+    from ..failover.health import ProviderHealthRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +33,7 @@ class RotationManager:
     - Cooldown period after failures
     - Rate limit handling
     - Usage tracking
+    - Optional circuit breakers shared with model failover routing
     """
 
     DEFAULT_COOLDOWN_MINUTES = 5
@@ -39,6 +44,7 @@ class RotationManager:
         store: ProfileStore,
         cooldown_minutes: int = DEFAULT_COOLDOWN_MINUTES,
         max_failures: int = DEFAULT_MAX_FAILURES,
+        health: ProviderHealthRegistry | None = None,
     ):
         """
         Initialize rotation manager
@@ -47,10 +53,20 @@ class RotationManager:
             store: Profile store
             cooldown_minutes: Minutes to cool down after failure
             max_failures: Max failures before cooldown
+            health: Provider health registry fed by profile outcomes
         """
         self.store = store
         self.cooldown_minutes = cooldown_minutes
         self.max_failures = max_failures
+        self.health = health
+
+    def _health_key(self, profile: AuthProfile) -> str:
+        return self.health.profile_key(profile.provider, profile.id)
+
+    def _is_routable(self, profile: AuthProfile) -> bool:
+        if not profile.is_available():
+            return False
+        return self.health is None or self.health.is_available(self._health_key(profile))
 
     def get_next_profile(
         self,
@@ -79,8 +95,8 @@ class RotationManager:
         if filter_fn:
             profiles = [p for p in profiles if filter_fn(p)]
 
-        # Filter out unavailable profiles
-        available = [p for p in profiles if p.is_available()]
+        # Filter out unavailable profiles (cooldown or open circuit)
+        available = [p for p in profiles if self._is_routable(p)]
 
         if not available:
             logger.warning(f"All profiles for {provider} are in cooldown")
@@ -110,6 +126,8 @@ class RotationManager:
             profile.failure_count = 0
             profile.cooldown_until = None
             self.store.add_profile(profile)
+            if self.health is not None:
+                self.health.record_success(self._health_key(profile))
             logger.debug(f"Profile {profile_id} used successfully")
 
     def mark_failure(
@@ -128,6 +146,8 @@ class RotationManager:
             return
 
         profile.failure_count += 1
+        if self.health is not None:
+            self.health.record_failure(self._health_key(profile), reason)
 
         # Apply cooldown if too many failures or rate limit
         if profile.failure_count >= self.max_failures or is_rate_limit:
@@ -158,6 +178,8 @@ class RotationManager:
             profile.failure_count = 0
             profile.cooldown_until = None
             self.store.add_profile(profile)
+            if self.health is not None:
+                self.health.reset(self._health_key(profile))
             logger.info(f"Profile {profile_id} reset")
 
     def get_status(self, provider: str | None = None) -> dict:
@@ -172,8 +194,8 @@ class RotationManager:
         """
         profiles = self.store.list_profiles(provider)
 
-        available = [p for p in profiles if p.is_available()]
-        in_cooldown = [p for p in profiles if not p.is_available()]
+        available = [p for p in profiles if self._is_routable(p)]
+        in_cooldown = [p for p in profiles if not self._is_routable(p)]
 
         return {
             "total": len(profiles),
@@ -183,7 +205,7 @@ class RotationManager:
                 {
                     "id": p.id,
                     "provider": p.provider,
-                    "available": p.is_available(),
+                    "available": self._is_routable(p),
                     "failures": p.failure_count,
                     "cooldown_until": p.cooldown_until.isoformat() if p.cooldown_until else None,
                 }
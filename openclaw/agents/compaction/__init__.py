@@ -4,5 +4,6 @@ Advanced context compaction strategies
 
 from .analyzer import TokenAnalyzer
 from .strategy import CompactionManager, CompactionStrategy
+from .summarizing import SummaryCompactor
 
-__all__ = ["TokenAnalyzer", "CompactionManager", "CompactionStrategy"]
+__all__ = ["TokenAnalyzer", "CompactionManager", "CompactionStrategy", "SummaryCompactor"]
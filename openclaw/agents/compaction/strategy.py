@@ -17,7 +17,7 @@ class CompactionStrategy(str, Enum):
     KEEP_RECENT = "recent"  # Keep last N messages
     KEEP_IMPORTANT = "important"  # Keep system + high importance
     SLIDING_WINDOW = "sliding"  # Keep first + last messages
-    SUMMARIZE = "summarize"  # Summarize old messages (future)
+    SUMMARIZE = "summarize"  # Summarize old messages (see SummaryCompactor)
 
 
 class CompactionManager:
@@ -0,0 +1,260 @@
+"""
+Summarization-based context compaction
+
+Instead of dropping old messages, the span that falls out of the recent
+window is summarized (with a cheap model) and the prompt is built as
+``system messages + summary + recent tail``.
+
+- Summaries run in the background, so the user-facing turn never waits on
+  them; until one is ready the tail is trimmed to the token budget
+- Each summary is recorded as a ``CompactionEntry`` in the session's
+  ``SessionTree`` and reloaded from there, so it is computed once and reused
+  across turns and restarts
+- Later compactions fold the newly evicted span into the previous summary
+  (``MessageSummarizer.incremental_summarize``)
+
+The session transcript itself is never rewritten.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..session_tree import CompactionEntry, SessionTree
+from ..summarization import MessageSummarizer, SummarizationStrategy
+from .analyzer import TokenAnalyzer
+
+if TYPE_CHECKING:
+    from ..session import Message, Session
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PREFIX = "[Summary of earlier conversation]"
+
+
+def compaction_tree_path(session: Session) -> Path:
+    """Location of the compaction tree for a session"""
+    return Path(session.workspace_dir) / ".sessions" / f"{session.session_id}.tree.jsonl"
+
+
+@dataclass
+class _SummaryState:
+    """Compaction state for one session"""
+
+    tree: SessionTree
+    summary: str = ""
+    covered: int = 0  # session.messages[:covered] are represented by the summary
+    last_entry_id: str | None = None
+    task: asyncio.Task | None = None
+
+
+class SummaryCompactor:
+    """
+    Background summarization compactor
+
+    Example:
+        compactor = SummaryCompactor(MessageSummarizer(cheap_provider), analyzer)
+        messages = compactor.build_messages(session)   # summary + tail
+        compactor.schedule(session)                    # summarize evicted span
+    """
+
+    def __init__(
+        self,
+        summarizer: MessageSummarizer,
+        analyzer: TokenAnalyzer,
+        max_prompt_tokens: int = 32000,
+        keep_recent_tokens: int = 8000,
+        summary_max_tokens: int = 1000,
+        strategy: SummarizationStrategy = SummarizationStrategy.COMPRESS,
+    ):
+        """
+        Initialize compactor
+
+        Args:
+            summarizer: Summarizer (configured with a cheap model)
+            analyzer: Token analyzer
+            max_prompt_tokens: Hard budget for summary + tail
+            keep_recent_tokens: Tail kept verbatim after a compaction
+            summary_max_tokens: Maximum summary length
+            strategy: Summarization strategy
+        """
+        self.summarizer = summarizer
+        self.analyzer = analyzer
+        self.max_prompt_tokens = max_prompt_tokens
+        self.keep_recent_tokens = min(keep_recent_tokens, max_prompt_tokens)
+        self.summary_max_tokens = summary_max_tokens
+        self.strategy = strategy
+        self._states: dict[str, _SummaryState] = {}
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def _state(self, session: Session) -> _SummaryState:
+        state = self._states.get(session.session_id)
+        if state is None:
+            state = self._load_state(SessionTree(compaction_tree_path(session)))
+            self._states[session.session_id] = state
+
+        # Session was cleared or replaced underneath us
+        if state.covered > len(session.messages):
+            logger.info(f"Session {session.session_id} shrank, discarding summary")
+            state.summary = ""
+            state.covered = 0
+        return state
+
+    @staticmethod
+    def _load_state(tree: SessionTree) -> _SummaryState:
+        state = _SummaryState(tree=tree)
+        for entry in reversed(tree.entries):
+            if isinstance(entry, CompactionEntry):
+                state.summary = entry.summary
+                if entry.covered_messages is not None:
+                    state.covered = entry.covered_messages
+                else:
+                    # Written before covered_messages existed: removed_entries held indices
+                    state.covered = max(map(int, entry.removed_entries), default=-1) + 1
+                state.last_entry_id = entry.id
+                break
+        return state
+
+    def get_summary(self, session: Session) -> str:
+        """Current summary for a session (empty if none)"""
+        return self._state(session).summary
+
+    # ------------------------------------------------------------------
+    # Prompt building
+    # ------------------------------------------------------------------
+
+    def _tokens(self, messages: list[Message]) -> int:
+        return self.analyzer.estimate_messages_tokens([m.to_api_format() for m in messages])
+
+    def _tail_start(self, messages: list[Message], start: int, budget: int) -> int:
+        """
+        Earliest index >= start such that messages[index:] (non-system) fit
+        the budget, moved forward to a user message so tool results are never
+        separated from their tool calls
+        """
+        used = 0
+        index = len(messages)
+        while index > start:
+            message = messages[index - 1]
+            if message.role != "system":
+                cost = self._tokens([message])
+                if used + cost > budget:
+                    break
+                used += cost
+            index -= 1
+
+        boundary = index
+        while index < len(messages) and messages[index].role != "user":
+            index += 1
+        if index < len(messages):
+            return index
+
+        # No turn boundary inside the budget: keep the latest user turn whole
+        for index in range(boundary - 1, start - 1, -1):
+            if messages[index].role == "user":
+                return index
+        return boundary
+
+    def build_messages(self, session: Session) -> list[Message]:
+        """
+        Build the prompt: system messages, summary, then the unsummarized tail
+
+        Never waits for a pending summary. If the unsummarized tail exceeds
+        the budget, its oldest part is left out of this prompt until the
+        background summary covering it lands.
+        """
+        from ..session import Message
+
+        state = self._state(session)
+        messages = session.get_messages()
+
+        system_msgs = [m for m in messages if m.role == "system"]
+        result = list(system_msgs)
+        if state.summary:
+            result.append(Message(role="system", content=f"{SUMMARY_PREFIX}\n{state.summary}"))
+
+        budget = max(self.max_prompt_tokens - self._tokens(result), 0)
+        start = self._tail_start(messages, state.covered, budget)
+        if start > state.covered:
+            logger.debug(
+                f"Prompt tail trimmed for {session.session_id}: "
+                f"{start - state.covered} message(s) awaiting summary"
+            )
+        result.extend(m for m in messages[start:] if m.role != "system")
+        return result
+
+    # ------------------------------------------------------------------
+    # Background summarization
+    # ------------------------------------------------------------------
+
+    def needs_compaction(self, session: Session) -> bool:
+        """Whether the unsummarized span has grown past the prompt budget"""
+        state = self._state(session)
+        tail = [m for m in session.get_messages()[state.covered:] if m.role != "system"]
+        return self._tokens(tail) > self.max_prompt_tokens - self.summary_max_tokens
+
+    def schedule(self, session: Session) -> asyncio.Task | None:
+        """
+        Start summarizing the evicted span in the background if needed
+
+        At most one summarization runs per session; returns the running task.
+        """
+        state = self._state(session)
+        if state.task and not state.task.done():
+            return state.task
+        if not self.needs_compaction(session):
+            return None
+
+        state.task = asyncio.create_task(self._compact(session, state))
+        return state.task
+
+    async def wait(self, session: Session) -> None:
+        """Wait for a pending summarization (tests, shutdown)"""
+        state = self._states.get(session.session_id)
+        if state and state.task:
+            await asyncio.gather(state.task, return_exceptions=True)
+
+    async def _compact(self, session: Session, state: _SummaryState) -> None:
+        messages = list(session.get_messages())
+        start = state.covered
+        end = self._tail_start(messages, start, self.keep_recent_tokens)
+        span = [m for m in messages[start:end] if m.role != "system"]
+        if not span:
+            return
+
+        span_dicts: list[dict[str, Any]] = [m.to_api_format() for m in span]
+        tokens_before = self.analyzer.estimate_messages_tokens(span_dicts)
+        try:
+            summary = await self.summarizer.incremental_summarize(
+                state.summary, span_dicts, self.strategy, self.summary_max_tokens
+            )
+        except Exception as e:
+            logger.error(f"Background summarization failed for {session.session_id}: {e}")
+            return
+
+        summary = summary.removeprefix("[SUMMARY]\n").strip()
+        if not summary:
+            return
+
+        entry = state.tree.append_compaction(
+            summary=summary,
+            removed_entries=[m.id for m in span],
+            tokens_before=tokens_before,
+            tokens_after=self.analyzer.estimate_tokens(summary),
+            parent_id=state.last_entry_id,
+            covered_messages=end,
+        )
+        state.summary = summary
+        state.covered = end
+        state.last_entry_id = entry.id
+        logger.info(
+            f"Compacted {len(span)} message(s) of {session.session_id} "
+            f"({tokens_before} -> {entry.tokens_after} tokens)"
+        )
@@ -11,9 +11,6 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Literal
 
-from ..events import Event as BaseEvent
-from ..events import EventType as BaseEventType
-
 
 class AgentEventType(str, Enum):
     """Agent event types matching pi-mono"""
@@ -395,6 +392,3 @@ class AgentEventStream:
             raise StopAsyncIteration
         return event
 
-
-# Backwards compatibility with existing Event system
-AgentEvent.__bases__ = (BaseEvent,)
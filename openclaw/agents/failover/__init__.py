@@ -4,5 +4,24 @@ Model failover chain management
 
 from .chain import FallbackChain, FallbackManager
 from .errors import FailoverReason, FallbackError
+from .health import (
+    CircuitState,
+    HealthConfig,
+    ProviderHealth,
+    ProviderHealthRegistry,
+    get_provider_health_registry,
+)
+from .hedging import hedged_stream
 
-__all__ = ["FallbackChain", "FallbackManager", "FallbackError", "FailoverReason"]
+__all__ = [
+    "FallbackChain",
+    "FallbackManager",
+    "FallbackError",
+    "FailoverReason",
+    "CircuitState",
+    "HealthConfig",
+    "ProviderHealth",
+    "ProviderHealthRegistry",
+    "get_provider_health_registry",
+    "hedged_stream",
+]
@@ -6,10 +6,13 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .errors import FailoverReason, FallbackError
 
+if TYPE_CHECKING:
+    from .health import ProviderHealthRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,19 +48,72 @@ class FallbackManager:
     - Try models in sequence
     - Track which models have been tried
     - Classify errors for failover decisions
+    - Skip models whose circuit breaker is open (when a health registry is set)
     """
 
-    def __init__(self, chain: FallbackChain | None = None):
+    def __init__(
+        self,
+        chain: FallbackChain | None = None,
+        health: ProviderHealthRegistry | None = None,
+    ):
         """
         Initialize fallback manager
 
         Args:
             chain: Fallback chain configuration
+            health: Provider health registry used to skip unhealthy models
         """
         self.chain = chain
+        self.health = health
         self.current_index = 0
         self.attempts_per_model: dict[str, int] = {}
 
+    def _is_available(self, model: str) -> bool:
+        return self.health is None or self.health.is_available(model)
+
+    def select_model(self) -> str:
+        """
+        Pick the model for a new turn
+
+        Starts from the top of the chain and skips models whose circuit is
+        open, so a dead primary costs nothing instead of a full timeout. If
+        every circuit is open the primary is used anyway.
+
+        Returns:
+            Selected model
+        """
+        if not self.chain:
+            raise ValueError("No fallback chain configured")
+
+        models = self.chain.get_models()
+        self.current_index = 0
+        if self.health is not None:
+            for index, model in enumerate(models):
+                if self.health.allow_request(model):
+                    if index > 0:
+                        logger.info(f"Skipping unhealthy model(s), using {model}")
+                    self.current_index = index
+                    break
+            else:
+                logger.warning("All models in fallback chain are unhealthy, trying primary")
+        return models[self.current_index]
+
+    def peek_next_model(self) -> str | None:
+        """
+        Next healthy model after the current one, without advancing
+
+        Returns:
+            Model or None if no healthy model remains
+        """
+        if not self.chain:
+            return None
+
+        models = self.chain.get_models()
+        for model in models[self.current_index + 1 :]:
+            if self._is_available(model):
+                return model
+        return None
+
     def get_current_model(self) -> str:
         """Get current model"""
         if not self.chain:
@@ -84,6 +140,14 @@ class FallbackManager:
         models = self.chain.get_models()
         self.current_index += 1
 
+        # Skip models whose circuit is open
+        if self.health is not None:
+            while self.current_index < len(models) and not self.health.allow_request(
+                models[self.current_index]
+            ):
+                logger.info(f"Skipping model with open circuit: {models[self.current_index]}")
+                self.current_index += 1
+
         if self.current_index >= len(models):
             return None
 
@@ -171,7 +235,7 @@ class FallbackManager:
         if not self.chain:
             return {"configured": False}
 
-        return {
+        status = {
             "configured": True,
             "current_model": self.get_current_model(),
             "current_index": self.current_index,
@@ -179,3 +243,8 @@ class FallbackManager:
             "attempts_per_model": self.attempts_per_model.copy(),
             "chain": self.chain.get_models(),
         }
+        if self.health is not None:
+            status["health"] = {
+                model: self.health.get(model).to_dict() for model in self.chain.get_models()
+            }
+        return status
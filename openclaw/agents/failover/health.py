@@ -0,0 +1,257 @@
+"""
+Provider health tracking with circuit breakers
+
+Keeps a rolling window of latency and error samples per model (and per auth
+profile), and trips a circuit breaker when a target keeps failing. Routing
+code (FallbackManager, RotationManager) consults the registry so a dead
+primary is skipped up front instead of being rediscovered through a full
+timeout on every turn.
+
+Circuit states:
+- CLOSED: requests flow normally
+- OPEN: requests are skipped until the cooldown expires
+- HALF_OPEN: one probe request is let through; success closes the circuit,
+  failure re-opens it with a longer cooldown
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class HealthConfig:
+    """
+    Circuit breaker tuning
+
+    Attributes:
+        window_seconds: Rolling window for error-rate and latency stats
+        max_samples: Maximum samples kept per target
+        min_requests: Minimum samples in window before error rate can trip
+        error_rate_threshold: Error rate (0-1) that opens the circuit
+        consecutive_failures: Consecutive failures that open the circuit
+        cooldown_seconds: Initial open duration
+        max_cooldown_seconds: Cap for exponential cooldown growth
+        hedge_min_delay: Lower bound for hedging delay (seconds)
+        hedge_max_delay: Upper bound / default hedging delay (seconds)
+    """
+
+    window_seconds: float = 300.0
+    max_samples: int = 200
+    min_requests: int = 5
+    error_rate_threshold: float = 0.5
+    consecutive_failures: int = 3
+    cooldown_seconds: float = 30.0
+    max_cooldown_seconds: float = 600.0
+    hedge_min_delay: float = 0.5
+    hedge_max_delay: float = 10.0
+
+
+@dataclass
+class _Sample:
+    at: float
+    ok: bool
+    latency: float | None
+
+
+@dataclass
+class ProviderHealth:
+    """Health stats and circuit breaker for one model/profile"""
+
+    key: str
+    config: HealthConfig = field(default_factory=HealthConfig)
+    state: CircuitState = CircuitState.CLOSED
+    open_until: float = 0.0
+    trips: int = 0
+    consecutive_failures: int = 0
+    last_error: str | None = None
+    _samples: deque = field(default_factory=deque, repr=False)
+    _probe_in_flight: bool = field(default=False, repr=False)
+    _probe_started: float = field(default=0.0, repr=False)
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.config.window_seconds
+        while self._samples and (
+            self._samples[0].at < cutoff or len(self._samples) > self.config.max_samples
+        ):
+            self._samples.popleft()
+
+    def allow_request(self, now: float | None = None) -> bool:
+        """Whether a request may be sent (claims the half-open probe slot)"""
+        now = now if now is not None else time.monotonic()
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            if now < self.open_until:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        if self._probe_in_flight and not self._probe_expired(now):
+            return False
+        self._probe_in_flight = True
+        self._probe_started = now
+        return True
+
+    def _probe_expired(self, now: float) -> bool:
+        # A probe that never reported back (e.g. cancelled turn) must not
+        # keep the circuit half-open forever
+        return now - self._probe_started > self.config.cooldown_seconds
+
+    def is_available(self, now: float | None = None) -> bool:
+        """Non-mutating check used for ordering and status"""
+        now = now if now is not None else time.monotonic()
+        if self.state == CircuitState.OPEN:
+            return now >= self.open_until
+        if self.state == CircuitState.HALF_OPEN:
+            return not self._probe_in_flight or self._probe_expired(now)
+        return True
+
+    def record_success(self, latency: float | None = None, now: float | None = None) -> None:
+        now = now if now is not None else time.monotonic()
+        self._samples.append(_Sample(now, True, latency))
+        self._prune(now)
+        self.consecutive_failures = 0
+        if self.state != CircuitState.CLOSED:
+            logger.info(f"Circuit closed for {self.key}")
+        self.state = CircuitState.CLOSED
+        self.trips = 0
+        self._probe_in_flight = False
+
+    def record_failure(self, error: str | None = None, now: float | None = None) -> None:
+        now = now if now is not None else time.monotonic()
+        self._samples.append(_Sample(now, False, None))
+        self._prune(now)
+        self.consecutive_failures += 1
+        self.last_error = error
+
+        if self.state == CircuitState.HALF_OPEN or self._should_trip():
+            self._trip(now)
+
+    def _should_trip(self) -> bool:
+        if self.consecutive_failures >= self.config.consecutive_failures:
+            return True
+        total = len(self._samples)
+        return total >= self.config.min_requests and self.error_rate() >= self.config.error_rate_threshold
+
+    def _trip(self, now: float) -> None:
+        cooldown = min(
+            self.config.cooldown_seconds * (2 ** self.trips),
+            self.config.max_cooldown_seconds,
+        )
+        self.trips += 1
+        self.state = CircuitState.OPEN
+        self.open_until = now + cooldown
+        self._probe_in_flight = False
+        logger.warning(
+            f"Circuit opened for {self.key} for {cooldown:.0f}s "
+            f"(error rate {self.error_rate():.0%}, last error: {self.last_error})"
+        )
+
+    def error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        failures = sum(1 for s in self._samples if not s.ok)
+        return failures / len(self._samples)
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Latency percentile (0-100) over successful samples in the window"""
+        latencies = sorted(s.latency for s in self._samples if s.ok and s.latency is not None)
+        if not latencies:
+            return None
+        rank = max(0, math.ceil(percentile / 100 * len(latencies)) - 1)
+        return latencies[rank]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "state": self.state.value,
+            "available": self.is_available(),
+            "error_rate": round(self.error_rate(), 3),
+            "samples": len(self._samples),
+            "p50": self.latency_percentile(50),
+            "p95": self.latency_percentile(95),
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "last_error": self.last_error,
+        }
+
+
+class ProviderHealthRegistry:
+    """
+    Process-wide provider health registry
+
+    Keys are model strings ("anthropic/claude-opus") or, for auth profiles,
+    "profile:<provider>:<profile_id>".
+    """
+
+    def __init__(self, config: HealthConfig | None = None):
+        self.config = config or HealthConfig()
+        self._entries: dict[str, ProviderHealth] = {}
+
+    @staticmethod
+    def profile_key(provider: str, profile_id: str) -> str:
+        return f"profile:{provider}:{profile_id}"
+
+    def get(self, key: str) -> ProviderHealth:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = ProviderHealth(key=key, config=self.config)
+            self._entries[key] = entry
+        return entry
+
+    def allow_request(self, key: str) -> bool:
+        return self.get(key).allow_request()
+
+    def is_available(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is None or entry.is_available()
+
+    def record_success(self, key: str, latency: float | None = None) -> None:
+        self.get(key).record_success(latency)
+
+    def record_failure(self, key: str, error: str | None = None) -> None:
+        self.get(key).record_failure(error)
+
+    def hedge_delay(self, key: str) -> float:
+        """Delay before starting a hedged request: the target's p95 latency"""
+        p95 = self.get(key).latency_percentile(95)
+        if p95 is None:
+            return self.config.hedge_max_delay
+        return min(max(p95, self.config.hedge_min_delay), self.config.hedge_max_delay)
+
+    def reset(self, key: str | None = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def get_status(self) -> dict[str, Any]:
+        return {key: entry.to_dict() for key, entry in self._entries.items()}
+
+
+# Global registry instance
+_registry: ProviderHealthRegistry | None = None
+
+
+def get_provider_health_registry() -> ProviderHealthRegistry:
+    """Get global provider health registry"""
+    global _registry
+    if _registry is None:
+        _registry = ProviderHealthRegistry()
+    return _registry
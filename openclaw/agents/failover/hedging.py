@@ -0,0 +1,135 @@
+"""
+Hedged streaming requests
+
+Starts a primary stream and, if it has not produced its first item after
+``delay`` seconds, starts a backup stream in parallel. Whichever stream
+yields real output first wins; the other is cancelled. Used by the runtime
+to keep tail latency bounded while a provider is degraded but not yet
+failing outright.
+
+An error response does not count as output, so a primary that fails fast
+doesn't cancel a healthy hedge.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator, Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+StreamFactory = Callable[[], AsyncIterator[Any]]
+
+
+async def _first_item(stream: AsyncIterator[T]) -> T:
+    return await stream.__anext__()
+
+
+def _is_error_response(item: Any) -> bool:
+    """LLMResponse(type="error") and the like"""
+    return getattr(item, "type", None) == "error"
+
+
+async def hedged_stream(
+    candidates: list[tuple[str, StreamFactory]],
+    delay: float,
+    is_error: Callable[[Any], bool] = _is_error_response,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Yield ``(label, item)`` from the first candidate stream to produce output
+
+    Args:
+        candidates: ``(label, factory)`` pairs; the first is the primary, the
+            second (if any) is the hedge. Factories are only called when the
+            stream is actually started.
+        delay: Seconds to wait for the primary's first item before starting
+            the hedge
+        is_error: Whether a first item is an error (a failure, not output)
+
+    If the primary fails (raises or yields an error item) before producing
+    anything, the hedge is started immediately. If every started stream
+    fails before producing output, the last failure is raised or yielded.
+    """
+    if not candidates:
+        return
+
+    pending: dict[asyncio.Task, tuple[str, AsyncIterator[Any]]] = {}
+    queue = list(candidates)
+
+    def launch() -> None:
+        label, factory = queue.pop(0)
+        stream = factory()
+        task = asyncio.ensure_future(_first_item(stream))
+        pending[task] = (label, stream)
+
+    launch()
+    winner: tuple[str, AsyncIterator[Any], Any] | None = None
+    last_error: BaseException | None = None
+    # Last error item, yielded if every stream fails
+    last_error_item: tuple[str, Any] | None = None
+
+    try:
+        while pending and winner is None:
+            timeout = delay if queue else None
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                logger.info(f"Hedging: no first token after {delay:.2f}s, starting {queue[0][0]}")
+                launch()
+                continue
+
+            for task in done:
+                label, stream = pending.pop(task)
+                error = task.exception()
+                if error is None and not is_error(task.result()):
+                    if winner is None:
+                        winner = (label, stream, task.result())
+                    else:
+                        with contextlib.suppress(Exception):
+                            await stream.aclose()
+                    continue
+                if error is None:
+                    # Error response: keep waiting on the other streams
+                    item = task.result()
+                    logger.warning(
+                        f"Hedging: {label} failed before first token: {getattr(item, 'content', item)}"
+                    )
+                    last_error, last_error_item = None, (label, item)
+                    with contextlib.suppress(Exception):
+                        await stream.aclose()
+                else:
+                    if isinstance(error, StopAsyncIteration):
+                        error = RuntimeError(f"{label} stream ended without output")
+                    logger.warning(f"Hedging: {label} failed before first token: {error}")
+                    last_error, last_error_item = error, None
+                if queue and not pending:
+                    launch()
+    finally:
+        for task, (_label, stream) in pending.items():
+            task.cancel()
+            with contextlib.suppress(BaseException):
+                await task
+            with contextlib.suppress(Exception):
+                await stream.aclose()
+
+    if winner is None:
+        if last_error is not None:
+            raise last_error
+        if last_error_item is not None:
+            yield last_error_item
+        return
+
+    label, stream, first = winner
+    yield label, first
+    try:
+        async for item in stream:
+            yield label, item
+    finally:
+        with contextlib.suppress(Exception):
+            await stream.aclose()
@@ -7,6 +7,7 @@ Implements intelligent image loading that:
 - Deduplicates images across current prompt and history
 - Skips images already loaded in previous messages
 - Only scans user messages (not assistant messages)
+- Scans each history message once (HistoryImageIndex)
 """
 from __future__ import annotations
 
@@ -15,6 +16,7 @@ import logging
 import re
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +91,7 @@ def detect_image_references(text: str) -> list[DetectedImageRef]:
             re.IGNORECASE,
         )
         if path_match and path_match.group(1):
-            add_path_ref(path_match.group(1).trim())
+            add_path_ref(path_match.group(1).strip())
 
     # Pattern 2: [Image: source: /path/...] format from messaging systems
     image_source_pattern = (
@@ -116,20 +118,27 @@ def detect_image_references(text: str) -> list[DetectedImageRef]:
     return refs
 
 
-def message_has_image_content(msg: dict) -> bool:
+def message_has_image_content(msg: Any) -> bool:
     """
     Check if message already has image content
     
     Args:
-        msg: Message dictionary with optional 'images' field
+        msg: Message dictionary (or Message) with optional 'images' field
     
     Returns:
         True if message has images, False otherwise
     """
-    images = msg.get("images")
+    images = _message_field(msg, "images")
     return bool(images and len(images) > 0)
 
 
+def _message_field(msg: Any, name: str) -> Any:
+    """Read a field from a message dict or a Message object"""
+    if isinstance(msg, dict):
+        return msg.get(name)
+    return getattr(msg, name, None)
+
+
 def detect_images_from_history(messages: list[dict]) -> list[DetectedImageRef]:
     """
     Extract image references from conversation history
@@ -155,35 +164,93 @@ def detect_images_from_history(messages: list[dict]) -> list[DetectedImageRef]:
     seen = set()
 
     for i, msg in enumerate(messages):
-        # Only scan user messages
-        if msg.get("role") != "user":
-            continue
+        _collect_message_refs(i, msg, seen, all_refs)
 
-        # Skip if message already has image content (prevents reloading each turn)
-        if message_has_image_content(msg):
-            logger.debug(f"Skipping message {i}: already has image content")
-            continue
+    return all_refs
 
-        text = msg.get("content", "")
-        if not text:
-            continue
 
-        refs = detect_image_references(text)
-        for ref in refs:
-            key = ref.resolved.lower()
-            if key not in seen:
-                seen.add(key)
-                ref.message_index = i
-                all_refs.append(ref)
-                logger.debug(f"Detected image in history[{i}]: {ref.resolved}")
+def _collect_message_refs(
+    index: int, msg: Any, seen: set[str], all_refs: list[DetectedImageRef]
+) -> None:
+    """Append a history message's not yet seen image refs"""
+    # Only scan user messages
+    if _message_field(msg, "role") != "user":
+        return
 
-    return all_refs
+    # Skip if message already has image content (prevents reloading each turn)
+    if message_has_image_content(msg):
+        logger.debug(f"Skipping message {index}: already has image content")
+        return
+
+    text = _message_field(msg, "content")
+    if not text:
+        return
+
+    for ref in detect_image_references(text):
+        key = ref.resolved.lower()
+        if key not in seen:
+            seen.add(key)
+            ref.message_index = index
+            all_refs.append(ref)
+            logger.debug(f"Detected image in history[{index}]: {ref.resolved}")
+
+
+class HistoryImageIndex:
+    """
+    Incremental detect_images_from_history for a growing conversation
+
+    Remembers how far the history has been scanned and only scans messages
+    appended since. If earlier messages changed (compaction, truncation),
+    the history is scanned again from the start.
+
+    Example:
+        index = HistoryImageIndex()
+        refs = index.update(session.messages)  # scans everything
+        session.add_user_message("see ./chart.png")
+        refs = index.update(session.messages)  # scans one message
+    """
+
+    def __init__(self):
+        self._refs: list[DetectedImageRef] = []
+        self._seen: set[str] = set()
+        self._scanned = 0
+        self._last: tuple[Any, Any] | None = None
+
+    @staticmethod
+    def _fingerprint(msg: Any) -> tuple[Any, Any]:
+        return (_message_field(msg, "role"), _message_field(msg, "content"))
+
+    def update(self, messages: list[Any]) -> list[DetectedImageRef]:
+        """
+        Scan new messages
+
+        Args:
+            messages: Full history (message dicts or Message objects)
+
+        Returns:
+            Image references in the history, as detect_images_from_history
+        """
+        unchanged = (
+            self._scanned <= len(messages)
+            and (self._scanned == 0 or self._fingerprint(messages[self._scanned - 1]) == self._last)
+        )
+        if not unchanged:
+            logger.debug("History changed, rescanning for image references")
+            self._refs, self._seen, self._scanned = [], set(), 0
+
+        for i in range(self._scanned, len(messages)):
+            _collect_message_refs(i, messages[i], self._seen, self._refs)
+        if messages:
+            self._last = self._fingerprint(messages[-1])
+        self._scanned = len(messages)
+        return list(self._refs)
 
 
 def smart_load_images(
     current_prompt: str,
-    history_messages: list[dict] | None = None,
+    history_messages: list[Any] | None = None,
     existing_images: list[str] | None = None,
+    history_index: HistoryImageIndex | None = None,
 ) -> dict:
     """
     Smart image loading for agent context
@@ -196,8 +263,9 @@ def smart_load_images(
     
     Args:
         current_prompt: Current user prompt text
-        history_messages: Previous conversation messages
+        history_messages: Previous conversation messages (dicts or Message objects)
         existing_images: Images already attached to current message
+        history_index: Index kept across turns, so only new history is scanned
     
     Returns:
         Dictionary with:
@@ -224,7 +292,10 @@ def smart_load_images(
     logger.debug(f"Detected {len(prompt_refs)} image refs in current prompt")
 
     # Detect images from history (with message indices)
-    history_refs = detect_images_from_history(history_messages or [])
+    if history_index is not None:
+        history_refs = history_index.update(history_messages or [])
+    else:
+        history_refs = detect_images_from_history(history_messages or [])
     logger.debug(f"Detected {len(history_refs)} image refs in history")
 
     # Deduplicate: if image is in current prompt, don't also load from history
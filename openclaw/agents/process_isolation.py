@@ -2,224 +2,766 @@
 
 Manages isolated agent processes for better resource control.
 Provides real process isolation using multiprocessing.
+
+Isolated turns run in a pool of pre-forked warm workers: a forkserver
+preloaded with ``openclaw.agents``, the providers and the tool registry
+forks each worker, so a worker starts with everything already imported and
+keeps its provider clients warm across turns. Each worker runs ``AgentLoop``
+turns and streams agent events back over a pipe. Workers run under
+memory/CPU rlimits and are recycled after ``max_turns`` turns.
 """
 from __future__ import annotations
 
 import asyncio
+import importlib
+import json
 import logging
 import multiprocessing as mp
-from dataclasses import dataclass
+import pickle
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# How often a waiting turn checks that its worker is still alive
+_LIVENESS_INTERVAL = 1.0
+
+# Imported once by the forkserver, inherited by every worker
+DEFAULT_PRELOAD = [
+    "openclaw.agents.agent_loop",
+    "openclaw.agents.runtime",
+    "openclaw.agents.providers.anthropic_provider",
+    "openclaw.agents.providers.openai_provider",
+    "openclaw.agents.providers.gemini_provider",
+    "openclaw.agents.providers.bedrock_provider",
+    "openclaw.agents.providers.ollama_provider",
+    "openclaw.agents.tools.registry",
+    "openclaw.agents.process_isolation",
+]
+
 
 @dataclass
 class AgentProcessConfig:
     """Configuration for isolated agent process"""
-    
+
     session_key: str
     workspace_dir: Path
     model: str
     timeout_s: float = 300.0
     memory_limit_mb: int | None = None
-    cpu_limit: float | None = None
+    cpu_limit: float | None = None  # CPU seconds (RLIMIT_CPU)
+    api_key: str | None = None
+    base_url: str | None = None
+    tool_profile: str = "minimal"
+    provider_factory: str | None = None  # "module:callable" for custom providers
+
+
+# ----------------------------------------------------------------------
+# Pipe helpers (shared by parent and worker)
+# ----------------------------------------------------------------------
+
+
+async def _recv(conn: Any, timeout: float | None = None) -> Any:
+    """Receive one message from a Connection without blocking the loop"""
+    loop = asyncio.get_running_loop()
+    if not conn.poll():
+        readable = loop.create_future()
+        try:
+            loop.add_reader(conn.fileno(), lambda: readable.done() or readable.set_result(None))
+        except NotImplementedError:
+            # Proactor loops have no add_reader
+            return await asyncio.wait_for(loop.run_in_executor(None, conn.recv), timeout)
+        try:
+            await asyncio.wait_for(readable, timeout)
+        finally:
+            loop.remove_reader(conn.fileno())
+    return conn.recv()
+
+
+def _send(conn: Any, message: dict[str, Any]) -> None:
+    """Send a message, degrading unpicklable payload values to strings"""
+    try:
+        conn.send(message)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        conn.send(json.loads(json.dumps(message, default=str)))
+
+
+def _apply_limits(memory_limit_mb: int | None, cpu_limit_s: float | None) -> None:
+    """Lower this process's rlimits (Unix only; limits can only go down)"""
+    try:
+        import resource
+    except ImportError:
+        return
+
+    if memory_limit_mb:
+        limit = int(memory_limit_mb) * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+    if cpu_limit_s:
+        # RLIMIT_CPU counts lifetime CPU time, so budget from current usage
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        limit = int(usage.ru_utime + usage.ru_stime + cpu_limit_s) + 1
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+
+def _resolve_provider(request: dict[str, Any], providers: dict[tuple, Any]) -> Any:
+    """Get a cached provider for a turn request"""
+    model = request["model"]
+    key = (model, request.get("api_key"), request.get("base_url"), request.get("provider_factory"))
+    provider = providers.get(key)
+    if provider is not None:
+        return provider
+
+    provider_name, model_name = model.split("/", 1) if "/" in model else ("anthropic", model)
+    kwargs = {"model": model_name, "api_key": request.get("api_key"), "base_url": request.get("base_url")}
+
+    factory_path = request.get("provider_factory")
+    if factory_path:
+        module_name, _, attr = factory_path.partition(":")
+        provider = getattr(importlib.import_module(module_name), attr)(**kwargs)
+    else:
+        from .runtime import create_provider
+
+        provider = create_provider(provider_name, **kwargs)
+
+    providers[key] = provider
+    return provider
+
+
+def _resolve_tools(request: dict[str, Any]) -> list[Any]:
+    from .tools.registry import get_tool_registry
+
+    tools = get_tool_registry().get_tools_by_profile(request.get("tool_profile", "minimal"))
+    return [tool for tool in tools if tool is not None]
+
+
+async def _run_worker_turn(conn: Any, request: dict[str, Any], providers: dict[tuple, Any]) -> None:
+    """Run one AgentLoop turn and stream its events to the parent"""
+    from .agent_loop import AgentLoop, AgentMessage, AgentOptions
+    from .events import AgentEventType, EventEmitter
+
+    emitter = EventEmitter()
+
+    def forward(event: Any) -> None:
+        _send(conn, {"type": "event", "event": event.type.value, "payload": event.payload})
+
+    for event_type in AgentEventType:
+        emitter.on(event_type, forward)
+
+    loop_ = AgentLoop(
+        _resolve_provider(request, providers),
+        _resolve_tools(request),
+        event_emitter=emitter,
+        options=AgentOptions(session_id=request.get("session_key")),
+    )
+
+    messages: list[AgentMessage] = []
+    if request.get("system_prompt"):
+        messages.append(AgentMessage(role="system", content=request["system_prompt"]))
+    for item in request.get("history") or []:
+        messages.append(AgentMessage(
+            role=item["role"],
+            content=item.get("content"),
+            tool_calls=item.get("tool_calls"),
+            tool_call_id=item.get("tool_call_id"),
+        ))
+    start = len(messages)
+    messages.extend(AgentMessage(role="user", content=prompt) for prompt in request["prompts"])
+    loop_.state.messages = messages
+    loop_.state.model = request["model"]
+
+    task = asyncio.create_task(loop_.agent_loop_continue())
+    while not task.done():
+        # Watch for control messages (abort) while the turn runs
+        reader = asyncio.create_task(_recv(conn))
+        await asyncio.wait({task, reader}, return_when=asyncio.FIRST_COMPLETED)
+        if reader.done():
+            control = reader.result()
+            if control.get("type") == "abort":
+                loop_.abort()
+        else:
+            # Must finish cancelling before the next _recv registers the fd
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+
+    result = await task
+    _send(conn, {
+        "type": "done",
+        "messages": [
+            {
+                "role": m.role,
+                "content": m.content,
+                "tool_calls": m.tool_calls,
+                "tool_call_id": m.tool_call_id,
+            }
+            for m in result[start:]
+        ],
+    })
+
+
+async def _serve(conn: Any) -> None:
+    providers: dict[tuple, Any] = {}
+    while True:
+        try:
+            request = await _recv(conn)
+        except (EOFError, OSError):
+            return
+
+        request_type = request.get("type")
+        if request_type == "shutdown":
+            return
+        if request_type == "limits":
+            _apply_limits(request.get("memory_limit_mb"), request.get("cpu_limit_s"))
+            continue
+        if request_type != "turn":
+            continue
+
+        try:
+            await _run_worker_turn(conn, request, providers)
+        except (EOFError, OSError):
+            return
+        except Exception as e:
+            logger.error(f"Agent worker turn failed: {e}")
+            _send(conn, {"type": "error", "error": str(e), "error_type": type(e).__name__})
+
+
+def _agent_process_worker(
+    conn: Any,
+    memory_limit_mb: int | None = None,
+    cpu_limit_s: float | None = None,
+):
+    """
+    Worker function for agent process
+
+    This runs in the isolated process and serves turn requests until
+    told to shut down or the parent goes away.
+
+    Args:
+        conn: Pipe connection to the parent
+        memory_limit_mb: Address space limit
+        cpu_limit_s: CPU time limit for the worker's lifetime
+    """
+    import os
+
+    logging.basicConfig(level=logging.INFO)
+    _apply_limits(memory_limit_mb, cpu_limit_s)
+
+    conn.send({"type": "ready", "pid": os.getpid()})
+    asyncio.run(_serve(conn))
+
+
+# ----------------------------------------------------------------------
+# Parent side
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class AgentWorker:
+    """A warm agent worker process"""
+
+    process: Any
+    conn: Any
+    started_at: float = field(default_factory=time.time)
+    turns: int = 0
+    session_key: str | None = None  # dedicated to a session
+    retire: bool = False  # broken or mid-turn; never reuse
+    limited: bool = False  # session rlimits applied; recycle when lease ends
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def pid(self) -> int | None:
+        return self.process.pid
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+
+class AgentWorkerPool:
+    """
+    Pool of pre-forked agent worker processes
+
+    Example:
+        pool = AgentWorkerPool(size=4, memory_limit_mb=1024)
+        await pool.start()
+        async for message in pool.run_turn({"model": "anthropic/claude-...", "prompts": ["hi"]}):
+            ...
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_turns: int = 50,
+        memory_limit_mb: int | None = None,
+        cpu_limit_s: float | None = None,
+        preload: list[str] | None = None,
+        start_method: str | None = None,
+    ):
+        """
+        Initialize pool
+
+        Args:
+            size: Number of warm workers
+            max_turns: Turns before a worker is recycled
+            memory_limit_mb: Per-worker address space limit
+            cpu_limit_s: Per-worker CPU time limit (over its lifetime)
+            preload: Modules imported by the forkserver
+            start_method: Multiprocessing start method (default: forkserver
+                where available, else spawn)
+        """
+        self.size = size
+        self.max_turns = max_turns
+        self.memory_limit_mb = memory_limit_mb
+        self.cpu_limit_s = cpu_limit_s
+
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+        self._ctx = mp.get_context(start_method)
+        if start_method == "forkserver":
+            self._ctx.set_forkserver_preload(preload or DEFAULT_PRELOAD)
+
+        self._workers: list[AgentWorker] = []
+        self._idle: deque[AgentWorker] = deque()
+        self._leases: dict[str, AgentWorker] = {}
+        self._available = asyncio.Condition()
+        self._spawning = 0
+        self._spawn_error: Exception | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._stats = {"turns": 0, "spawned": 0, "recycled": 0}
+
+    # ------------------------------------------------------------------
+    # Worker lifecycle
+    # ------------------------------------------------------------------
+
+    async def _spawn(self) -> AgentWorker:
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        process = self._ctx.Process(
+            target=_agent_process_worker,
+            args=(child_conn, self.memory_limit_mb, self.cpu_limit_s),
+            name="openclaw-agent-worker",
+            daemon=True,
+        )
+        # Forking from a thread keeps the child free of this loop's state
+        await asyncio.to_thread(process.start)
+        child_conn.close()
+
+        try:
+            ready = await _recv(parent_conn, timeout=30)
+        except (EOFError, asyncio.TimeoutError) as e:
+            process.kill()
+            raise RuntimeError(f"Agent worker failed to start: {e!r}") from e
+
+        worker = AgentWorker(process=process, conn=parent_conn)
+        self._workers.append(worker)
+        self._stats["spawned"] += 1
+        logger.info(f"Agent worker ready: PID={ready.get('pid')}")
+        return worker
+
+    async def _add_worker(self) -> None:
+        self._spawning += 1
+        try:
+            worker = await self._spawn()
+        except Exception as e:
+            logger.error(f"Failed to start agent worker: {e}")
+            worker = None
+            error = e
+        finally:
+            self._spawning -= 1
+
+        async with self._available:
+            if worker is None:
+                # Wake waiters so they fail instead of waiting forever
+                self._spawn_error = error
+                self._available.notify_all()
+                return
+            self._idle.append(worker)
+            self._available.notify()
+
+    def _background(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _stop(self, worker: AgentWorker) -> None:
+        if worker in self._workers:
+            self._workers.remove(worker)
+        try:
+            worker.conn.send({"type": "shutdown"})
+        except (OSError, ValueError):
+            pass
+        await asyncio.to_thread(worker.process.join, 2.0)
+        if worker.process.is_alive():
+            worker.process.kill()
+            await asyncio.to_thread(worker.process.join)
+        worker.conn.close()
+
+    async def _recycle(self, worker: AgentWorker) -> None:
+        self._stats["recycled"] += 1
+        await self._stop(worker)
+        await self._add_worker()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def _deficit(self) -> int:
+        """Missing shared workers (leased workers don't count toward size)"""
+        return self.size - (len(self._workers) - len(self._leases)) - self._spawning
+
+    async def start(self) -> None:
+        """Start warm workers up to ``size``"""
+        await asyncio.gather(*(self._add_worker() for _ in range(max(self._deficit(), 0))))
+
+    async def acquire(self) -> AgentWorker:
+        """Wait for an idle worker"""
+        async with self._available:
+            while True:
+                while self._idle:
+                    worker = self._idle.popleft()
+                    if worker.is_alive():
+                        return worker
+                    self._background(self._recycle(worker))
+                if self._spawn_error is not None and not self._spawning:
+                    error, self._spawn_error = self._spawn_error, None
+                    raise RuntimeError(f"No agent worker available: {error}") from error
+                if self._deficit() > 0:
+                    self._background(self._add_worker())
+                await self._available.wait()
+
+    async def release(self, worker: AgentWorker) -> None:
+        """Return a worker, recycling it if it is spent or dead"""
+        spent = worker.turns >= self.max_turns
+        if worker.retire or worker.limited or spent or not worker.is_alive():
+            self._background(self._recycle(worker))
+            return
+        async with self._available:
+            self._idle.append(worker)
+            self._available.notify()
+
+    async def lease(
+        self,
+        session_key: str,
+        memory_limit_mb: int | None = None,
+        cpu_limit_s: float | None = None,
+    ) -> AgentWorker:
+        """
+        Dedicate a worker to a session
+
+        Tighter per-session limits can be applied; the worker is recycled
+        when the lease ends since rlimits cannot be raised again.
+        """
+        worker = self._leases.get(session_key)
+        if worker is not None and worker.is_alive():
+            return worker
+
+        worker = await self.acquire()
+        worker.session_key = session_key
+        if memory_limit_mb or cpu_limit_s:
+            worker.conn.send({
+                "type": "limits",
+                "memory_limit_mb": memory_limit_mb,
+                "cpu_limit_s": cpu_limit_s,
+            })
+            worker.limited = True
+        self._leases[session_key] = worker
+        if self._deficit() > 0:
+            self._background(self.start())
+        return worker
+
+    async def unlease(self, session_key: str, terminate: bool = False) -> AgentWorker | None:
+        """End a session's lease"""
+        worker = self._leases.pop(session_key, None)
+        if worker is None:
+            return None
+        worker.session_key = None
+        if terminate:
+            worker.retire = True
+        await self.release(worker)
+        return worker
+
+    def get_worker(self, session_key: str) -> AgentWorker | None:
+        """Worker leased to a session, if any"""
+        return self._leases.get(session_key)
+
+    async def run_turn(
+        self,
+        request: dict[str, Any],
+        timeout_s: float | None = 300.0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Run one agent turn in a worker, streaming its messages
+
+        Uses the session's leased worker if there is one, otherwise any
+        idle worker for the duration of the turn.
+
+        Args:
+            request: Turn request (model, prompts, system_prompt, history,
+                api_key, base_url, tool_profile, provider_factory)
+            timeout_s: Kill the worker if the turn exceeds this
+
+        Yields:
+            ``event`` messages followed by one ``done`` or ``error`` message
+        """
+        session_key = request.get("session_key")
+        worker = self._leases.get(session_key) if session_key else None
+        leased = worker is not None
+        if worker is None:
+            worker = await self.acquire()
+
+        deadline = time.monotonic() + timeout_s if timeout_s else None
+        finished = False
+        try:
+            async with worker.lock:
+                worker.turns += 1
+                self._stats["turns"] += 1
+                worker.conn.send({**request, "type": "turn"})
+                while True:
+                    remaining = deadline - time.monotonic() if deadline else None
+                    if remaining is not None and remaining <= 0:
+                        finished = True
+                        worker.retire = True
+                        worker.process.kill()
+                        yield {"type": "error", "error": f"Turn timed out after {timeout_s}s",
+                               "error_type": "TimeoutError"}
+                        return
+
+                    wait = _LIVENESS_INTERVAL if remaining is None else min(remaining, _LIVENESS_INTERVAL)
+                    try:
+                        message = await _recv(worker.conn, timeout=wait)
+                    except asyncio.TimeoutError:
+                        # A dead worker doesn't always produce EOF (another
+                        # process may hold a copy of the pipe)
+                        if worker.is_alive():
+                            continue
+                        message = None
+                    except (EOFError, OSError):
+                        message = None
+
+                    if message is None:
+                        finished = True
+                        worker.retire = True
+                        yield {"type": "error", "error": "Agent worker exited",
+                               "error_type": "WorkerExited",
+                               "exitcode": worker.process.exitcode}
+                        return
+                    if message.get("type") in ("done", "error"):
+                        finished = True
+                        yield message
+                        return
+                    yield message
+        finally:
+            if not finished:
+                # Abandoned mid-turn: its remaining output would leak into
+                # the next turn
+                worker.retire = True
+            if leased:
+                if worker.retire or worker.turns >= self.max_turns:
+                    self._leases.pop(session_key, None)
+                    worker.session_key = None
+                    await self.release(worker)
+            else:
+                await self.release(worker)
+
+    def abort(self, session_key: str) -> bool:
+        """Abort the running turn of a leased worker"""
+        worker = self._leases.get(session_key)
+        if worker is None:
+            return False
+        worker.conn.send({"type": "abort"})
+        return True
+
+    async def close(self) -> None:
+        """Stop all workers"""
+        for task in list(self._tasks):
+            task.cancel()
+        workers = list(self._workers)
+        self._idle.clear()
+        self._leases.clear()
+        await asyncio.gather(*(self._stop(worker) for worker in workers))
+
+    def list_workers(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "pid": worker.pid,
+                "is_alive": worker.is_alive(),
+                "turns": worker.turns,
+                "session_key": worker.session_key,
+                "started_at": worker.started_at,
+            }
+            for worker in self._workers
+        ]
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "workers": len(self._workers),
+            "idle": len(self._idle),
+            "leased": len(self._leases),
+        }
 
 
 class AgentProcessManager:
     """
     Agent process isolation manager
-    
-    Creates truly isolated agent processes using multiprocessing.
-    Each agent runs in its own process with resource limits.
+
+    Runs agents in isolated worker processes with resource limits. Each
+    isolated session is pinned to a warm worker from ``AgentWorkerPool``
+    instead of paying for a fresh interpreter per session.
     """
-    
-    def __init__(self):
-        self._processes: dict[str, mp.Process] = {}
-        self._queues: dict[str, mp.Queue] = {}
+
+    def __init__(self, pool: AgentWorkerPool | None = None):
+        self.pool = pool or AgentWorkerPool()
+        self._configs: dict[str, AgentProcessConfig] = {}
         self._lock = asyncio.Lock()
-    
+
     async def spawn_isolated_agent(
         self,
         config: AgentProcessConfig,
     ) -> int:
         """
         Spawn an isolated agent process
-        
+
         Args:
             config: Agent process configuration
-            
+
         Returns:
             Process ID
         """
         logger.info(f"Spawning isolated agent: {config.session_key}")
-        
-        # Create communication queue
-        queue = mp.Queue()
-        self._queues[config.session_key] = queue
-        
-        # Create process
-        process = mp.Process(
-            target=_agent_process_worker,
-            args=(config, queue),
-            name=f"agent-{config.session_key}",
+
+        worker = await self.pool.lease(
+            config.session_key,
+            memory_limit_mb=config.memory_limit_mb,
+            cpu_limit_s=config.cpu_limit,
         )
-        
-        # Start process
-        process.start()
-        
+
         async with self._lock:
-            self._processes[config.session_key] = process
-        
-        logger.info(f"Agent process started: PID={process.pid}")
-        
-        return process.pid
-    
+            self._configs[config.session_key] = config
+
+        logger.info(f"Agent process assigned: PID={worker.pid}")
+
+        return worker.pid
+
+    async def run_turn(
+        self,
+        session_key: str,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        history: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Run a turn in the session's isolated process
+
+        Args:
+            session_key: Session key (must be spawned first)
+            prompts: User messages
+            system_prompt: Optional system prompt
+            history: Prior messages as {role, content, ...} dicts
+
+        Yields:
+            Event messages, then ``done`` (with new messages) or ``error``
+        """
+        config = self._configs.get(session_key)
+        if config is None:
+            raise ValueError(f"No isolated agent for session: {session_key}")
+
+        request = {
+            "session_key": session_key,
+            "model": config.model,
+            "api_key": config.api_key,
+            "base_url": config.base_url,
+            "tool_profile": config.tool_profile,
+            "provider_factory": config.provider_factory,
+            "prompts": prompts,
+            "system_prompt": system_prompt,
+            "history": history or [],
+        }
+        async for message in self.pool.run_turn(request, timeout_s=config.timeout_s):
+            yield message
+
     async def terminate_agent(self, session_key: str):
         """
         Terminate an agent process
-        
+
         Args:
             session_key: Session key
         """
         async with self._lock:
-            process = self._processes.get(session_key)
-        
-        if not process:
+            self._configs.pop(session_key, None)
+
+        worker = await self.pool.unlease(session_key, terminate=True)
+        if not worker:
             logger.warning(f"No process found for session: {session_key}")
             return
-        
-        logger.info(f"Terminating agent process: {session_key} (PID={process.pid})")
-        
-        # Terminate process
-        process.terminate()
-        
-        # Wait for termination (with timeout)
-        process.join(timeout=5.0)
-        
-        # Force kill if still alive
-        if process.is_alive():
-            logger.warning(f"Force killing process: {session_key}")
-            process.kill()
-            process.join()
-        
-        # Clean up
-        async with self._lock:
-            self._processes.pop(session_key, None)
-            self._queues.pop(session_key, None)
-        
-        logger.info(f"Agent process terminated: {session_key}")
-    
+
+        logger.info(f"Agent process terminated: {session_key} (PID={worker.pid})")
+
     async def send_message(self, session_key: str, message: dict[str, Any]):
         """
         Send message to agent process
-        
+
         Args:
             session_key: Session key
-            message: Message dict
+            message: Message dict (e.g. ``{"type": "abort"}``)
         """
-        queue = self._queues.get(session_key)
-        if not queue:
+        worker = self.pool.get_worker(session_key)
+        if not worker:
             raise ValueError(f"No queue for session: {session_key}")
-        
-        queue.put(message)
-    
+
+        worker.conn.send(message)
+
     async def receive_message(self, session_key: str, timeout: float = 1.0) -> dict[str, Any] | None:
         """
         Receive message from agent process
-        
+
         Args:
             session_key: Session key
             timeout: Timeout in seconds
-            
+
         Returns:
             Message dict or None
         """
-        queue = self._queues.get(session_key)
-        if not queue:
+        worker = self.pool.get_worker(session_key)
+        if not worker:
             return None
-        
+
         try:
-            # Run blocking get in thread pool
-            loop = asyncio.get_event_loop()
-            message = await loop.run_in_executor(
-                None,
-                queue.get,
-                True,  # block
-                timeout,
-            )
-            return message
+            return await _recv(worker.conn, timeout=timeout)
         except Exception:
             return None
-    
+
     def list_processes(self) -> list[dict[str, Any]]:
         """
         List all agent processes
-        
+
         Returns:
             List of process info dicts
         """
-        processes = []
-        
-        for session_key, process in self._processes.items():
-            processes.append({
-                "session_key": session_key,
-                "pid": process.pid,
-                "is_alive": process.is_alive(),
-                "name": process.name,
-            })
-        
-        return processes
-
-
-def _agent_process_worker(config: AgentProcessConfig, queue: mp.Queue):
-    """
-    Worker function for agent process
-    
-    This runs in the isolated process.
-    
-    Args:
-        config: Agent configuration
-        queue: Communication queue
-    """
-    import asyncio
-    
-    # Set up logging in subprocess
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-    
-    logger.info(f"Agent process worker started: {config.session_key}")
-    
-    try:
-        # TODO: Initialize agent in isolated process
-        # This would:
-        # 1. Load agent configuration
-        # 2. Initialize LLM provider
-        # 3. Set up tool registry
-        # 4. Run agent loop
-        # 5. Send results back via queue
-        
-        # For now, just simulate
-        import time
-        time.sleep(1)
-        
-        # Send completion message
-        queue.put({
-            "type": "complete",
-            "session_key": config.session_key,
-            "success": True,
-        })
-        
-    except Exception as e:
-        logger.error(f"Agent process error: {e}")
-        queue.put({
-            "type": "error",
-            "session_key": config.session_key,
-            "error": str(e),
-        })
-    
-    logger.info(f"Agent process worker finished: {config.session_key}")
+        return [
+            {
+                "session_key": info["session_key"],
+                "pid": info["pid"],
+                "is_alive": info["is_alive"],
+                "name": "openclaw-agent-worker",
+                "turns": info["turns"],
+            }
+            for info in self.pool.list_workers()
+            if info["session_key"]
+        ]
 
 
 # Global manager instance
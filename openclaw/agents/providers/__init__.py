@@ -2,12 +2,28 @@
 LLM Provider implementations
 """
 
-from .anthropic_provider import AnthropicProvider
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_imports import lazy_exports
 from .base import LLMMessage, LLMProvider, LLMResponse
-from .bedrock_provider import BedrockProvider
-from .gemini_provider import GeminiProvider
-from .ollama_provider import OllamaProvider
-from .openai_provider import OpenAIProvider
+
+if TYPE_CHECKING:
+    from .anthropic_provider import AnthropicProvider
+    from .bedrock_provider import BedrockProvider
+    from .gemini_provider import GeminiProvider
+    from .ollama_provider import OllamaProvider
+    from .openai_provider import OpenAIProvider
+
+# Each provider (and its SDK) is imported only when first used
+_EXPORTS = {
+    "AnthropicProvider": ".anthropic_provider",
+    "OpenAIProvider": ".openai_provider",
+    "GeminiProvider": ".gemini_provider",
+    "BedrockProvider": ".bedrock_provider",
+    "OllamaProvider": ".ollama_provider",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "LLMProvider",
@@ -2,6 +2,7 @@
 Anthropic Claude provider implementation
 """
 
+import json
 import logging
 import os
 from collections.abc import AsyncIterator
@@ -9,6 +10,7 @@ from collections.abc import AsyncIterator
 from anthropic import AsyncAnthropic
 
 from .base import LLMMessage, LLMProvider, LLMResponse
+from .http_clients import get_provider_client_registry, sdk_http_module
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +37,14 @@ class AnthropicProvider(LLMProvider):
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY not provided")
 
-            self._client = AsyncAnthropic(api_key=api_key)
+            # Shared per (endpoint, key) across provider instances: pooled connections
+            self._client = get_provider_client_registry().get_sdk_client(
+                "anthropic",
+                self.base_url,
+                api_key,
+                lambda http: AsyncAnthropic(api_key=api_key, base_url=self.base_url, http_client=http),
+                http_module=sdk_http_module("anthropic"),
+            )
 
         return self._client
 
@@ -71,18 +80,44 @@ class AnthropicProvider(LLMProvider):
                 tools=tools,
                 **kwargs,
             ) as stream:
+                # tool_use blocks being streamed: index -> call (JSON arguments so far)
+                pending_tools: dict[int, dict] = {}
+
                 async for event in stream:
                     if hasattr(event, "type"):
                         if event.type == "content_block_delta":
                             if hasattr(event.delta, "text"):
                                 yield LLMResponse(type="text_delta", content=event.delta.text)
+                            elif getattr(event.delta, "type", None) == "input_json_delta":
+                                if event.index in pending_tools:
+                                    pending_tools[event.index]["json"] += event.delta.partial_json
                         elif event.type == "content_block_start":
                             if (
                                 hasattr(event.content_block, "type")
                                 and event.content_block.type == "tool_use"
                             ):
-                                # Tool call started
-                                pass
+                                # Tool call started; its arguments arrive as JSON deltas
+                                pending_tools[event.index] = {
+                                    "id": event.content_block.id,
+                                    "name": event.content_block.name,
+                                    "json": "",
+                                }
+                        elif event.type == "content_block_stop":
+                            call = pending_tools.pop(getattr(event, "index", None), None)
+                            if call is not None:
+                                # Arguments are complete: the tool can start now
+                                # while the model streams the remaining blocks
+                                try:
+                                    arguments = json.loads(call["json"]) if call["json"] else {}
+                                except json.JSONDecodeError:
+                                    arguments = {}
+                                yield LLMResponse(
+                                    type="tool_call_ready",
+                                    content=None,
+                                    tool_calls=[
+                                        {"id": call["id"], "name": call["name"], "arguments": arguments}
+                                    ],
+                                )
 
                 # Get final message
                 final_message = await stream.get_final_message()
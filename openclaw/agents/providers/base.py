@@ -23,7 +23,18 @@ class LLMMessage:
 
 @dataclass
 class LLMResponse:
-    """Response from LLM"""
+    """
+    Response from LLM
+
+    Types:
+        text_delta: content is streamed text
+        tool_call_ready: tool_calls holds one call whose arguments are
+            complete, emitted while the model may still be streaming
+            (providers that can't tell only send tool_call)
+        tool_call: tool_calls holds every call of the response
+        done: end of response (finish_reason set)
+        error: content is the error message
+    """
 
     type: str
     content: Any
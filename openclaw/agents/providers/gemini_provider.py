@@ -22,6 +22,8 @@ except ImportError:
     types = None  # type: ignore
     GENAI_AVAILABLE = False
 
+from openclaw.media.image_cache import PreparedImage, get_image_prep_cache
+
 from .base import LLMMessage, LLMProvider, LLMResponse
 
 logger = logging.getLogger(__name__)
@@ -76,8 +78,18 @@ class GeminiProvider(LLMProvider):
 
         return self._client
 
-    def _convert_messages(self, messages: list[LLMMessage]) -> list[types.Content]:
-        """Convert messages to Gemini Content format"""
+    def _convert_messages(
+        self,
+        messages: list[LLMMessage],
+        prepared_images: dict[str, PreparedImage] | None = None,
+    ) -> list[types.Content]:
+        """
+        Convert messages to Gemini Content format
+
+        Args:
+            messages: Conversation messages
+            prepared_images: Image source -> prepared image, for msg.images
+        """
         if not GENAI_AVAILABLE or types is None:
             raise ImportError("google-genai package required")
 
@@ -107,35 +119,16 @@ class GeminiProvider(LLMProvider):
             # Create parts list (text + optional images + optional tool calls)
             parts = []
             
-            # Add images first (if any)
+            # Add images first (if any), prepared ahead of time by stream()
             if hasattr(msg, 'images') and msg.images:
                 for image_url in msg.images:
-                    try:
-                        # Download image and convert to bytes
-                        import httpx
-                        response = httpx.get(image_url, timeout=30.0)
-                        if response.status_code == 200:
-                            image_bytes = response.content
-                            # Determine MIME type from URL or content
-                            mime_type = "image/jpeg"  # Default
-                            if ".png" in image_url.lower():
-                                mime_type = "image/png"
-                            elif ".gif" in image_url.lower():
-                                mime_type = "image/gif"
-                            elif ".webp" in image_url.lower():
-                                mime_type = "image/webp"
-                            
-                            # Create image part
-                            parts.append(types.Part.from_bytes(
-                                data=image_bytes,
-                                mime_type=mime_type
-                            ))
-                            logger.info(f"Added image to Gemini request: {image_url[:50]}...")
-                        else:
-                            logger.warning(f"Failed to download image: {image_url} (status: {response.status_code})")
-                    except Exception as e:
-                        logger.error(f"Error loading image {image_url}: {e}")
-            
+                    image = (prepared_images or {}).get(image_url)
+                    if image is None:
+                        logger.warning(f"Image not available, skipping: {image_url[:80]}")
+                        continue
+                    parts.append(types.Part.from_bytes(data=image.data, mime_type=image.mime_type))
+                    logger.debug(f"Added image to Gemini request: {image_url[:50]}...")
+
             # Add tool calls if present (for assistant messages)
             if hasattr(msg, 'tool_calls') and msg.tool_calls and role == "model":
                 for tc in msg.tool_calls:
@@ -178,8 +171,12 @@ class GeminiProvider(LLMProvider):
         client = self.get_client()
 
         try:
+            # Load/resize/encode images once; repeated requests hit the cache
+            sources = [image for msg in messages for image in (msg.images or [])]
+            prepared_images = await get_image_prep_cache().prepare_many(sources) if sources else None
+
             # Convert messages
-            contents, system_instruction = self._convert_messages(messages)
+            contents, system_instruction = self._convert_messages(messages, prepared_images)
 
             if not contents:
                 logger.warning("No messages to send to Gemini")
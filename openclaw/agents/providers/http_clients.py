@@ -0,0 +1,313 @@
+"""
+Shared HTTP clients for LLM providers
+
+Runtimes (and with them providers) are created per request by the
+OpenAI-compatible API and per environment by RuntimeEnvManager. Giving
+every provider instance its own SDK client means every runtime opens new
+connections and repeats the TLS handshake. The registry keeps one client
+per (provider, base URL, credentials) for the whole process instead:
+
+- one tuned httpx transport (pool limits, long keep-alive, HTTP/2 when the
+  optional ``h2`` package is installed) shared by all SDK clients for a key
+- ``warm()`` opens connections ahead of the first turn (the gateway calls
+  it on start)
+- ``start_keepalive()`` touches idle connections periodically so the first
+  turn after a quiet period doesn't pay for a new handshake
+
+Example:
+    registry = get_provider_client_registry()
+    client = registry.get_sdk_client(
+        "anthropic", base_url, api_key,
+        lambda http: AsyncAnthropic(api_key=api_key, http_client=http),
+        http_module=sdk_http_module("anthropic"),
+    )
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import importlib
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class ProviderHttpConfig:
+    """
+    Connection settings for provider clients
+
+    Attributes:
+        max_connections: Pool size per client
+        max_keepalive_connections: Idle connections kept open per client
+        keepalive_expiry: Seconds an idle connection is kept
+        http2: Use HTTP/2 (if h2 is installed)
+        connect_timeout: Seconds to establish a connection
+        read_timeout: Seconds between bytes of a (streaming) response
+        keepalive_interval: Seconds between keep-alive requests on idle
+            clients (None disables)
+    """
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 300.0
+    http2: bool = True
+    connect_timeout: float = 10.0
+    read_timeout: float = 600.0
+    keepalive_interval: float | None = 120.0
+
+
+@dataclass
+class _Entry:
+    http: Any  # AsyncClient of http_module
+    http_module: ModuleType
+    loop: asyncio.AbstractEventLoop | None
+    warm_url: str | None = None
+    sdk_client: Any = None
+    last_used: float = field(default_factory=time.monotonic)
+
+
+def _credentials_key(credentials: str | None) -> str:
+    # Hashed so keys never sit in memory as dict keys
+    if not credentials:
+        return ""
+    return hashlib.sha256(credentials.encode()).hexdigest()[:16]
+
+
+def sdk_http_module(sdk: str) -> ModuleType:
+    """
+    httpx-compatible module an SDK builds its clients with
+
+    Recent anthropic/openai SDKs moved from httpx to its httpx2 fork and
+    reject http_client instances of the other package.
+
+    Args:
+        sdk: SDK package name ("anthropic", "openai")
+    """
+    base_client = importlib.import_module(f"{sdk}._base_client")
+    return getattr(base_client, "httpx2", None) or httpx
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class ProviderClientRegistry:
+    """Process-wide pool of provider HTTP/SDK clients"""
+
+    def __init__(self, config: ProviderHttpConfig | None = None):
+        """
+        Initialize registry
+
+        Args:
+            config: Connection settings (defaults if omitted)
+        """
+        self.config = config or ProviderHttpConfig()
+        self._entries: dict[tuple[str, str, str, str], _Entry] = {}
+        self._keepalive_task: asyncio.Task | None = None
+        self._stats = {"created": 0, "reused": 0, "warmed": 0, "pings": 0}
+
+    def _new_http_client(self, base_url: str | None, module: ModuleType = httpx) -> Any:
+        config = self.config
+        kwargs: dict[str, Any] = {}
+        if base_url:
+            kwargs["base_url"] = base_url
+        return module.AsyncClient(
+            http2=config.http2 and HTTP2_AVAILABLE,
+            limits=module.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            timeout=module.Timeout(config.read_timeout, connect=config.connect_timeout),
+            **kwargs,
+        )
+
+    def _entry(
+        self,
+        provider: str,
+        base_url: str | None,
+        credentials: str | None,
+        module: ModuleType = httpx,
+    ) -> _Entry:
+        """Get the entry for a key, replacing clients of closed event loops"""
+        key = (provider, base_url or "", _credentials_key(credentials), module.__name__)
+        loop = _running_loop()
+        entry = self._entries.get(key)
+        if entry is not None and entry.loop is not None and entry.loop is not loop and entry.loop.is_closed():
+            # Pooled connections belong to a loop that no longer exists
+            entry = None
+        if entry is not None:
+            if entry.loop is None:
+                entry.loop = loop
+            entry.last_used = time.monotonic()
+            self._stats["reused"] += 1
+            return entry
+
+        entry = _Entry(
+            http=self._new_http_client(base_url, module), http_module=module, loop=loop, warm_url=base_url
+        )
+        self._entries[key] = entry
+        self._stats["created"] += 1
+        logger.debug(f"Created shared HTTP client for {provider} ({base_url or 'default URL'})")
+        return entry
+
+    def get_http_client(
+        self, provider: str, base_url: str | None = None, credentials: str | None = None
+    ) -> httpx.AsyncClient:
+        """
+        Get the shared httpx client for a provider endpoint
+
+        Args:
+            provider: Provider name
+            base_url: Endpoint (also the client's base_url)
+            credentials: API key, if requests are authenticated per key
+
+        Returns:
+            httpx.AsyncClient (don't close it; the registry owns it)
+        """
+        return self._entry(provider, base_url, credentials).http
+
+    def get_sdk_client(
+        self,
+        provider: str,
+        base_url: str | None,
+        credentials: str | None,
+        factory: Callable[[Any], Any],
+        http_module: ModuleType = httpx,
+    ) -> Any:
+        """
+        Get the shared SDK client for a provider endpoint
+
+        Args:
+            provider: Provider name
+            base_url: Custom endpoint (None for the SDK default)
+            credentials: API key
+            factory: Builds the SDK client around the shared HTTP client
+            http_module: Module the SDK's http_client must come from
+                (see sdk_http_module)
+
+        Returns:
+            SDK client, built once per key
+        """
+        entry = self._entry(provider, base_url, credentials, http_module)
+        if entry.sdk_client is None:
+            entry.sdk_client = factory(entry.http)
+            sdk_base_url = getattr(entry.sdk_client, "base_url", None)
+            if sdk_base_url:
+                entry.warm_url = str(sdk_base_url)
+        return entry.sdk_client
+
+    async def _touch(self, entry: _Entry) -> bool:
+        """Open (or keep open) a connection to an entry's endpoint"""
+        if not entry.warm_url:
+            return False
+        try:
+            # Any response will do: the point is the pooled connection
+            await entry.http.head(entry.warm_url, timeout=self.config.connect_timeout)
+        except entry.http_module.HTTPError as e:
+            logger.debug(f"Connection warm-up to {entry.warm_url} failed: {e}")
+            return False
+        entry.last_used = time.monotonic()
+        return True
+
+    async def warm(self) -> int:
+        """
+        Open a connection for every registered client
+
+        Returns:
+            Number of endpoints warmed
+        """
+        loop = _running_loop()
+        entries = [e for e in self._entries.values() if e.loop in (None, loop)]
+        results = await asyncio.gather(*(self._touch(e) for e in entries))
+        warmed = sum(results)
+        self._stats["warmed"] += warmed
+        if warmed:
+            logger.info(f"Warmed {warmed} provider connection(s)")
+        return warmed
+
+    def start_keepalive(self) -> asyncio.Task | None:
+        """
+        Periodically touch clients idle for a keep-alive interval
+
+        Returns:
+            Background task (None if disabled or already running)
+        """
+        interval = self.config.keepalive_interval
+        if not interval or (self._keepalive_task and not self._keepalive_task.done()):
+            return None
+        self._keepalive_task = asyncio.create_task(self._keepalive_loop(interval))
+        return self._keepalive_task
+
+    async def _keepalive_loop(self, interval: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            idle = [
+                e for e in self._entries.values()
+                if e.loop in (None, loop) and now - e.last_used >= interval
+            ]
+            if idle:
+                self._stats["pings"] += sum(await asyncio.gather(*(self._touch(e) for e in idle)))
+
+    def get_stats(self) -> dict:
+        """Registry statistics"""
+        return {**self._stats, "clients": len(self._entries), "http2": self.config.http2 and HTTP2_AVAILABLE}
+
+    async def aclose(self) -> None:
+        """Stop keep-alive and close all clients"""
+        task, self._keepalive_task = self._keepalive_task, None
+        loop = _running_loop()
+        if task:
+            task.cancel()
+            if task.get_loop() is loop:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        entries, self._entries = list(self._entries.values()), {}
+        for entry in entries:
+            if entry.loop in (None, loop):
+                await entry.http.aclose()
+
+
+# Global registry
+_registry: ProviderClientRegistry | None = None
+
+
+def get_provider_client_registry() -> ProviderClientRegistry:
+    """Get global provider client registry"""
+    global _registry
+    if _registry is None:
+        _registry = ProviderClientRegistry()
+    return _registry
+
+
+def configure_provider_clients(config: ProviderHttpConfig) -> ProviderClientRegistry:
+    """
+    Replace the global registry with one using these settings
+
+    Clients already handed out keep working but are no longer shared.
+    """
+    global _registry
+    _registry = ProviderClientRegistry(config)
+    return _registry
+
+
+async def close_provider_clients() -> None:
+    """Close the global registry's clients"""
+    if _registry is not None:
+        await _registry.aclose()
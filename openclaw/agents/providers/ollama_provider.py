@@ -11,6 +11,7 @@ from collections.abc import AsyncIterator
 import httpx
 
 from .base import LLMMessage, LLMProvider, LLMResponse
+from .http_clients import get_provider_client_registry
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +51,8 @@ class OllamaProvider(LLMProvider):
     def get_client(self) -> httpx.AsyncClient:
         """Get HTTP client for Ollama"""
         if self._client is None:
-            self._client = httpx.AsyncClient(base_url=self.base_url, timeout=300.0)
+            # Shared with other Ollama providers for the same host
+            self._client = get_provider_client_registry().get_http_client("ollama", self.base_url)
         return self._client
 
     async def stream(
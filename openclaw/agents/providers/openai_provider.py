@@ -2,6 +2,7 @@
 OpenAI provider implementation
 """
 
+import json
 import logging
 import os
 from collections.abc import AsyncIterator
@@ -9,10 +10,20 @@ from collections.abc import AsyncIterator
 from openai import AsyncOpenAI
 
 from .base import LLMMessage, LLMProvider, LLMResponse
+from .http_clients import get_provider_client_registry, sdk_http_module
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_tool_call(buffered: dict) -> dict:
+    """Turn a buffered streamed tool call into {id, name, arguments}"""
+    try:
+        args = json.loads(buffered["arguments"]) if buffered["arguments"] else {}
+    except json.JSONDecodeError:
+        args = {}
+    return {"id": buffered["id"], "name": buffered["name"], "arguments": args}
+
+
 class OpenAIProvider(LLMProvider):
     """
     OpenAI provider
@@ -48,7 +59,14 @@ class OpenAIProvider(LLMProvider):
             if self.base_url:
                 kwargs["base_url"] = self.base_url
 
-            self._client = AsyncOpenAI(**kwargs)
+            # Shared per (endpoint, key) across provider instances: pooled connections
+            self._client = get_provider_client_registry().get_sdk_client(
+                "openai",
+                self.base_url,
+                api_key,
+                lambda http: AsyncOpenAI(**kwargs, http_client=http),
+                http_module=sdk_http_module("openai"),
+            )
 
         return self._client
 
@@ -86,6 +104,8 @@ class OpenAIProvider(LLMProvider):
 
             # Track tool calls
             tool_calls_buffer = {}
+            # Indices already emitted as tool_call_ready
+            ready: set[int] = set()
 
             async for chunk in stream:
                 if not chunk.choices:
@@ -105,6 +125,17 @@ class OpenAIProvider(LLMProvider):
 
                         # Initialize buffer for this tool call
                         if idx not in tool_calls_buffer:
+                            # Calls are streamed one after another, so earlier
+                            # ones are complete once a new one starts
+                            for done_idx in sorted(tool_calls_buffer):
+                                if done_idx not in ready:
+                                    ready.add(done_idx)
+                                    yield LLMResponse(
+                                        type="tool_call_ready",
+                                        content=None,
+                                        tool_calls=[_parse_tool_call(tool_calls_buffer[done_idx])],
+                                    )
+
                             tool_calls_buffer[idx] = {
                                 "id": tool_call.id or f"call_{idx}",
                                 "name": "",
@@ -123,18 +154,11 @@ class OpenAIProvider(LLMProvider):
                 if choice.finish_reason:
                     # Emit tool calls if any
                     if tool_calls_buffer:
-                        import json
-
-                        tool_calls = []
-                        for tc in tool_calls_buffer.values():
-                            try:
-                                args = json.loads(tc["arguments"]) if tc["arguments"] else {}
-                            except json.JSONDecodeError:
-                                args = {}
-
-                            tool_calls.append(
-                                {"id": tc["id"], "name": tc["name"], "arguments": args}
-                            )
+                        tool_calls = [_parse_tool_call(tc) for tc in tool_calls_buffer.values()]
+                        for idx, tc in zip(tool_calls_buffer, tool_calls):
+                            if idx not in ready:
+                                ready.add(idx)
+                                yield LLMResponse(type="tool_call_ready", content=None, tool_calls=[tc])
 
                         yield LLMResponse(type="tool_call", content=None, tool_calls=tool_calls)
 
@@ -6,26 +6,29 @@ Enhanced Agent runtime with multi-provider support
 
 import asyncio
 import logging
+import time
 from collections.abc import AsyncIterator
+from typing import Any
 
 from ..events import Event, EventType
 from .auth import AuthProfile, ProfileStore, RotationManager
-from .compaction import CompactionManager, CompactionStrategy, TokenAnalyzer
+from .compaction import CompactionManager, CompactionStrategy, SummaryCompactor, TokenAnalyzer
 from .context import ContextManager
 from .errors import classify_error, format_error_message, is_retryable_error
-from .failover import FailoverReason, FallbackChain, FallbackManager
-from .formatting import FormatMode, ToolFormatter
-from .providers import (
-    AnthropicProvider,
-    BedrockProvider,
-    GeminiProvider,
-    LLMMessage,
-    LLMProvider,
-    OllamaProvider,
-    OpenAIProvider,
+from .failover import (
+    FailoverReason,
+    FallbackChain,
+    FallbackManager,
+    get_provider_health_registry,
+    hedged_stream,
 )
+from .formatting import FormatMode, ToolFormatter
+from .image_loader import HistoryImageIndex, smart_load_images
+from .providers import LLMMessage, LLMProvider
+from .providers.http_clients import get_provider_client_registry
 from .queuing import QueueManager
 from .session import Session
+from .summarization import MessageSummarizer
 from .thinking import ThinkingExtractor, ThinkingMode
 from .tools.base import AgentTool
 
@@ -35,6 +38,48 @@ logger = logging.getLogger(__name__)
 AgentEvent = Event
 
 
+def create_provider(provider_name: str, **kwargs: Any) -> LLMProvider:
+    """
+    Create an LLM provider by name
+
+    Args:
+        provider_name: Provider name (anthropic, openai, gemini, ...)
+        **kwargs: Provider arguments (model, api_key, base_url, ...)
+
+    Returns:
+        Provider instance (OpenAI-compatible for unknown names)
+    """
+    provider_name = provider_name.lower()
+
+    # Import only the provider in use: each one pulls in its vendor SDK
+    if provider_name == "anthropic":
+        from .providers.anthropic_provider import AnthropicProvider
+
+        return AnthropicProvider(**kwargs)
+
+    elif provider_name in ("gemini", "google", "google-gemini"):
+        from .providers.gemini_provider import GeminiProvider
+
+        return GeminiProvider(**kwargs)
+
+    elif provider_name in ("bedrock", "aws-bedrock"):
+        from .providers.bedrock_provider import BedrockProvider
+
+        return BedrockProvider(**kwargs)
+
+    elif provider_name == "ollama":
+        from .providers.ollama_provider import OllamaProvider
+
+        return OllamaProvider(**kwargs)
+
+    from .providers.openai_provider import OpenAIProvider
+
+    if provider_name not in ("openai", "lmstudio", "openai-compatible", "custom"):
+        # Unknown provider, try OpenAI-compatible
+        logger.warning(f"Unknown provider '{provider_name}', trying OpenAI-compatible mode")
+    return OpenAIProvider(**kwargs)
+
+
 class MultiProviderRuntime:
     """
     Enhanced Agent runtime with support for multiple LLM providers
@@ -86,6 +131,9 @@ class MultiProviderRuntime:
         enable_queuing: bool = False,
         tool_format: FormatMode = FormatMode.MARKDOWN,
         compaction_strategy: CompactionStrategy = CompactionStrategy.KEEP_IMPORTANT,
+        hedge_requests: bool = False,
+        summary_model: str | None = None,
+        early_tool_dispatch: bool = True,
         **kwargs,
     ):
         self.model_str = model
@@ -98,8 +146,9 @@ class MultiProviderRuntime:
         # Parse provider and model
         self.provider_name, self.model_name = self._parse_model(model)
 
-        # Initialize provider
+        # Initialize provider (cached per model so failover doesn't rebuild clients)
         self.provider = self._create_provider()
+        self._providers: dict[str, LLMProvider] = {model: self.provider}
 
         # Initialize context manager
         if enable_context_management:
@@ -111,12 +160,17 @@ class MultiProviderRuntime:
         self.thinking_mode = thinking_mode
         self.thinking_extractor = ThinkingExtractor() if thinking_mode != ThinkingMode.OFF else None
 
-        # Failover management
+        # Failover management (circuit breakers are shared process-wide)
+        self.health = get_provider_health_registry()
+        self.hedge_requests = hedge_requests
+
+        # Start tools as soon as the provider reports their arguments complete
+        self.early_tool_dispatch = early_tool_dispatch
         self.fallback_chain = None
         self.fallback_manager = None
         if fallback_models:
             self.fallback_chain = FallbackChain(primary=model, fallbacks=fallback_models)
-            self.fallback_manager = FallbackManager(self.fallback_chain)
+            self.fallback_manager = FallbackManager(self.fallback_chain, health=self.health)
 
         # Auth rotation
         self.auth_rotation = None
@@ -124,7 +178,7 @@ class MultiProviderRuntime:
             store = ProfileStore()
             for profile in auth_profiles:
                 store.add_profile(profile)
-            self.auth_rotation = RotationManager(store)
+            self.auth_rotation = RotationManager(store, health=self.health)
 
         # Queuing
         self.queue_manager = QueueManager() if enable_queuing else None
@@ -141,6 +195,22 @@ class MultiProviderRuntime:
             self.token_analyzer = None
             self.compaction_manager = None
 
+        # Summarization compaction: evicted history becomes a persisted summary,
+        # produced in the background (optionally by a cheaper model)
+        self.summary_compactor = None
+        if compaction_strategy == CompactionStrategy.SUMMARIZE and self.context_manager:
+            summary_provider = self._get_provider(summary_model) if summary_model else self.provider
+            max_prompt_tokens = int(self.context_manager.max_tokens * 0.7)  # Use 70% of window
+            self.summary_compactor = SummaryCompactor(
+                MessageSummarizer(summary_provider),
+                self.token_analyzer,
+                max_prompt_tokens=max_prompt_tokens,
+                keep_recent_tokens=max_prompt_tokens // 4,
+            )
+
+        # Per-session image reference scan state (only new history is scanned)
+        self._image_indexes: dict[str, HistoryImageIndex] = {}
+
         # Observer pattern: event listeners (e.g., Gateway)
         self.event_listeners: list = []
         
@@ -242,42 +312,139 @@ class MultiProviderRuntime:
             except Exception as e:
                 logger.error(f"Observer notification failed: {e}", exc_info=True)
 
-    def _create_provider(self) -> LLMProvider:
+    def _create_provider(
+        self, provider_name: str | None = None, model_name: str | None = None
+    ) -> LLMProvider:
         """Create appropriate provider based on provider name"""
-        provider_name = self.provider_name.lower()
-
-        # Common parameters
-        kwargs = {
-            "model": self.model_name,
-            "api_key": self.api_key,
-            "base_url": self.base_url,
+        return create_provider(
+            provider_name or self.provider_name,
+            model=model_name or self.model_name,
+            api_key=self.api_key,
+            base_url=self.base_url,
             **self.extra_params,
-        }
+        )
 
-        # Create provider
-        if provider_name == "anthropic":
-            return AnthropicProvider(**kwargs)
+    def _get_provider(self, model: str) -> LLMProvider:
+        """Get the cached provider for ``model``, creating it on first use"""
+        provider = self._providers.get(model)
+        if provider is None:
+            provider = self._create_provider(*self._parse_model(model))
+            self._providers[model] = provider
+        return provider
 
-        elif provider_name == "openai":
-            return OpenAIProvider(**kwargs)
+    async def warm_connections(self) -> int:
+        """
+        Open provider connections before the first turn
 
-        elif provider_name in ("gemini", "google", "google-gemini"):
-            return GeminiProvider(**kwargs)
+        Registers the clients of this runtime's models (primary and
+        fallbacks) with the shared client registry and warms them.
 
-        elif provider_name in ("bedrock", "aws-bedrock"):
-            return BedrockProvider(**kwargs)
+        Returns:
+            Number of endpoints warmed
+        """
+        models = [self.model_str]
+        if self.fallback_chain:
+            models = self.fallback_chain.get_models()
+        for model in models:
+            try:
+                self._get_provider(model).get_client()
+            except (ImportError, ValueError) as e:
+                logger.debug(f"Not warming {model}: {e}")
+        return await get_provider_client_registry().warm()
+
+    def _use_model(self, model: str) -> None:
+        """Switch the active provider to ``model``"""
+        self.provider = self._get_provider(model)
+        self.provider_name, self.model_name = self._parse_model(model)
 
-        elif provider_name == "ollama":
-            return OllamaProvider(**kwargs)
+    async def _observed_stream(self, model: str, stream: AsyncIterator) -> AsyncIterator:
+        """Pass through a provider stream, recording latency and outcome"""
+        started = time.monotonic()
+        first_token_latency = None
+        try:
+            async for response in stream:
+                if first_token_latency is None:
+                    first_token_latency = time.monotonic() - started
+                if response.type == "error":
+                    self.health.record_failure(model, str(response.content))
+                elif response.type == "done":
+                    self.health.record_success(model, first_token_latency)
+                yield response
+        except Exception as e:
+            self.health.record_failure(model, str(e))
+            raise
+
+    async def _stream_with_health(
+        self,
+        model: str,
+        messages: list[LLMMessage],
+        tools: list[dict] | None,
+        max_tokens: int,
+        hedge: bool = True,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Stream from the active provider, yielding ``(model, response)``
 
-        elif provider_name in ("lmstudio", "openai-compatible", "custom"):
-            # OpenAI-compatible with custom base URL
-            return OpenAIProvider(**kwargs)
+        With ``hedge_requests`` enabled and a healthy fallback available, the
+        fallback is started once the primary exceeds its p95 time-to-first-token
+        and whichever produces output first is used. If the fallback wins, the
+        runtime switches to it for the rest of the turn.
+        """
 
-        else:
-            # Unknown provider, try OpenAI-compatible
-            logger.warning(f"Unknown provider '{provider_name}', trying OpenAI-compatible mode")
-            return OpenAIProvider(**kwargs)
+        def open_stream(candidate: str, provider: LLMProvider) -> AsyncIterator:
+            return self._observed_stream(
+                candidate,
+                provider.stream(
+                    messages=messages,
+                    tools=tools,
+                    max_tokens=max_tokens,
+                    **self.extra_params,  # Pass enable_search and other params
+                ),
+            )
+
+        backup = None
+        if hedge and self.hedge_requests and self.fallback_manager:
+            backup = self.fallback_manager.peek_next_model()
+
+        if backup is None:
+            async for response in open_stream(model, self.provider):
+                yield model, response
+            return
+
+        primary_provider = self.provider
+        backup_provider = self._get_provider(backup)
+        candidates = [
+            (model, lambda: open_stream(model, primary_provider)),
+            (backup, lambda: open_stream(backup, backup_provider)),
+        ]
+
+        first = True
+        async for winner, response in hedged_stream(candidates, self.health.hedge_delay(model)):
+            if first and winner != model:
+                logger.info(f"Hedged request to {winner} beat {model}, switching for this turn")
+                self._use_model(winner)
+                self.fallback_manager.current_index = self.fallback_chain.get_models().index(winner)
+            first = False
+            yield winner, response
+
+    @staticmethod
+    async def _execute_after(previous: asyncio.Task | None, tool: AgentTool, arguments: dict) -> Any:
+        """Execute a tool once the previously started call has finished"""
+        if previous is not None:
+            await asyncio.wait([previous])
+        return await tool.execute(arguments)
+
+    def _tool_use_event(self, tc: dict) -> AgentEvent:
+        """tool_use event for a tool call"""
+        formatted_use = self.tool_formatter.format_tool_use(tc["name"], tc["arguments"])
+        return AgentEvent(
+            "tool_use",
+            {
+                "tool": tc["name"],
+                "input": tc["arguments"],
+                "formatted": formatted_use,
+            },
+        )
 
     async def run_turn(
         self,
@@ -340,7 +507,7 @@ class MultiProviderRuntime:
             # Execute with queue management
             # Note: generators can't be wrapped directly in enqueue_both,
             # so we track execution but don't enforce hard queuing for streaming
-            logger.info(f"Executing turn with queue management for session {session_id}")
+            logger.debug("Executing turn with queue management for session %s", session_id)
             async for event in self._run_turn_internal(session, message, tools, max_tokens, images, system_prompt):
                 yield event
         else:
@@ -360,7 +527,7 @@ class MultiProviderRuntime:
         # Inject system prompt at the start of the session (only if no messages yet)
         if system_prompt and len(session.messages) == 0:
             session.add_system_message(system_prompt)
-            logger.info(f"✨ System prompt injected ({len(system_prompt)} chars)")
+            logger.debug("✨ System prompt injected (%d chars)", len(system_prompt))
         
         # Add user message (with images if provided)
         if images:
@@ -377,13 +544,16 @@ class MultiProviderRuntime:
             session.add_user_message(message)
 
         # Check context window and compact if needed
-        if self.compaction_manager and self.enable_context_management:
+        if self.summary_compactor:
+            # Summarizes in the background; this turn uses the last summary + tail
+            self.summary_compactor.schedule(session)
+        elif self.compaction_manager and self.enable_context_management:
             messages_for_api = session.get_messages_for_api()
             current_tokens = self.token_analyzer.estimate_messages_tokens(messages_for_api)
             window = self.context_manager.check_context(current_tokens)
 
             if window.should_compress:
-                logger.info(f"Context at {current_tokens}/{window.total_tokens} tokens, compacting")
+                logger.info("Context at %d/%d tokens, compacting", current_tokens, window.total_tokens)
                 # Use advanced compaction
                 target_tokens = int(window.total_tokens * 0.7)  # Use 70% of window
                 compacted = self.compaction_manager.compact(messages_for_api, target_tokens)
@@ -423,9 +593,38 @@ class MultiProviderRuntime:
         await self._notify_observers(event)
         yield event
 
+        # Start each turn on the first model whose circuit isn't open
+        if self.fallback_manager:
+            self._use_model(self.fallback_manager.select_model())
+
+        # Smart image loading: Only load images explicitly referenced in prompts
+        # Based on openclaw TypeScript: src/agents/pi-embedded-runner/run/images.ts
+        # Done once per turn; providers get the encoded images from the image prep cache
+        images_to_use = None
+        if images:
+            index = self._image_indexes.get(session.session_id)
+            if index is None:
+                index = self._image_indexes[session.session_id] = HistoryImageIndex()
+
+            image_data = smart_load_images(
+                current_prompt=message,
+                history_messages=session.messages,
+                existing_images=images,
+                history_index=index,
+            )
+            images_to_use = image_data["current_images"]
+
+            if image_data["loaded_count"] > 0 or image_data["skipped_count"] > 0:
+                logger.info(
+                    f"Smart image loading: {image_data['loaded_count']} loaded, "
+                    f"{image_data['skipped_count']} skipped"
+                )
+
         # Execute with retry logic and failover
         retry_count = 0
         thinking_state = {}  # State for streaming thinking extraction
+        # Tool call id -> execution started before the response finished
+        started_tools: dict[str, asyncio.Task] = {}
 
         while retry_count <= self.max_retries:
             try:
@@ -433,34 +632,8 @@ class MultiProviderRuntime:
                 current_model = self.model_str
                 if self.fallback_manager:
                     current_model = self.fallback_manager.get_current_model()
-                    logger.info(f"Using model: {current_model}")
+                    logger.debug("Using model: %s", current_model)
 
-                # Smart image loading: Only load images explicitly referenced in prompts
-                # Based on openclaw TypeScript: src/agents/pi-embedded-runner/run/images.ts
-                from openclaw.agents.image_loader import smart_load_images
-                
-                # Apply smart image loading if images are provided
-                images_to_use = None
-                if images:
-                    # Convert session messages to dict format for image loader
-                    history_messages = [
-                        {"role": msg.role, "content": msg.content, "images": msg.images}
-                        for msg in session.messages
-                    ] if session else []
-                    
-                    image_data = smart_load_images(
-                        current_prompt=prompt,
-                        history_messages=history_messages,
-                        existing_images=images
-                    )
-                    images_to_use = image_data["current_images"]
-                    
-                    if image_data["loaded_count"] > 0 or image_data["skipped_count"] > 0:
-                        logger.info(
-                            f"Smart image loading: {image_data['loaded_count']} loaded, "
-                            f"{image_data['skipped_count']} skipped"
-                        )
-                
                 # Convert session messages to LLM format
                 # CRITICAL: Only attach images to the LAST message (current turn)
                 # IMPORTANT: Limit history to prevent context overflow
@@ -468,8 +641,11 @@ class MultiProviderRuntime:
                 
                 all_messages = session.get_messages()
                 
+                if self.summary_compactor:
+                    # Token-bounded: system + summary of older turns + recent tail
+                    messages_to_send = self.summary_compactor.build_messages(session)
                 # If too many messages, keep system message + recent history
-                if len(all_messages) > MAX_HISTORY_MESSAGES:
+                elif len(all_messages) > MAX_HISTORY_MESSAGES:
                     # Separate system messages from conversation
                     system_msgs = [m for m in all_messages if m.role == "system"]
                     conversation_msgs = [m for m in all_messages if m.role != "system"]
@@ -497,21 +673,21 @@ class MultiProviderRuntime:
                     llm_messages.append(LLMMessage(role=msg.role, content=msg.content, images=msg_images))
                 
                 # DEBUG: Log message count and content
-                logger.info(f"📝 Sending {len(llm_messages)} message(s) to provider")
-                if len(llm_messages) <= 5:
-                    # Log all messages if few
-                    for idx, llm_msg in enumerate(llm_messages):
-                        content_preview = llm_msg.content[:50] if llm_msg.content and len(llm_msg.content) > 50 else llm_msg.content
-                        logger.info(f"  [{idx}] {llm_msg.role}: {repr(content_preview)}{'...' if llm_msg.content and len(llm_msg.content) > 50 else ''}")
-                else:
-                    # Log first and last few if many
-                    for idx in [0, 1, len(llm_messages)-2, len(llm_messages)-1]:
-                        if 0 <= idx < len(llm_messages):
-                            llm_msg = llm_messages[idx]
-                            content_preview = llm_msg.content[:50] if llm_msg.content and len(llm_msg.content) > 50 else llm_msg.content
-                            logger.info(f"  [{idx}] {llm_msg.role}: {repr(content_preview)}{'...' if llm_msg.content and len(llm_msg.content) > 50 else ''}")
-                    if len(llm_messages) > 4:
-                        logger.info(f"  ... ({len(llm_messages) - 4} more messages) ...")
+                logger.info("📝 Sending %d message(s) to provider", len(llm_messages))
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Previews of the first and last few messages
+                    if len(llm_messages) <= 5:
+                        preview_indexes = range(len(llm_messages))
+                    else:
+                        preview_indexes = [0, 1, len(llm_messages) - 2, len(llm_messages) - 1]
+                    for idx in preview_indexes:
+                        llm_msg = llm_messages[idx]
+                        content = llm_msg.content or ""
+                        logger.debug(
+                            "  [%d] %s: %r%s", idx, llm_msg.role, content[:50], "..." if len(content) > 50 else ""
+                        )
+                    if len(llm_messages) > 5:
+                        logger.debug("  ... (%d more messages) ...", len(llm_messages) - 4)
 
                 # Format tools for provider
                 tools_param = None
@@ -534,11 +710,8 @@ class MultiProviderRuntime:
                 tool_calls = []
                 needs_tool_response = False
 
-                async for response in self.provider.stream(
-                    messages=llm_messages, 
-                    tools=tools_param, 
-                    max_tokens=max_tokens,
-                    **self.extra_params  # Pass enable_search and other params
+                async for current_model, response in self._stream_with_health(
+                    current_model, llm_messages, tools_param, max_tokens
                 ):
                     if response.type == "text_delta":
                         text = response.content
@@ -581,32 +754,42 @@ class MultiProviderRuntime:
                             await self._notify_observers(event)
                             yield event
 
+                    elif response.type == "tool_call_ready":
+                        # Arguments of one call are complete: start it while the
+                        # model keeps streaming; results are collected on tool_call
+                        if not self.early_tool_dispatch:
+                            continue
+                        for tc in response.tool_calls or []:
+                            tool = next((t for t in tools if t.name == tc["name"]), None)
+                            if tool and tc.get("id") and tc["id"] not in started_tools:
+                                event = self._tool_use_event(tc)
+                                await self._notify_observers(event)
+                                yield event
+                                # Calls may depend on earlier ones: run in order
+                                previous = next(reversed(started_tools.values()), None)
+                                started_tools[tc["id"]] = asyncio.create_task(
+                                    self._execute_after(previous, tool, tc["arguments"])
+                                )
+
                     elif response.type == "tool_call":
                         tool_calls = response.tool_calls or []
 
-                        # Execute tools
+                        # Execute tools (or wait for those already started)
                         for tc in tool_calls:
                             tool = next((t for t in tools if t.name == tc["name"]), None)
                             if tool:
-                                # Format tool use
-                                formatted_use = self.tool_formatter.format_tool_use(
-                                    tc["name"], tc["arguments"]
-                                )
-
-                                event = AgentEvent(
-                                    "tool_use",
-                                    {
-                                        "tool": tc["name"],
-                                        "input": tc["arguments"],
-                                        "formatted": formatted_use,
-                                    },
-                                )
-                                await self._notify_observers(event)
-                                yield event
+                                started = started_tools.pop(tc.get("id"), None)
+                                if started is None:
+                                    event = self._tool_use_event(tc)
+                                    await self._notify_observers(event)
+                                    yield event
 
                                 # Execute tool
                                 try:
-                                    result = await tool.execute(tc["arguments"])
+                                    if started is not None:
+                                        result = await started
+                                    else:
+                                        result = await tool.execute(tc["arguments"])
                                     success = result.success if result else False
                                     output = result.content if result else "No output"
 
@@ -660,7 +843,7 @@ class MultiProviderRuntime:
                                             )
                                             await self._notify_observers(file_event)
                                             yield file_event
-                                            logger.info(f"📎 File generated and event emitted: {Path(file_path).name}")
+                                            logger.info("📎 File generated and event emitted: %s", Path(file_path).name)
 
                                     # Add tool result to session
                                     session.add_tool_message(
@@ -713,7 +896,7 @@ class MultiProviderRuntime:
                         # If there were tool calls, we need to continue the conversation
                         # to let the model generate a response based on tool results
                         if tool_calls:
-                            logger.info(f"Tool calls completed, will request final response from model")
+                            logger.debug("Tool calls completed, will request final response from model")
                             needs_tool_response = True
                             # Don't break yet - we'll make another API call after this loop
                         else:
@@ -750,11 +933,8 @@ class MultiProviderRuntime:
                     # Stream the final response WITHOUT tools (to prevent infinite loop)
                     # The model should now generate a text response based on tool results
                     # IMPORTANT: Pass empty list [] instead of None to truly disable tools
-                    async for response in self.provider.stream(
-                        messages=llm_messages, 
-                        tools=[], 
-                        max_tokens=max_tokens,
-                        **self.extra_params  # Pass enable_search and other params
+                    async for _, response in self._stream_with_health(
+                        current_model, llm_messages, [], max_tokens, hedge=False
                     ):
                         if response.type == "text_delta":
                             text = response.content
@@ -816,11 +996,10 @@ class MultiProviderRuntime:
                     if should_failover:
                         next_model = self.fallback_manager.get_next_model()
                         if next_model:
-                            logger.info(f"Failing over from {current_model} to {next_model}")
+                            logger.info("Failing over from %s to %s", current_model, next_model)
 
                             # Update provider for new model
-                            self.provider_name, self.model_name = self._parse_model(next_model)
-                            self.provider = self._create_provider()
+                            self._use_model(next_model)
 
                             event = AgentEvent(
                                 "failover",
@@ -888,6 +1067,12 @@ class MultiProviderRuntime:
 
                 await asyncio.sleep(delay)
 
+            finally:
+                # Tools started early for a response that didn't complete
+                for task in started_tools.values():
+                    task.cancel()
+                started_tools.clear()
+
 
 # Alias for backward compatibility
 AgentRuntime = MultiProviderRuntime
@@ -13,6 +13,8 @@ from .docker import (
 from .constants import DEFAULT_SANDBOX_IMAGE, SANDBOX_AGENT_WORKSPACE_MOUNT
 from .config_hash import compute_sandbox_config_hash
 from .registry import SandboxRegistry, get_sandbox_registry
+from .engine import DockerEngineClient, DockerEngineError, get_docker_engine
+from .pool import PooledContainer, SandboxPool, get_sandbox_pool
 
 __all__ = [
     "DockerSandbox",
@@ -25,4 +27,10 @@ __all__ = [
     "compute_sandbox_config_hash",
     "SandboxRegistry",
     "get_sandbox_registry",
+    "DockerEngineClient",
+    "DockerEngineError",
+    "get_docker_engine",
+    "PooledContainer",
+    "SandboxPool",
+    "get_sandbox_pool",
 ]
@@ -317,6 +317,18 @@ class DockerSandbox:
         if not self.container_name or not self._started:
             raise RuntimeError("Sandbox not started")
         
+        # Prefer the Engine API (no CLI process per command)
+        from .engine import get_docker_engine
+        
+        engine = get_docker_engine()
+        if engine is not None:
+            timeout_ms = kwargs.get("timeout_ms")
+            return await engine.exec(
+                self.container_name,
+                ["sh", "-c", cmd],
+                timeout=timeout_ms / 1000 if timeout_ms else None,
+            )
+        
         # Build exec command
         args = ["exec", self.container_name, "sh", "-c", cmd]
         
@@ -0,0 +1,378 @@
+"""Docker Engine API client over the Unix socket
+
+Talks to dockerd directly (``/var/run/docker.sock`` or ``DOCKER_HOST``)
+instead of forking the ``docker`` CLI for every operation, which removes a
+process spawn and CLI startup from each sandboxed command.
+
+Only the handful of endpoints the sandbox needs are implemented:
+image inspect/pull, containers (create/start/remove/inspect), exec, and
+archive upload/download.
+"""
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import logging
+import os
+import re
+import struct
+import tarfile
+from pathlib import Path
+from typing import Any
+
+from .constants import SANDBOX_AGENT_WORKSPACE_MOUNT
+from .docker import DockerSandboxConfig, normalize_docker_limit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+DOCKER_API_VERSION = "v1.41"
+
+# Multiplexed stream header: stream type (1 byte), 3 padding, size (uint32 BE)
+_STREAM_HEADER = struct.Struct(">BxxxI")
+_STDOUT = 1
+_STDERR = 2
+
+_MEMORY_UNITS = {"": 1, "b": 1, "k": 1024, "m": 1024**2, "g": 1024**3}
+
+
+def docker_socket_path() -> Path | None:
+    """Resolve the Docker Engine Unix socket, or None if not available"""
+    host = os.environ.get("DOCKER_HOST", "")
+    if host.startswith("unix://"):
+        path = Path(host[len("unix://"):])
+    elif host:
+        return None  # tcp:// etc. - not supported, use the CLI
+    else:
+        path = Path(DEFAULT_DOCKER_SOCKET)
+    return path if path.exists() else None
+
+
+def parse_memory_limit(value: str | int | None) -> int | None:
+    """Convert a Docker memory limit ("512m", "1g") to bytes"""
+    normalized = normalize_docker_limit(value)
+    if normalized is None:
+        return None
+    match = re.fullmatch(r"(\d+)\s*([bkmg]?)b?", normalized.lower())
+    if not match:
+        raise ValueError(f"Invalid memory limit: {value}")
+    return int(match.group(1)) * _MEMORY_UNITS[match.group(2)]
+
+
+def demux_stream(data: bytes) -> tuple[bytes, bytes]:
+    """Split a multiplexed exec/attach stream into (stdout, stderr)"""
+    stdout = bytearray()
+    stderr = bytearray()
+    offset = 0
+    while offset + _STREAM_HEADER.size <= len(data):
+        stream, size = _STREAM_HEADER.unpack_from(data, offset)
+        offset += _STREAM_HEADER.size
+        chunk = data[offset:offset + size]
+        offset += size
+        if stream == _STDERR:
+            stderr += chunk
+        else:
+            stdout += chunk
+    return bytes(stdout), bytes(stderr)
+
+
+def build_create_body(
+    config: DockerSandboxConfig,
+    workspace_dir: Path | None = None,
+    cmd: list[str] | None = None,
+    labels: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """
+    Engine API container create body equivalent to ``DockerSandbox.start``
+
+    Args:
+        config: Sandbox configuration
+        workspace_dir: Host workspace to mount at SANDBOX_AGENT_WORKSPACE_MOUNT
+        cmd: Container command (defaults to an idle process)
+        labels: Container labels
+    """
+    host_config: dict[str, Any] = {"NetworkMode": config.network_mode}
+
+    memory = parse_memory_limit(config.memory)
+    if memory:
+        host_config["Memory"] = memory
+
+    cpus = normalize_docker_limit(config.cpus)
+    if cpus:
+        host_config["NanoCpus"] = int(float(cpus) * 1e9)
+
+    if config.cpu_shares:
+        host_config["CpuShares"] = config.cpu_shares
+
+    if config.ulimits:
+        ulimits = []
+        for name, limits in config.ulimits.items():
+            soft = limits.get("soft")
+            if soft is not None:
+                ulimits.append({"Name": name, "Soft": soft, "Hard": limits.get("hard", soft)})
+        if ulimits:
+            host_config["Ulimits"] = ulimits
+
+    binds = []
+    if workspace_dir and config.workspace_access != "none":
+        mount_mode = "ro" if config.workspace_access == "read-only" else "rw"
+        binds.append(f"{workspace_dir}:{SANDBOX_AGENT_WORKSPACE_MOUNT}:{mount_mode}")
+    for host_path, container_path in config.volumes.items():
+        binds.append(f"{host_path}:{container_path}")
+    if binds:
+        host_config["Binds"] = binds
+
+    return {
+        "Image": config.image,
+        "Cmd": cmd or ["tail", "-f", "/dev/null"],
+        "Env": [f"{key}={value}" for key, value in config.env.items()],
+        "Labels": labels or {},
+        "HostConfig": host_config,
+    }
+
+
+def make_tar(files: dict[str, bytes]) -> bytes:
+    """Build an in-memory tar archive from {relative path: content}"""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(content)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def read_tar(data: bytes, strip_root: bool = True) -> dict[str, bytes]:
+    """Extract regular files from a tar archive into {relative path: content}"""
+    files: dict[str, bytes] = {}
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r") as tar:
+        for member in tar.getmembers():
+            if not member.isfile():
+                continue
+            name = member.name
+            if strip_root and "/" in name:
+                # get_archive prefixes entries with the requested directory name
+                name = name.split("/", 1)[1]
+            extracted = tar.extractfile(member)
+            if extracted is not None:
+                files[name] = extracted.read()
+    return files
+
+
+class DockerEngineError(RuntimeError):
+    """Docker Engine API request failed"""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class DockerEngineClient:
+    """
+    Minimal async Docker Engine API client
+
+    Example:
+        engine = DockerEngineClient()
+        container_id = await engine.create_container(build_create_body(config))
+        await engine.start_container(container_id)
+        result = await engine.exec(container_id, ["sh", "-c", "echo hi"])
+    """
+
+    def __init__(self, socket_path: Path | str | None = None, api_version: str = DOCKER_API_VERSION):
+        resolved = Path(socket_path) if socket_path else docker_socket_path()
+        if resolved is None:
+            raise DockerEngineError("Docker Engine socket not found")
+        self.socket_path = resolved
+        self.api_version = api_version
+        self._client = None
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether a Docker Engine Unix socket is reachable on this host"""
+        return docker_socket_path() is not None
+
+    def _http(self):
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=str(self.socket_path)),
+                base_url=f"http://docker/{self.api_version}",
+                timeout=None,
+            )
+        return self._client
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        expected: tuple[int, ...] = (200, 201, 204),
+        **kwargs: Any,
+    ):
+        response = await self._http().request(method, path, **kwargs)
+        if response.status_code not in expected:
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            raise DockerEngineError(
+                f"{method} {path} failed ({response.status_code}): {message}",
+                status_code=response.status_code,
+            )
+        return response
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # ------------------------------------------------------------------
+    # Images / containers
+    # ------------------------------------------------------------------
+
+    async def ping(self) -> bool:
+        try:
+            await self._request("GET", "/_ping")
+            return True
+        except Exception:
+            return False
+
+    async def image_exists(self, image: str) -> bool:
+        response = await self._request("GET", f"/images/{image}/json", expected=(200, 404))
+        return response.status_code == 200
+
+    async def pull_image(self, image: str) -> None:
+        # Without a tag the API pulls every tag of the repository
+        name, _, tag = image.rpartition(":")
+        if "@" in image or not name or "/" in tag:
+            params = {"fromImage": image}
+            if "@" not in image:
+                params["tag"] = "latest"
+        else:
+            params = {"fromImage": name, "tag": tag}
+        response = await self._request("POST", "/images/create", params=params)
+        # Pull failures arrive as an "error" line in a 200 progress stream
+        for line in response.text.splitlines():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict) and event.get("error"):
+                raise DockerEngineError(f"Pulling {image} failed: {event['error']}")
+
+    async def create_container(self, body: dict[str, Any], name: str | None = None) -> str:
+        params = {"name": name} if name else None
+        response = await self._request("POST", "/containers/create", params=params, json=body)
+        return response.json()["Id"]
+
+    async def start_container(self, container_id: str) -> None:
+        await self._request("POST", f"/containers/{container_id}/start", expected=(204, 304))
+
+    async def remove_container(self, container_id: str) -> None:
+        await self._request(
+            "DELETE",
+            f"/containers/{container_id}",
+            params={"force": "true", "v": "true"},
+            expected=(204, 404),
+        )
+
+    async def container_state(self, container_id: str) -> dict[str, bool]:
+        response = await self._request(
+            "GET", f"/containers/{container_id}/json", expected=(200, 404)
+        )
+        if response.status_code == 404:
+            return {"exists": False, "running": False}
+        return {"exists": True, "running": bool(response.json()["State"]["Running"])}
+
+    # ------------------------------------------------------------------
+    # Exec
+    # ------------------------------------------------------------------
+
+    async def exec(
+        self,
+        container_id: str,
+        cmd: list[str],
+        workdir: str | None = None,
+        env: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run a command in a running container
+
+        Returns:
+            Dict with stdout, stderr, exit_code, success, timed_out
+        """
+        body: dict[str, Any] = {"AttachStdout": True, "AttachStderr": True, "Cmd": cmd}
+        if workdir:
+            body["WorkingDir"] = workdir
+        if env:
+            body["Env"] = [f"{key}={value}" for key, value in env.items()]
+
+        created = await self._request("POST", f"/containers/{container_id}/exec", json=body)
+        exec_id = created.json()["Id"]
+
+        try:
+            response = await asyncio.wait_for(
+                self._request(
+                    "POST", f"/exec/{exec_id}/start", json={"Detach": False, "Tty": False}
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            return {
+                "stdout": "",
+                "stderr": f"Execution timed out after {timeout}s",
+                "exit_code": -1,
+                "success": False,
+                "timed_out": True,
+            }
+
+        stdout, stderr = demux_stream(response.content)
+        inspect = await self._request("GET", f"/exec/{exec_id}/json")
+        exit_code = inspect.json().get("ExitCode")
+        exit_code = -1 if exit_code is None else exit_code
+        return {
+            "stdout": stdout.decode("utf-8", errors="replace"),
+            "stderr": stderr.decode("utf-8", errors="replace"),
+            "exit_code": exit_code,
+            "success": exit_code == 0,
+            "timed_out": False,
+        }
+
+    # ------------------------------------------------------------------
+    # Archives
+    # ------------------------------------------------------------------
+
+    async def put_files(self, container_id: str, path: str, files: dict[str, bytes]) -> None:
+        """Upload files into ``path`` (must exist) as one tar archive"""
+        await self._request(
+            "PUT",
+            f"/containers/{container_id}/archive",
+            params={"path": path},
+            content=make_tar(files),
+            headers={"Content-Type": "application/x-tar"},
+        )
+
+    async def get_files(self, container_id: str, path: str) -> dict[str, bytes]:
+        """Download the regular files under ``path``"""
+        response = await self._request(
+            "GET", f"/containers/{container_id}/archive", params={"path": path},
+            expected=(200, 404),
+        )
+        if response.status_code == 404:
+            return {}
+        return read_tar(response.content)
+
+
+# Global engine client (None when the socket is unavailable)
+_engine: DockerEngineClient | None = None
+
+
+def get_docker_engine() -> DockerEngineClient | None:
+    """Get the shared Docker Engine client, or None to fall back to the CLI"""
+    global _engine
+    if _engine is None and DockerEngineClient.available():
+        _engine = DockerEngineClient()
+    return _engine
@@ -0,0 +1,323 @@
+"""Warm sandbox container pool
+
+Keeps pre-started containers per image/limits profile so an execution only
+pays for a Docker exec, not a container create + start. Containers are
+handed out per session, their workspace is wiped between users, and they
+are recycled after ``max_executions`` uses or after a policy violation
+(timeout, failed reset) so state never leaks for long. Session leases
+that sit unused for ``lease_idle_timeout`` seconds go back to the pool.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .config_hash import compute_sandbox_config_hash
+from .constants import SANDBOX_AGENT_WORKSPACE_MOUNT
+from .docker import DockerSandboxConfig
+from .engine import DockerEngineClient, build_create_body, get_docker_engine
+
+logger = logging.getLogger(__name__)
+
+POOL_LABEL = "openclaw.sandbox.pool"
+
+
+@dataclass
+class PooledContainer:
+    """A warm container owned by the pool"""
+
+    container_id: str
+    profile: str
+    created_at: float = field(default_factory=time.time)
+    executions: int = 0
+    last_used: float = field(default_factory=time.time)
+    session_key: str | None = None
+    retire: bool = False  # recycle instead of returning to the idle set
+
+
+class SandboxPool:
+    """
+    Pool of pre-started sandbox containers
+
+    Example:
+        pool = get_sandbox_pool()
+        container = await pool.acquire(config, session_key="agent:main")
+        result = await pool.exec(container, ["python", "script.py"], timeout=30)
+        await pool.release(container)
+    """
+
+    def __init__(
+        self,
+        engine: DockerEngineClient | None = None,
+        warm_size: int = 2,
+        max_executions: int = 50,
+        workdir: str = SANDBOX_AGENT_WORKSPACE_MOUNT,
+        lease_idle_timeout: float = 600.0,
+    ):
+        """
+        Initialize pool
+
+        Args:
+            engine: Docker Engine client (defaults to the shared client)
+            warm_size: Idle containers kept per profile
+            max_executions: Executions before a container is recycled
+            workdir: In-container working directory reset between uses
+            lease_idle_timeout: Seconds an unused session lease is kept
+        """
+        self._engine = engine
+        self.warm_size = warm_size
+        self.max_executions = max_executions
+        self.workdir = workdir
+        self.lease_idle_timeout = lease_idle_timeout
+        self._configs: dict[str, DockerSandboxConfig] = {}
+        self._idle: dict[str, deque[PooledContainer]] = {}
+        self._leases: dict[tuple[str, str], PooledContainer] = {}
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+        self._warming: set[str] = set()
+        self._images: set[str] = set()
+        self._stats = {"hits": 0, "misses": 0, "recycled": 0, "created": 0}
+
+    @property
+    def engine(self) -> DockerEngineClient:
+        if self._engine is None:
+            self._engine = get_docker_engine()
+            if self._engine is None:
+                raise RuntimeError("Docker Engine socket not available")
+        return self._engine
+
+    def _profile(self, config: DockerSandboxConfig) -> str:
+        profile = compute_sandbox_config_hash(config.to_dict())
+        self._configs.setdefault(profile, config)
+        return profile
+
+    # ------------------------------------------------------------------
+    # Container lifecycle
+    # ------------------------------------------------------------------
+
+    async def _ensure_image(self, image: str) -> None:
+        if image in self._images:
+            return
+        if not await self.engine.image_exists(image):
+            logger.info(f"Pulling sandbox image {image}")
+            await self.engine.pull_image(image)
+        self._images.add(image)
+
+    async def _create(self, profile: str) -> PooledContainer:
+        await self._ensure_image(self._configs[profile].image)
+        body = build_create_body(self._configs[profile], labels={POOL_LABEL: profile})
+        body["WorkingDir"] = self.workdir
+        name = f"openclaw-pool-{profile[:8]}-{uuid.uuid4().hex[:8]}"
+        container_id = await self.engine.create_container(body, name=name)
+        try:
+            await self.engine.start_container(container_id)
+        except Exception:
+            await self.engine.remove_container(container_id)
+            raise
+        self._stats["created"] += 1
+        logger.debug(f"Started pooled sandbox container {name}")
+        return PooledContainer(container_id=container_id, profile=profile)
+
+    async def _destroy(self, container: PooledContainer) -> None:
+        try:
+            await self.engine.remove_container(container.container_id)
+        except Exception as e:
+            logger.warning(f"Error removing pooled container {container.container_id}: {e}")
+
+    async def _reset(self, container: PooledContainer) -> bool:
+        """Wipe the workspace; False if the container should be recycled"""
+        try:
+            result = await self.engine.exec(
+                container.container_id,
+                ["find", self.workdir, "-mindepth", "1", "-delete"],
+                timeout=10,
+            )
+        except Exception as e:
+            logger.warning(f"Workspace reset failed for {container.container_id}: {e}")
+            return False
+        return result["success"]
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _replenish(self, profile: str) -> None:
+        """Top the idle set for a profile back up to warm_size"""
+        if profile in self._warming:
+            return
+        self._warming.add(profile)
+        try:
+            while len(self._idle.setdefault(profile, deque())) < self.warm_size:
+                try:
+                    container = await self._create(profile)
+                except Exception as e:
+                    logger.warning(f"Failed to warm sandbox container: {e}")
+                    return
+                self._idle[profile].append(container)
+        finally:
+            self._warming.discard(profile)
+
+    def _reap_idle_leases(self) -> None:
+        """Release session leases unused for ``lease_idle_timeout``; call under the lock"""
+        cutoff = time.time() - self.lease_idle_timeout
+        for key, container in list(self._leases.items()):
+            if container.last_used < cutoff:
+                del self._leases[key]
+                self._spawn(self.release(container))
+
+    async def _recycle(self, container: PooledContainer) -> None:
+        self._stats["recycled"] += 1
+        await self._destroy(container)
+        await self._replenish(container.profile)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def warm(self, config: DockerSandboxConfig) -> None:
+        """Pre-start ``warm_size`` containers for a profile"""
+        await self._replenish(self._profile(config))
+
+    async def acquire(
+        self,
+        config: DockerSandboxConfig,
+        session_key: str | None = None,
+    ) -> PooledContainer:
+        """
+        Get a container for a profile
+
+        With a session key the same container is returned on every call
+        until ``release_session``, recycling, or ``lease_idle_timeout``
+        seconds without use, so a session keeps its workspace between
+        executions.
+
+        Args:
+            config: Sandbox configuration (image and limits)
+            session_key: Optional session for a sticky lease
+
+        Returns:
+            Pooled container
+        """
+        profile = self._profile(config)
+        async with self._lock:
+            self._reap_idle_leases()
+            if session_key:
+                leased = self._leases.get((profile, session_key))
+                if leased and not leased.retire:
+                    leased.last_used = time.time()
+                    return leased
+
+            idle = self._idle.setdefault(profile, deque())
+            if idle:
+                container = idle.popleft()
+                self._stats["hits"] += 1
+            else:
+                container = None
+                self._stats["misses"] += 1
+
+        if container is None:
+            container = await self._create(profile)
+        self._spawn(self._replenish(profile))
+
+        container.session_key = session_key
+        container.last_used = time.time()
+        if session_key:
+            async with self._lock:
+                stale = self._leases.get((profile, session_key))
+                self._leases[(profile, session_key)] = container
+            if stale is not None and stale is not container:
+                self._stats["recycled"] += 1
+                await self._destroy(stale)
+        return container
+
+    async def exec(
+        self,
+        container: PooledContainer,
+        cmd: list[str],
+        timeout: float | None = None,
+        env: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Run a command in a pooled container, tracking recycle conditions"""
+        container.executions += 1
+        container.last_used = time.time()
+        result = await self.engine.exec(
+            container.container_id, cmd, workdir=self.workdir, env=env, timeout=timeout
+        )
+        container.last_used = time.time()
+        if result.get("timed_out"):
+            # The process may still be running in there
+            container.retire = True
+        if container.executions >= self.max_executions:
+            container.retire = True
+        return result
+
+    async def release(self, container: PooledContainer, violated: bool = False) -> None:
+        """
+        Return a container to the pool
+
+        Args:
+            container: Container from ``acquire``
+            violated: Policy violation observed; always recycle
+        """
+        if container.session_key:
+            async with self._lock:
+                key = (container.profile, container.session_key)
+                if self._leases.get(key) is container:
+                    del self._leases[key]
+            container.session_key = None
+
+        if violated or container.retire or not await self._reset(container):
+            await self._recycle(container)
+            return
+
+        async with self._lock:
+            idle = self._idle.setdefault(container.profile, deque())
+            if len(idle) < self.warm_size:
+                idle.append(container)
+                return
+        await self._destroy(container)
+
+    async def release_session(self, session_key: str) -> None:
+        """Release every container leased to a session"""
+        async with self._lock:
+            leased = [c for (_, key), c in self._leases.items() if key == session_key]
+        for container in leased:
+            await self.release(container)
+
+    async def close(self) -> None:
+        """Remove all pooled containers"""
+        for task in list(self._tasks):
+            task.cancel()
+        async with self._lock:
+            containers = [c for idle in self._idle.values() for c in idle]
+            containers.extend(self._leases.values())
+            self._idle.clear()
+            self._leases.clear()
+        for container in containers:
+            await self._destroy(container)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Pool statistics"""
+        return {
+            **self._stats,
+            "idle": {profile: len(idle) for profile, idle in self._idle.items()},
+            "leased": len(self._leases),
+        }
+
+
+# Global pool instance
+_pool: SandboxPool | None = None
+
+
+def get_sandbox_pool() -> SandboxPool:
+    """Get global sandbox pool instance"""
+    global _pool
+    if _pool is None:
+        _pool = SandboxPool()
+    return _pool
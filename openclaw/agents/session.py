@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import logging
+import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -13,6 +14,9 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from openclaw.agents.session_ids import generate_session_id, looks_like_session_id
+from openclaw.config.sessions.paths import resolve_session_db_path
+from openclaw.config.sessions.sqlite_store import SqliteSessionStore, get_sqlite_session_store
+from openclaw.media.attachments import release_session_attachments
 from openclaw.routing.session_key import (
     build_agent_main_session_key,
     build_agent_peer_session_key,
@@ -26,6 +30,7 @@ logger = logging.getLogger(__name__)
 class Message(BaseModel):
     """A single message in a conversation"""
 
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     role: str  # "user", "assistant", "system", "tool"
     content: str
     timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
@@ -189,13 +194,21 @@ class SessionManager:
     - Session key to session ID mapping
     """
 
-    def __init__(self, workspace_dir: Path, agent_id: str = "main"):
+    def __init__(
+        self,
+        workspace_dir: Path,
+        agent_id: str = "main",
+        session_store: SqliteSessionStore | None = None,
+    ):
         """
         Initialize session manager
 
         Args:
             workspace_dir: Base directory for session storage
             agent_id: Agent identifier (default: "main")
+            session_store: Keep the session key mapping in this SQLite
+                store (default: .sessions/sessions.db if it exists,
+                otherwise session_map.json)
         """
         self.workspace_dir = Path(workspace_dir)
         self.agent_id = normalize_agent_id(agent_id)
@@ -208,10 +221,17 @@ class SessionManager:
         sessions_dir = self.workspace_dir / ".sessions"
         sessions_dir.mkdir(parents=True, exist_ok=True)
         self._session_map_file = sessions_dir / "session_map.json"
+        if session_store is None:
+            db_path = resolve_session_db_path(self._session_map_file)
+            if db_path is not None:
+                session_store = get_sqlite_session_store(db_path)
+        self._session_store = session_store
         self._session_map: dict[str, str] = self._load_session_map()
 
     def _load_session_map(self) -> dict[str, str]:
         """Load session key -> session ID mapping."""
+        if self._session_store is not None:
+            return self._session_store.session_ids(self.agent_id)
         if self._session_map_file.exists():
             try:
                 with open(self._session_map_file) as f:
@@ -282,7 +302,10 @@ class SessionManager:
             # Store mapping if we have a session key
             if session_key:
                 self._session_map[session_key] = session_id
-                self._save_session_map()
+                if self._session_store is not None:
+                    self._session_store.set_session_id(session_key, session_id, channel=channel)
+                else:
+                    self._save_session_map()
                 logger.info(f"Created new session: {session_key} -> {session_id}")
         
         # Get or create session instance
@@ -357,11 +380,17 @@ class SessionManager:
         keys_to_remove = [k for k, v in self._session_map.items() if v == session_id]
         for key in keys_to_remove:
             del self._session_map[key]
+            if self._session_store is not None:
+                self._session_store.delete(key)
         
         if keys_to_remove:
-            self._save_session_map()
+            if self._session_store is None:
+                self._save_session_map()
             logger.info(f"Removed {len(keys_to_remove)} session key(s) for {session_id}")
 
+        # Attachments are held per session (keyed like the channel session id)
+        release_session_attachments(session_id)
+
         # Remove from disk
         session_file = self.workspace_dir / ".sessions" / f"{session_id}.json"
         if session_file.exists():
@@ -12,7 +12,7 @@ from __future__ import annotations
 import json
 import logging
 import uuid
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -55,6 +55,7 @@ class CompactionEntry(SessionEntry):
     removed_entries: list[str] = field(default_factory=list)
     tokens_before: int = 0
     tokens_after: int = 0
+    covered_messages: int | None = None  # session messages[:n] the summary stands for
 
 
 @dataclass
@@ -93,6 +94,16 @@ class CustomEntry(SessionEntry):
     data: dict[str, Any] = field(default_factory=dict)
 
 
+_ENTRY_TYPES: dict[str, type[SessionEntry]] = {
+    "message": MessageEntry,
+    "compaction": CompactionEntry,
+    "branch_summary": BranchSummaryEntry,
+    "model_change": ModelChangeEntry,
+    "thinking_level_change": ThinkingLevelChangeEntry,
+    "custom": CustomEntry,
+}
+
+
 class SessionTree:
     """
     Tree-based session storage with append-only JSONL format
@@ -150,22 +161,16 @@ class SessionTree:
     def _dict_to_entry(self, data: dict[str, Any]) -> SessionEntry:
         """Convert dictionary to entry object"""
         entry_type = data.get("type", "message")
-        
-        if entry_type == "message":
-            return MessageEntry(**{k: v for k, v in data.items() if k in MessageEntry.__annotations__})
-        elif entry_type == "compaction":
-            return CompactionEntry(**{k: v for k, v in data.items() if k in CompactionEntry.__annotations__})
-        elif entry_type == "branch_summary":
-            return BranchSummaryEntry(**{k: v for k, v in data.items() if k in BranchSummaryEntry.__annotations__})
-        elif entry_type == "model_change":
-            return ModelChangeEntry(**{k: v for k, v in data.items() if k in ModelChangeEntry.__annotations__})
-        elif entry_type == "thinking_level_change":
-            return ThinkingLevelChangeEntry(**{k: v for k, v in data.items() if k in ThinkingLevelChangeEntry.__annotations__})
-        elif entry_type == "custom":
-            return CustomEntry(**{k: v for k, v in data.items() if k in CustomEntry.__annotations__})
-        else:
-            # Unknown type, use SessionEntry base class
-            return SessionEntry(**{k: v for k, v in data.items() if k in SessionEntry.__annotations__})
+        entry_cls = _ENTRY_TYPES.get(entry_type, SessionEntry)
+
+        # Only pass init fields: inherited ones (id, parent_id, timestamp)
+        # are included, fixed ones (type on subclasses) are not
+        init_fields = {f.name for f in fields(entry_cls) if f.init}
+        entry = entry_cls(**{k: v for k, v in data.items() if k in init_fields})
+        if entry_cls is SessionEntry:
+            # Unknown type, keep the original type tag
+            entry.type = entry_type
+        return entry
     
     def append(self, entry: SessionEntry) -> None:
         """
@@ -227,6 +232,7 @@ class SessionTree:
         tokens_before: int,
         tokens_after: int,
         parent_id: str | None = None,
+        covered_messages: int | None = None,
     ) -> CompactionEntry:
         """
         Append compaction entry
@@ -237,6 +243,8 @@ class SessionTree:
             tokens_before: Token count before compaction
             tokens_after: Token count after compaction
             parent_id: Parent entry ID
+            covered_messages: Number of leading session messages the
+                summary stands for
             
         Returns:
             Created compaction entry
@@ -246,7 +254,8 @@ class SessionTree:
             summary=summary,
             removed_entries=removed_entries,
             tokens_before=tokens_before,
-            tokens_after=tokens_after
+            tokens_after=tokens_after,
+            covered_messages=covered_messages,
         )
         
         self.append(entry)
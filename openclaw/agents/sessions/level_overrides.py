@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Optional
 from pathlib import Path
 import json
 
+from openclaw.config.sessions.paths import resolve_session_db_path
+from openclaw.config.sessions.sqlite_store import SqliteSessionStore, get_sqlite_session_store
+
+_KIND = "level"
+
 
 @dataclass
 class LevelOverride:
@@ -20,12 +25,26 @@ class LevelOverride:
 class SessionLevelOverrides:
     """Manages session-level overrides."""
     
-    def __init__(self, storage_path: Optional[Path] = None):
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        session_store: Optional[SqliteSessionStore] = None
+    ):
         self.storage_path = storage_path or Path("./data/session_levels.json")
+        if session_store is None:
+            db_path = resolve_session_db_path(self.storage_path)
+            if db_path is not None:
+                session_store = get_sqlite_session_store(db_path)
+        self.session_store = session_store
         self.overrides: dict[str, LevelOverride] = {}
         self._load()
     
     def _load(self) -> None:
+        if self.session_store is not None:
+            for session_key, override_data in self.session_store.get_overrides(_KIND).items():
+                self.overrides[session_key] = LevelOverride(**override_data)
+            return
+        
         if not self.storage_path.exists():
             return
         
@@ -65,7 +84,10 @@ class SessionLevelOverrides:
             verbose_level=verbose_level,
             reasoning_level=reasoning_level
         )
-        self._save()
+        if self.session_store is not None:
+            self.session_store.set_override(session_key, _KIND, asdict(self.overrides[session_key]))
+        else:
+            self._save()
     
     def get_override(self, session_key: str) -> Optional[LevelOverride]:
         return self.overrides.get(session_key)
@@ -73,4 +95,7 @@ class SessionLevelOverrides:
     def clear_override(self, session_key: str) -> None:
         if session_key in self.overrides:
             del self.overrides[session_key]
-            self._save()
+            if self.session_store is not None:
+                self.session_store.clear_override(session_key, _KIND)
+            else:
+                self._save()
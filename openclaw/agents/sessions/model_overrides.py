@@ -5,11 +5,16 @@ Allows different sessions to use different models.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Optional
 from pathlib import Path
 import json
 
+from openclaw.config.sessions.paths import resolve_session_db_path
+from openclaw.config.sessions.sqlite_store import SqliteSessionStore, get_sqlite_session_store
+
+_KIND = "model"
+
 
 @dataclass
 class ModelOverride:
@@ -23,18 +28,34 @@ class ModelOverride:
 class SessionModelOverrides:
     """Manages session-level model overrides."""
     
-    def __init__(self, storage_path: Optional[Path] = None):
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        session_store: Optional[SqliteSessionStore] = None
+    ):
         """Initialize overrides manager.
         
         Args:
             storage_path: Path to store overrides (JSON file)
+            session_store: Keep overrides in this SQLite store instead
+                (default: a sessions.db next to storage_path, if any)
         """
         self.storage_path = storage_path or Path("./data/session_overrides.json")
+        if session_store is None:
+            db_path = resolve_session_db_path(self.storage_path)
+            if db_path is not None:
+                session_store = get_sqlite_session_store(db_path)
+        self.session_store = session_store
         self.overrides: dict[str, ModelOverride] = {}
         self._load()
     
     def _load(self) -> None:
         """Load overrides from storage."""
+        if self.session_store is not None:
+            for session_key, override_data in self.session_store.get_overrides(_KIND).items():
+                self.overrides[session_key] = ModelOverride(**override_data)
+            return
+        
         if not self.storage_path.exists():
             return
         
@@ -83,7 +104,10 @@ class SessionModelOverrides:
             model=model,
             think_level=think_level
         )
-        self._save()
+        if self.session_store is not None:
+            self.session_store.set_override(session_key, _KIND, asdict(self.overrides[session_key]))
+        else:
+            self._save()
     
     def get_override(self, session_key: str) -> Optional[ModelOverride]:
         """Get model override for session.
@@ -104,7 +128,10 @@ class SessionModelOverrides:
         """
         if session_key in self.overrides:
             del self.overrides[session_key]
-            self._save()
+            if self.session_store is not None:
+                self.session_store.clear_override(session_key, _KIND)
+            else:
+                self._save()
     
     def apply_override(
         self,
@@ -5,10 +5,14 @@ from __future__ import annotations
 
 
 import logging
+import time
+from collections import deque
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +45,9 @@ class ToolPolicy:
     - What arguments are allowed
     """
 
+    # Bumped whenever any policy is enabled/disabled so compiled tables rebuild
+    _generation = 0
+
     def __init__(self, name: str):
         """
         Initialize policy
@@ -51,6 +58,15 @@ class ToolPolicy:
         self.name = name
         self.enabled = True
 
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        ToolPolicy._generation += 1
+
     def evaluate(
         self, tool_name: str, arguments: dict[str, Any], context: dict[str, Any]
     ) -> PolicyDecision:
@@ -122,31 +138,33 @@ class RateLimitPolicy(ToolPolicy):
         self.max_calls = max_calls
         self.window_seconds = window_seconds
         self.per_tool = per_tool
-        self._call_history: dict[str, list[datetime]] = {}
+        # Sliding windows of monotonic call times, oldest first
+        self._call_history: dict[str, deque[float]] = {}
 
     def evaluate(self, tool_name: str, arguments: dict, context: dict) -> PolicyDecision:
         key = tool_name if self.per_tool else "global"
-        now = datetime.now(UTC)
+        now = time.monotonic()
 
-        # Initialize history
-        if key not in self._call_history:
-            self._call_history[key] = []
+        history = self._call_history.get(key)
+        if history is None:
+            history = self._call_history[key] = deque()
 
-        # Clean old entries
-        cutoff = now - timedelta(seconds=self.window_seconds)
-        self._call_history[key] = [ts for ts in self._call_history[key] if ts > cutoff]
+        # Drop calls that left the window (amortized O(1))
+        cutoff = now - self.window_seconds
+        while history and history[0] <= cutoff:
+            history.popleft()
 
         # Check limit
-        if len(self._call_history[key]) >= self.max_calls:
+        if len(history) >= self.max_calls:
             logger.warning(
                 f"Rate limit exceeded for {key}: "
-                f"{len(self._call_history[key])}/{self.max_calls} "
+                f"{len(history)}/{self.max_calls} "
                 f"in {self.window_seconds}s"
             )
             return PolicyDecision.DENY
 
         # Record this call
-        self._call_history[key].append(now)
+        history.append(now)
         return PolicyDecision.ALLOW
 
 
@@ -233,6 +251,57 @@ class ApprovalRequiredPolicy(ToolPolicy):
         return PolicyDecision.ALLOW
 
 
+@dataclass(frozen=True)
+class CompiledPolicies:
+    """
+    Immutable decision table built from a PolicyManager's policies
+
+    Static name-based policies (whitelist, blacklist, approval) collapse into
+    lookup tables; policies that depend on time, arguments or call history
+    stay in ``dynamic`` and run in order after the table lookup.
+    """
+
+    allowed: frozenset[str] | None  # Intersection of whitelists (None: no whitelist)
+    whitelist_name: str | None
+    denied: Mapping[str, str]  # tool -> deciding policy name
+    approval: Mapping[str, str]
+    dynamic: tuple[ToolPolicy, ...]
+
+    @classmethod
+    def from_policies(cls, policies: list[ToolPolicy]) -> CompiledPolicies:
+        allowed: frozenset[str] | None = None
+        whitelist_name = None
+        denied: dict[str, str] = {}
+        approval: dict[str, str] = {}
+        dynamic: list[ToolPolicy] = []
+
+        for policy in policies:
+            if not policy.enabled:
+                continue
+            # Exact type checks: subclasses may override evaluate()
+            policy_type = type(policy)
+            if policy_type is WhitelistPolicy:
+                tools = frozenset(policy.allowed_tools)
+                allowed = tools if allowed is None else allowed & tools
+                whitelist_name = whitelist_name or policy.name
+            elif policy_type is BlacklistPolicy:
+                for tool in policy.denied_tools:
+                    denied.setdefault(tool, policy.name)
+            elif policy_type is ApprovalRequiredPolicy:
+                for tool in policy.tools_requiring_approval:
+                    approval.setdefault(tool, policy.name)
+            else:
+                dynamic.append(policy)
+
+        return cls(
+            allowed=allowed,
+            whitelist_name=whitelist_name,
+            denied=MappingProxyType(denied),
+            approval=MappingProxyType(approval),
+            dynamic=tuple(dynamic),
+        )
+
+
 class PolicyManager:
     """
     Manage and enforce tool policies
@@ -242,6 +311,7 @@ class PolicyManager:
     - Policy chaining
     - Audit logging
     - Dynamic policy updates
+    - Policies compiled into a decision table (rebuilt when policies change)
 
     Example:
         manager = PolicyManager()
@@ -255,6 +325,24 @@ class PolicyManager:
         """Initialize policy manager"""
         self.policies: list[ToolPolicy] = []
         self._audit_log: list[dict[str, Any]] = []
+        self._compiled: CompiledPolicies | None = None
+        self._compiled_generation = -1
+        self._decisions = 0
+        self._decision_time = 0.0
+        self._max_decision_time = 0.0
+        self._compiles = 0
+
+    def invalidate(self) -> None:
+        """Rebuild the decision table on next evaluation (after editing a policy in place)"""
+        self._compiled = None
+
+    def compile(self) -> CompiledPolicies:
+        """Get the current decision table, compiling it if policies changed"""
+        if self._compiled is None or self._compiled_generation != ToolPolicy._generation:
+            self._compiled = CompiledPolicies.from_policies(self.policies)
+            self._compiled_generation = ToolPolicy._generation
+            self._compiles += 1
+        return self._compiled
 
     def add_policy(self, policy: ToolPolicy) -> None:
         """
@@ -264,6 +352,7 @@ class PolicyManager:
             policy: ToolPolicy instance
         """
         self.policies.append(policy)
+        self.invalidate()
         logger.info(f"Added policy: {policy.name}")
 
     def remove_policy(self, policy_name: str) -> bool:
@@ -279,6 +368,7 @@ class PolicyManager:
         for i, policy in enumerate(self.policies):
             if policy.name == policy_name:
                 self.policies.pop(i)
+                self.invalidate()
                 logger.info(f"Removed policy: {policy_name}")
                 return True
         return False
@@ -300,40 +390,61 @@ class PolicyManager:
         if context is None:
             context = {}
 
-        decisions = []
-
-        for policy in self.policies:
-            if not policy.enabled:
-                continue
+        started = time.perf_counter()
+        decision, policy_name = self._decide(self.compile(), tool_name, arguments, context)
+        elapsed = time.perf_counter() - started
+
+        self._decisions += 1
+        self._decision_time += elapsed
+        if elapsed > self._max_decision_time:
+            self._max_decision_time = elapsed
+
+        # Log decision
+        self._audit_log.append(
+            {
+                "timestamp": datetime.now(UTC).isoformat(),
+                "policy": policy_name,
+                "tool": tool_name,
+                "decision": decision.value,
+                "duration_us": round(elapsed * 1e6, 2),
+            }
+        )
 
+        if decision == PolicyDecision.DENY:
+            logger.warning(f"Tool {tool_name} DENIED by policies")
+        elif decision == PolicyDecision.REQUIRE_APPROVAL:
+            logger.info(f"Tool {tool_name} requires APPROVAL")
+        return decision
+
+    def _decide(
+        self,
+        compiled: CompiledPolicies,
+        tool_name: str,
+        arguments: dict[str, Any],
+        context: dict[str, Any],
+    ) -> tuple[PolicyDecision, str | None]:
+        """DENY takes precedence, then REQUIRE_APPROVAL, then ALLOW"""
+        denied_by = compiled.denied.get(tool_name)
+        if denied_by:
+            return PolicyDecision.DENY, denied_by
+        if compiled.allowed is not None and tool_name not in compiled.allowed:
+            return PolicyDecision.DENY, compiled.whitelist_name
+
+        approval_by = compiled.approval.get(tool_name)
+        for policy in compiled.dynamic:
             try:
                 decision = policy.evaluate(tool_name, arguments, context)
-                decisions.append((policy.name, decision))
-
-                # Log decision
-                self._audit_log.append(
-                    {
-                        "timestamp": datetime.now(UTC).isoformat(),
-                        "policy": policy.name,
-                        "tool": tool_name,
-                        "decision": decision.value,
-                    }
-                )
-
             except Exception as e:
                 logger.error(f"Policy {policy.name} evaluation error: {e}")
-                decisions.append((policy.name, PolicyDecision.DENY))
-
-        # Determine final decision (DENY > REQUIRE_APPROVAL > ALLOW)
-        if any(d == PolicyDecision.DENY for _, d in decisions):
-            logger.warning(f"Tool {tool_name} DENIED by policies")
-            return PolicyDecision.DENY
-
-        if any(d == PolicyDecision.REQUIRE_APPROVAL for _, d in decisions):
-            logger.info(f"Tool {tool_name} requires APPROVAL")
-            return PolicyDecision.REQUIRE_APPROVAL
+                decision = PolicyDecision.DENY
+            if decision == PolicyDecision.DENY:
+                return decision, policy.name
+            if decision == PolicyDecision.REQUIRE_APPROVAL and not approval_by:
+                approval_by = policy.name
 
-        return PolicyDecision.ALLOW
+        if approval_by:
+            return PolicyDecision.REQUIRE_APPROVAL, approval_by
+        return PolicyDecision.ALLOW, None
 
     def check_and_enforce(
         self, tool_name: str, arguments: dict[str, Any], context: dict[str, Any] | None = None
@@ -375,6 +486,24 @@ class PolicyManager:
             return self._audit_log[-limit:]
         return self._audit_log.copy()
 
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Decision timings
+
+        Returns:
+            Decision count, average/max decision time (microseconds) and
+            number of table compilations
+        """
+        return {
+            "decisions": self._decisions,
+            "avg_decision_us": (
+                self._decision_time / self._decisions * 1e6 if self._decisions else 0.0
+            ),
+            "max_decision_us": self._max_decision_time * 1e6,
+            "compiles": self._compiles,
+            "dynamic_policies": len(self.compile().dynamic),
+        }
+
     def clear_audit_log(self) -> None:
         """Clear audit log"""
         self._audit_log.clear()
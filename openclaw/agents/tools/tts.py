@@ -5,12 +5,13 @@ from pathlib import Path
 from typing import Any
 
 from .base import AgentTool, ToolResult
+from .tts_providers.service import get_tts_service
 
 logger = logging.getLogger(__name__)
 
 
 class TTSTool(AgentTool):
-    """Convert text to speech using OpenAI or ElevenLabs"""
+    """Convert text to speech using OpenAI, ElevenLabs, Edge or Google"""
 
     def __init__(self):
         super().__init__()
@@ -29,11 +30,14 @@ class TTSTool(AgentTool):
                 },
                 "provider": {
                     "type": "string",
-                    "enum": ["openai", "elevenlabs"],
+                    "enum": ["openai", "elevenlabs", "edge", "google"],
                     "description": "TTS provider",
                     "default": "openai",
                 },
-                "voice": {"type": "string", "description": "Voice ID or name", "default": "alloy"},
+                "voice": {
+                    "type": "string",
+                    "description": "Voice ID or name (default: provider's default voice)",
+                },
                 "model": {
                     "type": "string",
                     "description": "Model to use (provider-specific)",
@@ -48,99 +52,32 @@ class TTSTool(AgentTool):
         text = params.get("text", "")
         output_path = params.get("output_path", "output.mp3")
         provider = params.get("provider", "openai")
-        voice = params.get("voice", "alloy")
-        model = params.get("model", "tts-1")
+        voice = params.get("voice")
+        model = params.get("model", "tts-1") if provider == "openai" else params.get("model")
 
         if not text:
             return ToolResult(success=False, content="", error="text required")
 
-        try:
-            if provider == "openai":
-                return await self._openai_tts(text, output_path, voice, model)
-            elif provider == "elevenlabs":
-                return await self._elevenlabs_tts(text, output_path, voice)
-            else:
-                return ToolResult(success=False, content="", error=f"Unknown provider: {provider}")
-
-        except Exception as e:
-            logger.error(f"TTS error: {e}", exc_info=True)
-            return ToolResult(success=False, content="", error=str(e))
+        if provider == "openai":
+            voice = voice or "alloy"
 
-    async def _openai_tts(self, text: str, output_path: str, voice: str, model: str) -> ToolResult:
-        """Generate speech using OpenAI TTS"""
         try:
-            import os
-
-            from openai import AsyncOpenAI
-
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                return ToolResult(success=False, content="", error="OPENAI_API_KEY not set")
-
-            client = AsyncOpenAI(api_key=api_key)
-
-            response = await client.audio.speech.create(model=model, voice=voice, input=text)
-
-            # Save to file
-            output_file = Path(output_path).expanduser()
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-
-            response.stream_to_file(str(output_file))
-
-            return ToolResult(
-                success=True,
-                content=f"Speech saved to {output_path}",
-                metadata={
-                    "output_path": str(output_file),
-                    "provider": "openai",
-                    "voice": voice,
-                    "model": model,
-                },
+            # Cached per (provider, voice, model, text); long text is
+            # synthesized sentence by sentence and written as it arrives
+            result = await get_tts_service().synthesize_to_file(
+                text, output_path, provider=provider, voice=voice, model=model
             )
-
-        except ImportError:
-            return ToolResult(success=False, content="", error="openai package not installed")
         except Exception as e:
+            logger.error(f"TTS error: {e}", exc_info=True)
             return ToolResult(success=False, content="", error=str(e))
 
-    async def _elevenlabs_tts(self, text: str, output_path: str, voice: str) -> ToolResult:
-        """Generate speech using ElevenLabs"""
-        try:
-            import os
-
-            from elevenlabs import save
-            from elevenlabs.client import ElevenLabs
-
-            api_key = os.getenv("ELEVENLABS_API_KEY")
-            if not api_key:
-                return ToolResult(success=False, content="", error="ELEVENLABS_API_KEY not set")
-
-            client = ElevenLabs(api_key=api_key)
-
-            # Generate speech
-            audio = client.generate(text=text, voice=voice, model="eleven_monolingual_v1")
-
-            # Save to file
-            output_file = Path(output_path).expanduser()
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-
-            save(audio, str(output_file))
-
-            return ToolResult(
-                success=True,
-                content=f"Speech saved to {output_path}",
-                metadata={
-                    "output_path": str(output_file),
-                    "provider": "elevenlabs",
-                    "voice": voice,
-                },
-            )
-
-        except ImportError:
-            return ToolResult(
-                success=False,
-                content="",
-                error="elevenlabs package not installed. Install with: pip install elevenlabs",
-            )
-        except Exception as e:
-            return ToolResult(success=False, content="", error=str(e))
+        metadata = {
+            "output_path": str(Path(output_path).expanduser()),
+            "provider": result.provider,
+            "voice": result.voice,
+            "cached": result.cached,
+            "segments": result.segments,
+        }
+        if result.model:
+            metadata["model"] = result.model
+        return ToolResult(success=True, content=f"Speech saved to {output_path}", metadata=metadata)
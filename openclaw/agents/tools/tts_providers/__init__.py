@@ -5,6 +5,7 @@ from .openai_provider import OpenAITTSProvider
 from .elevenlabs_provider import ElevenLabsTTSProvider
 from .edge_provider import EdgeTTSProvider
 from .google_provider import GoogleTTSProvider
+from .service import TTSResult, TTSService, get_tts_service, split_sentences
 
 __all__ = [
     "TTSProvider",
@@ -12,4 +13,8 @@ __all__ = [
     "ElevenLabsTTSProvider",
     "EdgeTTSProvider",
     "GoogleTTSProvider",
+    "TTSResult",
+    "TTSService",
+    "get_tts_service",
+    "split_sentences",
 ]
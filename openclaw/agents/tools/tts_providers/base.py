@@ -1,10 +1,12 @@
 """Base TTS provider interface"""
 from __future__ import annotations
 
+import asyncio
+import tempfile
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List
 
 
 @dataclass
@@ -21,6 +23,9 @@ class TTSVoice:
 class TTSProvider(ABC):
     """Base class for TTS providers"""
     
+    name = "tts"
+    output_format = "mp3"
+    
     def __init__(self, api_key: str | None = None):
         """
         Initialize TTS provider
@@ -52,6 +57,30 @@ class TTSProvider(ABC):
         """
         pass
     
+    async def synthesize_bytes(self, text: str, voice: str, **kwargs) -> bytes:
+        """
+        Synthesize speech and return the encoded audio
+        
+        Providers that get audio back in memory override this; the default
+        goes through :meth:`synthesize` and a temp file.
+        """
+        with tempfile.TemporaryDirectory(prefix="openclaw-tts-") as tmp:
+            output_path = Path(tmp) / f"speech.{self.output_format}"
+            await self.synthesize(text, output_path, voice, **kwargs)
+            return await asyncio.to_thread(output_path.read_bytes)
+    
+    async def stream(self, text: str, voice: str, **kwargs) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech, yielding audio chunks as the provider produces them
+        
+        The default yields the whole result at once.
+        """
+        yield await self.synthesize_bytes(text, voice, **kwargs)
+    
+    def model_for(self, **kwargs) -> str | None:
+        """Model a synthesis with these options would use (part of the cache key)"""
+        return kwargs.get("model") or getattr(self, "model", None)
+    
     @abstractmethod
     async def list_voices(self) -> List[TTSVoice]:
         """
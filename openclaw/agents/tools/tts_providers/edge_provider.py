@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List
 
 from .base import TTSProvider, TTSVoice
 
@@ -17,6 +17,8 @@ class EdgeTTSProvider(TTSProvider):
     Uses Microsoft Edge's free TTS service (no API key required).
     """
     
+    name = "edge"
+    
     # Popular voices (full list available via edge-tts --list-voices)
     POPULAR_VOICES = [
         TTSVoice(id="en-US-AriaNeural", name="Aria (US English)", language="en-US", gender="female"),
@@ -64,6 +66,26 @@ class EdgeTTSProvider(TTSProvider):
             "characters": len(text),
         }
     
+    async def stream(self, text: str, voice: str, **kwargs) -> AsyncIterator[bytes]:
+        """Yield audio chunks as Edge TTS produces them"""
+        try:
+            import edge_tts
+        except ImportError:
+            raise RuntimeError(
+                "edge-tts not installed. Install with: pip install edge-tts"
+            )
+        
+        logger.info(f"Streaming with Edge TTS: {len(text)} chars, voice={voice}")
+        
+        communicate = edge_tts.Communicate(text, voice)
+        async for message in communicate.stream():
+            if message["type"] == "audio":
+                yield message["data"]
+    
+    async def synthesize_bytes(self, text: str, voice: str, **kwargs) -> bytes:
+        """Synthesize speech using Edge TTS, returning the audio"""
+        return b"".join([chunk async for chunk in self.stream(text, voice, **kwargs)])
+    
     async def list_voices(self) -> List[TTSVoice]:
         """List available voices"""
         try:
@@ -1,6 +1,7 @@
 """ElevenLabs TTS provider"""
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import List
@@ -13,6 +14,8 @@ logger = logging.getLogger(__name__)
 class ElevenLabsTTSProvider(TTSProvider):
     """ElevenLabs TTS provider"""
     
+    name = "elevenlabs"
+    
     def __init__(self, api_key: str | None = None):
         """
         Initialize ElevenLabs TTS provider
@@ -38,6 +41,28 @@ class ElevenLabsTTSProvider(TTSProvider):
         
         return self._client
     
+    def model_for(self, **kwargs) -> str | None:
+        return kwargs.get("model", "eleven_monolingual_v1")
+    
+    async def synthesize_bytes(self, text: str, voice: str, **kwargs) -> bytes:
+        """Synthesize speech using ElevenLabs, returning the audio"""
+        client = self._get_client()
+        
+        model = self.model_for(**kwargs)
+        voice_settings = {
+            "stability": kwargs.get("stability", 0.5),
+            "similarity_boost": kwargs.get("similarity_boost", 0.5),
+        }
+        
+        logger.info(f"Synthesizing with ElevenLabs: {len(text)} chars, voice={voice}")
+        
+        def generate() -> bytes:
+            # The SDK client is synchronous; keep it off the event loop
+            audio = client.generate(text=text, voice=voice, model=model, voice_settings=voice_settings)
+            return b"".join(audio)
+        
+        return await asyncio.to_thread(generate)
+    
     async def synthesize(
         self,
         text: str,
@@ -46,35 +71,15 @@ class ElevenLabsTTSProvider(TTSProvider):
         **kwargs
     ) -> dict:
         """Synthesize speech using ElevenLabs"""
-        client = self._get_client()
-        
-        model = kwargs.get("model", "eleven_monolingual_v1")
-        stability = kwargs.get("stability", 0.5)
-        similarity_boost = kwargs.get("similarity_boost", 0.5)
-        
-        logger.info(f"Synthesizing with ElevenLabs: {len(text)} chars, voice={voice}")
-        
-        # Generate audio
-        audio = client.generate(
-            text=text,
-            voice=voice,
-            model=model,
-            voice_settings={
-                "stability": stability,
-                "similarity_boost": similarity_boost,
-            }
-        )
+        audio = await self.synthesize_bytes(text, voice, **kwargs)
         
         # Save to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, "wb") as f:
-            for chunk in audio:
-                f.write(chunk)
+        await asyncio.to_thread(output_path.write_bytes, audio)
         
         return {
             "provider": "elevenlabs",
-            "model": model,
+            "model": self.model_for(**kwargs),
             "voice": voice,
             "output_path": str(output_path),
             "characters": len(text),
@@ -1,6 +1,7 @@
 """Google Cloud TTS provider"""
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import List
@@ -13,6 +14,8 @@ logger = logging.getLogger(__name__)
 class GoogleTTSProvider(TTSProvider):
     """Google Cloud TTS provider"""
     
+    name = "google"
+    
     def __init__(self, credentials_path: str | None = None):
         """
         Initialize Google TTS provider
@@ -43,14 +46,8 @@ class GoogleTTSProvider(TTSProvider):
         
         return self._client
     
-    async def synthesize(
-        self,
-        text: str,
-        output_path: Path,
-        voice: str,
-        **kwargs
-    ) -> dict:
-        """Synthesize speech using Google Cloud TTS"""
+    async def synthesize_bytes(self, text: str, voice: str, **kwargs) -> bytes:
+        """Synthesize speech using Google Cloud TTS, returning the audio"""
         from google.cloud import texttospeech
         
         client = self._get_client()
@@ -78,18 +75,28 @@ class GoogleTTSProvider(TTSProvider):
             pitch=kwargs.get("pitch", 0.0),
         )
         
-        # Synthesize
-        response = client.synthesize_speech(
+        # Synthesize (synchronous client, so in a thread)
+        response = await asyncio.to_thread(
+            client.synthesize_speech,
             input=synthesis_input,
             voice=voice_params,
             audio_config=audio_config,
         )
+        return response.audio_content
+    
+    async def synthesize(
+        self,
+        text: str,
+        output_path: Path,
+        voice: str,
+        **kwargs
+    ) -> dict:
+        """Synthesize speech using Google Cloud TTS"""
+        audio = await self.synthesize_bytes(text, voice, **kwargs)
         
         # Save to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, "wb") as f:
-            f.write(response.audio_content)
+        await asyncio.to_thread(output_path.write_bytes, audio)
         
         return {
             "provider": "google",
@@ -1,9 +1,10 @@
 """OpenAI TTS provider"""
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List
 
 from .base import TTSProvider, TTSVoice
 
@@ -13,6 +14,8 @@ logger = logging.getLogger(__name__)
 class OpenAITTSProvider(TTSProvider):
     """OpenAI TTS provider"""
     
+    name = "openai"
+    
     VOICES = [
         TTSVoice(id="alloy", name="Alloy", language="en", gender="neutral"),
         TTSVoice(id="echo", name="Echo", language="en", gender="male"),
@@ -46,6 +49,32 @@ class OpenAITTSProvider(TTSProvider):
         
         return self._client
     
+    def _request(self, text: str, voice: str, **kwargs) -> dict:
+        return {
+            "model": kwargs.get("model", self.model),
+            "voice": voice,
+            "input": text,
+            "speed": kwargs.get("speed", 1.0),
+            "response_format": self.output_format,
+        }
+    
+    async def synthesize_bytes(self, text: str, voice: str, **kwargs) -> bytes:
+        """Synthesize speech using OpenAI, returning the audio"""
+        client = self._get_client()
+        logger.info(f"Synthesizing with OpenAI: {len(text)} chars, voice={voice}")
+        response = await client.audio.speech.create(**self._request(text, voice, **kwargs))
+        return response.content
+    
+    async def stream(self, text: str, voice: str, **kwargs) -> AsyncIterator[bytes]:
+        """Yield audio chunks while OpenAI is still generating"""
+        client = self._get_client()
+        logger.info(f"Streaming with OpenAI: {len(text)} chars, voice={voice}")
+        async with client.audio.speech.with_streaming_response.create(
+            **self._request(text, voice, **kwargs)
+        ) as response:
+            async for chunk in response.iter_bytes():
+                yield chunk
+    
     async def synthesize(
         self,
         text: str,
@@ -54,23 +83,12 @@ class OpenAITTSProvider(TTSProvider):
         **kwargs
     ) -> dict:
         """Synthesize speech using OpenAI"""
-        client = self._get_client()
-        
         model = kwargs.get("model", self.model)
-        speed = kwargs.get("speed", 1.0)
-        
-        logger.info(f"Synthesizing with OpenAI: {len(text)} chars, voice={voice}")
-        
-        response = await client.audio.speech.create(
-            model=model,
-            voice=voice,
-            input=text,
-            speed=speed,
-        )
+        audio = await self.synthesize_bytes(text, voice, **kwargs)
         
         # Save to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        response.stream_to_file(str(output_path))
+        await asyncio.to_thread(output_path.write_bytes, audio)
         
         return {
             "provider": "openai",
@@ -0,0 +1,437 @@
+"""TTS synthesis with a content-addressed audio cache
+
+Audio is cached on disk by a hash of (provider, voice, model, options,
+normalized text), so repeated utterances — greetings, heartbeat messages,
+canned cron announcements — are synthesized and billed once.
+
+Longer text is split into sentences that are synthesized ahead of playback
+with a small lookahead window, so the first segment can be delivered while
+the rest is still being generated. Each sentence is cached on its own as
+well, which lets a reply that repeats a known sentence reuse it.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from .base import TTSProvider
+
+logger = logging.getLogger(__name__)
+
+# Sentence ends: punctuation followed by whitespace, or a line break
+_SENTENCE_END = re.compile(r"(?<=[.!?;:。！？；])\s+|\n+")
+
+# Sentences shorter than this are merged into the next one
+MIN_SEGMENT_CHARS = 24
+
+
+def normalize_tts_text(text: str) -> str:
+    """Normalize text so trivially different inputs share a cache entry"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def split_sentences(text: str, min_chars: int = MIN_SEGMENT_CHARS) -> list[str]:
+    """
+    Split text into sentence-sized segments for incremental synthesis
+
+    Very short sentences are merged with the following one so providers
+    aren't called for a single word and intonation stays natural.
+    """
+    segments: list[str] = []
+    pending = ""
+    for part in _SENTENCE_END.split(text):
+        part = normalize_tts_text(part)
+        if not part:
+            continue
+        pending = f"{pending} {part}" if pending else part
+        if len(pending) >= min_chars:
+            segments.append(pending)
+            pending = ""
+    if pending:
+        if segments and len(pending) < min_chars:
+            segments[-1] = f"{segments[-1]} {pending}"
+        else:
+            segments.append(pending)
+    return segments
+
+
+@dataclass
+class TTSResult:
+    """Synthesized speech"""
+
+    audio: bytes
+    format: str
+    provider: str
+    voice: str
+    model: str | None
+    cached: bool = False
+    segments: int = 1
+
+
+def _default_cache_dir() -> Path:
+    from openclaw.config.paths import get_openclaw_data_dir
+
+    return get_openclaw_data_dir() / "cache" / "tts"
+
+
+def create_tts_provider(name: str) -> TTSProvider:
+    """
+    Create a TTS provider from environment credentials
+
+    Raises:
+        ValueError: For unknown providers or missing API keys
+    """
+    if name == "openai":
+        from .openai_provider import OpenAITTSProvider
+
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not set")
+        return OpenAITTSProvider(api_key=api_key)
+    if name == "elevenlabs":
+        from .elevenlabs_provider import ElevenLabsTTSProvider
+
+        api_key = os.getenv("ELEVENLABS_API_KEY")
+        if not api_key:
+            raise ValueError("ELEVENLABS_API_KEY not set")
+        return ElevenLabsTTSProvider(api_key=api_key)
+    if name == "edge":
+        from .edge_provider import EdgeTTSProvider
+
+        return EdgeTTSProvider()
+    if name == "google":
+        from .google_provider import GoogleTTSProvider
+
+        return GoogleTTSProvider(credentials_path=os.getenv("GOOGLE_APPLICATION_CREDENTIALS"))
+    raise ValueError(f"Unknown provider: {name}")
+
+
+class TTSService:
+    """
+    Cached, streaming speech synthesis
+
+    Example:
+        service = get_tts_service()
+        async for chunk in service.stream("Good morning! Here's your summary.", provider="edge"):
+            await send_audio_chunk(chunk)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str | None = None,
+        max_cache_bytes: int = 256 * 1024 * 1024,
+        memory_items: int = 64,
+        lookahead: int = 2,
+        providers: dict[str, TTSProvider] | None = None,
+    ):
+        """
+        Initialize service
+
+        Args:
+            cache_dir: Audio cache directory (default: <data dir>/cache/tts)
+            max_cache_bytes: Disk budget; least recently used audio is removed beyond it
+            memory_items: Recently used clips also kept in memory
+            lookahead: Sentences synthesized ahead of the one being delivered
+            providers: Provider instances by name (created on demand otherwise)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+        self.max_cache_bytes = max_cache_bytes
+        self.memory_items = memory_items
+        self.lookahead = max(1, lookahead)
+        self._providers: dict[str, TTSProvider] = dict(providers or {})
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._disk_bytes: int | None = None
+        self._stats = {"hits": 0, "misses": 0, "characters_synthesized": 0, "characters_saved": 0}
+
+    def get_provider(self, name: str) -> TTSProvider:
+        """Get (or create) a provider by name"""
+        if name not in self._providers:
+            self._providers[name] = create_tts_provider(name)
+        return self._providers[name]
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def cache_key(provider: str, voice: str, model: str | None, text: str, options: dict[str, Any]) -> str:
+        """Content address of a synthesis request"""
+        material = json.dumps(
+            [provider, voice, model, normalize_tts_text(text), sorted(options.items())],
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _path(self, key: str, fmt: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.{fmt}"
+
+    def _load(self, key: str, fmt: str) -> bytes | None:
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            return audio
+        path = self._path(key, fmt)
+        try:
+            audio = path.read_bytes()
+        except OSError:
+            return None
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._remember(key, audio)
+        return audio
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        self._memory[key] = audio
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _files(self) -> list[Path]:
+        return [p for p in self.cache_dir.glob("*/*") if p.is_file() and not p.name.startswith(".")]
+
+    def _save(self, key: str, fmt: str, audio: bytes) -> None:
+        self._remember(key, audio)
+        path = self._path(key, fmt)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_bytes(audio)
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write TTS cache entry: {e}")
+            return
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(p.stat().st_size for p in self._files())
+        else:
+            self._disk_bytes += len(audio)
+        if self._disk_bytes > self.max_cache_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        files = sorted(self._files(), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+        target = self.max_cache_bytes * 0.9
+        for path in files:
+            if total <= target:
+                break
+            size = path.stat().st_size
+            path.unlink(missing_ok=True)
+            total -= size
+        self._disk_bytes = total
+
+    # ------------------------------------------------------------------
+    # Synthesis
+    # ------------------------------------------------------------------
+
+    async def _synthesize_one(
+        self,
+        provider: TTSProvider,
+        voice: str,
+        text: str,
+        options: dict[str, Any],
+    ) -> tuple[bytes, bool]:
+        """Synthesize one cache unit; returns (audio, cached)"""
+        model = provider.model_for(**options)
+        key = self.cache_key(provider.name, voice, model, text, options)
+        audio = self._load(key, provider.output_format)
+        if audio is not None:
+            self._stats["hits"] += 1
+            self._stats["characters_saved"] += len(text)
+            return audio, True
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight), True
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The synthesis we joined was cancelled by its own caller; retry
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self._stats["misses"] += 1
+            audio = await provider.synthesize_bytes(text, voice, **options)
+            self._stats["characters_synthesized"] += len(text)
+            self._save(key, provider.output_format, audio)
+            future.set_result(audio)
+            return audio, False
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _resolve(self, provider: str, voice: str | None, model: str | None, options: dict[str, Any]):
+        tts = self.get_provider(provider)
+        voice = voice or tts.get_default_voice()
+        if model:
+            options = {**options, "model": model}
+        return tts, voice, options
+
+    async def synthesize(
+        self,
+        text: str,
+        provider: str = "openai",
+        voice: str | None = None,
+        model: str | None = None,
+        **options: Any,
+    ) -> TTSResult:
+        """
+        Synthesize text, from cache when possible
+
+        Args:
+            text: Text to speak
+            provider: Provider name (openai, elevenlabs, edge, google)
+            voice: Voice ID (default: provider's default voice)
+            model: Model (provider-specific)
+            **options: Provider options (speed, stability, ...)
+
+        Returns:
+            Synthesized audio
+        """
+        tts, voice, options = self._resolve(provider, voice, model, options)
+        audio, cached = await self._synthesize_one(tts, voice, normalize_tts_text(text), options)
+        return TTSResult(
+            audio=audio,
+            format=tts.output_format,
+            provider=tts.name,
+            voice=voice,
+            model=tts.model_for(**options),
+            cached=cached,
+        )
+
+    async def stream(
+        self,
+        text: str,
+        provider: str = "openai",
+        voice: str | None = None,
+        model: str | None = None,
+        **options: Any,
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize text sentence by sentence, yielding audio as it's ready
+
+        Up to ``lookahead`` following sentences are synthesized while the
+        current one is delivered. The concatenated result is cached under
+        the whole text as well.
+
+        Args:
+            text: Text to speak
+            provider: Provider name
+            voice: Voice ID (default: provider's default voice)
+            model: Model (provider-specific)
+            **options: Provider options
+
+        Yields:
+            Encoded audio segments, in order
+        """
+        tts, voice, options = self._resolve(provider, voice, model, options)
+        text = normalize_tts_text(text)
+        whole_key = self.cache_key(tts.name, voice, tts.model_for(**options), text, options)
+        audio = self._load(whole_key, tts.output_format)
+        if audio is not None:
+            self._stats["hits"] += 1
+            self._stats["characters_saved"] += len(text)
+            yield audio
+            return
+
+        segments = split_sentences(text)
+        if len(segments) <= 1:
+            # One sentence: pass the provider's own stream straight through
+            chunks = []
+            self._stats["misses"] += 1
+            async for chunk in tts.stream(text, voice, **options):
+                chunks.append(chunk)
+                yield chunk
+            self._stats["characters_synthesized"] += len(text)
+            self._save(whole_key, tts.output_format, b"".join(chunks))
+            return
+
+        tasks: list[asyncio.Task] = []
+        parts: list[bytes] = []
+        try:
+            for index in range(len(segments)):
+                while len(tasks) <= min(index + self.lookahead, len(segments) - 1):
+                    segment = segments[len(tasks)]
+                    tasks.append(asyncio.create_task(self._synthesize_one(tts, voice, segment, options)))
+                audio, _ = await tasks[index]
+                parts.append(audio)
+                yield audio
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        self._save(whole_key, tts.output_format, b"".join(parts))
+
+    async def synthesize_to_file(
+        self,
+        text: str,
+        output_path: Path | str,
+        provider: str = "openai",
+        voice: str | None = None,
+        model: str | None = None,
+        **options: Any,
+    ) -> TTSResult:
+        """
+        Stream synthesis into a file, writing each segment as it arrives
+
+        Returns:
+            Synthesized audio (``cached`` when nothing had to be generated)
+        """
+        output_path = Path(output_path).expanduser()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tts, voice, resolved = self._resolve(provider, voice, model, options)
+
+        misses = self._stats["misses"]
+        parts: list[bytes] = []
+        with open(output_path, "wb") as f:
+            async for chunk in self.stream(text, provider, voice, model, **options):
+                parts.append(chunk)
+                await asyncio.to_thread(f.write, chunk)
+
+        return TTSResult(
+            audio=b"".join(parts),
+            format=tts.output_format,
+            provider=tts.name,
+            voice=voice,
+            model=tts.model_for(**resolved),
+            cached=self._stats["misses"] == misses,
+            segments=len(parts),
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Cache statistics"""
+        return {**self._stats, "memory_items": len(self._memory), "disk_bytes": self._disk_bytes}
+
+
+# Global service instance
+_service: TTSService | None = None
+
+
+def get_tts_service() -> TTSService:
+    """Get global TTS service instance"""
+    global _service
+    if _service is None:
+        _service = TTSService()
+    return _service
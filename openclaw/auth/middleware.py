@@ -3,7 +3,9 @@ Authentication middleware for FastAPI
 """
 
 import logging
+import math
 from collections.abc import Callable
+from typing import Any
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -19,7 +21,9 @@ class AuthMiddleware(BaseHTTPMiddleware):
     """
     Authentication middleware
 
-    Validates API keys and enforces rate limits
+    Validates API keys and enforces rate limits: the global per-client
+    limit, and each key's own ``rate_limit`` when the key manager tracks
+    it (``check_rate_limit``, e.g. PersistentAPIKeyStore)
     """
 
     def __init__(
@@ -27,6 +31,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         skip_auth_paths: list[str] | None = None,
         enable_rate_limiting: bool = True,
+        api_key_manager: Any | None = None,
     ):
         super().__init__(app)
         self.skip_auth_paths = skip_auth_paths or [
@@ -40,7 +45,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             "/openapi.json",
         ]
         self.enable_rate_limiting = enable_rate_limiting
-        self.api_key_manager = get_api_key_manager()
+        self.api_key_manager = api_key_manager or get_api_key_manager()
         self.rate_limiter = get_global_limiter()
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -56,6 +61,17 @@ class AuthMiddleware(BaseHTTPMiddleware):
             if validated_key:
                 # Attach to request state
                 request.state.api_key = validated_key
+                check_key_limit = getattr(self.api_key_manager, "check_rate_limit", None)
+                if check_key_limit and not check_key_limit(validated_key):
+                    # Buckets refill one request every 60 / rate_limit seconds
+                    retry_after = math.ceil(60 / validated_key.rate_limit)
+                    logger.warning(f"Rate limit exceeded for API key {validated_key.key_id}")
+                    return Response(
+                        content=f'{{"detail": "Rate limit exceeded. Try again in {retry_after}s"}}',
+                        status_code=429,
+                        media_type="application/json",
+                        headers={"Retry-After": str(retry_after)},
+                    )
             else:
                 logger.warning(f"Invalid API key from {request.client.host}")
                 return Response(
@@ -91,7 +107,10 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
 
 def setup_auth_middleware(
-    app, skip_auth_paths: list[str] | None = None, enable_rate_limiting: bool = True
+    app,
+    skip_auth_paths: list[str] | None = None,
+    enable_rate_limiting: bool = True,
+    api_key_manager: Any | None = None,
 ) -> None:
     """
     Setup authentication middleware for FastAPI app
@@ -100,8 +119,13 @@ def setup_auth_middleware(
         app: FastAPI application
         skip_auth_paths: Paths to skip authentication
         enable_rate_limiting: Enable rate limiting
+        api_key_manager: Key manager to validate with (default: the global
+            APIKeyManager)
     """
     app.add_middleware(
-        AuthMiddleware, skip_auth_paths=skip_auth_paths, enable_rate_limiting=enable_rate_limiting
+        AuthMiddleware,
+        skip_auth_paths=skip_auth_paths,
+        enable_rate_limiting=enable_rate_limiting,
+        api_key_manager=api_key_manager,
     )
     logger.info("Auth middleware configured")
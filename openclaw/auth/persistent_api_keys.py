@@ -2,6 +2,13 @@
 Persistent API key storage
 
 Provides SQLite-based persistent storage for API keys.
+
+Validation is served from memory: validated keys are cached by hash for a
+short TTL (invalidated immediately on revoke/update/delete in this process),
+``last_used_at`` updates are coalesced and written in batches by a
+background thread, and a single WAL-mode connection is reused for all
+queries. Per-key ``rate_limit`` is enforced with in-memory token buckets
+(AuthMiddleware calls ``check_rate_limit`` for every validated key).
 """
 from __future__ import annotations
 
@@ -10,13 +17,17 @@ import json
 import logging
 import secrets
 import sqlite3
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 logger = logging.getLogger(__name__)
 
+_MAX_CACHED_HASHES = 10_000
+
 
 @dataclass
 class APIKey:
@@ -61,6 +72,38 @@ class APIKey:
         }
 
 
+@dataclass
+class _TokenBucket:
+    """Per-key request budget refilled at rate_limit per minute"""
+    capacity: float
+    tokens: float
+    updated_at: float
+    
+    def take(self, now: float) -> bool:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.capacity / 60.0)
+        self.updated_at = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+def _row_to_key(row: sqlite3.Row) -> APIKey:
+    return APIKey(
+        key_id=row["key_id"],
+        name=row["name"],
+        key_hash=row["key_hash"],
+        permissions=json.loads(row["permissions"]),
+        created_at=row["created_at"],
+        expires_at=row["expires_at"],
+        last_used_at=row["last_used_at"],
+        enabled=bool(row["enabled"]),
+        rate_limit=row["rate_limit"],
+        metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+    )
+
+
 class PersistentAPIKeyStore:
     """
     Persistent API key storage using SQLite.
@@ -72,28 +115,60 @@ class PersistentAPIKeyStore:
     - Expiration support
     - Rate limiting
     - Metadata storage
+    - In-memory validation cache with batched last-used writes
+    
+    The cache is per process: a revoke done by another process takes
+    effect here once the cached entry's TTL runs out.
     """
     
-    def __init__(self, db_path: Path | None = None):
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        cache_ttl: float = 30.0,
+        flush_interval: float = 5.0,
+    ):
         """
         Initialize persistent API key store.
         
         Args:
             db_path: Path to SQLite database (default: ~/.openclaw/api_keys.db)
+            cache_ttl: Seconds a validation result is served from memory
+            flush_interval: Seconds between batched last_used_at writes
         """
         if db_path is None:
             db_path = Path.home() / ".openclaw" / "api_keys.db"
         
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = cache_ttl
+        self.flush_interval = flush_interval
+        
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        
+        # key_hash -> (cache expiry, key or None for unknown hashes)
+        self._cache: dict[str, tuple[float, APIKey | None]] = {}
+        self._last_used: dict[str, int] = {}
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._flusher: threading.Thread | None = None
+        self._closed = threading.Event()
         
         self._init_database()
         
         logger.info(f"Persistent API key store initialized: {self.db_path}")
     
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Shared connection, one transaction per block."""
+        with self._lock, self._conn:
+            yield self._conn
+    
     def _init_database(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS api_keys (
                     key_id TEXT PRIMARY KEY,
@@ -114,7 +189,6 @@ class PersistentAPIKeyStore:
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_enabled ON api_keys(enabled)
             """)
-            conn.commit()
     
     def _hash_key(self, raw_key: str) -> str:
         """Hash API key using SHA-256."""
@@ -153,7 +227,7 @@ class PersistentAPIKeyStore:
             expires_at = created_at + (expires_days * 24 * 3600)
         
         # Store in database
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 INSERT INTO api_keys (
@@ -173,7 +247,8 @@ class PersistentAPIKeyStore:
                     json.dumps(metadata or {}),
                 ),
             )
-            conn.commit()
+        
+        self._cache.pop(key_hash, None)
         
         logger.info(f"Created API key: {key_id} ({name})")
         return raw_key
@@ -182,6 +257,9 @@ class PersistentAPIKeyStore:
         """
         Validate an API key.
         
+        Served from memory for ``cache_ttl`` seconds after the first lookup;
+        the last-used time is recorded in memory and written in batches.
+        
         Args:
             raw_key: Raw API key
         
@@ -192,46 +270,109 @@ class PersistentAPIKeyStore:
             return None
         
         key_hash = self._hash_key(raw_key)
-        
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM api_keys WHERE key_hash = ?", (key_hash,)
-            )
-            row = cursor.fetchone()
-        
-        if not row:
+        now = time.time()
+        
+        entry = self._cache.get(key_hash)
+        if entry is not None and entry[0] > now:
+            api_key = entry[1]
+        else:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT * FROM api_keys WHERE key_hash = ?", (key_hash,)
+                ).fetchone()
+            api_key = _row_to_key(row) if row else None
+            if len(self._cache) >= _MAX_CACHED_HASHES:
+                # Guessed keys fill the cache with misses; drop what has expired
+                self._cache = {h: e for h, e in self._cache.items() if e[0] > now}
+                if len(self._cache) >= _MAX_CACHED_HASHES:
+                    self._cache.clear()
+            self._cache[key_hash] = (now + self.cache_ttl, api_key)
+        
+        # Same checks as APIKey.is_valid(), without re-reading the clock
+        if api_key is None or not api_key.enabled:
             return None
-        
-        api_key = APIKey(
-            key_id=row["key_id"],
-            name=row["name"],
-            key_hash=row["key_hash"],
-            permissions=json.loads(row["permissions"]),
-            created_at=row["created_at"],
-            expires_at=row["expires_at"],
-            last_used_at=row["last_used_at"],
-            enabled=bool(row["enabled"]),
-            rate_limit=row["rate_limit"],
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-        )
-        
-        if not api_key.is_valid():
+        if api_key.expires_at is not None and now > api_key.expires_at:
             return None
         
         # Update last used
-        self._update_last_used(api_key.key_id)
+        self._update_last_used(api_key, int(now))
         
         return api_key
     
-    def _update_last_used(self, key_id: str):
-        """Update last used timestamp."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "UPDATE api_keys SET last_used_at = ? WHERE key_id = ?",
-                (int(time.time()), key_id),
-            )
-            conn.commit()
+    def _update_last_used(self, api_key: APIKey, now: int):
+        """Record last used timestamp (written by the flusher)."""
+        api_key.last_used_at = now
+        self._last_used[api_key.key_id] = now
+        if self._flusher is None:
+            self._start_flusher()
+    
+    def _start_flusher(self):
+        with self._lock:
+            if self._flusher is None and not self._closed.is_set():
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="api-key-last-used", daemon=True
+                )
+                self._flusher.start()
+    
+    def _flush_loop(self):
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Failed to write API key last-used times: {e}")
+    
+    def flush(self) -> int:
+        """
+        Write pending last_used_at updates in one transaction.
+        
+        Returns:
+            Number of keys updated
+        """
+        with self._lock:
+            pending, self._last_used = self._last_used, {}
+            if not pending:
+                return 0
+            with self._connect() as conn:
+                conn.executemany(
+                    "UPDATE api_keys SET last_used_at = ? WHERE key_id = ?",
+                    [(used_at, key_id) for key_id, used_at in pending.items()],
+                )
+        return len(pending)
+    
+    def _invalidate(self, key_id: str):
+        """Drop cached state for a key after it changes."""
+        for key_hash, (_, api_key) in list(self._cache.items()):
+            if api_key is not None and api_key.key_id == key_id:
+                del self._cache[key_hash]
+        self._buckets.pop(key_id, None)
+    
+    def check_rate_limit(self, api_key: APIKey) -> bool:
+        """
+        Take one request from a key's rate limit budget.
+        
+        Args:
+            api_key: Validated key
+        
+        Returns:
+            True if allowed (always, for keys without a rate_limit)
+        """
+        if not api_key.rate_limit:
+            return True
+        now = time.monotonic()
+        bucket = self._buckets.get(api_key.key_id)
+        if bucket is None:
+            limit = float(api_key.rate_limit)
+            bucket = self._buckets[api_key.key_id] = _TokenBucket(capacity=limit, tokens=limit, updated_at=now)
+        return bucket.take(now)
+    
+    def close(self):
+        """Flush pending updates and close the database connection."""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=1.0)
+        self.flush()
+        with self._lock:
+            self._conn.close()
     
     def revoke_key(self, key_id: str) -> bool:
         """
@@ -243,15 +384,15 @@ class PersistentAPIKeyStore:
         Returns:
             True if revoked, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "UPDATE api_keys SET enabled = 0 WHERE key_id = ?", (key_id,)
             )
-            conn.commit()
-            
-            if cursor.rowcount > 0:
-                logger.info(f"Revoked API key: {key_id}")
-                return True
+        self._invalidate(key_id)
+        
+        if cursor.rowcount > 0:
+            logger.info(f"Revoked API key: {key_id}")
+            return True
         
         return False
     
@@ -265,13 +406,14 @@ class PersistentAPIKeyStore:
         Returns:
             True if deleted, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("DELETE FROM api_keys WHERE key_id = ?", (key_id,))
-            conn.commit()
-            
-            if cursor.rowcount > 0:
-                logger.info(f"Deleted API key: {key_id}")
-                return True
+        self._invalidate(key_id)
+        self._last_used.pop(key_id, None)
+        
+        if cursor.rowcount > 0:
+            logger.info(f"Deleted API key: {key_id}")
+            return True
         
         return False
     
@@ -290,29 +432,14 @@ class PersistentAPIKeyStore:
             query += " WHERE enabled = 1"
         query += " ORDER BY created_at DESC"
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        # Include last-used times not yet written
+        self.flush()
+        
+        with self._connect() as conn:
             cursor = conn.execute(query)
             rows = cursor.fetchall()
         
-        keys = []
-        for row in rows:
-            keys.append(
-                APIKey(
-                    key_id=row["key_id"],
-                    name=row["name"],
-                    key_hash=row["key_hash"],
-                    permissions=json.loads(row["permissions"]),
-                    created_at=row["created_at"],
-                    expires_at=row["expires_at"],
-                    last_used_at=row["last_used_at"],
-                    enabled=bool(row["enabled"]),
-                    rate_limit=row["rate_limit"],
-                    metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-                )
-            )
-        
-        return keys
+        return [_row_to_key(row) for row in rows]
     
     def update_key(
         self,
@@ -360,12 +487,12 @@ class PersistentAPIKeyStore:
         values.append(key_id)
         query = f"UPDATE api_keys SET {', '.join(updates)} WHERE key_id = ?"
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(query, values)
-            conn.commit()
-            
-            if cursor.rowcount > 0:
-                logger.info(f"Updated API key: {key_id}")
-                return True
+        self._invalidate(key_id)
+        
+        if cursor.rowcount > 0:
+            logger.info(f"Updated API key: {key_id}")
+            return True
         
         return False
@@ -2,14 +2,22 @@
 
 Determines whether to process messages in group chats.
 Aligned with TypeScript src/web/auto-reply/monitor/group-gating.ts
+
+Gating runs on every group message, and most are dropped, so the agent
+names and activation keywords are compiled once per configuration into a
+single case-insensitive pattern (:class:`GroupGate`) and the check is one
+regex search over the raw text. Decisions are counted per reason; see
+:func:`get_group_gating_stats`.
 """
 
 from __future__ import annotations
 
+import re
+import threading
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional
-
-from .mentions import has_mention
+from functools import lru_cache
+from typing import Any, Optional
 
 
 @dataclass
@@ -28,6 +36,136 @@ class GroupGatingMode:
     NEVER = "never"  # Never respond in groups
 
 
+# Decisions by reason, across all gates
+_stats: Counter[str] = Counter()
+_stats_lock = threading.Lock()
+
+
+def _record(reason: str) -> None:
+    with _stats_lock:
+        _stats[reason] += 1
+
+
+class GroupGate:
+    """Group gating compiled for one agent configuration.
+    
+    Mentions (``@name`` as a whole ``\\w+`` token) and keywords
+    (case-insensitive substrings) are one alternation, so a dropped
+    message costs a single scan of its text.
+    """
+    
+    def __init__(
+        self,
+        mode: str = GroupGatingMode.MENTIONS,
+        agent_names: Optional[list[str]] = None,
+        activation_keywords: Optional[list[str]] = None,
+    ):
+        """Compile gate.
+        
+        Args:
+            mode: Gating mode (always, mentions, never)
+            agent_names: Agent names for mention detection
+            activation_keywords: Keywords that activate the bot
+        """
+        self.mode = mode
+        # Only names that can appear as an @\w+ token can ever match
+        names = {n.lower() for n in agent_names or [] if re.fullmatch(r"\w+", n)}
+        keywords = {k.lower() for k in activation_keywords or []}
+        # An empty keyword is a substring of every message
+        self._match_all = "" in keywords
+        keywords.discard("")
+        
+        alternatives = []
+        if names:
+            name_alts = "|".join(map(re.escape, sorted(names, key=len, reverse=True)))
+            alternatives.append(rf"(?P<mention>@(?:{name_alts})(?!\w))")
+        if keywords:
+            keyword_alts = "|".join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+            alternatives.append(f"(?P<keyword>{keyword_alts})")
+        self._pattern = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+    
+    def check(self, message_text: str, is_group: bool = True) -> GroupGatingResult:
+        """Check if message should be processed.
+        
+        Args:
+            message_text: Message text
+            is_group: Whether this is a group chat
+        
+        Returns:
+            GroupGatingResult indicating whether to process
+        """
+        if not is_group:
+            reason, process = "not_group", True
+        elif self.mode == GroupGatingMode.NEVER:
+            reason, process = "mode_never", False
+        elif self.mode == GroupGatingMode.ALWAYS:
+            reason, process = "mode_always", True
+        elif self._match_all and message_text is not None:
+            reason, process = "keyword_match", True
+        else:
+            match = self._pattern.search(message_text) if self._pattern and message_text else None
+            if match is None:
+                reason, process = "no_mention_or_keyword", False
+            elif match.lastgroup == "mention":
+                reason, process = "mentioned", True
+            else:
+                reason, process = "keyword_match", True
+        _record(reason)
+        return GroupGatingResult(should_process=process, reason=reason)
+
+
+@lru_cache(maxsize=256)
+def _compile(mode: str, agent_names: tuple[str, ...], activation_keywords: tuple[str, ...]) -> GroupGate:
+    return GroupGate(mode, list(agent_names), list(activation_keywords))
+
+
+def compile_group_gate(
+    mode: str = GroupGatingMode.MENTIONS,
+    agent_names: Optional[list[str]] = None,
+    activation_keywords: Optional[list[str]] = None,
+) -> GroupGate:
+    """Get the compiled gate for a configuration (cached).
+    
+    Args:
+        mode: Gating mode (always, mentions, never)
+        agent_names: Agent names for mention detection
+        activation_keywords: Keywords that activate the bot
+    
+    Returns:
+        Compiled GroupGate
+    """
+    return _compile(mode, tuple(agent_names or ()), tuple(activation_keywords or ()))
+
+
+def group_gate_from_config(config: dict[str, Any]) -> GroupGate:
+    """Get the compiled gate for a ``group_mode``/``agent_names``/``activation_keywords`` config."""
+    return compile_group_gate(
+        mode=config.get("group_mode", GroupGatingMode.MENTIONS),
+        agent_names=config.get("agent_names", []),
+        activation_keywords=config.get("activation_keywords", []),
+    )
+
+
+def get_group_gating_stats() -> dict[str, Any]:
+    """Gating decisions by reason, with the overall reject rate."""
+    with _stats_lock:
+        by_reason = dict(_stats)
+    rejected = by_reason.get("mode_never", 0) + by_reason.get("no_mention_or_keyword", 0)
+    checked = sum(by_reason.values())
+    return {
+        "checked": checked,
+        "rejected": rejected,
+        "reject_rate": rejected / checked if checked else 0.0,
+        "by_reason": by_reason,
+    }
+
+
+def reset_group_gating_stats() -> None:
+    """Clear gating counters."""
+    with _stats_lock:
+        _stats.clear()
+
+
 def check_group_gating(
     message_text: str,
     is_group: bool,
@@ -47,30 +185,8 @@ def check_group_gating(
     Returns:
         GroupGatingResult indicating whether to process
     """
-    # If not a group, always process
-    if not is_group:
-        return GroupGatingResult(should_process=True, reason="not_group")
-    
-    # Check mode
-    if mode == GroupGatingMode.NEVER:
-        return GroupGatingResult(should_process=False, reason="mode_never")
-    
-    if mode == GroupGatingMode.ALWAYS:
-        return GroupGatingResult(should_process=True, reason="mode_always")
-    
-    # Default: mentions mode
-    # Check for mentions
-    if agent_names and has_mention(message_text, agent_names):
-        return GroupGatingResult(should_process=True, reason="mentioned")
-    
-    # Check for activation keywords
-    if activation_keywords:
-        message_lower = message_text.lower()
-        for keyword in activation_keywords:
-            if keyword.lower() in message_lower:
-                return GroupGatingResult(should_process=True, reason="keyword_match")
-    
-    return GroupGatingResult(should_process=False, reason="no_mention_or_keyword")
+    gate = compile_group_gate(mode, agent_names, activation_keywords)
+    return gate.check(message_text, is_group)
 
 
 def should_process_group_message(
@@ -90,19 +206,6 @@ def should_process_group_message(
     Returns:
         True if message should be processed
     """
-    if not config:
-        config = {}
-    
-    mode = config.get("group_mode", GroupGatingMode.MENTIONS)
-    agent_names = config.get("agent_names", [])
-    activation_keywords = config.get("activation_keywords", [])
-    
-    result = check_group_gating(
-        message_text=message_text,
-        is_group=is_group,
-        mode=mode,
-        agent_names=agent_names,
-        activation_keywords=activation_keywords
-    )
-    
-    return result.should_process
+    if not is_group:
+        return True
+    return group_gate_from_config(config or {}).check(message_text, is_group).should_process
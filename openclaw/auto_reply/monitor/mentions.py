@@ -9,6 +9,8 @@ import re
 from dataclasses import dataclass
 from typing import Optional
 
+_MENTION_RE = re.compile(r'@(\w+)')
+
 
 @dataclass
 class MentionMatch:
@@ -34,28 +36,17 @@ def detect_mentions(text: str, agent_names: Optional[list[str]] = None) -> list[
     
     mentions: list[MentionMatch] = []
     
-    # Pattern for @mentions
-    mention_pattern = r'@(\w+)'
+    # Lowercased name -> agent name (first one wins, as before)
+    known: dict[str, str] = {}
+    for name in agent_names or []:
+        known.setdefault(name.lower(), name)
     
-    for match in re.finditer(mention_pattern, text):
-        full_match = match.group(0)
-        username = match.group(1).lower()
-        
-        # Check if this mention matches any known agent
-        is_valid = False
-        agent_id = None
-        
-        if agent_names:
-            for name in agent_names:
-                if username == name.lower():
-                    is_valid = True
-                    agent_id = name
-                    break
-        
+    for match in _MENTION_RE.finditer(text):
+        agent_id = known.get(match.group(1).lower())
         mentions.append(MentionMatch(
-            full_match=full_match,
+            full_match=match.group(0),
             agent_id=agent_id,
-            is_mention=is_valid
+            is_mention=agent_id is not None
         ))
     
     return mentions
@@ -84,4 +75,4 @@ def strip_mentions(text: str) -> str:
     Returns:
         Text with mentions removed
     """
-    return re.sub(r'@\w+', '', text).strip()
+    return _MENTION_RE.sub('', text).strip()
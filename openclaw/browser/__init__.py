@@ -11,9 +11,22 @@ Provides:
 - Profile management
 """
 
-from .controller import BrowserController
-from .profiles import BrowserProfile
-from .tools.browser_tool import UnifiedBrowserTool
+from typing import TYPE_CHECKING
+
+from openclaw.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .controller import BrowserController
+    from .profiles import BrowserProfile
+    from .tools.browser_tool import UnifiedBrowserTool
+
+# Lazy: the browser tool imports openclaw.agents.tools, which imports it back
+_EXPORTS = {
+    "BrowserController": ".controller",
+    "BrowserProfile": ".profiles",
+    "UnifiedBrowserTool": ".tools.browser_tool",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BrowserController",
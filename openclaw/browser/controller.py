@@ -6,27 +6,57 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from .pool import BrowserLease, BrowserPool, get_browser_pool, set_resource_blocking
+from .snapshot_diff import SnapshotDiff, SnapshotEngine
+
 logger = logging.getLogger(__name__)
 
 
+class _PlaywrightCDP:
+    """Adapts a Playwright CDPSession to the CDPHelper command interface"""
+    
+    def __init__(self, session: Any):
+        self._session = session
+    
+    async def execute_command(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        return await self._session.send(method, params or {})
+
+
 class BrowserController:
     """
     Unified browser controller using Playwright
     
     Consolidates functionality from both previous browser implementations.
     Provides page management, navigation, interaction, and data extraction.
+    
+    With a ``session_key`` the controller leases an isolated context from
+    the shared ``BrowserPool`` instead of launching its own browser.
     """
     
-    def __init__(self, headless: bool = True, user_data_dir: Path | None = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        user_data_dir: Path | None = None,
+        session_key: str | None = None,
+        pool: BrowserPool | None = None,
+        block_resources: list[str] | None = None,
+    ):
         """
         Initialize browser controller
         
         Args:
             headless: Run in headless mode
             user_data_dir: Optional user data directory for profiles
+            session_key: Lease a context from the browser pool for this session
+            pool: Browser pool (defaults to the shared pool)
+            block_resources: Resource types to block, e.g. ["image", "font", "media"]
         """
         self.headless = headless
         self.user_data_dir = user_data_dir
+        self.session_key = session_key
+        self.block_resources = block_resources
+        self._pool = pool
+        self._lease: BrowserLease | None = None
         
         # Browser instances
         self._playwright = None
@@ -34,6 +64,8 @@ class BrowserController:
         self._context = None
         self._pages: dict[str, Any] = {}  # page_id -> Page
         self._default_page = None
+        self._cdp_sessions: dict[str, _PlaywrightCDP] = {}  # page_id -> CDP session
+        self._snapshots = SnapshotEngine()
         
         # State
         self.running = False
@@ -51,6 +83,17 @@ class BrowserController:
                 "Playwright not installed. Install with: pip install playwright && playwright install"
             )
         
+        if self.session_key is not None and self.user_data_dir is None:
+            if self._pool is None:
+                self._pool = get_browser_pool()
+            self._lease = await self._pool.acquire(self.session_key, self.block_resources)
+            self._context = self._lease.context
+            self._default_page = await self._pool.new_page(self._lease)
+            self._pages["default"] = self._default_page
+            self.running = True
+            logger.info(f"Leased pooled browser context for {self.session_key}")
+            return
+        
         logger.info("Starting browser...")
         
         # Start playwright
@@ -76,6 +119,10 @@ class BrowserController:
             self._context = await self._browser.new_context()
             self._default_page = await self._context.new_page()
         
+        if self.block_resources:
+            self._lease = BrowserLease(context=self._context)
+            await set_resource_blocking(self._lease, self.block_resources)
+        
         self._pages["default"] = self._default_page
         self.running = True
         
@@ -89,6 +136,11 @@ class BrowserController:
         logger.info("Stopping browser...")
         
         try:
+            if self._lease is not None and self._lease.session_key is not None:
+                # Pooled: closing the context drops its pages; the browser stays up
+                await self._pool.release(self._lease.session_key)
+                self._context = None
+            
             # Close all pages
             for page in self._pages.values():
                 if page and not page.is_closed():
@@ -111,6 +163,9 @@ class BrowserController:
         
         finally:
             self._pages.clear()
+            self._cdp_sessions.clear()
+            self._snapshots.reset()
+            self._lease = None
             self._default_page = None
             self._context = None
             self._browser = None
@@ -121,6 +176,17 @@ class BrowserController:
     
     async def _ensure_running(self) -> None:
         """Ensure browser is running"""
+        if self._lease is not None:
+            if self._lease.closed:
+                # Context was reaped while idle; start over in a fresh one
+                logger.info(f"Browser context for {self.session_key} was reaped, re-leasing")
+                self._pages.clear()
+                self._cdp_sessions.clear()
+                self._snapshots.reset()
+                self._lease = None
+                self.running = False
+            else:
+                self._lease.touch()
         if not self.running:
             await self.start()
     
@@ -141,14 +207,23 @@ class BrowserController:
             logger.warning(f"Page {page_id} already exists")
             return self._pages[page_id]
         
-        page = await self._context.new_page()
+        if self._lease is not None and self._lease.session_key is not None:
+            page = await self._pool.new_page(self._lease)
+        else:
+            page = await self._context.new_page()
         self._pages[page_id] = page
         
         logger.info(f"Created page: {page_id}")
         
         return page
     
-    async def navigate(self, url: str, page_id: str | None = None, wait_until: str = "load") -> dict[str, Any]:
+    async def navigate(
+        self,
+        url: str,
+        page_id: str | None = None,
+        wait_until: str = "load",
+        block_resources: list[str] | None = None,
+    ) -> dict[str, Any]:
         """
         Navigate to URL
         
@@ -156,12 +231,16 @@ class BrowserController:
             url: URL to navigate to
             page_id: Optional page ID
             wait_until: Wait until state ('load', 'domcontentloaded', 'networkidle')
+            block_resources: Resource types to block from now on (None keeps current)
             
         Returns:
             Navigation result
         """
         await self._ensure_running()
         
+        if block_resources is not None:
+            await self.set_resource_blocking(block_resources)
+        
         page = self._get_page(page_id)
         
         logger.info(f"Navigating to {url}")
@@ -328,6 +407,8 @@ class BrowserController:
             await page.close()
         
         del self._pages[page_id]
+        self._cdp_sessions.pop(page_id, None)
+        self._snapshots.reset(page_id)
         
         logger.info(f"Closed page: {page_id}")
     
@@ -351,6 +432,51 @@ class BrowserController:
             "viewport": page.viewport_size,
         }
     
+    async def accessibility_snapshot(
+        self,
+        page_id: str | None = None,
+        full: bool = False,
+        max_nodes: int | None = None,
+    ) -> SnapshotDiff:
+        """
+        Accessibility snapshot of a page
+        
+        The first snapshot of a page is complete; later ones only carry
+        the nodes added, removed or changed since the previous call.
+        
+        Args:
+            page_id: Optional page ID
+            full: Return the complete snapshot
+            max_nodes: Optional cap on nodes in the snapshot
+            
+        Returns:
+            Snapshot diff
+        """
+        await self._ensure_running()
+        
+        key = page_id if page_id in self._pages else "default"
+        session = self._cdp_sessions.get(key)
+        if session is None:
+            page = self._get_page(page_id)
+            session = _PlaywrightCDP(await self._context.new_cdp_session(page))
+            self._cdp_sessions[key] = session
+        
+        return await self._snapshots.snapshot(session, key, full=full, max_nodes=max_nodes)
+    
+    async def set_resource_blocking(self, resource_types: list[str]) -> None:
+        """
+        Block resource types (image, font, media, stylesheet) for all pages
+        
+        Args:
+            resource_types: Types to block; empty list unblocks everything
+        """
+        await self._ensure_running()
+        
+        if self._lease is None:
+            self._lease = BrowserLease(context=self._context)
+        await set_resource_blocking(self._lease, resource_types)
+        self.block_resources = list(resource_types)
+    
     def list_pages(self) -> list[str]:
         """List all page IDs"""
         return list(self._pages.keys())
@@ -0,0 +1,318 @@
+"""Shared browser with pooled, session-scoped contexts
+
+One long-lived Chromium process serves every agent session. Each session
+key leases its own ``BrowserContext`` (separate cookies, storage and
+cache), taken from a set of pre-warmed contexts so a session never waits
+for a browser launch. Contexts are closed rather than reused when a
+session ends, idle sessions are reaped, and each context can block heavy
+resource types (images, fonts, media) to speed up page loads.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+BLOCKABLE_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+@dataclass
+class BrowserLease:
+    """A browser context assigned to one session"""
+
+    context: Any
+    session_key: str | None = None
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.monotonic)
+    blocked: set[str] = field(default_factory=set)
+    routed: bool = False
+    closed: bool = False
+
+    def touch(self) -> None:
+        self.last_used = time.monotonic()
+
+    def open_pages(self) -> list[Any]:
+        return [page for page in self.context.pages if not page.is_closed()]
+
+
+async def set_resource_blocking(lease: BrowserLease, resource_types: list[str] | None) -> None:
+    """
+    Block resource types for every page in a lease's context
+
+    The route is installed once; later calls only change the blocked set,
+    so contexts that never block anything pay no interception cost.
+
+    Args:
+        lease: Context lease
+        resource_types: Playwright resource types to abort (None/[] = none)
+    """
+    types = set(resource_types or ())
+    unknown = types - BLOCKABLE_RESOURCE_TYPES
+    if unknown:
+        raise ValueError(f"Cannot block resource types: {', '.join(sorted(unknown))}")
+
+    lease.blocked.clear()
+    lease.blocked.update(types)
+    if lease.blocked and not lease.routed:
+        blocked = lease.blocked
+
+        async def handle(route):
+            if route.request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await lease.context.route("**/*", handle)
+        lease.routed = True
+
+
+class BrowserPool:
+    """
+    One browser process, many isolated contexts
+
+    Example:
+        pool = get_browser_pool()
+        lease = await pool.acquire("agent:main", block_resources=["image", "font"])
+        page = await pool.new_page(lease)
+        await page.goto("https://example.com")
+        await pool.release("agent:main")
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        warm_size: int = 2,
+        max_contexts: int = 20,
+        max_pages_per_context: int = 5,
+        idle_timeout: float = 600.0,
+        browser: Any | None = None,
+    ):
+        """
+        Initialize pool
+
+        Args:
+            headless: Launch Chromium headless
+            warm_size: Fresh contexts kept ready for new sessions
+            max_contexts: Most sessions holding a context at once
+            max_pages_per_context: Open pages allowed per session
+            idle_timeout: Seconds before an unused session's context is closed
+            browser: Already-launched Playwright browser (skips launching)
+        """
+        self.headless = headless
+        self.warm_size = warm_size
+        self.max_contexts = max_contexts
+        self.max_pages_per_context = max_pages_per_context
+        self.idle_timeout = idle_timeout
+        self._browser = browser
+        self._playwright = None
+        self._idle: deque[Any] = deque()
+        self._leases: dict[str, BrowserLease] = {}
+        self._lock = asyncio.Lock()
+        self._start_lock = asyncio.Lock()
+        self._warming = False
+        self._tasks: set[asyncio.Task] = set()
+        self._reaper: asyncio.Task | None = None
+        self._stats = {"hits": 0, "misses": 0, "reaped": 0, "launches": 0}
+
+    # ------------------------------------------------------------------
+    # Browser and context lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Launch the browser (once) and warm contexts"""
+        async with self._start_lock:
+            if self._browser is None or not self._browser.is_connected():
+                try:
+                    from playwright.async_api import async_playwright
+                except ImportError:
+                    raise RuntimeError(
+                        "Playwright not installed. Install with: pip install playwright && playwright install"
+                    )
+
+                logger.info("Launching pooled browser...")
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+                self._idle.clear()
+                self._stats["launches"] += 1
+
+            if self._reaper is None or self._reaper.done():
+                self._reaper = asyncio.create_task(self._reap_loop())
+
+        await self._replenish()
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _replenish(self) -> None:
+        """Top the warm set back up to warm_size"""
+        if self._warming:
+            return
+        self._warming = True
+        try:
+            while len(self._idle) < self.warm_size:
+                try:
+                    context = await self._browser.new_context()
+                except Exception as e:
+                    logger.warning(f"Failed to warm browser context: {e}")
+                    return
+                self._idle.append(context)
+        finally:
+            self._warming = False
+
+    async def _close_lease(self, lease: BrowserLease) -> None:
+        lease.closed = True
+        try:
+            await lease.context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context for {lease.session_key}: {e}")
+
+    async def _reap_loop(self) -> None:
+        interval = max(1.0, min(self.idle_timeout / 2, 60.0))
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reap_idle()
+            except Exception as e:
+                logger.warning(f"Browser context reaper error: {e}")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def acquire(
+        self,
+        session_key: str,
+        block_resources: list[str] | None = None,
+    ) -> BrowserLease:
+        """
+        Get the context for a session, leasing a warm one on first use
+
+        Args:
+            session_key: Session the context belongs to
+            block_resources: Resource types to block (None keeps the current setting)
+
+        Returns:
+            Context lease
+
+        Raises:
+            RuntimeError: If every context is leased to a live session
+        """
+        await self.start()
+
+        async with self._lock:
+            lease = self._leases.get(session_key)
+            if lease is None or lease.closed:
+                if len(self._leases) >= self.max_contexts:
+                    await self._reap_idle_locked()
+                if len(self._leases) >= self.max_contexts:
+                    raise RuntimeError(f"Browser pool exhausted ({self.max_contexts} contexts)")
+
+                if self._idle:
+                    context = self._idle.popleft()
+                    self._stats["hits"] += 1
+                else:
+                    context = await self._browser.new_context()
+                    self._stats["misses"] += 1
+                lease = BrowserLease(context=context, session_key=session_key)
+                self._leases[session_key] = lease
+                self._spawn(self._replenish())
+
+        lease.touch()
+        if block_resources is not None:
+            await set_resource_blocking(lease, block_resources)
+        return lease
+
+    async def new_page(self, lease: BrowserLease) -> Any:
+        """
+        Open a page in a leased context
+
+        Raises:
+            RuntimeError: If the context is at its page limit
+        """
+        if len(lease.open_pages()) >= self.max_pages_per_context:
+            raise RuntimeError(
+                f"Page limit reached ({self.max_pages_per_context}) for session {lease.session_key}"
+            )
+        lease.touch()
+        return await lease.context.new_page()
+
+    async def release(self, session_key: str) -> None:
+        """Close a session's context; its cookies and storage go with it"""
+        async with self._lock:
+            lease = self._leases.pop(session_key, None)
+        if lease is not None:
+            await self._close_lease(lease)
+
+    async def _reap_idle_locked(self) -> int:
+        cutoff = time.monotonic() - self.idle_timeout
+        stale = [key for key, lease in self._leases.items() if lease.last_used < cutoff]
+        for key in stale:
+            lease = self._leases.pop(key)
+            await self._close_lease(lease)
+            logger.debug(f"Reaped idle browser context for {key}")
+        self._stats["reaped"] += len(stale)
+        return len(stale)
+
+    async def reap_idle(self) -> int:
+        """Close contexts of sessions idle longer than idle_timeout"""
+        async with self._lock:
+            return await self._reap_idle_locked()
+
+    async def close(self) -> None:
+        """Close every context and the browser"""
+        for task in [self._reaper, *self._tasks]:
+            if task is not None:
+                task.cancel()
+        self._reaper = None
+
+        async with self._lock:
+            leases = list(self._leases.values())
+            idle = list(self._idle)
+            self._leases.clear()
+            self._idle.clear()
+        for lease in leases:
+            await self._close_lease(lease)
+        for context in idle:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled browser: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Pool statistics"""
+        return {
+            **self._stats,
+            "idle": len(self._idle),
+            "leased": len(self._leases),
+            "pages": sum(len(lease.open_pages()) for lease in self._leases.values()),
+        }
+
+
+# Global pool instance
+_pool: BrowserPool | None = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get global browser pool instance"""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool()
+    return _pool
@@ -12,6 +12,12 @@ from .cdp_helpers import CDPHelper
 
 logger = logging.getLogger(__name__)
 
+INTERACTIVE_ROLES = frozenset({
+    "button", "link", "textbox", "searchbox", "combobox",
+    "listbox", "menu", "menubar", "menuitem", "tab",
+    "checkbox", "radio", "switch", "slider"
+})
+
 
 class AccessibilityError(Exception):
     """Accessibility tree error"""
@@ -36,8 +42,13 @@ class AXNode:
         self.value: str = data.get("value", {}).get("value", "")
         self.properties: list[dict] = data.get("properties", [])
         self.child_ids: list[str] = data.get("childIds", [])
+        self.parent_id: str | None = data.get("parentId")
         self.backend_dom_node_id: int | None = data.get("backendDOMNodeId")
         
+        # Lowercased once; lookups and snapshots compare these
+        self.role_lower: str = self.role.lower()
+        self.name_lower: str = self.name.lower()
+        
         # Parse properties
         self.prop_dict: dict[str, Any] = {}
         for prop in self.properties:
@@ -48,12 +59,7 @@ class AXNode:
     
     def is_interactive(self) -> bool:
         """Check if node is interactive"""
-        interactive_roles = {
-            "button", "link", "textbox", "searchbox", "combobox",
-            "listbox", "menu", "menubar", "menuitem", "tab",
-            "checkbox", "radio", "switch", "slider"
-        }
-        return self.role.lower() in interactive_roles
+        return self.role_lower in INTERACTIVE_ROLES
     
     def is_focusable(self) -> bool:
         """Check if node is focusable"""
@@ -98,6 +104,16 @@ class AccessibilityTree:
             node.node_id: node for node in nodes
         }
         self.root: AXNode | None = nodes[0] if nodes else None
+        
+        # Indexes for role/name lookups (document order preserved)
+        self._by_role: dict[str, list[AXNode]] = {}
+        self._by_name: dict[str, list[AXNode]] = {}
+        self._interactive: list[AXNode] = []
+        for node in nodes:
+            self._by_role.setdefault(node.role_lower, []).append(node)
+            self._by_name.setdefault(node.name, []).append(node)
+            if node.is_interactive():
+                self._interactive.append(node)
     
     def find_by_role(self, role: str) -> list[AXNode]:
         """
@@ -109,7 +125,7 @@ class AccessibilityTree:
         Returns:
             List of matching nodes
         """
-        return [node for node in self.nodes if node.role.lower() == role.lower()]
+        return list(self._by_role.get(role.lower(), ()))
     
     def find_by_name(self, name: str, exact: bool = False) -> list[AXNode]:
         """
@@ -123,10 +139,10 @@ class AccessibilityTree:
             List of matching nodes
         """
         if exact:
-            return [node for node in self.nodes if node.name == name]
+            return list(self._by_name.get(name, ()))
         else:
             name_lower = name.lower()
-            return [node for node in self.nodes if name_lower in node.name.lower()]
+            return [node for node in self.nodes if name_lower in node.name_lower]
     
     def find_interactive(self) -> list[AXNode]:
         """
@@ -135,7 +151,7 @@ class AccessibilityTree:
         Returns:
             List of interactive nodes
         """
-        return [node for node in self.nodes if node.is_interactive()]
+        return list(self._interactive)
     
     def find_focusable(self) -> list[AXNode]:
         """
@@ -194,9 +210,9 @@ async def get_accessibility_tree(
         AccessibilityError: If snapshot fails
     """
     try:
+        # No frameId: the main frame
         result = await cdp.execute_command("Accessibility.getFullAXTree", {
             "depth": -1,  # Full tree
-            "frameId": None,  # Current frame
         })
         
         nodes = [AXNode(node_data) for node_data in result.get("nodes", [])]
@@ -0,0 +1,372 @@
+"""Incremental accessibility snapshots for browser automation
+
+Sending the agent the whole page after every browser step is expensive in
+prompt tokens. ``SnapshotEngine`` keeps the last snapshot per page and
+returns only what changed (added, removed and changed nodes), with refs
+that stay stable for a node across snapshots of the same document.
+
+Snapshots are capped by relevance: interactive controls first, then
+focusable/editable nodes, headings, landmarks and named content. Before
+fetching the full AX tree the engine asks the page (one tiny
+``Runtime.evaluate``) whether anything mutated since the last snapshot and
+skips the fetch when nothing did.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from .cdp_helpers import CDPHelper, evaluate_js
+from .role_snapshots import AccessibilityTree, AXNode, get_accessibility_tree
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_NODES = 200
+MAX_NAME_LENGTH = 100
+
+_LANDMARK_ROLES = frozenset({
+    "main", "navigation", "banner", "contentinfo", "form", "search",
+    "dialog", "alertdialog", "alert", "region", "complementary",
+})
+_SKIP_ROLES = frozenset({"inlinetextbox", "none", "presentation", "linebreak"})
+_STATE_PROPS = (
+    "focused", "checked", "pressed", "expanded", "selected",
+    "disabled", "required", "invalid",
+)
+
+# Installs a mutation counter on first call; returns [url, version]. The
+# random document id makes a reload of the same URL count as a change.
+_PROBE_JS = """(() => {
+  let s = window.__openclawAxSeq;
+  if (!s) {
+    s = window.__openclawAxSeq = {id: Math.random().toString(36).slice(2), seq: 0};
+    const bump = () => { s.seq++; };
+    new MutationObserver(bump).observe(document, {
+      subtree: true, childList: true, attributes: true, characterData: true
+    });
+    for (const t of ["input", "change", "focusin", "focusout"]) {
+      document.addEventListener(t, bump, true);
+    }
+  }
+  return [location.href, s.id + ":" + s.seq];
+})()"""
+
+
+@dataclass(frozen=True)
+class SnapshotNode:
+    """A node as presented to the agent"""
+
+    ref: str
+    role: str
+    name: str = ""
+    value: str = ""
+    states: tuple[str, ...] = ()
+    depth: int = 0
+    backend_node_id: int | None = None
+
+    def signature(self) -> tuple:
+        """Fields whose change is reported as a change"""
+        return (self.role, self.name, self.value, self.states)
+
+    def format(self) -> str:
+        """One-line text form, e.g. ``[e3] button "Submit" (disabled)``"""
+        parts = [f"[{self.ref}]", self.role]
+        if self.name:
+            name = self.name
+            if len(name) > MAX_NAME_LENGTH:
+                name = name[:MAX_NAME_LENGTH] + "…"
+            parts.append(f'"{name}"')
+        if self.value:
+            parts.append(f'value="{self.value[:MAX_NAME_LENGTH]}"')
+        if self.states:
+            parts.append(f"({', '.join(self.states)})")
+        return " ".join(parts)
+
+
+@dataclass
+class SnapshotDiff:
+    """Result of a snapshot: either a full snapshot or changes since the last one"""
+
+    page_id: str
+    url: str | None = None
+    full: bool = False
+    unchanged: bool = False
+    nodes: list[SnapshotNode] = field(default_factory=list)
+    added: list[SnapshotNode] = field(default_factory=list)
+    changed: list[SnapshotNode] = field(default_factory=list)
+    removed: list[SnapshotNode] = field(default_factory=list)
+    total: int = 0
+    omitted: int = 0
+
+    def format(self) -> str:
+        """Text form sent to the agent"""
+        where = f" of {self.url}" if self.url else ""
+        if self.unchanged:
+            return f"No changes since last snapshot{where} ({self.total} nodes)"
+
+        if self.full:
+            header = f"Snapshot{where} ({self.total} nodes"
+            if self.omitted:
+                header += f", {self.omitted} low-relevance nodes omitted"
+            lines = [header + "):"]
+            lines.extend("  " * node.depth + node.format() for node in self.nodes)
+            return "\n".join(lines)
+
+        lines = [
+            f"Changes since last snapshot{where} "
+            f"(+{len(self.added)} ~{len(self.changed)} -{len(self.removed)}, "
+            f"{self.total} nodes):"
+        ]
+        lines.extend(f"+ {node.format()}" for node in self.added)
+        lines.extend(f"~ {node.format()}" for node in self.changed)
+        lines.extend(f"- {node.format()}" for node in self.removed)
+        return "\n".join(lines)
+
+
+@dataclass
+class _PageState:
+    url: str | None = None
+    version: str | None = None
+    refs: dict[str, str] = field(default_factory=dict)  # stable node key -> ref
+    nodes: dict[str, SnapshotNode] = field(default_factory=dict)  # last snapshot
+    next_ref: int = 1
+
+
+def _relevance(node: AXNode, tree: AccessibilityTree) -> int:
+    """Score a node for inclusion; 0 means never shown"""
+    role = node.role_lower
+    if node.ignored or role in _SKIP_ROLES:
+        return 0
+    if node.is_interactive():
+        return 100
+    if role == "rootwebarea":
+        return 90
+    if node.is_focusable() or node.is_editable():
+        return 80
+    if role == "heading":
+        return 60
+    if role in _LANDMARK_ROLES:
+        return 50
+    if not node.name:
+        return 0
+    if role == "statictext":
+        # Text that only repeats its parent's accessible name
+        parent = tree.nodes_by_id.get(node.parent_id or "")
+        if parent is not None and parent.name == node.name:
+            return 0
+    return 20
+
+
+def _states(node: AXNode) -> tuple[str, ...]:
+    states = []
+    for prop in _STATE_PROPS:
+        value = node.prop_dict.get(prop)
+        if value in (None, False, "false", ""):
+            continue
+        states.append(prop if value in (True, "true") else f"{prop}={value}")
+    return tuple(states)
+
+
+class SnapshotEngine:
+    """
+    Per-page incremental accessibility snapshots
+
+    Example:
+        engine = SnapshotEngine()
+        first = await engine.snapshot(cdp, "default")   # full snapshot
+        # ... click something ...
+        diff = await engine.snapshot(cdp, "default")    # only the changes
+        print(diff.format())
+    """
+
+    def __init__(self, max_nodes: int = DEFAULT_MAX_NODES):
+        """
+        Initialize engine
+
+        Args:
+            max_nodes: Most nodes kept per snapshot (by relevance)
+        """
+        self.max_nodes = max_nodes
+        self._pages: dict[str, _PageState] = {}
+        self._stats = {"full": 0, "diffs": 0, "unchanged": 0, "fetches_skipped": 0}
+
+    async def _probe(self, cdp: CDPHelper) -> tuple[str | None, str | None]:
+        try:
+            url, version = await evaluate_js(cdp, _PROBE_JS, await_promise=False)
+            return url, version
+        except Exception as e:
+            logger.debug(f"Snapshot change probe failed: {e}")
+            return None, None
+
+    async def snapshot(
+        self,
+        cdp: CDPHelper,
+        page_id: str = "default",
+        full: bool = False,
+        max_nodes: int | None = None,
+    ) -> SnapshotDiff:
+        """
+        Snapshot a page, returning changes since the previous snapshot
+
+        Args:
+            cdp: CDP connection to the page
+            page_id: Key the previous snapshot is stored under
+            full: Return the whole snapshot even if a diff is possible
+            max_nodes: Override the node cap for this snapshot
+
+        Returns:
+            Snapshot diff (``full`` set for a complete snapshot)
+        """
+        state = self._pages.setdefault(page_id, _PageState())
+        url, version = await self._probe(cdp)
+
+        if (
+            not full
+            and state.nodes
+            and version is not None
+            and (url, version) == (state.url, state.version)
+        ):
+            self._stats["unchanged"] += 1
+            self._stats["fetches_skipped"] += 1
+            return SnapshotDiff(
+                page_id=page_id, url=url, unchanged=True, total=len(state.nodes)
+            )
+
+        tree = await get_accessibility_tree(cdp)
+        diff = self.update(tree, page_id, url=url, full=full, max_nodes=max_nodes)
+        state.version = version
+        return diff
+
+    def update(
+        self,
+        tree: AccessibilityTree,
+        page_id: str = "default",
+        url: str | None = None,
+        full: bool = False,
+        max_nodes: int | None = None,
+    ) -> SnapshotDiff:
+        """
+        Diff a fetched tree against the page's previous snapshot
+
+        Args:
+            tree: Freshly fetched accessibility tree
+            page_id: Page key
+            url: Page URL; a new URL starts a new document (full snapshot)
+            full: Force a full snapshot
+            max_nodes: Override the node cap
+
+        Returns:
+            Snapshot diff
+        """
+        state = self._pages.setdefault(page_id, _PageState())
+        if url is not None and url != state.url:
+            # New document: backend node ids are not comparable
+            state.url = url
+            state.refs.clear()
+            state.nodes.clear()
+
+        current, omitted = self._select(tree, state, max_nodes or self.max_nodes)
+        previous = state.nodes
+        state.nodes = current
+
+        added = [node for ref, node in current.items() if ref not in previous]
+        changed = [
+            node
+            for ref, node in current.items()
+            if ref in previous and previous[ref].signature() != node.signature()
+        ]
+        removed = [node for ref, node in previous.items() if ref not in current]
+
+        # A diff as large as the page is no cheaper than the page
+        if not previous or len(added) + len(changed) + len(removed) >= len(current):
+            full = True
+
+        if full:
+            self._stats["full"] += 1
+            return SnapshotDiff(
+                page_id=page_id,
+                url=state.url,
+                full=True,
+                nodes=list(current.values()),
+                total=len(current),
+                omitted=omitted,
+            )
+
+        self._stats["diffs"] += 1
+        return SnapshotDiff(
+            page_id=page_id,
+            url=state.url,
+            unchanged=not (added or changed or removed),
+            added=added,
+            changed=changed,
+            removed=removed,
+            total=len(current),
+            omitted=omitted,
+        )
+
+    def _select(
+        self,
+        tree: AccessibilityTree,
+        state: _PageState,
+        max_nodes: int,
+    ) -> tuple[dict[str, SnapshotNode], int]:
+        """Pick the most relevant nodes in document order and assign refs"""
+        candidates: list[tuple[int, int, AXNode, int]] = []
+        visited: set[str] = set()
+        stack = [(tree.root, 0)] if tree.root else []
+        while stack:
+            node, depth = stack.pop()
+            if node.node_id in visited:
+                continue
+            visited.add(node.node_id)
+
+            score = _relevance(node, tree)
+            if score:
+                candidates.append((score, len(candidates), node, depth))
+                depth += 1
+            for child in reversed(tree.get_children(node)):
+                stack.append((child, depth))
+
+        omitted = max(0, len(candidates) - max_nodes)
+        if omitted:
+            candidates = sorted(candidates, key=lambda c: (-c[0], c[1]))[:max_nodes]
+            candidates.sort(key=lambda c: c[1])
+
+        selected: dict[str, SnapshotNode] = {}
+        for _, _, node, depth in candidates:
+            key = (
+                f"b{node.backend_dom_node_id}"
+                if node.backend_dom_node_id is not None
+                else f"a{node.node_id}"
+            )
+            ref = state.refs.get(key)
+            if ref is None:
+                ref = state.refs[key] = f"e{state.next_ref}"
+                state.next_ref += 1
+            selected[ref] = SnapshotNode(
+                ref=ref,
+                role=node.role,
+                name=node.name,
+                value=str(node.value) if node.value else "",
+                states=_states(node),
+                depth=depth,
+                backend_node_id=node.backend_dom_node_id,
+            )
+        return selected, omitted
+
+    def get_node(self, page_id: str, ref: str) -> SnapshotNode | None:
+        """Look up a node from the page's last snapshot by ref"""
+        state = self._pages.get(page_id)
+        return state.nodes.get(ref) if state else None
+
+    def reset(self, page_id: str | None = None) -> None:
+        """Forget snapshots for a page (or all pages)"""
+        if page_id is None:
+            self._pages.clear()
+        else:
+            self._pages.pop(page_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Snapshot statistics"""
+        return {**self._stats, "pages": len(self._pages)}
@@ -28,20 +28,24 @@ class UnifiedBrowserTool(AgentTool):
     - Multi-page management
     """
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, session_key: str | None = None):
         """
         Initialize browser tool
         
         Args:
             headless: Run in headless mode
+            session_key: Use an isolated context from the shared browser pool
         """
         super().__init__()
         self.name = "browser"
         self.description = (
             "Control a web browser for automation, testing, and data extraction. "
-            "Can navigate, interact with elements, take screenshots, extract text, and execute JavaScript."
+            "Can navigate, interact with elements, take screenshots, extract text, and execute JavaScript. "
+            "The snapshot action returns the page's accessibility tree; after the first call "
+            "it returns only what changed."
         )
         self.headless = headless
+        self.session_key = session_key
         self.controller: BrowserController | None = None
     
     def get_schema(self) -> dict[str, Any]:
@@ -55,6 +59,7 @@ class UnifiedBrowserTool(AgentTool):
                         "stop",
                         "navigate",
                         "screenshot",
+                        "snapshot",
                         "click",
                         "type",
                         "evaluate",
@@ -101,6 +106,20 @@ class UnifiedBrowserTool(AgentTool):
                     "description": "Capture full page (for screenshot)",
                     "default": False,
                 },
+                "full": {
+                    "type": "boolean",
+                    "description": "Return the complete snapshot instead of changes (for snapshot)",
+                    "default": False,
+                },
+                "max_nodes": {
+                    "type": "integer",
+                    "description": "Maximum nodes in the snapshot, most relevant first (for snapshot)",
+                },
+                "block_resources": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": ["image", "font", "media", "stylesheet"]},
+                    "description": "Resource types to skip loading from now on (for navigate); [] loads everything",
+                },
                 "wait_until": {
                     "type": "string",
                     "enum": ["load", "domcontentloaded", "networkidle"],
@@ -114,7 +133,10 @@ class UnifiedBrowserTool(AgentTool):
     async def _ensure_controller(self) -> None:
         """Ensure browser controller is initialized"""
         if self.controller is None:
-            self.controller = BrowserController(headless=self.headless)
+            self.controller = BrowserController(
+                headless=self.headless,
+                session_key=self.session_key,
+            )
     
     async def execute(self, params: dict[str, Any]) -> ToolResult:
         """Execute browser action"""
@@ -154,7 +176,9 @@ class UnifiedBrowserTool(AgentTool):
                 page_id = params.get("page_id")
                 wait_until = params.get("wait_until", "load")
                 
-                result = await self.controller.navigate(url, page_id, wait_until)
+                result = await self.controller.navigate(
+                    url, page_id, wait_until, block_resources=params.get("block_resources")
+                )
                 
                 return ToolResult(
                     success=True,
@@ -173,6 +197,20 @@ class UnifiedBrowserTool(AgentTool):
                     content=f"Screenshot saved to {result_path}"
                 )
             
+            elif action == "snapshot":
+                page_id = params.get("page_id")
+                
+                diff = await self.controller.accessibility_snapshot(
+                    page_id,
+                    full=params.get("full", False),
+                    max_nodes=params.get("max_nodes"),
+                )
+                
+                return ToolResult(
+                    success=True,
+                    content=diff.format()
+                )
+            
             elif action == "click":
                 selector = params.get("selector")
                 if not selector:
@@ -3,6 +3,7 @@
 Splits long messages into chunks respecting channel limits.
 Matches TypeScript src/auto-reply/chunk.ts
 """
+import re
 from typing import List
 import logging
 
@@ -18,7 +19,8 @@ def chunk_text(text: str, limit: int, mode: str = "length") -> List[str]:
     Args:
         text: Text to chunk
         limit: Character limit per chunk
-        mode: "length" or "newline"
+        mode: "length", "newline" or "markdown" (never splits inside a
+            code block, code span, emphasis or link)
         
     Returns:
         List of text chunks
@@ -26,7 +28,10 @@ def chunk_text(text: str, limit: int, mode: str = "length") -> List[str]:
     if len(text) <= limit:
         return [text]
     
-    if mode == "newline":
+    if mode == "markdown":
+        from openclaw.markdown.channel_render import chunk_channel_markdown
+        return chunk_channel_markdown(text, "markdown", limit)
+    elif mode == "newline":
         return _chunk_by_newline(text, limit)
     else:
         return _chunk_by_length(text, limit)
@@ -170,16 +175,16 @@ def chunk_telegram_message(text: str, limit: int = 4000) -> List[str]:
     
     Matches TypeScript markdownToTelegramChunks()
     """
-    return chunk_text(text, limit, "newline")
+    return chunk_text(text, limit, "markdown")
 
 
 # Discord-specific chunking  
 def chunk_discord_message(text: str, limit: int = 2000) -> List[str]:
     """Chunk for Discord (2000 char limit)"""
-    return chunk_text(text, limit, "length")
+    return chunk_text(text, limit, "markdown")
 
 
 # Slack-specific chunking
 def chunk_slack_message(text: str, limit: int = 4000) -> List[str]:
     """Chunk for Slack (40000 char limit, using 4000 for readability)"""
-    return chunk_text(text, limit, "newline")
+    return chunk_text(text, limit, "markdown")
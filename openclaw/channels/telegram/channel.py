@@ -7,8 +7,11 @@ from datetime import UTC, datetime, timezone
 from typing import Any, Optional
 
 from telegram import Update, BotCommand, ReplyKeyboardMarkup, KeyboardButton, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest
 from telegram.ext import Application, ContextTypes, MessageHandler, CommandHandler, CallbackQueryHandler, filters
 
+from ...markdown.channel_render import chunk_channel_markdown
+from ...media.attachments import get_attachment_store
 from ..chat_commands import ChatCommandExecutor, ChatCommandParser
 from ..base import ChannelCapabilities, ChannelPlugin, InboundMessage
 from .command_handler import TelegramCommandHandler
@@ -18,6 +21,19 @@ from .commands_extended import register_extended_commands
 
 logger = logging.getLogger(__name__)
 
+TELEGRAM_TEXT_LIMIT = 4096
+
+
+def _message_file_id(message: Any) -> str | None:
+    """file_id of the media in a sent message"""
+    if getattr(message, "photo", None):
+        return message.photo[-1].file_id
+    for attr in ("video", "document", "audio", "voice", "animation"):
+        media = getattr(message, attr, None)
+        if media is not None:
+            return media.file_id
+    return None
+
 
 class TelegramChannel(ChannelPlugin):
     """Telegram bot channel"""
@@ -167,22 +183,16 @@ class TelegramChannel(ChannelPlugin):
             # Parse target (chat_id)
             chat_id = int(target) if target.lstrip("-").isdigit() else target
 
-            # Send message with Markdown parsing
-            # Try Markdown first, fallback to plain text if parsing fails
-            try:
-                message = await self._app.bot.send_message(
-                    chat_id=chat_id, 
-                    text=text, 
-                    reply_to_message_id=int(reply_to) if reply_to else None,
-                    parse_mode="Markdown"
-                )
-            except Exception as markdown_error:
-                logger.debug(f"Markdown parsing failed, sending as plain text: {markdown_error}")
-                # Fallback to plain text
+            # Render once to well-formed HTML, split on entity boundaries
+            chunks = chunk_channel_markdown(text, "telegram", TELEGRAM_TEXT_LIMIT) or [text]
+
+            message = None
+            for index, chunk in enumerate(chunks):
                 message = await self._app.bot.send_message(
-                    chat_id=chat_id, 
-                    text=text, 
-                    reply_to_message_id=int(reply_to) if reply_to else None
+                    chat_id=chat_id,
+                    text=chunk,
+                    reply_to_message_id=int(reply_to) if reply_to and index == 0 else None,
+                    parse_mode="HTML"
                 )
 
             return str(message.message_id)
@@ -355,7 +365,12 @@ class TelegramChannel(ChannelPlugin):
     async def send_media(
         self, target: str, media_url: str, media_type: str, caption: str | None = None
     ) -> str:
-        """Send media message (supports both URLs and local file paths)"""
+        """
+        Send media message (supports both URLs and local file paths)
+
+        Content Telegram already has (sent or received before) is sent by
+        its file_id instead of being uploaded again.
+        """
         if not self._app:
             raise RuntimeError("Telegram channel not started")
 
@@ -365,44 +380,58 @@ class TelegramChannel(ChannelPlugin):
             # Determine if media_url is a local file path or URL
             from pathlib import Path
             
-            media_source = media_url
-            is_local_file = False
-            
-            # Check if it's a local file path
+            local_path = None
             if not media_url.startswith(("http://", "https://", "file://")):
                 file_path = Path(media_url).expanduser()
                 if file_path.exists() and file_path.is_file():
-                    # Open local file for sending
-                    media_source = open(file_path, "rb")
-                    is_local_file = True
-                    logger.info(f"Sending local file: {file_path}")
-            
-            try:
-                if media_type == "photo":
-                    message = await self._app.bot.send_photo(
-                        chat_id=chat_id, photo=media_source, caption=caption
-                    )
-                elif media_type == "video":
-                    message = await self._app.bot.send_video(
-                        chat_id=chat_id, video=media_source, caption=caption
-                    )
-                elif media_type == "document":
-                    message = await self._app.bot.send_document(
-                        chat_id=chat_id, document=media_source, caption=caption
-                    )
-                else:
-                    raise ValueError(f"Unsupported media type: {media_type}")
-
-                return str(message.message_id)
-            finally:
-                # Close file if it was opened
-                if is_local_file and hasattr(media_source, "close"):
-                    media_source.close()
+                    local_path = file_path
+
+            # Content hash, for reusing Telegram's file_id
+            store = get_attachment_store()
+            sha256 = None
+            if local_path is not None:
+                sha256 = await store.hash_file(local_path)
+            elif media_url.startswith(("http://", "https://")):
+                cached = store.lookup_source(media_url)
+                sha256 = cached.sha256 if cached else None
+
+            file_id = store.get_platform_file_id(sha256, "telegram") if sha256 else None
+            if file_id:
+                try:
+                    message = await self._send_media_source(chat_id, media_type, file_id, caption)
+                    return str(message.message_id)
+                except BadRequest as e:
+                    logger.info(f"Cached Telegram file_id rejected, uploading again: {e}")
+                    store.forget_platform_file_id(sha256, "telegram")
+
+            if local_path is not None:
+                logger.info(f"Sending local file: {local_path}")
+                with open(local_path, "rb") as media_file:
+                    message = await self._send_media_source(chat_id, media_type, media_file, caption)
+            else:
+                message = await self._send_media_source(chat_id, media_type, media_url, caption)
+
+            sent_file_id = _message_file_id(message)
+            if sha256 and sent_file_id:
+                store.set_platform_file_id(sha256, "telegram", sent_file_id)
+            return str(message.message_id)
 
         except Exception as e:
             logger.error(f"Failed to send Telegram media: {e}", exc_info=True)
             raise
 
+    async def _send_media_source(
+        self, chat_id: int | str, media_type: str, source: Any, caption: str | None
+    ) -> Any:
+        """Send a file_id, URL or open file with the method for its media type"""
+        if media_type == "photo":
+            return await self._app.bot.send_photo(chat_id=chat_id, photo=source, caption=caption)
+        if media_type == "video":
+            return await self._app.bot.send_video(chat_id=chat_id, video=source, caption=caption)
+        if media_type == "document":
+            return await self._app.bot.send_document(chat_id=chat_id, document=source, caption=caption)
+        raise ValueError(f"Unsupported media type: {media_type}")
+
     def set_command_executor(self, session_manager, agent_runtime) -> None:
         """Set up command executor with session manager and agent runtime"""
         self._command_executor = ChatCommandExecutor(session_manager, agent_runtime)
@@ -460,6 +489,9 @@ class TelegramChannel(ChannelPlugin):
             file = await context.bot.get_file(file_id)
             file_url = file.file_path
 
+            # Once the URL is fetched, sending the same content reuses file_id
+            get_attachment_store().note_source(file_url, "telegram", file_id)
+
             logger.info(f"Received {media_type}: {file_name} from user {sender.id}")
 
             # Determine chat type
@@ -6,8 +6,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from ..config.loader import load_config
-
 console = Console()
 agent_app = typer.Typer(help="Agent execution and management", no_args_is_help=True)
 
@@ -31,6 +29,7 @@ def run(
     """Run an agent turn via the Gateway"""
     import asyncio
     import uuid
+
     from ..gateway.rpc_client import GatewayRPCClient
     
     try:
@@ -38,6 +37,8 @@ def run(
         if not session_id:
             session_id = f"cli-{uuid.uuid4().hex[:8]}"
         
+        from ..config.loader import load_config
+
         # Create RPC client
         config = load_config()
         client = GatewayRPCClient(config=config)
@@ -114,6 +115,8 @@ def list_agents(
 ):
     """List configured agents"""
     try:
+        from ..config.loader import load_config
+
         config = load_config()
         
         if not config.agents or not config.agents.agents:
@@ -6,8 +6,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from ..config.loader import load_config
-
 console = Console()
 channels_app = typer.Typer(help="Messaging channel management")
 
@@ -18,6 +16,8 @@ def list_channels(
 ):
     """List configured channels"""
     try:
+        from ..config.loader import load_config
+
         config = load_config()
         
         if json_output:
@@ -90,6 +90,8 @@ def add(
     
     # Load config
     try:
+        from ..config.loader import load_config
+
         config = load_config()
     except Exception as e:
         console.print(f"[red]Error loading config:[/red] {e}")
@@ -159,6 +161,8 @@ def remove(
     
     # Load config
     try:
+        from ..config.loader import load_config
+
         config = load_config()
     except Exception as e:
         console.print(f"[red]Error loading config:[/red] {e}")
@@ -8,8 +8,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from ..config.loader import load_config
-
 console = Console()
 gateway_app = typer.Typer(help="Gateway server management")
 
@@ -20,17 +18,24 @@ def run(
     bind: str = typer.Option("loopback", "--bind", help="Bind mode (loopback|lan|auto)"),
     force: bool = typer.Option(False, "--force", help="Kill existing listener on port"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose logging"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Worker processes for channels (supervisor mode when > 1)"),
 ):
     """Run the Gateway server (foreground)"""
     try:
         import logging
-        import subprocess
         import signal
+        import subprocess
+
         from ..gateway.bootstrap import GatewayBootstrap
+        from ..gateway.logs_tail import DEFAULT_LOG_FILE
+        from ..logging.pipeline import install_log_pipeline
         
         level = logging.DEBUG if verbose else logging.INFO
-        logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        # Console + rotated JSON-lines file (read by logs.tail), written off the event loop
+        install_log_pipeline(level=level, log_file=DEFAULT_LOG_FILE)
         
+        from ..config.loader import load_config
+
         config = load_config()
         
         if port:
@@ -68,10 +73,24 @@ def run(
         console.print(f"[cyan]Starting Gateway on port {gateway_port}...[/cyan]")
         
         # Use bootstrap to initialize all components
-        bootstrap = GatewayBootstrap()
+        # In supervisor mode, channels run in worker processes instead
+        bootstrap = GatewayBootstrap(start_channels=workers <= 1)
         
         async def run_with_bootstrap():
             await bootstrap.bootstrap()
+            
+            supervisor = None
+            if workers > 1:
+                from ..gateway.supervisor import GatewaySupervisor
+                
+                async def relay(event, payload):
+                    if bootstrap.server:
+                        await bootstrap.server.broadcast_event(event, payload)
+                
+                supervisor = GatewaySupervisor(workers, on_event=relay)
+                await supervisor.start()
+                console.print(f"[green]✓[/green] Started {workers} gateway workers")
+            
             console.print(f"[green]✓[/green] Gateway listening on ws://127.0.0.1:{gateway_port}")
             console.print("Press Ctrl+C to stop\n")
             
@@ -81,6 +100,9 @@ def run(
                     await asyncio.sleep(1)
             except asyncio.CancelledError:
                 pass
+            finally:
+                if supervisor:
+                    await supervisor.stop()
         
         asyncio.run(run_with_bootstrap())
     
@@ -148,6 +170,8 @@ def install(
             console.print("Use --force to reinstall")
             return
         
+        from ..config.loader import load_config
+
         config = load_config()
         if port:
             config.gateway.port = port
@@ -25,6 +25,9 @@ def logs(
     
     try:
         import time
+        from pathlib import Path
+
+        from openclaw.gateway.logs_tail import read_log_from, tail_log_file
         
         log_file = Path.home() / ".openclaw" / "logs" / "gateway.log"
         
@@ -33,32 +36,29 @@ def logs(
             console.print(f"Expected at: {log_file}")
             return
         
+        result = tail_log_file(log_file, limit=limit, max_bytes=max_bytes)
+        
         if json_output:
-            with open(log_file) as f:
-                lines = f.readlines()[-limit:]
-            for line in lines:
-                console.print(line.rstrip())
+            for line in result.lines:
+                console.print(line)
             return
         
         console.print(f"[dim]Tailing {log_file}[/dim]\n")
         
-        with open(log_file) as f:
-            # Seek to end minus limit lines
-            lines = f.readlines()[-limit:]
-            for line in lines:
-                console.print(line.rstrip())
+        for line in result.lines:
+            console.print(line)
         
         if follow:
             console.print(f"\n[dim]Following (Ctrl+C to stop)...[/dim]\n")
             try:
-                with open(log_file) as f:
-                    f.seek(0, 2)  # Seek to end
-                    while True:
-                        line = f.readline()
-                        if line:
-                            console.print(line.rstrip())
-                        else:
-                            time.sleep(interval / 1000.0)
+                cursor, inode = result.cursor, result.inode
+                while True:
+                    update = read_log_from(log_file, cursor, inode=inode, max_bytes=max_bytes)
+                    cursor, inode = update.cursor, update.inode
+                    for line in update.lines:
+                        console.print(line)
+                    if not update.truncated:
+                        time.sleep(interval / 1000.0)
             except KeyboardInterrupt:
                 console.print("\n[yellow]Stopped[/yellow]")
     
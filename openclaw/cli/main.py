@@ -9,8 +9,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ..config.loader import load_config
-
 app = typer.Typer(
     name="openclaw",
     help="🦞 OpenClaw - Personal AI Assistant Platform",
@@ -37,8 +35,9 @@ def start(
     ))
     
     # Load .env file before checking environment variables
-    from dotenv import load_dotenv
     from pathlib import Path
+
+    from dotenv import load_dotenv
     env_path = Path.cwd() / ".env"
     if env_path.exists():
         load_dotenv(env_path)
@@ -75,6 +74,7 @@ def start(
         
         # Use GatewayBootstrap to initialize and start all components
         import asyncio
+
         from ..gateway.bootstrap import GatewayBootstrap
         
         async def start_gateway():
@@ -348,26 +348,26 @@ def doctor(
 
 
 # Register subcommand modules
-from .gateway_cmd import gateway_app
-from .channels_cmd import channels_app
 from .agent_cmd import agent_app
-from .config_cmd import config_app
-from .status_cmd import status_app
-from .memory_cmd import memory_app
-from .models_cmd import models_app
-from .skills_cmd import skills_app
-from .tools_cmd import tools_app
-from .logs_cmd import logs_app
-from .message_cmd import message_app
 from .browser_cmd import browser_app
-from .system_cmd import system_app
+from .channels_cmd import channels_app
+from .config_cmd import config_app
 from .cron_cmd import cron_app
+from .gateway_cmd import gateway_app
 from .hooks_cmd import hooks_app
+from .logs_cmd import logs_app
+from .memory_cmd import memory_app
+from .message_cmd import message_app
+from .misc_cmd import register_misc_commands
+from .models_cmd import models_app
+from .nodes_cmd import nodes_app
 from .plugins_cmd import plugins_app
-from .security_cmd import security_app
 from .sandbox_cmd import sandbox_app
-from .nodes_cmd import nodes_app
-from .misc_cmd import register_misc_commands
+from .security_cmd import security_app
+from .skills_cmd import skills_app
+from .status_cmd import status_app
+from .system_cmd import system_app
+from .tools_cmd import tools_app
 
 app.add_typer(gateway_app, name="gateway")
 app.add_typer(channels_app, name="channels")
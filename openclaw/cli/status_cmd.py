@@ -7,8 +7,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from ..config.loader import load_config
-
 console = Console()
 status_app = typer.Typer(help="Status and health checks", no_args_is_help=False)
 
@@ -23,6 +21,8 @@ def status(
 ):
     """Show channel health and recent sessions"""
     try:
+        from ..config.loader import load_config
+
         config = load_config()
         
         if json_output:
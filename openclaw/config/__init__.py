@@ -1,8 +1,23 @@
 """Configuration management"""
 
-from .settings import Settings, get_settings
-from .schema import ClawdbotConfig
-from .loader import load_config, save_config
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .settings import Settings, get_settings
+    from .schema import ClawdbotConfig
+    from .loader import load_config, save_config
+
+_EXPORTS = {
+    "Settings": ".settings",
+    "get_settings": ".settings",
+    "ClawdbotConfig": ".schema",
+    "load_config": ".loader",
+    "save_config": ".loader",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "Settings",
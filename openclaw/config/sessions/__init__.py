@@ -0,0 +1,59 @@
+"""Session store (sessions.json or sessions.db), transcripts and preview index
+
+Aligned with TypeScript src/config/sessions/
+"""
+from __future__ import annotations
+
+from .paths import (
+    get_default_store_path,
+    get_sessions_dir,
+    resolve_session_db_path,
+    resolve_session_store_path,
+    resolve_session_transcript_path,
+)
+from .preview_index import SessionPreview, SessionPreviewIndex, get_session_preview_index
+from .sqlite_store import SessionStoreBusyError, SqliteSessionStore, get_sqlite_session_store
+from .store import (
+    load_session_store,
+    read_session_store_file,
+    save_session_store,
+    sorted_session_keys,
+    update_session_store,
+    update_session_store_entry,
+)
+from .transcripts import (
+    append_transcript_message,
+    compact_transcript,
+    delete_transcript,
+    read_first_user_message,
+    read_last_message_preview,
+    read_transcript_preview,
+    write_transcript_line,
+)
+
+__all__ = [
+    "get_default_store_path",
+    "get_sessions_dir",
+    "resolve_session_db_path",
+    "resolve_session_store_path",
+    "resolve_session_transcript_path",
+    "SessionPreview",
+    "SessionPreviewIndex",
+    "get_session_preview_index",
+    "SessionStoreBusyError",
+    "SqliteSessionStore",
+    "get_sqlite_session_store",
+    "load_session_store",
+    "read_session_store_file",
+    "save_session_store",
+    "sorted_session_keys",
+    "update_session_store",
+    "update_session_store_entry",
+    "append_transcript_message",
+    "compact_transcript",
+    "delete_transcript",
+    "read_first_user_message",
+    "read_last_message_preview",
+    "read_transcript_preview",
+    "write_transcript_line",
+]
@@ -0,0 +1,99 @@
+"""Session store and transcript paths
+
+Layout (aligned with TypeScript src/config/sessions/paths.ts):
+
+    ~/.openclaw/agents/<agentId>/sessions/sessions.json
+    ~/.openclaw/agents/<agentId>/sessions/<sessionId>.jsonl
+
+A ``sessions.db`` in the same directory replaces sessions.json (see
+:mod:`openclaw.config.sessions.sqlite_store`).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from openclaw.config.paths import get_openclaw_config_dir
+from openclaw.routing.session_key import normalize_agent_id
+
+STORE_FILENAME = "sessions.json"
+DB_FILENAME = "sessions.db"
+_DB_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+def get_sessions_dir(agent_id: str = "main") -> Path:
+    """Directory holding an agent's session store and transcripts"""
+    return get_openclaw_config_dir() / "agents" / normalize_agent_id(agent_id) / "sessions"
+
+
+def get_default_store_path(agent_id: str = "main") -> Path:
+    """
+    Default sessions.json path for an agent
+
+    Args:
+        agent_id: Agent identifier
+
+    Returns:
+        Path to sessions.json
+    """
+    return get_sessions_dir(agent_id) / STORE_FILENAME
+
+
+def resolve_session_store_path(store: str | None = None, agent_id: str = "main") -> Path:
+    """
+    Resolve a configured store path
+
+    Args:
+        store: Configured path; may contain ``{agentId}`` and ``~``
+        agent_id: Agent identifier
+
+    Returns:
+        Path to sessions.json
+    """
+    if not store:
+        return get_default_store_path(agent_id)
+    return Path(store.replace("{agentId}", normalize_agent_id(agent_id))).expanduser()
+
+
+def resolve_session_transcript_path(
+    session_id: str,
+    store_path: str | Path,
+    session_file: str | None = None,
+) -> Path:
+    """
+    Transcript path for a session
+
+    Relative ``session_file`` values are resolved against the store's
+    directory; the default is ``<sessionId>.jsonl`` there.
+
+    Args:
+        session_id: Session identifier
+        store_path: Path to sessions.json
+        session_file: Transcript file from the session entry
+
+    Returns:
+        Path to the JSONL transcript
+    """
+    sessions_dir = Path(store_path).parent
+    if session_file:
+        path = Path(session_file).expanduser()
+        return path if path.is_absolute() else sessions_dir / path
+    return sessions_dir / f"{session_id}.jsonl"
+
+
+def resolve_session_db_path(json_path: str | Path) -> Path | None:
+    """
+    SQLite database that takes over from a JSON session file
+
+    Args:
+        json_path: sessions.json (or another session JSON file), or a
+            database path itself
+
+    Returns:
+        The database path if ``json_path`` is a database or a
+        ``sessions.db`` exists next to it, else None
+    """
+    path = Path(json_path)
+    if path.suffix in _DB_SUFFIXES:
+        return path
+    db_path = path.with_name(DB_FILENAME)
+    return db_path if db_path.exists() else None
@@ -0,0 +1,276 @@
+"""Session preview index
+
+sessions.list can show a derived title (first user message) and the last
+message for every row. Reading those from the transcripts means opening
+and scanning one file per row on every refresh, so they are kept in a
+small SQLite sidecar next to sessions.json instead:
+
+    <sessions dir>/sessions.index.db
+
+Appends made through :func:`~openclaw.config.sessions.transcripts.write_transcript_line`
+update the index in place. Each record also stores the transcript's size
+and mtime, so a transcript changed some other way is rescanned once on
+its next lookup. A lookup costs a dict read and a ``stat``.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "sessions.index.db"
+
+# Characters kept for the first user message and last message preview
+PREVIEW_MAX_CHARS = 240
+
+
+@dataclass
+class SessionPreview:
+    """Indexed summary of one transcript"""
+
+    first_user_message: str | None = None
+    last_message_preview: str | None = None
+    message_count: int = 0
+    size: int = 0
+    mtime_ns: int = 0
+
+
+def message_from_record(record: Any) -> tuple[str, str] | None:
+    """
+    Extract (role, text) from a transcript line
+
+    Handles both ``{"type": "message", "message": {...}}`` lines and bare
+    ``{"role": ..., "content": ...}`` lines; session headers and other
+    records return None.
+    """
+    if not isinstance(record, dict):
+        return None
+    if record.get("type") == "message":
+        message = record.get("message")
+    elif "role" in record:
+        message = record
+    else:
+        return None
+    if not isinstance(message, dict):
+        return None
+
+    content = message.get("content")
+    if isinstance(content, list):
+        content = " ".join(
+            block.get("text", "") for block in content
+            if isinstance(block, dict) and block.get("type", "text") == "text"
+        )
+    elif not isinstance(content, str):
+        content = ""
+    return str(message.get("role") or "other"), content
+
+
+def _clip(text: str) -> str | None:
+    text = " ".join(text.split())
+    if not text:
+        return None
+    return text[:PREVIEW_MAX_CHARS]
+
+
+def _apply(preview: SessionPreview, role: str, text: str) -> None:
+    preview.message_count += 1
+    clipped = _clip(text)
+    if clipped is None:
+        return
+    if role == "user" and preview.first_user_message is None:
+        preview.first_user_message = clipped
+    if role in ("user", "assistant"):
+        preview.last_message_preview = clipped
+
+
+def scan_transcript(transcript_path: str | Path) -> SessionPreview:
+    """Build a preview by reading a whole transcript"""
+    preview = SessionPreview()
+    try:
+        stat = os.stat(transcript_path)
+        with open(transcript_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    message = message_from_record(json.loads(line))
+                except ValueError:
+                    continue
+                if message is not None:
+                    _apply(preview, *message)
+    except FileNotFoundError:
+        return preview
+    preview.size, preview.mtime_ns = stat.st_size, stat.st_mtime_ns
+    return preview
+
+
+class SessionPreviewIndex:
+    """
+    Preview records for the transcripts of one session store
+
+    Example:
+        index = get_session_preview_index(store_path)
+        preview = index.get(entry.session_id, transcript_path)
+    """
+
+    def __init__(self, db_path: Path | str):
+        """
+        Initialize index
+
+        Args:
+            db_path: SQLite sidecar path
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._sessions_dir = str(self.db_path.parent)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS previews (
+                session_id TEXT PRIMARY KEY,
+                first_user_message TEXT,
+                last_message_preview TEXT,
+                message_count INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL
+            )
+        """)
+        self._conn.commit()
+        self._entries: dict[str, SessionPreview] = {
+            row[0]: SessionPreview(*row[1:])
+            for row in self._conn.execute("SELECT * FROM previews")
+        }
+
+    def _store(self, session_id: str, preview: SessionPreview) -> None:
+        with self._lock:
+            self._entries[session_id] = preview
+            self._conn.execute(
+                "INSERT OR REPLACE INTO previews VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    session_id,
+                    preview.first_user_message,
+                    preview.last_message_preview,
+                    preview.message_count,
+                    preview.size,
+                    preview.mtime_ns,
+                ),
+            )
+            self._conn.commit()
+
+    def get(self, session_id: str, transcript_path: str | Path) -> SessionPreview:
+        """
+        Preview for a session, rescanning the transcript only if it changed
+
+        Args:
+            session_id: Session identifier
+            transcript_path: Transcript path
+
+        Returns:
+            SessionPreview (empty if the transcript does not exist)
+        """
+        preview = self._entries.get(session_id)
+        try:
+            stat = os.stat(transcript_path)
+        except FileNotFoundError:
+            return SessionPreview()
+        if preview is not None and (preview.size, preview.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            return preview
+
+        preview = scan_transcript(transcript_path)
+        self._store(session_id, preview)
+        return preview
+
+    def lookup(self, session_id: str, session_file: str | None = None) -> SessionPreview:
+        """
+        Preview for a session entry of this index's store
+
+        Same as :meth:`get`, resolving the transcript like
+        :func:`~openclaw.config.sessions.paths.resolve_session_transcript_path`
+        with string operations (this runs once per listed row).
+
+        Args:
+            session_id: Session identifier
+            session_file: Transcript file from the session entry
+        """
+        if session_file:
+            path = os.path.join(self._sessions_dir, os.path.expanduser(session_file))
+        else:
+            path = os.path.join(self._sessions_dir, session_id + ".jsonl")
+        return self.get(session_id, path)
+
+    def record_append(
+        self,
+        session_id: str,
+        transcript_path: str | Path,
+        record: dict[str, Any],
+        previous_size: int,
+    ) -> None:
+        """
+        Update a preview after one line was appended
+
+        Args:
+            session_id: Session identifier
+            transcript_path: Transcript path
+            record: Appended transcript record
+            previous_size: Transcript size before the append
+        """
+        preview = self._entries.get(session_id)
+        if preview is None and previous_size == 0:
+            preview = SessionPreview()
+        if preview is None or preview.size != previous_size:
+            # Not indexed, or changed behind our back: rescan on next lookup
+            self.discard(session_id)
+            return
+
+        updated = SessionPreview(**vars(preview))
+        message = message_from_record(record)
+        if message is not None:
+            _apply(updated, *message)
+        stat = os.stat(transcript_path)
+        updated.size, updated.mtime_ns = stat.st_size, stat.st_mtime_ns
+        self._store(session_id, updated)
+
+    def discard(self, session_id: str) -> None:
+        """Forget a session's preview"""
+        with self._lock:
+            if self._entries.pop(session_id, None) is not None:
+                self._conn.execute("DELETE FROM previews WHERE session_id = ?", (session_id,))
+                self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+
+# Index per sessions directory
+_indexes: dict[str, SessionPreviewIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_session_preview_index(store_path: str | Path) -> SessionPreviewIndex:
+    """
+    Get the preview index for a session store
+
+    Args:
+        store_path: Path to sessions.json
+
+    Returns:
+        SessionPreviewIndex stored next to it
+    """
+    db_path = Path(store_path).parent / INDEX_FILENAME
+    key = str(db_path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = SessionPreviewIndex(db_path)
+        return index
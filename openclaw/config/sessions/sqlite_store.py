@@ -0,0 +1,398 @@
+"""SQLite session metadata store (sessions.db)
+
+A ``sessions.db`` in a sessions directory takes over from the JSON files
+next to it (sessions.json, session_map.json and the override files), see
+:func:`~openclaw.config.sessions.paths.resolve_session_db_path`. Create
+one from existing JSON files with ``tools/migrate_sessions.py --sqlite``.
+
+The database runs in WAL mode, so several gateway processes can share it:
+readers never block, and writers take the write lock with
+``BEGIN IMMEDIATE`` (retried with backoff while another process holds
+it, then :class:`SessionStoreBusyError`) and update only the rows they
+change. Each entry is
+stored as JSON together with indexed copies of the columns sessions are
+looked up by (agent, channel, updated_at, label, spawned_by).
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from openclaw.agents.session_entry import SessionEntry, merge_session_entry
+from openclaw.routing.session_key import parse_agent_session_key
+
+logger = logging.getLogger(__name__)
+
+SessionStore = dict[str, SessionEntry]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    key TEXT PRIMARY KEY,
+    agent_id TEXT,
+    channel TEXT,
+    updated_at INTEGER NOT NULL,
+    label TEXT,
+    spawned_by TEXT,
+    session_id TEXT NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_agent ON sessions(agent_id, updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_channel ON sessions(channel, updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_label ON sessions(label);
+CREATE INDEX IF NOT EXISTS idx_sessions_spawned_by ON sessions(spawned_by);
+CREATE INDEX IF NOT EXISTS idx_sessions_session_id ON sessions(session_id);
+
+CREATE TABLE IF NOT EXISTS session_overrides (
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (key, kind)
+);
+"""
+
+# Backoff between BEGIN IMMEDIATE attempts when SQLite reports busy
+_BUSY_RETRY_DELAYS = (0.01, 0.05, 0.1, 0.25, 0.5)
+
+
+class SessionStoreBusyError(sqlite3.OperationalError):
+    """The write lock stayed held by another connection through every retry"""
+
+
+def _is_busy(error: sqlite3.OperationalError) -> bool:
+    # Extended result codes keep the primary code in the low byte
+    return error.sqlite_errorcode & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+
+_UPSERT_SQL = "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def _entry_json(entry: SessionEntry) -> str:
+    return json.dumps(entry.model_dump(mode="json", exclude_none=True), ensure_ascii=False)
+
+
+def _row(key: str, entry: SessionEntry, entry_json: str | None = None) -> tuple:
+    parsed = parse_agent_session_key(key)
+    return (
+        key,
+        parsed.agent_id if parsed else None,
+        entry.channel or entry.last_channel,
+        entry.updated_at,
+        entry.label,
+        entry.spawned_by,
+        entry.session_id,
+        entry_json if entry_json is not None else _entry_json(entry),
+    )
+
+
+class SqliteSessionStore:
+    """
+    Session entries and per-session overrides in one SQLite database
+
+    Example:
+        store = get_sqlite_session_store(db_path)
+        store.update("agent:main:main", {"label": "Inbox"})
+        recent = store.query(agent_id="main", limit=20)
+    """
+
+    def __init__(self, db_path: Path | str, busy_timeout_ms: int = 5000):
+        """
+        Initialize store
+
+        Args:
+            db_path: Database path (created if missing)
+            busy_timeout_ms: How long a writer waits for another process's
+                write lock before failing
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit; transactions are opened explicitly in _transaction()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=busy_timeout_ms / 1000,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._begin_immediate()
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _begin_immediate(self) -> None:
+        for delay in (*_BUSY_RETRY_DELAYS, None):
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as e:
+                if not _is_busy(e):
+                    raise
+                if delay is None:
+                    raise SessionStoreBusyError(
+                        f"Session database {self.db_path} is busy: {e}"
+                    ) from e
+                logger.debug(f"Session database busy, retrying in {delay}s: {e}")
+                time.sleep(delay)
+
+    def signature(self) -> tuple[int, int]:
+        """
+        Changes whenever the database does
+
+        ``PRAGMA data_version`` moves on commits from other connections
+        (including other processes), ``total_changes`` on our own.
+        """
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            return data_version, self._conn.total_changes
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> SessionEntry | None:
+        """Get one entry"""
+        with self._lock:
+            row = self._conn.execute("SELECT entry FROM sessions WHERE key = ?", (key,)).fetchone()
+        return SessionEntry.model_validate_json(row[0]) if row else None
+
+    def load(self) -> SessionStore:
+        """All entries, newest updated_at first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, entry FROM sessions ORDER BY updated_at DESC"
+            ).fetchall()
+        return self._entries(rows)
+
+    def query(
+        self,
+        agent_id: str | None = None,
+        channel: str | None = None,
+        label: str | None = None,
+        spawned_by: str | None = None,
+        updated_since: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[tuple[str, SessionEntry]]:
+        """
+        Entries matching the given columns, newest updated_at first
+
+        Args:
+            agent_id: Agent parsed from the session key
+            channel: Entry channel (or last channel)
+            label: Exact label
+            spawned_by: Parent session key
+            updated_since: Minimum updated_at (ms)
+            limit: Maximum rows
+            offset: Rows to skip
+
+        Returns:
+            (key, entry) pairs
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("agent_id", agent_id),
+            ("channel", channel),
+            ("label", label),
+            ("spawned_by", spawned_by),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if updated_since is not None:
+            clauses.append("updated_at >= ?")
+            params.append(updated_since)
+
+        sql = "SELECT key, entry FROM sessions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY updated_at DESC LIMIT ? OFFSET ?"
+        params += [limit if limit is not None else -1, offset]
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return list(self._entries(rows).items())
+
+    @staticmethod
+    def _entries(rows: list[tuple[str, str]]) -> SessionStore:
+        store: SessionStore = {}
+        for key, data in rows:
+            try:
+                store[key] = SessionEntry.model_validate_json(data)
+            except ValueError as e:
+                logger.warning(f"Skipping invalid session entry {key}: {e}")
+        return store
+
+    def upsert(self, key: str, entry: SessionEntry) -> None:
+        """Insert or replace one entry"""
+        with self._transaction() as conn:
+            conn.execute(_UPSERT_SQL, _row(key, entry))
+
+    def upsert_many(self, entries: SessionStore) -> None:
+        """Insert or replace several entries in one transaction"""
+        with self._transaction() as conn:
+            conn.executemany(_UPSERT_SQL, [_row(key, entry) for key, entry in entries.items()])
+
+    def update(self, key: str, patch: dict[str, Any]) -> SessionEntry:
+        """
+        Merge a patch into one entry (creating it if missing)
+
+        Args:
+            key: Session key
+            patch: Fields to set
+
+        Returns:
+            The updated entry
+        """
+        with self._transaction() as conn:
+            row = conn.execute("SELECT entry FROM sessions WHERE key = ?", (key,)).fetchone()
+            existing = SessionEntry.model_validate_json(row[0]) if row else None
+            entry = merge_session_entry(existing, patch)
+            conn.execute(_UPSERT_SQL, _row(key, entry))
+        return entry
+
+    def apply(self, mutator: Callable[[SessionStore], SessionStore | None]) -> SessionStore:
+        """
+        Run a whole-store mutator, writing back only the rows it changed
+
+        Args:
+            mutator: Changes the store in place (or returns a replacement)
+
+        Returns:
+            The resulting store
+        """
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT key, entry FROM sessions ORDER BY updated_at DESC").fetchall()
+            before = dict(rows)
+            store = self._entries(rows)
+            result = mutator(store)
+            if result is not None:
+                store = result
+
+            upserts = []
+            for key, entry in store.items():
+                entry_json = _entry_json(entry)
+                if before.get(key) != entry_json:
+                    upserts.append(_row(key, entry, entry_json))
+            removed = [(key,) for key in before if key not in store]
+            if upserts:
+                conn.executemany(_UPSERT_SQL, upserts)
+            if removed:
+                conn.executemany("DELETE FROM sessions WHERE key = ?", removed)
+        return store
+
+    def replace_all(self, entries: SessionStore) -> None:
+        """Make the table hold exactly these entries"""
+        self.apply(lambda _store: dict(entries))
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete one entry and its overrides
+
+        Returns:
+            True if the entry existed
+        """
+        with self._transaction() as conn:
+            deleted = conn.execute("DELETE FROM sessions WHERE key = ?", (key,)).rowcount
+            conn.execute("DELETE FROM session_overrides WHERE key = ?", (key,))
+        return deleted > 0
+
+    def session_ids(self, agent_id: str | None = None) -> dict[str, str]:
+        """Session key -> session ID (optionally for one agent)"""
+        sql = "SELECT key, session_id FROM sessions"
+        params: tuple = ()
+        if agent_id is not None:
+            sql += " WHERE agent_id = ?"
+            params = (agent_id,)
+        with self._lock:
+            return dict(self._conn.execute(sql, params).fetchall())
+
+    def set_session_id(self, key: str, session_id: str, **fields: Any) -> SessionEntry:
+        """Point a session key at a session ID (creating the entry if missing)"""
+        patch = {k: v for k, v in fields.items() if v is not None}
+        return self.update(key, {**patch, "session_id": session_id, "updated_at": int(time.time() * 1000)})
+
+    # ------------------------------------------------------------------
+    # Overrides
+    # ------------------------------------------------------------------
+
+    def get_overrides(self, kind: str) -> dict[str, dict[str, Any]]:
+        """
+        All overrides of one kind
+
+        Args:
+            kind: Override kind ("model", "level", ...)
+
+        Returns:
+            Session key -> override fields
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, data FROM session_overrides WHERE kind = ?", (kind,)
+            ).fetchall()
+        return {key: json.loads(data) for key, data in rows}
+
+    def set_override(self, key: str, kind: str, data: dict[str, Any]) -> None:
+        """Insert or replace one override"""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO session_overrides VALUES (?, ?, ?)",
+                (key, kind, json.dumps(data)),
+            )
+
+    def clear_override(self, key: str, kind: str) -> None:
+        """Delete one override"""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM session_overrides WHERE key = ? AND kind = ?", (key, kind))
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+
+# Store per database path
+_stores: dict[str, SqliteSessionStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_sqlite_session_store(db_path: Path | str) -> SqliteSessionStore:
+    """
+    Get the shared store for a database path
+
+    Args:
+        db_path: Database path
+
+    Returns:
+        SqliteSessionStore (one connection per path and process)
+    """
+    key = str(Path(db_path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = SqliteSessionStore(db_path)
+        return store
+
+
+def close_sqlite_session_stores() -> None:
+    """Close and forget all shared stores"""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
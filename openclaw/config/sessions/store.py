@@ -0,0 +1,278 @@
+"""Session store (sessions.json)
+
+Aligned with TypeScript src/config/sessions/store.ts:
+- loads are cached and revalidated by file mtime/size
+- writes are atomic (temp file + rename)
+- read-modify-write updates are serialized by a lock file
+
+If a sessions.db exists next to sessions.json, these functions read and
+write it instead (see :mod:`openclaw.config.sessions.sqlite_store`).
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from openclaw.agents.session_entry import SessionEntry, merge_session_entry
+
+from .paths import resolve_session_db_path
+from .sqlite_store import get_sqlite_session_store
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SessionStore = dict[str, SessionEntry]
+
+
+@dataclass
+class _CachedStore:
+    signature: tuple[int, int]  # (mtime_ns, size)
+    store: SessionStore
+    order: list[str] | None = None  # keys, newest updated_at first
+
+
+# store path -> cached load
+_cache: dict[str, _CachedStore] = {}
+_cache_lock = threading.Lock()
+_path_locks: dict[str, threading.Lock] = {}
+
+_CAMEL_RE = re.compile(r"(?<=[a-z0-9])([A-Z])")
+
+
+def _snake_keys(data: dict[str, Any]) -> dict[str, Any]:
+    # Stores written by the TypeScript gateway use camelCase keys
+    return {_CAMEL_RE.sub(r"_\1", key).lower(): value for key, value in data.items()}
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_session_store_file(path: str | Path) -> SessionStore:
+    """
+    Read a sessions.json file, bypassing the cache and any sessions.db
+
+    Args:
+        path: Path to sessions.json
+
+    Returns:
+        Session key -> SessionEntry (invalid entries are skipped)
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read session store {path}: {e}")
+        return {}
+
+    store: SessionStore = {}
+    for key, data in (raw or {}).items():
+        if not isinstance(data, dict):
+            continue
+        try:
+            store[key] = SessionEntry.model_validate(_snake_keys(data))
+        except ValueError as e:
+            logger.warning(f"Skipping invalid session entry {key}: {e}")
+    return store
+
+
+def load_session_store(store_path: str | Path, skip_cache: bool = False) -> SessionStore:
+    """
+    Load a session store
+
+    Cached loads return the same dict until the file changes; treat it as
+    read-only and change the store with :func:`update_session_store`.
+
+    Args:
+        store_path: Path to sessions.json
+        skip_cache: Read the file even if it is unchanged
+
+    Returns:
+        Session key -> SessionEntry
+    """
+    path = Path(store_path)
+    db_path = resolve_session_db_path(path)
+    if db_path is not None:
+        return _load_sqlite_store(db_path, skip_cache)
+
+    key = str(path)
+    signature = _signature(path)
+    if signature is None:
+        return {}
+
+    if not skip_cache:
+        with _cache_lock:
+            cached = _cache.get(key)
+        if cached is not None and cached.signature == signature:
+            return cached.store
+
+    store = read_session_store_file(path)
+    if not skip_cache:
+        with _cache_lock:
+            _cache[key] = _CachedStore(signature, store)
+    return store
+
+
+def _load_sqlite_store(db_path: Path, skip_cache: bool) -> SessionStore:
+    db = get_sqlite_session_store(db_path)
+    if skip_cache:
+        return db.load()
+
+    key = str(db_path)
+    signature = db.signature()
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached.signature == signature:
+        return cached.store
+
+    store = db.load()
+    with _cache_lock:
+        # Rows come back newest first, which is already the listing order
+        _cache[key] = _CachedStore(signature, store, order=list(store))
+    return store
+
+
+def save_session_store(store_path: str | Path, store: SessionStore) -> None:
+    """
+    Write a session store atomically
+
+    Args:
+        store_path: Path to sessions.json
+        store: Session key -> SessionEntry
+    """
+    path = Path(store_path)
+    db_path = resolve_session_db_path(path)
+    if db_path is not None:
+        get_sqlite_session_store(db_path).replace_all(store)
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {key: entry.model_dump(mode="json", exclude_none=True) for key, entry in store.items()}
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    with _cache_lock:
+        _cache.pop(str(path), None)
+
+
+@contextmanager
+def _store_lock(path: Path) -> Iterator[None]:
+    with _cache_lock:
+        lock = _path_locks.setdefault(str(path), threading.Lock())
+    with lock:
+        if fcntl is None:
+            yield
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_name(path.name + ".lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def update_session_store(
+    store_path: str | Path,
+    mutator: Callable[[SessionStore], SessionStore | None],
+) -> SessionStore:
+    """
+    Read, modify and write a session store under a lock
+
+    Args:
+        store_path: Path to sessions.json
+        mutator: Changes the store in place (or returns a replacement)
+
+    Returns:
+        The written store
+    """
+    path = Path(store_path)
+    db_path = resolve_session_db_path(path)
+    if db_path is not None:
+        # Only changed rows are written, inside one write transaction
+        return get_sqlite_session_store(db_path).apply(mutator)
+
+    with _store_lock(path):
+        store = load_session_store(path, skip_cache=True)
+        result = mutator(store)
+        if result is not None:
+            store = result
+        save_session_store(path, store)
+    return store
+
+
+def update_session_store_entry(
+    store_path: str | Path,
+    session_key: str,
+    patch: dict[str, Any],
+) -> SessionEntry:
+    """
+    Merge a patch into one entry (creating it if missing)
+
+    Args:
+        store_path: Path to sessions.json
+        session_key: Session key
+        patch: Fields to set
+
+    Returns:
+        The updated entry
+    """
+    db_path = resolve_session_db_path(store_path)
+    if db_path is not None:
+        return get_sqlite_session_store(db_path).update(session_key, patch)
+
+    updated: list[SessionEntry] = []
+
+    def mutator(store: SessionStore) -> None:
+        store[session_key] = merge_session_entry(store.get(session_key), patch)
+        updated.append(store[session_key])
+
+    update_session_store(store_path, mutator)
+    return updated[0]
+
+
+def sorted_session_keys(store: SessionStore) -> list[str]:
+    """
+    Store keys ordered by updated_at, newest first
+
+    The order is computed once per cached snapshot from
+    :func:`load_session_store`; other dicts are sorted on each call.
+    """
+    with _cache_lock:
+        cached = next((c for c in _cache.values() if c.store is store), None)
+    if cached is None:
+        return sorted(store, key=lambda k: store[k].updated_at, reverse=True)
+    if cached.order is None:
+        cached.order = sorted(store, key=lambda k: store[k].updated_at, reverse=True)
+    return cached.order
+
+
+def clear_session_store_cache_for_test() -> None:
+    """Forget cached stores"""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,218 @@
+"""Session transcripts (<sessionId>.jsonl)
+
+Reading, appending, compacting and deleting transcripts. Derived titles
+and last-message previews come from the preview index
+(:mod:`openclaw.config.sessions.preview_index`), not from the files.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from .paths import STORE_FILENAME, resolve_session_transcript_path
+from .preview_index import get_session_preview_index, message_from_record
+
+logger = logging.getLogger(__name__)
+
+
+def write_transcript_line(
+    transcript_path: str | Path,
+    record: dict[str, Any],
+    session_id: str | None = None,
+    store_path: str | Path | None = None,
+) -> None:
+    """
+    Append one record to a transcript and update the preview index
+
+    Args:
+        transcript_path: Transcript path
+        record: JSON-serializable transcript record
+        session_id: Session identifier (default: the file's stem)
+        store_path: sessions.json the transcript belongs to (default: the
+            one in the transcript's directory)
+    """
+    path = Path(transcript_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+
+    with open(path, "a", encoding="utf-8") as f:
+        previous_size = f.tell()
+        f.write(line)
+
+    index = get_session_preview_index(store_path or path.parent / STORE_FILENAME)
+    index.record_append(session_id or path.stem, path, record, previous_size)
+
+
+def append_transcript_message(
+    session_id: str,
+    store_path: str | Path,
+    role: str,
+    content: Any,
+    session_file: str | None = None,
+    **fields: Any,
+) -> None:
+    """
+    Append a message to a session's transcript
+
+    Args:
+        session_id: Session identifier
+        store_path: Path to sessions.json
+        role: Message role
+        content: Message content
+        session_file: Transcript file from the session entry
+        **fields: Extra fields stored with the message
+    """
+    record = {
+        "role": role,
+        "content": content,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        **fields,
+    }
+    path = resolve_session_transcript_path(session_id, store_path, session_file)
+    write_transcript_line(path, record, session_id=session_id, store_path=store_path)
+
+
+def read_first_user_message(
+    session_id: str,
+    store_path: str | Path,
+    session_file: str | None = None,
+) -> str | None:
+    """First user message of a session (from the preview index)"""
+    path = resolve_session_transcript_path(session_id, store_path, session_file)
+    return get_session_preview_index(store_path).get(session_id, path).first_user_message
+
+
+def read_last_message_preview(
+    session_id: str,
+    store_path: str | Path,
+    session_file: str | None = None,
+) -> str | None:
+    """Last user or assistant message of a session (from the preview index)"""
+    path = resolve_session_transcript_path(session_id, store_path, session_file)
+    return get_session_preview_index(store_path).get(session_id, path).last_message_preview
+
+
+def read_transcript_preview(
+    session_id: str,
+    store_path: str | Path,
+    session_file: str | None = None,
+    limit: int = 12,
+    max_chars: int = 240,
+) -> list[dict[str, str]]:
+    """
+    Last messages of a transcript
+
+    Args:
+        session_id: Session identifier
+        store_path: Path to sessions.json
+        session_file: Transcript file from the session entry
+        limit: Number of messages
+        max_chars: Maximum characters per message
+
+    Returns:
+        ``{"role", "content"}`` dicts, oldest first
+    """
+    path = resolve_session_transcript_path(session_id, store_path, session_file)
+    messages: deque[dict[str, str]] = deque(maxlen=max(limit, 0))
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try:
+                    message = message_from_record(json.loads(line))
+                except ValueError:
+                    continue
+                if message is not None:
+                    role, text = message
+                    messages.append({"role": role, "content": text[:max_chars]})
+    except FileNotFoundError:
+        return []
+    return list(messages)
+
+
+def _archive(path: Path, reason: str) -> Path:
+    archived = path.with_name(f"{path.name}.{reason}.{int(time.time() * 1000)}")
+    shutil.copy2(path, archived)
+    return archived
+
+
+def compact_transcript(
+    session_id: str,
+    store_path: str | Path,
+    keep_lines: int,
+    session_file: str | None = None,
+    archive_reason: str = "compaction",
+) -> dict[str, Any]:
+    """
+    Keep only the last lines of a transcript (plus its session header)
+
+    Args:
+        session_id: Session identifier
+        store_path: Path to sessions.json
+        keep_lines: Lines to keep
+        session_file: Transcript file from the session entry
+        archive_reason: Suffix for the archived copy of the full transcript
+
+    Returns:
+        Dict with removed_lines, kept_lines and archived_path
+    """
+    path = resolve_session_transcript_path(session_id, store_path, session_file)
+    if not path.exists():
+        return {"removed_lines": 0, "kept_lines": 0, "archived_path": None}
+
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    header = []
+    if lines:
+        try:
+            if json.loads(lines[0]).get("type") == "session":
+                header = lines[:1]
+        except (ValueError, AttributeError):
+            pass
+    body = lines[len(header):]
+    kept = body[-keep_lines:] if keep_lines > 0 else []
+    removed = len(body) - len(kept)
+    if removed <= 0:
+        return {"removed_lines": 0, "kept_lines": len(kept), "archived_path": None}
+
+    archived = _archive(path, archive_reason)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text("".join(header + kept), encoding="utf-8")
+    os.replace(tmp_path, path)
+    get_session_preview_index(store_path).discard(session_id)
+
+    return {"removed_lines": removed, "kept_lines": len(kept), "archived_path": str(archived)}
+
+
+def delete_transcript(
+    session_id: str,
+    store_path: str | Path,
+    session_file: str | None = None,
+    archive_first: bool = True,
+    archive_reason: str = "delete",
+) -> bool:
+    """
+    Delete a transcript
+
+    Args:
+        session_id: Session identifier
+        store_path: Path to sessions.json
+        session_file: Transcript file from the session entry
+        archive_first: Keep a copy next to the transcript
+        archive_reason: Suffix for the archived copy
+
+    Returns:
+        True if a transcript was deleted
+    """
+    path = resolve_session_transcript_path(session_id, store_path, session_file)
+    get_session_preview_index(store_path).discard(session_id)
+    if not path.exists():
+        return False
+    if archive_first:
+        _archive(path, archive_reason)
+    path.unlink()
+    return True
@@ -0,0 +1,12 @@
+"""Session store types
+
+Aligned with TypeScript src/config/sessions/types.ts; the models live in
+:mod:`openclaw.agents.session_entry`.
+"""
+from __future__ import annotations
+
+from openclaw.agents.session_entry import DeliveryContext, SessionEntry, SessionOrigin
+
+from .store import SessionStore
+
+__all__ = ["DeliveryContext", "SessionEntry", "SessionOrigin", "SessionStore"]
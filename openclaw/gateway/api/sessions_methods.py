@@ -17,13 +17,13 @@ from openclaw.config.sessions.store import (
 )
 from openclaw.config.sessions.paths import get_default_store_path
 from openclaw.config.sessions.transcripts import (
-    read_session_preview_items,
     compact_transcript,
     delete_transcript,
 )
 from openclaw.gateway.session_utils import (
     SessionsListOptions,
     list_sessions_from_store,
+    read_session_preview_items,
     resolve_gateway_session_store_target,
     resolve_main_session_key,
 )
@@ -109,6 +109,8 @@ READ_ONLY_METHODS = {
     "node.list",
     "device.pair.list",
     "logs.tail",
+    "logs.follow",
+    "logs.unfollow",
 }
 
 
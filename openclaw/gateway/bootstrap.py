@@ -44,9 +44,29 @@ class GatewayBootstrap:
     22. Log startup
     23. Start config reloader
     24. Create close handler
+    
+    In supervisor mode (``openclaw gateway run --workers N``) the same
+    sequence runs in every process with different flags: the supervisor
+    serves the WebSocket API and owns cron/heartbeats but starts no
+    channels, while each worker starts only the channel accounts that hash
+    to its ``shard`` and serves nothing.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        shard: tuple[int, int] | None = None,
+        start_channels: bool = True,
+        serve: bool = True,
+    ):
+        """
+        Args:
+            shard: (index, count) when running as a supervised worker
+            start_channels: Start configured channels (Step 13)
+            serve: Start the WebSocket server (Step 22)
+        """
+        self.shard = shard
+        self.start_channels = start_channels
+        self.serve = serve
         self.config = None
         self.runtime = None
         self.session_manager = None
@@ -226,29 +246,33 @@ class GatewayBootstrap:
         
         # Step 12: Build cron service
         logger.info("Step 12: Building cron service")
-        try:
-            from ..cron import CronService
+        if self.shard is not None:
+            # Workers must not run jobs a second time; the supervisor owns cron
+            logger.info("Cron service runs in the supervisor process, skipping")
+        else:
+            try:
+                from ..cron import CronService
             
-            # Cron directories
-            cron_dir = Path.home() / ".openclaw" / "cron"
-            store_path = cron_dir / "jobs.json"
-            log_dir = cron_dir / "runs"
+                # Cron directories
+                cron_dir = Path.home() / ".openclaw" / "cron"
+                store_path = cron_dir / "jobs.json"
+                log_dir = cron_dir / "runs"
             
-            # Create cron service
-            self.cron_service = CronService(
-                store_path=store_path,
-                log_dir=log_dir,
-                on_system_event=None,  # Will be set later
-                on_isolated_agent=None,  # Will be set later
-                on_event=None,  # Will be set later
-            )
+                # Create cron service
+                self.cron_service = CronService(
+                    store_path=store_path,
+                    log_dir=log_dir,
+                    on_system_event=None,  # Will be set later
+                    on_isolated_agent=None,  # Will be set later
+                    on_event=None,  # Will be set later
+                )
             
-            # Start cron service
-            self.cron_service.start()
+                # Start cron service
+                self.cron_service.start()
             
-            logger.info(f"Cron service started with {len(self.cron_service.jobs)} jobs")
-        except Exception as e:
-            logger.warning(f"Cron service initialization failed: {e}")
+                logger.info(f"Cron service started with {len(self.cron_service.jobs)} jobs")
+            except Exception as e:
+                logger.warning(f"Cron service initialization failed: {e}")
         results["steps_completed"] += 1
         
         # Step 13: Create channel manager and start channels
@@ -259,10 +283,11 @@ class GatewayBootstrap:
                 default_runtime=self.runtime,
                 session_manager=self.session_manager,
                 tools=self.tool_registry.list_tools() if self.tool_registry else [],
+                shard=self.shard,
             )
             
             # Register and start enabled channels from config
-            if self.config and self.config.channels:
+            if self.config and self.config.channels and self.start_channels:
                 started_count = 0
                 
                 # Telegram
@@ -368,7 +393,7 @@ class GatewayBootstrap:
                 for agent in self.config.agents.agents:
                     agents_config[agent.id] = {"heartbeat": {"enabled": False}}
             
-            if agents_config:
+            if agents_config and self.shard is None:
                 self.heartbeat_stop = start_heartbeat_runner(
                     agents_config,
                     execute_fn=self._execute_heartbeat,
@@ -404,6 +429,10 @@ class GatewayBootstrap:
                 config_path=config_file,
                 reload_fn=load_config,
             )
+            from ..security.tool_policy import invalidate_tool_policy_cache
+
+            # Compiled tool policy tables are keyed by config version
+            self.config_reloader.on_reload(lambda _config: invalidate_tool_policy_cache())
             self.config_reloader.start()
         except Exception as e:
             logger.warning(f"Config reloader failed: {e}")
@@ -416,36 +445,39 @@ class GatewayBootstrap:
         
         # Step 22: Start WebSocket server
         logger.info("Step 22: Starting WebSocket server")
-        try:
-            from .server import GatewayServer
-            port = self.config.gateway.port if self.config and self.config.gateway else 18789
+        if not self.serve:
+            logger.info("WebSocket server disabled for this process, skipping")
+        else:
+            try:
+                from .server import GatewayServer
+                port = self.config.gateway.port if self.config and self.config.gateway else 18789
             
-            # Get tools list from registry
-            tools = self.tool_registry.list_tools() if self.tool_registry else []
+                # Get tools list from registry
+                tools = self.tool_registry.list_tools() if self.tool_registry else []
             
-            self.server = GatewayServer(
-                config=self.config,
-                agent_runtime=self.runtime,
-                session_manager=self.session_manager,
-                tools=tools,
-                system_prompt=None,  # Will be built from skills
-                auto_discover_channels=False,  # We already created ChannelManager
-            )
+                self.server = GatewayServer(
+                    config=self.config,
+                    agent_runtime=self.runtime,
+                    session_manager=self.session_manager,
+                    tools=tools,
+                    system_prompt=None,  # Will be built from skills
+                    auto_discover_channels=False,  # We already created ChannelManager
+                )
             
-            # Override the ChannelManager that GatewayServer created with our own
-            # (since we already configured it in Step 13)
-            self.server.channel_manager = self.channel_manager
+                # Override the ChannelManager that GatewayServer created with our own
+                # (since we already configured it in Step 13)
+                self.server.channel_manager = self.channel_manager
             
-            # Start server in background task
-            # Pass start_channels=False since we already started channels in Step 13
-            asyncio.create_task(self.server.start(start_channels=False))
-            # Give server time to start
-            await asyncio.sleep(0.5)
-            logger.info(f"WebSocket server started on port {port}")
-            results["steps_completed"] += 1
-        except Exception as e:
-            logger.error(f"Server start failed: {e}")
-            results["errors"].append(f"server_start: {e}")
+                # Start server in background task
+                # Pass start_channels=False since we already started channels in Step 13
+                asyncio.create_task(self.server.start(start_channels=False))
+                # Give server time to start
+                await asyncio.sleep(0.5)
+                logger.info(f"WebSocket server started on port {port}")
+                results["steps_completed"] += 1
+            except Exception as e:
+                logger.error(f"Server start failed: {e}")
+                results["errors"].append(f"server_start: {e}")
         
         logger.info(f"Bootstrap complete: {results['steps_completed']} steps, {len(results['errors'])} errors")
         
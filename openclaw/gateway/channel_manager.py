@@ -26,8 +26,11 @@ from pathlib import Path
 from typing import Any
 
 from ..agents.runtime import AgentRuntime
+from ..auto_reply.monitor.group_gating import get_group_gating_stats, group_gate_from_config
 from ..channels.base import ChannelPlugin, InboundMessage, MessageHandler
 from ..events import Event, EventType
+from ..logging.pipeline import LogSampler
+from ..media.attachments import get_attachment_store
 
 # Channel event type constants
 class ChannelEventType:
@@ -42,6 +45,10 @@ class ChannelEventType:
 
 logger = logging.getLogger(__name__)
 
+# Per-event/per-delta debug lines: at most one per channel per second
+_event_sampler = LogSampler(logger)
+_delta_sampler = LogSampler(logger)
+
 
 class ChannelState(str, Enum):
     """Channel lifecycle state"""
@@ -141,6 +148,7 @@ class ChannelManager:
         session_manager: Any = None,
         tools: list | None = None,
         system_prompt: str | None = None,
+        shard: tuple[int, int] | None = None,
     ):
         """
         Initialize ChannelManager
@@ -150,11 +158,14 @@ class ChannelManager:
             session_manager: Session manager for creating/retrieving sessions
             tools: List of tools available to the agent
             system_prompt: Optional system prompt (skills, capabilities, etc.)
+            shard: Optional (index, count) when running as a supervised worker;
+                only channels that hash to this shard are started
         """
         self.default_runtime = default_runtime
         self.session_manager = session_manager
         self.tools = tools or []
         self.system_prompt = system_prompt
+        self.shard = shard
 
         # Channel plugin classes (for lazy instantiation)
         self._channel_classes: dict[str, type[ChannelPlugin]] = {}
@@ -171,6 +182,10 @@ class ChannelManager:
         # Running state
         self._running = False
 
+        # Background tasks (attachment prefetches), kept so they aren't
+        # garbage-collected mid-run
+        self._tasks: set[asyncio.Task] = set()
+
         logger.info("ChannelManager initialized")
 
     # =========================================================================
@@ -334,6 +349,15 @@ class ChannelManager:
     # Lifecycle Management
     # =========================================================================
 
+    def owns_channel(self, channel_id: str) -> bool:
+        """Whether this manager's shard is responsible for a channel account"""
+        if self.shard is None:
+            return True
+        from .supervisor import shard_index
+
+        index, count = self.shard
+        return shard_index(channel_id, count) == index
+
     async def start_channel(self, channel_id: str) -> bool:
         """
         Start a specific channel
@@ -349,6 +373,10 @@ class ChannelManager:
             logger.error(f"Channel not found: {channel_id}")
             return False
 
+        if not self.owns_channel(channel_id):
+            logger.info(f"Channel owned by another worker shard, skipping: {channel_id}")
+            return False
+
         if not env.enabled:
             logger.info(f"Channel disabled, skipping: {channel_id}")
             return False
@@ -588,6 +616,7 @@ class ChannelManager:
             "running_count": len(self.list_running()),
             "enabled_count": len(self.list_enabled()),
             "channels": channels,
+            "group_gating": get_group_gating_stats(),
         }
 
     # =========================================================================
@@ -658,6 +687,18 @@ class ChannelManager:
 
         return None
 
+    def _spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Run a background task, keeping a reference and logging failures"""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background task failed: %s", task.exception(), exc_info=task.exception())
+
     def _create_message_handler(self, channel_id: str) -> MessageHandler:
         """
         Create message handler for a channel
@@ -678,6 +719,12 @@ class ChannelManager:
                 await env.custom_message_handler(message)
                 return
 
+            # Group gating runs first: most group messages are dropped, and
+            # they should not pay for context building or session lookup
+            if env and "group_mode" in env.config and message.chat_type not in ("direct", "dm"):
+                if not group_gate_from_config(env.config).check(message.text or "").should_process:
+                    return
+
             # Get runtime
             runtime = self.get_runtime(channel_id)
             if not runtime:
@@ -690,7 +737,7 @@ class ChannelManager:
                 logger.error(f"Channel not found: {channel_id}")
                 return
 
-            logger.info(f"📨 [{channel_id}] Message from {message.sender_name}: {message.text}")
+            logger.info("📨 [%s] Message from %s (%d chars)", channel_id, message.sender_name, len(message.text or ""))
 
             try:
                 # Build MsgContext from InboundMessage
@@ -727,17 +774,26 @@ class ChannelManager:
                     if media_url:
                         ctx.MediaUrls = [media_url]
                         ctx.MediaUrl = media_url
+                        # Download into the attachment store while the turn
+                        # starts, held by this session until it is deleted
+                        if media_url.startswith(("http://", "https://")):
+                            self._spawn(
+                                get_attachment_store().prefetch(media_url, session_key=session_id)
+                            )
                 
                 # Finalize context (applies normalization, sender metadata, etc.)
                 ctx = finalize_inbound_context(ctx)
                 
-                logger.debug(f"[{channel_id}] Context finalized: BodyForAgent length={len(ctx.BodyForAgent or '')}, ChatType={ctx.ChatType}")
+                logger.debug(
+                    "[%s] Context finalized: BodyForAgent length=%d, ChatType=%s",
+                    channel_id, len(ctx.BodyForAgent or ""), ctx.ChatType,
+                )
 
                 # Get or create session
                 session = None
                 if self.session_manager:
                     session = self.session_manager.get_session(session_id)
-                    logger.info(f"[{channel_id}] Session created/retrieved: {session_id}")
+                    logger.debug("[%s] Session created/retrieved: %s", channel_id, session_id)
                     
                     # Resolve session workspace for file generation
                     from openclaw.agents.session_workspace import resolve_session_workspace_dir
@@ -745,17 +801,17 @@ class ChannelManager:
                         workspace_root=session.workspace_dir if session else Path.home() / ".openclaw" / "workspace",
                         session_key=session_id
                     )
-                    logger.info(f"[{channel_id}] Session workspace: {session_workspace}")
+                    logger.debug("[%s] Session workspace: %s", channel_id, session_workspace)
 
                 # Process through Agent Runtime
                 response_text = ""
-                logger.info(f"[{channel_id}] Starting runtime.run_turn with {len(self.tools)} tools")
+                logger.debug("[%s] Starting runtime.run_turn with %d tools", channel_id, len(self.tools))
 
                 # Extract images from context
                 images = None
                 if ctx.MediaUrls:
                     images = ctx.MediaUrls
-                    logger.info(f"[{channel_id}] Including {len(images)} media item(s) in request")
+                    logger.info("[%s] Including %d media item(s) in request", channel_id, len(images))
 
                 # Use BodyForAgent (properly formatted with sender metadata for groups)
                 message_text = ctx.BodyForAgent or ctx.Body
@@ -767,8 +823,7 @@ class ChannelManager:
                     images=images,
                     system_prompt=self.system_prompt
                 ):
-                    event_type_str = str(getattr(event, 'type', 'unknown'))
-                    logger.debug(f"[{channel_id}] Event received: type={event_type_str}")
+                    _event_sampler.debug(channel_id, "[%s] Event received: type=%s", channel_id, getattr(event, "type", "unknown"))
                     if hasattr(event, "type"):
                         # Handle EventType enum or string
                         event_type_value = event.type.value if hasattr(event.type, 'value') else str(event.type)
@@ -776,7 +831,7 @@ class ChannelManager:
                         if event_type_value == "agent.text" or event_type_value == "text":
                             delta_text = event.data.get("delta", {}).get("text", "")
                             response_text += delta_text
-                            logger.debug(f"[{channel_id}] Text delta: {delta_text[:50]}...")
+                            _delta_sampler.debug(channel_id, "[%s] Text delta: %.50s...", channel_id, delta_text)
                         elif event_type_value == "agent.file_generated":
                             # Handle file generated event - send file to user
                             file_path = event.data.get("file_path")
@@ -784,7 +839,7 @@ class ChannelManager:
                             caption = event.data.get("caption", "")
                             
                             if file_path and Path(file_path).exists():
-                                logger.info(f"[{channel_id}] Sending generated file: {file_path}")
+                                logger.info("[%s] Sending generated file: %s", channel_id, file_path)
                                 try:
                                     await channel.send_media(
                                         target=message.chat_id,
@@ -792,13 +847,13 @@ class ChannelManager:
                                         media_type=file_type,
                                         caption=caption
                                     )
-                                    logger.info(f"📎 [{channel_id}] Sent file to {message.chat_id}: {Path(file_path).name}")
+                                    logger.info("📎 [%s] Sent file to %s: %s", channel_id, message.chat_id, Path(file_path).name)
                                 except Exception as e:
-                                    logger.error(f"Failed to send file: {e}", exc_info=True)
+                                    logger.error("Failed to send file: %s", e, exc_info=True)
                             else:
-                                logger.warning(f"[{channel_id}] File not found or path missing: {file_path}")
+                                logger.warning("[%s] File not found or path missing: %s", channel_id, file_path)
                         elif event_type_value == "agent.turn_complete" or event_type_value == "turn_complete":
-                            logger.info(f"[{channel_id}] Turn complete")
+                            logger.debug("[%s] Turn complete", channel_id)
                             break
                     elif isinstance(event, dict):
                         if event.get("type") == "text":
@@ -806,7 +861,7 @@ class ChannelManager:
                         elif event.get("type") == "turn_complete":
                             break
 
-                logger.info(f"[{channel_id}] Accumulated response length: {len(response_text)}")
+                logger.debug("[%s] Accumulated response length: %d", channel_id, len(response_text))
 
                 # Send response back
                 if response_text:
@@ -815,12 +870,12 @@ class ChannelManager:
                         text=response_text,
                         reply_to=message.message_id,
                     )
-                    logger.info(f"📤 [{channel_id}] Sent response to {message.chat_id}")
+                    logger.info("📤 [%s] Sent response to %s (%d chars)", channel_id, message.chat_id, len(response_text))
                 else:
-                    logger.warning(f"[{channel_id}] No response text generated")
+                    logger.warning("[%s] No response text generated", channel_id)
 
             except Exception as e:
-                logger.error(f"Error processing message: {e}")
+                logger.error("Error processing message: %s", e)
                 # Optionally send error message
                 try:
                     await channel.send_text(
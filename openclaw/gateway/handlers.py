@@ -822,15 +822,83 @@ async def handle_exec_approvals_set(connection: Any, params: dict[str, Any]) ->
 
 @register_handler("logs.tail")
 async def handle_logs_tail(connection: Any, params: dict[str, Any]) -> dict[str, Any]:
-    """Tail gateway logs"""
-    from pathlib import Path
-    limit = params.get("limit", 200)
-    log_file = Path.home() / ".openclaw" / "logs" / "gateway.log"
-    lines = []
-    if log_file.exists():
-        with open(log_file) as f:
-            lines = f.readlines()[-limit:]
-    return {"lines": [l.rstrip() for l in lines]}
+    """Tail gateway logs
+
+    Without a cursor, returns the last ``limit`` lines read backwards from
+    EOF. With a ``cursor`` from a previous response, returns only the lines
+    appended since then (restarting from 0 after rotation).
+    """
+    from openclaw.gateway.logs_tail import (
+        DEFAULT_LIMIT,
+        DEFAULT_LOG_FILE,
+        DEFAULT_MAX_BYTES,
+        LogFilter,
+        read_log_from,
+        tail_log_file,
+    )
+
+    limit = params.get("limit") or DEFAULT_LIMIT
+    max_bytes = params.get("maxBytes") or DEFAULT_MAX_BYTES
+    log_filter = LogFilter.from_params(params)
+    cursor = params.get("cursor")
+
+    if cursor is None:
+        result = tail_log_file(DEFAULT_LOG_FILE, limit, max_bytes, log_filter)
+    else:
+        result = read_log_from(
+            DEFAULT_LOG_FILE, cursor, inode=params.get("inode"),
+            max_bytes=max_bytes, log_filter=log_filter,
+        )
+    return result.to_dict()
+
+
+@register_handler("logs.follow")
+async def handle_logs_follow(connection: Any, params: dict[str, Any]) -> dict[str, Any]:
+    """Subscribe to new log lines, pushed as ``logs.lines`` events"""
+    from openclaw.gateway.logs_tail import (
+        DEFAULT_LOG_FILE,
+        LogFilter,
+        LogFollower,
+        tail_log_file,
+    )
+
+    cursor = params.get("cursor")
+    inode = params.get("inode")
+    if cursor is None:
+        # Start from the current end of file
+        head = tail_log_file(DEFAULT_LOG_FILE, limit=1)
+        cursor, inode = head.cursor, head.inode
+
+    follower = LogFollower(
+        connection.send_event,
+        DEFAULT_LOG_FILE,
+        cursor=cursor,
+        inode=inode,
+        log_filter=LogFilter.from_params(params),
+        interval=(params.get("intervalMs") or 1000) / 1000.0,
+    )
+    followers = getattr(connection, "log_followers", None)
+    if followers is None:
+        followers = connection.log_followers = {}
+    followers[follower.subscription_id] = follower
+    follower.start()
+
+    return {
+        "subscriptionId": follower.subscription_id,
+        "file": str(follower.path),
+        "cursor": follower.cursor,
+        "inode": follower.inode,
+    }
+
+
+@register_handler("logs.unfollow")
+async def handle_logs_unfollow(connection: Any, params: dict[str, Any]) -> dict[str, Any]:
+    """Cancel a logs.follow subscription"""
+    followers = getattr(connection, "log_followers", None) or {}
+    follower = followers.pop(params.get("subscriptionId"), None)
+    if follower:
+        await follower.stop()
+    return {"subscriptionId": params.get("subscriptionId"), "stopped": follower is not None}
 
 
 @register_handler("models.list")
@@ -0,0 +1,380 @@
+"""Offset-based gateway log tailing and following
+
+Backs the ``logs.tail`` and ``logs.follow`` gateway methods. Instead of
+loading the whole log file, tailing reads backwards from EOF in fixed-size
+blocks until enough lines (or ``max_bytes``) have been collected, and every
+response carries a byte cursor. Followers poll the file from that cursor and
+detect rotation by comparing inode and size, so clients never re-read data
+they have already seen.
+
+Lines are matched against level/subsystem filters server-side. Both the
+classic ``asctime - name - LEVEL - message`` file format and JSON-lines
+records (``{"level": ..., "subsystem": ...}``) are understood.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import secrets
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from openclaw.logging.levels import LogLevel, level_from_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_FILE = Path.home() / ".openclaw" / "logs" / "gateway.log"
+DEFAULT_LIMIT = 200
+DEFAULT_MAX_BYTES = 250_000
+BLOCK_SIZE = 64 * 1024
+
+# Python logging level names -> OpenClaw log levels
+_PY_LEVEL_NAMES = {
+    "NOTSET": LogLevel.TRACE,
+    "TRACE": LogLevel.TRACE,
+    "DEBUG": LogLevel.DEBUG,
+    "INFO": LogLevel.INFO,
+    "WARN": LogLevel.WARN,
+    "WARNING": LogLevel.WARN,
+    "ERROR": LogLevel.ERROR,
+    "CRITICAL": LogLevel.FATAL,
+    "FATAL": LogLevel.FATAL,
+}
+
+
+@dataclass
+class LogFilter:
+    """Server-side line filter for tail/follow requests"""
+
+    min_level: LogLevel | None = None
+    subsystem: str | None = None
+
+    @classmethod
+    def from_params(cls, params: dict[str, Any]) -> LogFilter:
+        level = params.get("level")
+        subsystem = params.get("subsystem")
+        return cls(
+            min_level=level_from_string(level) if level else None,
+            subsystem=normalize_subsystem(subsystem) if subsystem else None,
+        )
+
+    @property
+    def active(self) -> bool:
+        return self.min_level is not None or self.subsystem is not None
+
+    def matches(self, line: str) -> bool:
+        if not self.active:
+            return True
+        level, subsystem = parse_log_line(line)
+        if self.min_level is not None:
+            # Continuation lines (tracebacks) have no level; keep them only
+            # when no level filter is requested.
+            if level is None or level < self.min_level:
+                return False
+        if self.subsystem is not None:
+            if subsystem is None:
+                return False
+            if subsystem != self.subsystem and not subsystem.startswith(self.subsystem + "/"):
+                return False
+        return True
+
+
+@dataclass
+class LogTailResult:
+    """Result of a tail/read operation"""
+
+    file: str
+    cursor: int
+    size: int
+    lines: list[str] = field(default_factory=list)
+    truncated: bool = False
+    reset: bool = False
+    inode: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "file": self.file,
+            "cursor": self.cursor,
+            "size": self.size,
+            "lines": self.lines,
+            "truncated": self.truncated,
+            "reset": self.reset,
+            "inode": self.inode,
+        }
+
+
+def normalize_subsystem(name: str) -> str:
+    """Normalize a logger name (``openclaw.gateway.auth``) to ``gateway/auth``"""
+    name = name.strip()
+    if name.startswith("openclaw."):
+        name = name[len("openclaw."):]
+    return name.replace(".", "/").strip("/")
+
+
+def parse_log_line(line: str) -> tuple[LogLevel | None, str | None]:
+    """
+    Extract (level, subsystem) from a log line
+
+    Returns (None, None) for lines that carry no metadata, such as
+    traceback continuation lines.
+    """
+    stripped = line.lstrip()
+    if stripped.startswith("{"):
+        try:
+            record = json.loads(stripped)
+        except ValueError:
+            record = None
+        if isinstance(record, dict):
+            level_name = str(record.get("level", "")).upper()
+            subsystem = record.get("subsystem") or record.get("name")
+            return (
+                _PY_LEVEL_NAMES.get(level_name),
+                normalize_subsystem(str(subsystem)) if subsystem else None,
+            )
+
+    parts = line.split(" - ", 3)
+    if len(parts) < 4:
+        return None, None
+    level = _PY_LEVEL_NAMES.get(parts[2].strip().upper())
+    if level is None:
+        return None, None
+    return level, normalize_subsystem(parts[1])
+
+
+def _stat(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _decode_lines(data: bytes) -> list[str]:
+    return [line.rstrip("\r") for line in data.decode("utf-8", errors="replace").split("\n")]
+
+
+def tail_log_file(
+    path: Path | str = DEFAULT_LOG_FILE,
+    limit: int = DEFAULT_LIMIT,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    log_filter: LogFilter | None = None,
+) -> LogTailResult:
+    """
+    Return the last ``limit`` matching lines of a log file
+
+    Reads backwards from EOF in ``BLOCK_SIZE`` blocks and stops as soon as
+    enough lines were found or ``max_bytes`` were scanned. The returned
+    cursor points just past the last complete line, suitable for
+    ``read_log_from``.
+    """
+    path = Path(path)
+    log_filter = log_filter or LogFilter()
+    st = _stat(path)
+    if st is None:
+        return LogTailResult(file=str(path), cursor=0, size=0)
+
+    size = st.st_size
+    lines: list[str] = []
+    # Bytes of an incomplete line carried over to the next (earlier) block
+    carry = b""
+    scanned = 0
+
+    with open(path, "rb") as f:
+        # A trailing line without newline is still being written; leave it
+        # behind the cursor so followers pick it up once complete.
+        end = _last_line_end(f, size, max_bytes)
+        pos = end
+
+        while pos > 0 and len(lines) < limit and scanned < max_bytes:
+            read_size = min(BLOCK_SIZE, pos, max_bytes - scanned)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size) + carry
+            scanned += read_size
+
+            if pos > 0:
+                newline = block.find(b"\n")
+                if newline == -1:
+                    carry = block
+                    continue
+                # Everything before the first newline belongs to a line that
+                # starts in an earlier block.
+                carry, complete = block[:newline], block[newline + 1:]
+            else:
+                carry, complete = b"", block
+
+            chunk_lines = _decode_lines(complete)
+            if chunk_lines and chunk_lines[-1] == "":
+                chunk_lines.pop()
+            lines = [line for line in chunk_lines if log_filter.matches(line)] + lines
+
+    # Earlier content exists that was not returned
+    truncated = pos > 0 or len(lines) > limit
+    lines = lines[-limit:]
+
+    return LogTailResult(
+        file=str(path),
+        cursor=end,
+        size=size,
+        lines=lines,
+        truncated=truncated,
+        inode=st.st_ino,
+    )
+
+
+def _last_line_end(f: Any, size: int, max_bytes: int) -> int:
+    """Offset just past the last newline within the final ``max_bytes``"""
+    pos = size
+    while pos > 0 and size - pos < max_bytes:
+        read_size = min(BLOCK_SIZE, pos)
+        pos -= read_size
+        f.seek(pos)
+        block = f.read(read_size)
+        newline = block.rfind(b"\n")
+        if newline != -1:
+            return pos + newline + 1
+    # No newline in range: a single oversized line, treat it as complete
+    return 0 if pos == 0 else size
+
+
+def read_log_from(
+    path: Path | str,
+    cursor: int,
+    inode: int | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    log_filter: LogFilter | None = None,
+) -> LogTailResult:
+    """
+    Read complete lines appended after ``cursor``
+
+    If the file was rotated (inode changed) or truncated (size below the
+    cursor), reading restarts from offset 0 and ``reset`` is set. Partial
+    trailing lines are left for the next call.
+    """
+    path = Path(path)
+    log_filter = log_filter or LogFilter()
+    st = _stat(path)
+    if st is None:
+        return LogTailResult(file=str(path), cursor=0, size=0, reset=cursor > 0)
+
+    reset = False
+    if (inode is not None and st.st_ino != inode) or st.st_size < cursor:
+        cursor = 0
+        reset = True
+
+    size = st.st_size
+    if size == cursor:
+        return LogTailResult(
+            file=str(path), cursor=cursor, size=size, reset=reset, inode=st.st_ino
+        )
+
+    with open(path, "rb") as f:
+        f.seek(cursor)
+        data = f.read(min(size - cursor, max_bytes))
+
+    end = data.rfind(b"\n")
+    if end == -1:
+        # Single line longer than max_bytes: emit it rather than stall
+        if len(data) >= max_bytes:
+            end = len(data) - 1
+        else:
+            return LogTailResult(
+                file=str(path), cursor=cursor, size=size, reset=reset, inode=st.st_ino
+            )
+    complete = data[: end + 1]
+    new_cursor = cursor + len(complete)
+
+    lines = _decode_lines(complete)
+    if lines and lines[-1] == "":
+        lines.pop()
+
+    return LogTailResult(
+        file=str(path),
+        cursor=new_cursor,
+        size=size,
+        lines=[line for line in lines if log_filter.matches(line)],
+        truncated=new_cursor < size,
+        reset=reset,
+        inode=st.st_ino,
+    )
+
+
+SendEvent = Callable[[str, Any], Awaitable[None]]
+
+
+class LogFollower:
+    """
+    Pushes new log lines to a client starting from a byte cursor
+
+    Polls the log file every ``interval`` seconds and sends ``logs.lines``
+    events through ``send_event`` whenever complete lines were appended.
+    """
+
+    def __init__(
+        self,
+        send_event: SendEvent,
+        path: Path | str = DEFAULT_LOG_FILE,
+        cursor: int = 0,
+        inode: int | None = None,
+        log_filter: LogFilter | None = None,
+        interval: float = 1.0,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.subscription_id = secrets.token_hex(8)
+        self.send_event = send_event
+        self.path = Path(path)
+        self.cursor = cursor
+        self.inode = inode
+        self.log_filter = log_filter or LogFilter()
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def poll_once(self) -> LogTailResult:
+        """Read newly appended lines and push them if there are any"""
+        result = read_log_from(
+            self.path,
+            self.cursor,
+            inode=self.inode,
+            max_bytes=self.max_bytes,
+            log_filter=self.log_filter,
+        )
+        self.cursor = result.cursor
+        self.inode = result.inode
+        if result.lines or result.reset:
+            payload = result.to_dict()
+            payload["subscriptionId"] = self.subscription_id
+            await self.send_event("logs.lines", payload)
+        return result
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                result = await self.poll_once()
+                # More data already waiting: drain without sleeping
+                if result.truncated:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Log follower {self.subscription_id} poll failed: {e}")
+            await asyncio.sleep(self.interval)
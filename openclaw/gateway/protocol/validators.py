@@ -235,6 +235,34 @@ class DevicePairRejectParams(BaseModel):
     reason: Optional[str] = None
 
 
+# ============================================================================
+# Logs Methods
+# ============================================================================
+
+class LogsTailParams(BaseModel):
+    """Parameters for logs.tail"""
+    limit: Optional[int] = Field(None, gt=0, le=5000)
+    maxBytes: Optional[int] = Field(None, gt=0, le=10_000_000)
+    cursor: Optional[int] = Field(None, ge=0)
+    inode: Optional[int] = None
+    level: Optional[str] = None
+    subsystem: Optional[str] = None
+
+
+class LogsFollowParams(BaseModel):
+    """Parameters for logs.follow"""
+    cursor: Optional[int] = Field(None, ge=0)
+    inode: Optional[int] = None
+    level: Optional[str] = None
+    subsystem: Optional[str] = None
+    intervalMs: Optional[int] = Field(None, ge=100, le=60_000)
+
+
+class LogsUnfollowParams(BaseModel):
+    """Parameters for logs.unfollow"""
+    subscriptionId: str
+
+
 # ============================================================================
 # Validator Registry
 # ============================================================================
@@ -280,6 +308,11 @@ PARAM_VALIDATORS = {
     "node.pair.approve": NodePairApproveParams,
     "node.pair.reject": NodePairRejectParams,
     
+    # Logs
+    "logs.tail": LogsTailParams,
+    "logs.follow": LogsFollowParams,
+    "logs.unfollow": LogsUnfollowParams,
+    
     # Devices
     "device.pair.approve": DevicePairApproveParams,
     "device.pair.reject": DevicePairRejectParams,
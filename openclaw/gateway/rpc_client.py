@@ -191,6 +191,8 @@ class GatewayRPCClient:
         self,
         limit: int = 200,
         max_bytes: int = 250000,
+        level: str | None = None,
+        subsystem: str | None = None,
     ) -> list[str]:
         """
         Tail gateway logs.
@@ -198,15 +200,49 @@ class GatewayRPCClient:
         Args:
             limit: Max lines to return
             max_bytes: Max bytes to read
+            level: Minimum log level to include
+            subsystem: Only include lines from this subsystem (and children)
         
         Returns:
             List of log lines
         """
-        result = await self.call("logs.tail", {
+        result = await self.tail_logs_from(
+            limit=limit, max_bytes=max_bytes, level=level, subsystem=subsystem
+        )
+        return result.get("lines", [])
+    
+    async def tail_logs_from(
+        self,
+        cursor: int | None = None,
+        limit: int = 200,
+        max_bytes: int = 250000,
+        level: str | None = None,
+        subsystem: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Tail gateway logs with a byte cursor for polling.
+        
+        Args:
+            cursor: Byte cursor from a previous call (returns only new lines)
+            limit: Max lines to return
+            max_bytes: Max bytes to read
+            level: Minimum log level to include
+            subsystem: Only include lines from this subsystem (and children)
+        
+        Returns:
+            Dict with ``lines``, ``cursor``, ``size``, ``truncated`` and ``reset``
+        """
+        params: dict[str, Any] = {
             "limit": limit,
             "maxBytes": max_bytes,
-        })
-        return result.get("lines", [])
+        }
+        if cursor is not None:
+            params["cursor"] = cursor
+        if level:
+            params["level"] = level
+        if subsystem:
+            params["subsystem"] = subsystem
+        return await self.call("logs.tail", params)
     
     async def send_message(
         self,
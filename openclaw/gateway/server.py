@@ -79,6 +79,7 @@ class GatewayConnection:
         self.auth_context = AuthContext(role="operator", scopes=set())
         self.nonce: Optional[str] = None
         self.connect_challenge_sent = False
+        self.log_followers: dict[str, Any] = {}  # logs.follow subscriptions
 
     async def send_response(
         self, request_id: str | int, payload: Any = None, error: ErrorShape | None = None
@@ -406,6 +407,7 @@ class GatewayServer:
         self.system_prompt = system_prompt
         self.http_server = None
         self.http_server_task = None
+        self._warmup_task: asyncio.Task | None = None
         self.active_runs: dict[str, asyncio.Task] = {}  # Track active agent runs for abort
         
         # Initialize memory manager (lazy initialization)
@@ -510,6 +512,9 @@ class GatewayServer:
             logger.error(f"Connection error: {e}", exc_info=True)
         finally:
             self.connections.discard(connection)
+            for follower in list(connection.log_followers.values()):
+                await follower.stop()
+            connection.log_followers.clear()
 
     async def broadcast_event(self, event: str, payload: Any = None) -> None:
         """Broadcast event to all connected clients"""
@@ -580,6 +585,11 @@ class GatewayServer:
         logger.info(f"Starting Gateway server on {host}:{port} (TLS: {enable_tls})")
         self.running = True
 
+        # Open provider connections now so the first turn skips the handshake,
+        # and keep them from idling out
+        if self.agent_runtime and hasattr(self.agent_runtime, "warm_connections"):
+            self._warmup_task = asyncio.create_task(self._warm_provider_connections())
+
         # Start HTTP server for control UI if enabled
         if getattr(self.config.gateway, 'enable_web_ui', True):
             await self._start_http_server()
@@ -634,11 +644,24 @@ class GatewayServer:
         except Exception as e:
             logger.error(f"Failed to start HTTP server: {e}", exc_info=True)
     
+    async def _warm_provider_connections(self) -> None:
+        """Warm the agent runtime's provider connections and start keep-alive"""
+        from openclaw.agents.providers.http_clients import get_provider_client_registry
+
+        try:
+            await self.agent_runtime.warm_connections()
+        except Exception as e:
+            logger.warning(f"Provider connection warm-up failed: {e}")
+        get_provider_client_registry().start_keepalive()
+
     async def stop(self) -> None:
         """Stop the Gateway server"""
         logger.info("Stopping Gateway server")
         self.running = False
 
+        if self._warmup_task:
+            self._warmup_task.cancel()
+
         # Stop HTTP server if running
         if self.http_server_task:
             try:
@@ -661,4 +684,9 @@ class GatewayServer:
                 logger.error(f"Error closing connection: {e}")
 
         self.connections.clear()
+
+        # Shared provider connections (and their keep-alive)
+        from openclaw.agents.providers.http_clients import close_provider_clients
+
+        await close_provider_clients()
         logger.info("Gateway server stopped")
@@ -12,16 +12,14 @@ from typing import Any, Dict, List, Literal, Optional, NamedTuple
 from dataclasses import dataclass
 
 from openclaw.agents.session_entry import SessionEntry
-from openclaw.config.sessions.store import load_session_store
+from openclaw.config.sessions.store import load_session_store, sorted_session_keys
 from openclaw.config.sessions.paths import (
     get_default_store_path,
+    resolve_session_db_path,
     resolve_session_store_path,
 )
-from openclaw.config.sessions.transcripts import (
-    read_first_user_message,
-    read_last_message_preview,
-    read_transcript_preview,
-)
+from openclaw.config.sessions.preview_index import get_session_preview_index
+from openclaw.config.sessions.transcripts import read_transcript_preview
 from openclaw.routing.session_key import (
     parse_agent_session_key,
     normalize_agent_id,
@@ -260,7 +258,7 @@ def load_combined_session_store(
     
     for agent_id in agent_ids:
         store_path = get_default_store_path(agent_id)
-        if not Path(store_path).exists():
+        if not Path(store_path).exists() and resolve_session_db_path(store_path) is None:
             continue
         
         store = load_session_store(str(store_path))
@@ -385,7 +383,7 @@ def list_sessions_from_store(
     opts: Optional[SessionsListOptions] = None
 ) -> SessionsListResult:
     """
-    Filter, search, and sort sessions from store
+    Filter, search, and page sessions from store (newest first)
     
     Args:
         store_path: Path to sessions.json
@@ -398,10 +396,23 @@ def list_sessions_from_store(
     if opts is None:
         opts = SessionsListOptions()
     
-    # Filter sessions
+    search_lower = opts.search.lower() if opts.search else None
+    cutoff_ms = None
+    if opts.active_minutes:
+        cutoff_ms = int(time.time() * 1000) - (opts.active_minutes * 60 * 1000)
+    
+    # Walk keys newest first (order cached per store snapshot), so offset
+    # and limit stop the scan early instead of filtering and sorting it all
     filtered_sessions: List[tuple[str, SessionEntry]] = []
+    skipped = 0
     
-    for key, entry in store.items():
+    for key in sorted_session_keys(store):
+        entry = store[key]
+        
+        # Active minutes filter (everything after this is older)
+        if cutoff_ms is not None and entry.updated_at < cutoff_ms:
+            break
+        
         # Agent ID filter
         if opts.agent_id:
             parsed = parse_agent_session_key(key)
@@ -417,8 +428,7 @@ def list_sessions_from_store(
             continue
         
         # Search filter (case-insensitive)
-        if opts.search:
-            search_lower = opts.search.lower()
+        if search_lower:
             searchable = " ".join([
                 entry.session_id,
                 entry.label or "",
@@ -435,50 +445,35 @@ def list_sessions_from_store(
         if key == "unknown" and not opts.include_unknown:
             continue
         
-        # Active minutes filter
-        if opts.active_minutes:
-            now_ms = int(time.time() * 1000)
-            cutoff_ms = now_ms - (opts.active_minutes * 60 * 1000)
-            if entry.updated_at < cutoff_ms:
-                continue
-        
+        # Apply offset and limit
+        if skipped < opts.offset:
+            skipped += 1
+            continue
         filtered_sessions.append((key, entry))
-    
-    # Sort by updated_at (newest first)
-    filtered_sessions.sort(key=lambda x: x[1].updated_at, reverse=True)
-    
-    # Apply offset and limit
-    if opts.offset > 0:
-        filtered_sessions = filtered_sessions[opts.offset:]
-    if opts.limit:
-        filtered_sessions = filtered_sessions[:opts.limit]
+        if opts.limit and len(filtered_sessions) >= opts.limit:
+            break
     
     # Convert to GatewaySessionRow
+    preview_index = get_session_preview_index(store_path) if (
+        opts.add_derived_titles or opts.add_last_message_preview
+    ) else None
     rows: List[GatewaySessionRow] = []
     for key, entry in filtered_sessions:
         kind = classify_session_key(key, entry)
         
-        # Optionally add derived title
+        # Derived title and last message preview come from the preview
+        # index (no transcript reads unless a transcript changed)
+        preview = None
+        if (opts.add_derived_titles or opts.add_last_message_preview) and entry.session_id:
+            preview = preview_index.lookup(entry.session_id, entry.session_file)
+        
         derived_title = None
         if opts.add_derived_titles:
-            first_message = None
-            if entry.session_file or entry.session_id:
-                first_message = read_first_user_message(
-                    entry.session_id,
-                    store_path,
-                    entry.session_file
-                )
-            derived_title = derive_session_title(entry, first_message)
+            derived_title = derive_session_title(entry, preview.first_user_message if preview else None)
         
-        # Optionally add last message preview
         last_message_preview = None
-        if opts.add_last_message_preview:
-            if entry.session_file or entry.session_id:
-                last_message_preview = read_last_message_preview(
-                    entry.session_id,
-                    store_path,
-                    entry.session_file
-                )
+        if opts.add_last_message_preview and preview:
+            last_message_preview = preview.last_message_preview
         
         row = GatewaySessionRow(
             key=key,
@@ -0,0 +1,223 @@
+"""Multi-process gateway supervisor
+
+Runs channel accounts and their agent runtimes in several worker processes
+so the gateway can use more than one core. The supervisor process:
+
+1. Hosts the Unix socket IPC hub (``openclaw.ipc.unix_socket``)
+2. Spawns ``count`` workers (``python -m openclaw.gateway.worker``)
+3. Restarts workers that exit unexpectedly, with exponential backoff
+4. Relays channel/agent events from workers to ``on_event`` (typically
+   ``GatewayServer.broadcast_event``) so WebSocket clients see one gateway
+
+Channel accounts are assigned to workers with a stable hash of the channel
+ID (``shard_index``), so an account always lands on the same worker across
+restarts.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from openclaw.ipc.message_queue import Message
+from openclaw.ipc.unix_socket import BROADCAST, UnixSocketMessageQueue, default_socket_path
+
+logger = logging.getLogger(__name__)
+
+SUPERVISOR_QUEUE = "gateway-supervisor"
+SUPERVISOR_NODE_ID = "supervisor"
+
+EventCallback = Callable[[str, Any], Awaitable[None]]
+
+
+def shard_index(key: str, count: int) -> int:
+    """Stable shard assignment for a channel account or session key"""
+    if count <= 1:
+        return 0
+    return zlib.crc32(key.encode("utf-8")) % count
+
+
+def worker_node_id(index: int) -> str:
+    return f"worker-{index}"
+
+
+@dataclass
+class WorkerHandle:
+    """Supervisor-side state of one worker process"""
+
+    index: int
+    process: asyncio.subprocess.Process | None = None
+    started_at: float = 0.0
+    restarts: int = 0
+    last_exit_code: int | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "nodeId": worker_node_id(self.index),
+            "pid": self.process.pid if self.process else None,
+            "running": self.running,
+            "startedAt": self.started_at,
+            "restarts": self.restarts,
+            "lastExitCode": self.last_exit_code,
+        }
+
+
+class GatewaySupervisor:
+    """
+    Spawns and supervises gateway worker processes
+
+    Example:
+        supervisor = GatewaySupervisor(4, on_event=server.broadcast_event)
+        await supervisor.start()
+        ...
+        await supervisor.stop()
+    """
+
+    def __init__(
+        self,
+        worker_count: int,
+        socket_path: Path | str | None = None,
+        on_event: EventCallback | None = None,
+        restart_backoff_max: float = 30.0,
+        shutdown_timeout: float = 10.0,
+    ):
+        if worker_count < 1:
+            raise ValueError("worker_count must be >= 1")
+        self.worker_count = worker_count
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path(SUPERVISOR_QUEUE)
+        self.on_event = on_event
+        self.restart_backoff_max = restart_backoff_max
+        self.shutdown_timeout = shutdown_timeout
+
+        self.queue = UnixSocketMessageQueue(
+            SUPERVISOR_QUEUE,
+            socket_path=self.socket_path,
+            listen=True,
+            node_id=SUPERVISOR_NODE_ID,
+        )
+        self.workers = [WorkerHandle(index=i) for i in range(worker_count)]
+        self._tasks: list[asyncio.Task] = []
+        self._stopping = False
+
+    def worker_command(self, index: int) -> list[str]:
+        """Command line used to launch worker ``index``"""
+        return [
+            sys.executable, "-m", "openclaw.gateway.worker",
+            "--index", str(index),
+            "--count", str(self.worker_count),
+            "--socket", str(self.socket_path),
+        ]
+
+    async def start(self) -> None:
+        """Start the IPC hub and all workers"""
+        await self.queue.start()
+        for worker in self.workers:
+            await self._spawn(worker)
+            self._tasks.append(asyncio.create_task(self._watch(worker)))
+        self._tasks.append(asyncio.create_task(self._pump_events()))
+        logger.info(f"Gateway supervisor started {self.worker_count} workers")
+
+    async def _spawn(self, worker: WorkerHandle) -> None:
+        worker.process = await asyncio.create_subprocess_exec(*self.worker_command(worker.index))
+        worker.started_at = time.time()
+        logger.info(f"Started gateway worker {worker.index} (PID={worker.process.pid})")
+
+    async def _watch(self, worker: WorkerHandle) -> None:
+        """Restart a worker whenever it exits while the supervisor is running"""
+        delay = 1.0
+        while not self._stopping:
+            assert worker.process is not None
+            worker.last_exit_code = await worker.process.wait()
+            if self._stopping:
+                break
+            # A worker that stayed up for a while resets the backoff
+            if time.time() - worker.started_at > 60:
+                delay = 1.0
+            logger.warning(
+                f"Gateway worker {worker.index} exited with {worker.last_exit_code}, "
+                f"restarting in {delay:.0f}s"
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.restart_backoff_max)
+            if self._stopping:
+                break
+            worker.restarts += 1
+            await self._spawn(worker)
+
+    async def _pump_events(self) -> None:
+        """Relay worker events to the event callback"""
+        while not self._stopping:
+            message = await self.queue.receive(timeout=1.0)
+            if message is None:
+                continue
+            if message.type == "event" and self.on_event:
+                try:
+                    await self.on_event(message.payload.get("event"), message.payload.get("payload"))
+                except Exception as e:
+                    logger.error(f"Supervisor event relay failed: {e}")
+
+    async def status(self, timeout: float = 2.0) -> list[dict[str, Any]]:
+        """Process state plus live status reported by each worker"""
+        results = []
+        for worker in self.workers:
+            info = worker.to_dict()
+            node_id = worker_node_id(worker.index)
+            if node_id in self.queue.peers():
+                try:
+                    reply = await self.queue.request(
+                        Message(
+                            type="status",
+                            sender=SUPERVISOR_NODE_ID,
+                            recipient=node_id,
+                            payload={},
+                            timestamp=time.time(),
+                        ),
+                        timeout=timeout,
+                    )
+                    info["status"] = reply.payload
+                except asyncio.TimeoutError:
+                    info["status"] = {"error": "timeout"}
+            results.append(info)
+        return results
+
+    async def stop(self) -> None:
+        """Ask workers to shut down, then terminate stragglers"""
+        self._stopping = True
+        with contextlib.suppress(Exception):
+            await self.queue.send(Message(
+                type="shutdown",
+                sender=SUPERVISOR_NODE_ID,
+                recipient=BROADCAST,
+                payload={},
+                timestamp=time.time(),
+            ))
+
+        for worker in self.workers:
+            if not worker.running:
+                continue
+            try:
+                await asyncio.wait_for(worker.process.wait(), timeout=self.shutdown_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Gateway worker {worker.index} did not exit, killing")
+                worker.process.kill()
+                await worker.process.wait()
+
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks.clear()
+        await self.queue.close()
+        logger.info("Gateway supervisor stopped")
@@ -0,0 +1,119 @@
+"""Gateway worker process
+
+Entry point for workers launched by ``GatewaySupervisor``:
+
+    python -m openclaw.gateway.worker --index 0 --count 4 --socket PATH
+
+A worker runs the normal bootstrap with ``shard=(index, count)``: it starts
+only the channel accounts assigned to its shard, with their own agent
+runtime, and does not serve the WebSocket API. Channel and agent events are
+forwarded to the supervisor over the Unix socket IPC queue.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from openclaw.ipc.message_queue import Message
+from openclaw.ipc.unix_socket import UnixSocketMessageQueue
+from openclaw.logging.pipeline import install_log_pipeline
+
+from .logs_tail import DEFAULT_LOG_FILE
+from .supervisor import SUPERVISOR_NODE_ID, SUPERVISOR_QUEUE, worker_node_id
+
+logger = logging.getLogger(__name__)
+
+
+class GatewayWorker:
+    """One supervised gateway shard"""
+
+    def __init__(self, index: int, count: int, socket_path: Path | str):
+        self.index = index
+        self.count = count
+        self.node_id = worker_node_id(index)
+        self.queue = UnixSocketMessageQueue(
+            SUPERVISOR_QUEUE, socket_path=socket_path, node_id=self.node_id
+        )
+        self.bootstrap = None
+        self._started_at = time.time()
+
+    async def _forward(self, event: str, payload: Any) -> None:
+        try:
+            await self.queue.send(Message(
+                type="event",
+                sender=self.node_id,
+                recipient=SUPERVISOR_NODE_ID,
+                payload={"event": event, "payload": payload},
+                timestamp=time.time(),
+            ))
+        except ConnectionError as e:
+            logger.warning(f"Worker {self.index}: dropping {event} event: {e}")
+
+    async def _on_channel_event(self, event_type: str, channel_id: str, data: dict[str, Any]) -> None:
+        await self._forward("channel", {"event": event_type, "channel_id": channel_id, "data": data})
+
+    async def _on_agent_event(self, event: Any) -> None:
+        await self._forward("agent", event.to_dict())
+
+    def status(self) -> dict[str, Any]:
+        manager = self.bootstrap.channel_manager if self.bootstrap else None
+        return {
+            "index": self.index,
+            "count": self.count,
+            "pid": os.getpid(),
+            "uptime": time.time() - self._started_at,
+            "channels": manager.list_running() if manager else [],
+        }
+
+    async def run(self) -> None:
+        from .bootstrap import GatewayBootstrap
+
+        await self.queue.wait_connected()
+
+        self.bootstrap = GatewayBootstrap(shard=(self.index, self.count), serve=False)
+        await self.bootstrap.bootstrap()
+        if self.bootstrap.channel_manager:
+            self.bootstrap.channel_manager.add_event_listener(self._on_channel_event)
+        if self.bootstrap.runtime and hasattr(self.bootstrap.runtime, "add_event_listener"):
+            self.bootstrap.runtime.add_event_listener(self._on_agent_event)
+
+        logger.info(f"Gateway worker {self.index}/{self.count} ready")
+        try:
+            while True:
+                message = await self.queue.receive(timeout=1.0)
+                if message is None:
+                    continue
+                if message.type == "shutdown":
+                    break
+                if message.type == "status":
+                    await self.queue.reply(message, self.status())
+        finally:
+            await self.bootstrap.shutdown()
+            await self.queue.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="OpenClaw gateway worker")
+    parser.add_argument("--index", type=int, required=True)
+    parser.add_argument("--count", type=int, required=True)
+    parser.add_argument("--socket", required=True)
+    args = parser.parse_args(argv)
+
+    # Same file as the gateway so logs.tail sees worker lines; the gateway
+    # process rotates it
+    install_log_pipeline(
+        level=logging.INFO,
+        log_file=DEFAULT_LOG_FILE,
+        rotate=False,
+        console_format=f"%(asctime)s - %(name)s - %(levelname)s - [worker-{args.index}] %(message)s",
+    )
+    asyncio.run(GatewayWorker(args.index, args.count, args.socket).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
 """Inter-process communication"""
 
-from .message_queue import MessageQueue, MessageQueueBackend
+from .message_queue import Message, MessageQueue, MessageQueueBackend, create_message_queue
+from .unix_socket import UnixSocketMessageQueue
 
-__all__ = ["MessageQueue", "MessageQueueBackend"]
+__all__ = [
+    "Message",
+    "MessageQueue",
+    "MessageQueueBackend",
+    "create_message_queue",
+    "UnixSocketMessageQueue",
+]
@@ -8,7 +8,7 @@ import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from enum import Enum
 from typing import Any
 
@@ -31,6 +31,18 @@ class Message:
     recipient: str
     payload: dict[str, Any]
     timestamp: float
+    message_id: str | None = None
+    correlation_id: str | None = None  # message_id of the request this replies to
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize message to a JSON-compatible dict"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Message:
+        """Deserialize message, ignoring unknown fields"""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
 
 
 class MessageQueue(ABC):
@@ -137,7 +149,7 @@ class RedisMessageQueue(MessageQueue):
                 
                 if msg and msg["type"] == "message":
                     data = json.loads(msg["data"])
-                    return Message(**data)
+                    return Message.from_dict(data)
             
             return None
             
@@ -175,5 +187,8 @@ def create_message_queue(
     elif backend == MessageQueueBackend.REDIS:
         redis_url = kwargs.get("redis_url", "redis://localhost")
         return RedisMessageQueue(queue_name, redis_url)
+    elif backend == MessageQueueBackend.UNIX:
+        from .unix_socket import UnixSocketMessageQueue
+        return UnixSocketMessageQueue(queue_name, **kwargs)
     else:
         raise ValueError(f"Unsupported backend: {backend}")
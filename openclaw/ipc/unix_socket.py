@@ -0,0 +1,364 @@
+"""Unix domain socket message queue
+
+Length-prefixed JSON frames over a Unix socket, for cross-process messaging
+on a single host without external services.
+
+Topology is hub-and-spoke: one process creates the queue with ``listen=True``
+and owns the socket; every other process connects to it. Each side has a
+``node_id``; the hub routes messages by ``recipient`` (``"*"`` broadcasts to
+all other nodes).
+
+Features:
+- Request/reply correlation via ``request()`` / ``reply()``
+- Backpressure: inbound messages go to a bounded queue; when it is full the
+  reader stops draining the socket and senders block in ``drain()``
+- Automatic reconnection with exponential backoff for client nodes
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import struct
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from .message_queue import Message, MessageQueue
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+BROADCAST = "*"
+HUB_NODE_ID = "hub"
+
+# Internal frame types (never delivered to receive())
+_HELLO = "__hello__"
+
+
+def default_socket_path(queue_name: str) -> Path:
+    """Default socket location for a queue name"""
+    return Path.home() / ".openclaw" / "ipc" / f"{queue_name}.sock"
+
+
+def encode_frame(data: dict[str, Any]) -> bytes:
+    """Encode a dict as a length-prefixed JSON frame"""
+    body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    if len(body) > MAX_FRAME_SIZE:
+        raise ValueError(f"IPC frame too large: {len(body)} bytes")
+    return HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """Read one frame, returning None on clean EOF"""
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"IPC frame too large: {length} bytes")
+    body = await reader.readexactly(length)
+    return json.loads(body)
+
+
+class _Peer:
+    """Connected node on the hub side"""
+
+    def __init__(self, node_id: str, writer: asyncio.StreamWriter):
+        self.node_id = node_id
+        self.writer = writer
+        self.lock = asyncio.Lock()
+
+    async def send(self, frame: bytes) -> None:
+        async with self.lock:
+            self.writer.write(frame)
+            await self.writer.drain()
+
+
+class UnixSocketMessageQueue(MessageQueue):
+    """
+    Message queue over a Unix domain socket
+
+    Example:
+        hub = UnixSocketMessageQueue("gateway", listen=True, node_id="supervisor")
+        worker = UnixSocketMessageQueue("gateway", node_id="worker-0")
+
+        reply = await worker.request(Message(
+            type="status", sender="worker-0", recipient="supervisor",
+            payload={}, timestamp=time.time(),
+        ))
+    """
+
+    def __init__(
+        self,
+        queue_name: str,
+        socket_path: Path | str | None = None,
+        listen: bool = False,
+        node_id: str | None = None,
+        max_pending: int = 1000,
+        connect_timeout: float = 10.0,
+        reconnect_initial: float = 0.1,
+        reconnect_max: float = 5.0,
+    ):
+        self.queue_name = queue_name
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path(queue_name)
+        self.listen = listen
+        self.node_id = node_id or (HUB_NODE_ID if listen else f"node-{uuid.uuid4().hex[:8]}")
+        self.connect_timeout = connect_timeout
+        self.reconnect_initial = reconnect_initial
+        self.reconnect_max = reconnect_max
+
+        self._inbox: asyncio.Queue[Message] = asyncio.Queue(maxsize=max_pending)
+        self._pending: dict[str, asyncio.Future[Message]] = {}
+        self._started = False
+        self._closed = False
+
+        # Hub state
+        self._server: asyncio.AbstractServer | None = None
+        self._peers: dict[str, _Peer] = {}
+        self._connections: set[asyncio.StreamWriter] = set()
+
+        # Client state
+        self._writer: asyncio.StreamWriter | None = None
+        self._write_lock = asyncio.Lock()
+        self._connected = asyncio.Event()
+        self._client_task: asyncio.Task | None = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Bind (hub) or start connecting (client)"""
+        if self._started:
+            return
+        self._started = True
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.listen:
+            # Remove a stale socket left behind by a crashed process
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+            self._server = await asyncio.start_unix_server(
+                self._handle_peer, path=str(self.socket_path)
+            )
+            os.chmod(self.socket_path, 0o600)
+            logger.info(f"IPC hub listening on {self.socket_path}")
+        else:
+            self._client_task = asyncio.create_task(self._client_loop())
+
+    async def wait_connected(self, timeout: float | None = None) -> None:
+        """Wait until a client node is connected to the hub"""
+        await self.start()
+        if self.listen:
+            return
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout or self.connect_timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError(f"IPC hub not reachable at {self.socket_path}") from None
+
+    @property
+    def connected(self) -> bool:
+        return (self.listen and self._server is not None) or self._connected.is_set()
+
+    def peers(self) -> list[str]:
+        """Node IDs currently connected to the hub"""
+        return list(self._peers)
+
+    async def close(self):
+        """Close connections and remove the socket (hub)"""
+        self._closed = True
+        if self._client_task:
+            self._client_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._client_task
+            self._client_task = None
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        # Includes connections that have not completed the hello yet
+        for writer in list(self._connections):
+            writer.close()
+        self._connections.clear()
+        self._peers.clear()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("IPC queue closed"))
+        self._pending.clear()
+
+    # ------------------------------------------------------------------
+    # MessageQueue API
+    # ------------------------------------------------------------------
+
+    async def send(self, message: Message):
+        """Send message (routed by recipient)"""
+        await self.start()
+        if not message.sender:
+            message.sender = self.node_id
+        if self.listen:
+            await self._route(message.to_dict(), from_node=self.node_id)
+        else:
+            await self._send_to_hub(encode_frame(message.to_dict()))
+
+    async def receive(self, timeout: float = 1.0) -> Message | None:
+        """Receive next message addressed to this node"""
+        await self.start()
+        try:
+            return await asyncio.wait_for(self._inbox.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def request(self, message: Message, timeout: float = 30.0) -> Message:
+        """Send a message and wait for the correlated reply"""
+        message.message_id = message.message_id or uuid.uuid4().hex
+        future: asyncio.Future[Message] = asyncio.get_running_loop().create_future()
+        self._pending[message.message_id] = future
+        try:
+            await self.send(message)
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._pending.pop(message.message_id, None)
+
+    async def reply(
+        self,
+        request: Message,
+        payload: dict[str, Any],
+        type: str | None = None,
+    ) -> None:
+        """Reply to a message received via receive()"""
+        await self.send(Message(
+            type=type or f"{request.type}.reply",
+            sender=self.node_id,
+            recipient=request.sender,
+            payload=payload,
+            timestamp=time.time(),
+            message_id=uuid.uuid4().hex,
+            correlation_id=request.message_id,
+        ))
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    async def _deliver_local(self, data: dict[str, Any]) -> None:
+        message = Message.from_dict(data)
+        if message.correlation_id:
+            future = self._pending.get(message.correlation_id)
+            if future and not future.done():
+                future.set_result(message)
+                return
+        # Blocks while the inbox is full, which stops reading from the
+        # socket and pushes backpressure onto the sender.
+        await self._inbox.put(message)
+
+    async def _route(self, data: dict[str, Any], from_node: str) -> None:
+        """Hub-side routing"""
+        recipient = data.get("recipient") or BROADCAST
+        if recipient == BROADCAST:
+            frame = encode_frame(data)
+            for node_id, peer in list(self._peers.items()):
+                if node_id != from_node:
+                    await self._send_to_peer(peer, frame)
+            if from_node != self.node_id:
+                await self._deliver_local(data)
+        elif recipient == self.node_id:
+            await self._deliver_local(data)
+        else:
+            peer = self._peers.get(recipient)
+            if peer is None:
+                logger.warning(f"IPC: dropping {data.get('type')} for unknown node {recipient}")
+                return
+            await self._send_to_peer(peer, encode_frame(data))
+
+    async def _send_to_peer(self, peer: _Peer, frame: bytes) -> None:
+        try:
+            await peer.send(frame)
+        except (ConnectionError, RuntimeError) as e:
+            logger.warning(f"IPC: failed to send to {peer.node_id}: {e}")
+            self._peers.pop(peer.node_id, None)
+
+    async def _handle_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        node_id: str | None = None
+        if self._closed:
+            writer.close()
+            return
+        self._connections.add(writer)
+        try:
+            hello = await read_frame(reader)
+            if not hello or hello.get("type") != _HELLO or self._closed:
+                return
+            node_id = hello["sender"]
+            previous = self._peers.get(node_id)
+            if previous:
+                previous.writer.close()
+            self._peers[node_id] = _Peer(node_id, writer)
+            logger.info(f"IPC: node connected: {node_id}")
+
+            while True:
+                data = await read_frame(reader)
+                if data is None:
+                    break
+                data["sender"] = node_id
+                await self._route(data, from_node=node_id)
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError) as e:
+            logger.warning(f"IPC: connection from {node_id} failed: {e}")
+        finally:
+            peer = self._peers.get(node_id) if node_id else None
+            if peer is not None and peer.writer is writer:
+                self._peers.pop(node_id, None)
+                logger.info(f"IPC: node disconnected: {node_id}")
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _send_to_hub(self, frame: bytes) -> None:
+        await self.wait_connected()
+        async with self._write_lock:
+            writer = self._writer
+            if writer is None:
+                raise ConnectionError("IPC connection lost")
+            writer.write(frame)
+            await writer.drain()
+
+    async def _client_loop(self) -> None:
+        """Connect to the hub, read frames, reconnect with backoff"""
+        delay = self.reconnect_initial
+        while not self._closed:
+            try:
+                reader, writer = await asyncio.open_unix_connection(str(self.socket_path))
+            except (FileNotFoundError, ConnectionError, OSError):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.reconnect_max)
+                continue
+
+            delay = self.reconnect_initial
+            writer.write(encode_frame({"type": _HELLO, "sender": self.node_id}))
+            await writer.drain()
+            self._writer = writer
+            self._connected.set()
+            logger.debug(f"IPC: {self.node_id} connected to {self.socket_path}")
+
+            try:
+                while True:
+                    data = await read_frame(reader)
+                    if data is None:
+                        break
+                    await self._deliver_local(data)
+            except (ConnectionError, ValueError, asyncio.IncompleteReadError) as e:
+                logger.warning(f"IPC: connection to hub lost: {e}")
+            finally:
+                self._connected.clear()
+                self._writer = None
+                writer.close()
+            if not self._closed:
+                logger.info(f"IPC: {self.node_id} reconnecting to {self.socket_path}")
@@ -6,10 +6,13 @@ from .detect import detect_urls
 from .fetch import fetch_url_content
 from .format import format_url_content
 from .apply import apply_link_understanding
+from .service import LinkUnderstandingService, get_link_understanding_service
 
 __all__ = [
     "detect_urls",
     "fetch_url_content",
     "format_url_content",
     "apply_link_understanding",
+    "LinkUnderstandingService",
+    "get_link_understanding_service",
 ]
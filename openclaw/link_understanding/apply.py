@@ -5,8 +5,8 @@ from __future__ import annotations
 from typing import Optional, Any
 
 from .detect import detect_urls
-from .fetch import fetch_url_content
 from .format import format_url_content
+from .service import get_link_understanding_service
 
 
 async def apply_link_understanding(
@@ -37,11 +37,13 @@ async def apply_link_understanding(
     if not urls:
         return
     
-    # Fetch content for each URL
-    contents = []
-    for detected_url in urls:
-        content = await fetch_url_content(detected_url.url)
-        contents.append(content)
+    # Fetch all URLs concurrently under one deadline
+    max_urls = config.get("link_understanding_max_urls", 5)
+    service = get_link_understanding_service()
+    contents = await service.fetch_many(
+        [detected_url.url for detected_url in urls][:max_urls],
+        deadline=config.get("link_understanding_deadline", 5.0),
+    )
     
     # Format and add to context
     if contents:
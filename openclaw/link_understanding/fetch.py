@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from html.parser import HTMLParser
 from typing import Optional
 from dataclasses import dataclass
-import httpx
+
+MAX_TEXT_LENGTH = 1000
+
+# Elements whose text is never page content
+_SKIP_TAGS = frozenset({"script", "style", "noscript", "template", "svg", "head"})
 
 
 @dataclass
 class URLContent:
     """Fetched URL content."""
-    
+
     url: str
     title: Optional[str] = None
     description: Optional[str] = None
@@ -19,130 +24,93 @@ class URLContent:
     error: Optional[str] = None
 
 
+class _PageParser(HTMLParser):
+    """Collects title, description and visible text in one pass."""
+
+    def __init__(self, max_text: int):
+        super().__init__(convert_charrefs=True)
+        self.max_text = max_text
+        self.title_parts: list[str] = []
+        self.meta: dict[str, str] = {}
+        self.text_parts: list[str] = []
+        self.text_length = 0
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "meta":
+            attrs = dict(attrs)
+            key = (attrs.get("property") or attrs.get("name") or "").lower()
+            if key and attrs.get("content") and key not in self.meta:
+                self.meta[key] = attrs["content"].strip()
+        elif tag == "title":
+            self._in_title = True
+        elif tag in _SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        elif tag in _SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title_parts.append(data)
+        elif not self._skip_depth and self.text_length <= self.max_text:
+            chunk = " ".join(data.split())
+            if chunk:
+                self.text_parts.append(chunk)
+                self.text_length += len(chunk) + 1
+
+
+def parse_html(html: str, max_text: int = MAX_TEXT_LENGTH) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Extract title, description and plain text from HTML in one pass.
+
+    Args:
+        html: HTML content
+        max_text: Maximum plain text length
+
+    Returns:
+        (title, description, text), each None if not found
+    """
+    parser = _PageParser(max_text)
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        # Malformed markup: keep whatever was collected
+        pass
+
+    title = " ".join("".join(parser.title_parts).split()) or parser.meta.get("og:title")
+    description = parser.meta.get("og:description") or parser.meta.get("description")
+
+    text = " ".join(parser.text_parts)
+    if len(text) > max_text:
+        text = text[:max_text] + "..."
+
+    return title or None, description or None, text or None
+
+
 async def fetch_url_content(
     url: str,
     timeout: int = 10,
     max_size: int = 1024 * 1024  # 1MB
 ) -> URLContent:
     """Fetch and parse URL content.
-    
+
+    Goes through the shared link understanding service, so results are
+    cached and the body is streamed with ``max_size`` enforced while
+    downloading.
+
     Args:
         url: URL to fetch
         timeout: Request timeout in seconds
         max_size: Maximum content size in bytes
-    
+
     Returns:
         URLContent with extracted information
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                timeout=timeout,
-                follow_redirects=True
-            )
-            
-            response.raise_for_status()
-            
-            # Check size
-            content = response.text
-            if len(content) > max_size:
-                return URLContent(
-                    url=url,
-                    error=f"Content too large ({len(content)} bytes)"
-                )
-            
-            # Extract title and description (basic HTML parsing)
-            title = _extract_title(content)
-            description = _extract_description(content)
-            text = _extract_text(content)
-            
-            return URLContent(
-                url=url,
-                title=title,
-                description=description,
-                text=text,
-                html=content
-            )
-    
-    except Exception as e:
-        return URLContent(
-            url=url,
-            error=str(e)
-        )
-
-
-def _extract_title(html: str) -> Optional[str]:
-    """Extract title from HTML.
-    
-    Args:
-        html: HTML content
-    
-    Returns:
-        Title if found
-    """
-    import re
-    
-    # Try <title> tag
-    match = re.search(r'<title[^>]*>([^<]+)</title>', html, re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
-    
-    # Try og:title
-    match = re.search(r'<meta[^>]*property=["\']og:title["\'][^>]*content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
-    
-    return None
-
-
-def _extract_description(html: str) -> Optional[str]:
-    """Extract description from HTML.
-    
-    Args:
-        html: HTML content
-    
-    Returns:
-        Description if found
-    """
-    import re
-    
-    # Try og:description
-    match = re.search(r'<meta[^>]*property=["\']og:description["\'][^>]*content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
-    
-    # Try meta description
-    match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
-    
-    return None
-
-
-def _extract_text(html: str) -> Optional[str]:
-    """Extract plain text from HTML.
-    
-    Args:
-        html: HTML content
-    
-    Returns:
-        Plain text
-    """
-    import re
-    
-    # Remove scripts and styles
-    text = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Limit length
-    if len(text) > 1000:
-        text = text[:1000] + "..."
-    
-    return text if text else None
+    from .service import get_link_understanding_service
+
+    return await get_link_understanding_service().fetch(url, timeout=timeout, max_bytes=max_size)
@@ -0,0 +1,294 @@
+"""Link understanding service.
+
+Fetches every link in a message concurrently under one deadline, streams
+bodies with the byte cap enforced while downloading, parses HTML in a
+single pass and caches the extracted content. Stale entries are
+revalidated with ``If-None-Match``/``If-Modified-Since``, and concurrent
+requests for the same URL share one fetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from .fetch import MAX_TEXT_LENGTH, URLContent, parse_html
+
+logger = logging.getLogger(__name__)
+
+_TEXT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+@dataclass
+class _CacheEntry:
+    content: URLContent
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class LinkUnderstandingService:
+    """Concurrent, cached URL content extraction.
+
+    Example:
+        service = get_link_understanding_service()
+        contents = await service.fetch_many(["https://a.example", "https://b.example"])
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        timeout: float = 10.0,
+        max_bytes: int = 1024 * 1024,
+        concurrency: int = 8,
+        ttl: float = 900.0,
+        error_ttl: float = 60.0,
+        cache_size: int = 512,
+    ):
+        """Initialize service.
+
+        Args:
+            client: HTTP client (defaults to a shared pooled client)
+            timeout: Per-request timeout in seconds
+            max_bytes: Most bytes read from a response body
+            concurrency: Simultaneous fetches
+            ttl: Seconds extracted content stays fresh
+            error_ttl: Seconds a failed fetch is remembered
+            cache_size: Cached URLs
+        """
+        self._client = client
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.cache_size = cache_size
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "fetches": 0}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                headers={"User-Agent": "OpenClaw-LinkPreview/1.0"},
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+        return self._client
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _cached(self, url: str) -> Optional[_CacheEntry]:
+        entry = self._cache.get(url)
+        if entry is not None:
+            self._cache.move_to_end(url)
+        return entry
+
+    def _store(self, url: str, entry: _CacheEntry) -> None:
+        self._cache[url] = entry
+        self._cache.move_to_end(url)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _ttl_for(self, response: httpx.Response) -> Optional[float]:
+        """Freshness lifetime; None when the response must not be stored"""
+        cache_control = response.headers.get("cache-control", "").lower()
+        if "no-store" in cache_control:
+            return None
+        if "no-cache" in cache_control:
+            # Stored, but revalidated before every reuse
+            return 0.0
+        match = _MAX_AGE.search(cache_control)
+        if match:
+            return min(self.ttl, float(match.group(1)))
+        return self.ttl
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    async def fetch(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> URLContent:
+        """Fetch one URL, from cache when fresh.
+
+        Args:
+            url: URL to fetch
+            timeout: Override the request timeout
+            max_bytes: Override the body byte cap
+
+        Returns:
+            Extracted content (``error`` set on failure)
+        """
+        entry = self._cached(url)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._stats["hits"] += 1
+            return entry.content
+
+        inflight = self._inflight.get(url)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The fetch we joined was cancelled (its caller's deadline); retry
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        try:
+            content = await self._fetch(url, entry, timeout or self.timeout, max_bytes or self.max_bytes)
+            future.set_result(content)
+            return content
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(url, None)
+
+    async def _fetch(
+        self,
+        url: str,
+        stale: Optional[_CacheEntry],
+        timeout: float,
+        max_bytes: int,
+    ) -> URLContent:
+        headers = {}
+        if stale is not None and not stale.content.error:
+            if stale.etag:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified:
+                headers["If-Modified-Since"] = stale.last_modified
+
+        self._stats["misses"] += 1
+        async with self._semaphore:
+            self._stats["fetches"] += 1
+            try:
+                async with self.client.stream("GET", url, headers=headers, timeout=timeout) as response:
+                    if response.status_code == 304 and stale is not None:
+                        self._stats["revalidated"] += 1
+                        stale.expires_at = time.monotonic() + (self._ttl_for(response) or 0.0)
+                        return stale.content
+
+                    response.raise_for_status()
+                    content = await self._read(url, response, max_bytes)
+                    ttl = self._ttl_for(response)
+                    # max-age=0 is kept (expired) so the next fetch can revalidate
+                    if ttl is not None:
+                        self._store(url, _CacheEntry(
+                            content=content,
+                            expires_at=time.monotonic() + ttl,
+                            etag=response.headers.get("etag"),
+                            last_modified=response.headers.get("last-modified"),
+                        ))
+                    return content
+
+            except Exception as e:
+                content = URLContent(url=url, error=str(e) or type(e).__name__)
+                self._store(url, _CacheEntry(content, time.monotonic() + self.error_ttl))
+                return content
+
+    async def _read(self, url: str, response: httpx.Response, max_bytes: int) -> URLContent:
+        """Stream the body up to max_bytes and extract content"""
+        content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type and content_type not in _TEXT_TYPES:
+            # Don't download images, archives, video...
+            return URLContent(url=url, description=f"{content_type} content")
+
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body.extend(chunk)
+            if len(body) >= max_bytes:
+                # Titles and descriptions live at the top; stop reading here
+                logger.debug(f"Truncated {url} at {max_bytes} bytes")
+                del body[max_bytes:]
+                break
+
+        encoding = response.encoding or "utf-8"
+        try:
+            text = bytes(body).decode(encoding, errors="replace")
+        except LookupError:
+            text = bytes(body).decode("utf-8", errors="replace")
+
+        if content_type == "text/plain":
+            plain = " ".join(text.split())
+            if len(plain) > MAX_TEXT_LENGTH:
+                plain = plain[:MAX_TEXT_LENGTH] + "..."
+            return URLContent(url=url, text=plain or None)
+
+        title, description, page_text = parse_html(text)
+        return URLContent(url=url, title=title, description=description, text=page_text)
+
+    async def fetch_many(
+        self,
+        urls: list[str],
+        deadline: Optional[float] = None,
+    ) -> list[URLContent]:
+        """Fetch several URLs concurrently.
+
+        Args:
+            urls: URLs to fetch (duplicates are fetched once)
+            deadline: Seconds to wait for all of them; slower ones come
+                back with ``error="Timed out"``
+
+        Returns:
+            Contents in the order of the unique URLs
+        """
+        unique = list(dict.fromkeys(urls))
+        if not unique:
+            return []
+
+        tasks = {url: asyncio.create_task(self.fetch(url)) for url in unique}
+        done, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+        for task in pending:
+            task.cancel()
+
+        results = []
+        for url, task in tasks.items():
+            if task in done and not task.cancelled() and task.exception() is None:
+                results.append(task.result())
+            elif task in done:
+                results.append(URLContent(url=url, error=str(task.exception())))
+            else:
+                results.append(URLContent(url=url, error="Timed out"))
+        return results
+
+    def clear_cache(self) -> None:
+        """Drop all cached content"""
+        self._cache.clear()
+
+    def get_stats(self) -> dict:
+        """Cache and fetch statistics"""
+        return {**self._stats, "cached": len(self._cache)}
+
+    async def close(self) -> None:
+        """Close the HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Global service instance
+_service: Optional[LinkUnderstandingService] = None
+
+
+def get_link_understanding_service() -> LinkUnderstandingService:
+    """Get global link understanding service instance"""
+    global _service
+    if _service is None:
+        _service = LinkUnderstandingService()
+    return _service
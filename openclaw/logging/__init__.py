@@ -8,6 +8,14 @@ from __future__ import annotations
 from .subsystem import create_subsystem_logger, SubsystemLogger
 from .levels import LogLevel, MIN_LEVEL, MAX_LEVEL
 from .state import get_logging_state, set_logging_state
+from .pipeline import (
+    JsonLinesFormatter,
+    LogPipeline,
+    LogSampler,
+    get_log_pipeline,
+    install_log_pipeline,
+    shutdown_log_pipeline,
+)
 
 __all__ = [
     "create_subsystem_logger",
@@ -17,4 +25,10 @@ __all__ = [
     "MAX_LEVEL",
     "get_logging_state",
     "set_logging_state",
+    "JsonLinesFormatter",
+    "LogPipeline",
+    "LogSampler",
+    "get_log_pipeline",
+    "install_log_pipeline",
+    "shutdown_log_pipeline",
 ]
@@ -0,0 +1,310 @@
+"""Non-blocking log pipeline.
+
+Log calls on the event loop only enqueue the record; a background thread
+formats it and writes it to the console and to a size-rotated JSON-lines
+file. Per-event and per-delta call sites use :class:`LogSampler` so a busy
+stream logs at most one line per key per interval.
+
+Usage:
+    install_log_pipeline(level=logging.INFO, log_file=DEFAULT_LOG_FILE)
+    logger.info("Turn complete for %s", session_id)  # formatted off-loop
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Attributes every LogRecord has; anything else came from ``extra=``
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
+
+# Argument types that are safe to format later on the writer thread
+_IMMUTABLE_ARGS = (str, int, float, bool, bytes, type(None))
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One compact JSON object per record.
+
+    The ``level`` and ``name`` keys match what ``logs.tail`` parses.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+@dataclass
+class _ConsoleLine:
+    """Pre-formatted console output queued by subsystem loggers."""
+
+    text: str
+    stream: TextIO
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops instead of blocking or raising when full.
+
+    Unlike the stdlib handler it does not format the message on the
+    calling thread; arguments are only rendered early when they are
+    mutable and could change before the writer gets to them.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.args and not all(isinstance(arg, _IMMUTABLE_ARGS) for arg in record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info and record.exc_text is None:
+            # Render while the traceback still describes this exception
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: Any) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(logging.handlers.QueueListener):
+    """Writer thread: dispatches records to handlers and writes console lines."""
+
+    def handle(self, record: Any) -> None:
+        if isinstance(record, _ConsoleLine):
+            try:
+                record.stream.write(record.text + "\n")
+                record.stream.flush()
+            except (OSError, ValueError):
+                pass
+            return
+        super().handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        # Wait for room: a full queue must still be drained on stop
+        self.queue.put(self._sentinel)
+
+
+class LogPipeline:
+    """Queue-backed logging backend with a single writer thread."""
+
+    def __init__(self, handlers: list[logging.Handler], queue_size: int = 10_000):
+        """Initialize pipeline.
+
+        Args:
+            handlers: Handlers run on the writer thread
+            queue_size: Records buffered before new ones are dropped
+        """
+        self.handlers = handlers
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.queue_handler = _NonBlockingQueueHandler(self.queue)
+        self._listener = _Listener(self.queue, *handlers, respect_handler_level=True)
+        self._started = False
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if not self._started:
+                self._listener.start()
+                self._started = True
+
+    def stop(self) -> None:
+        """Drain the queue and stop the writer thread."""
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+            self._listener.stop()
+            for handler in self.handlers:
+                handler.close()
+
+    @property
+    def running(self) -> bool:
+        return self._started
+
+    @property
+    def dropped(self) -> int:
+        """Records dropped because the queue was full."""
+        return self.queue_handler.dropped
+
+    def write_console(self, text: str, stream: TextIO) -> None:
+        """Queue a pre-formatted console line."""
+        self.queue_handler.enqueue(_ConsoleLine(text, stream))
+
+
+def _not_subsystem_record(record: logging.LogRecord) -> bool:
+    # Subsystem loggers queue their own formatted console line
+    return not hasattr(record, "subsystem")
+
+
+# Global pipeline instance
+_pipeline: Optional[LogPipeline] = None
+
+
+def get_log_pipeline() -> Optional[LogPipeline]:
+    """Get the installed pipeline, if any."""
+    return _pipeline
+
+
+def install_log_pipeline(
+    level: int = logging.INFO,
+    log_file: Optional[Path | str] = None,
+    file_level: int = logging.DEBUG,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    rotate: bool = True,
+    console: bool = True,
+    console_format: str = TEXT_FORMAT,
+    queue_size: int = 10_000,
+) -> LogPipeline:
+    """Route root logging through a background writer thread.
+
+    Replaces the root logger's handlers with one non-blocking queue
+    handler. Calling it again replaces the previous pipeline.
+
+    Args:
+        level: Console level
+        log_file: JSON-lines log file (rotated by size)
+        file_level: File level
+        max_bytes: Rotate the log file past this size
+        backup_count: Rotated files kept
+        rotate: Rotate the log file here; False for processes that share
+            a file another process rotates (reopens it after rotation)
+        console: Also write to stderr
+        console_format: Console line format
+        queue_size: Records buffered before new ones are dropped
+
+    Returns:
+        The running pipeline
+    """
+    global _pipeline
+
+    handlers: list[logging.Handler] = []
+    if console:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setLevel(level)
+        console_handler.setFormatter(logging.Formatter(console_format))
+        console_handler.addFilter(_not_subsystem_record)
+        handlers.append(console_handler)
+    if log_file:
+        log_path = Path(log_file).expanduser()
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        if rotate:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+        else:
+            file_handler = logging.handlers.WatchedFileHandler(log_path, encoding="utf-8")
+        file_handler.setLevel(file_level)
+        file_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(file_handler)
+
+    shutdown_log_pipeline()
+    pipeline = LogPipeline(handlers, queue_size=queue_size)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(pipeline.queue_handler)
+    # Disabled levels are rejected by the logger before any formatting
+    root.setLevel(min([h.level for h in handlers] or [level]))
+
+    pipeline.start()
+    _pipeline = pipeline
+    return pipeline
+
+
+def shutdown_log_pipeline() -> None:
+    """Flush and stop the installed pipeline."""
+    global _pipeline
+    pipeline, _pipeline = _pipeline, None
+    if pipeline is not None:
+        logging.getLogger().removeHandler(pipeline.queue_handler)
+        pipeline.stop()
+
+
+atexit.register(shutdown_log_pipeline)
+
+
+class LogSampler:
+    """Rate-limits log lines from hot paths.
+
+    At most one record per key is emitted per interval; the next emitted
+    record notes how many were suppressed in between.
+
+    Example:
+        sampler = LogSampler(logger, interval=1.0)
+        sampler.debug("delta", "[%s] Text delta: %.50s", channel_id, text)
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float = 1.0):
+        self.logger = logger
+        self.interval = interval
+        self._next_at: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    def log(self, level: int, key: str, msg: str, *args: Any) -> bool:
+        """Log unless ``key`` was logged within the interval.
+
+        Returns:
+            True if the record was emitted
+        """
+        if not self.logger.isEnabledFor(level):
+            return False
+        now = time.monotonic()
+        if now < self._next_at.get(key, 0.0):
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+        self._next_at[key] = now + self.interval
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            msg = f"{msg} (+%d suppressed)"
+            args = (*args, suppressed)
+        self.logger.log(level, msg, *args, stacklevel=3)
+        return True
+
+    def debug(self, key: str, msg: str, *args: Any) -> bool:
+        return self.log(logging.DEBUG, key, msg, *args)
+
+    def info(self, key: str, msg: str, *args: Any) -> bool:
+        return self.log(logging.INFO, key, msg, *args)
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Forget rate state for one key, or all keys."""
+        if key is None:
+            self._next_at.clear()
+            self._suppressed.clear()
+        else:
+            self._next_at.pop(key, None)
+            self._suppressed.pop(key, None)
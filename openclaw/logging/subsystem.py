@@ -5,14 +5,24 @@ Aligned with TypeScript src/logging/subsystem.ts
 
 from __future__ import annotations
 
-import sys
 import logging
+import sys
 from typing import Optional, Protocol
-from pathlib import Path
 
+from .formatters import format_console_line
 from .levels import LogLevel, should_log
+from .pipeline import get_log_pipeline
 from .state import get_console_settings, get_logging_state
-from .formatters import format_console_line
+
+# Map to standard library levels
+_PY_LEVELS = {
+    LogLevel.TRACE: logging.DEBUG,
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARN: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.FATAL: logging.ERROR,
+}
 
 
 class SubsystemLogger(Protocol):
@@ -46,32 +56,16 @@ class SubsystemLoggerImpl:
         self._file_logger: Optional[logging.Logger] = None
     
     def _get_file_logger(self) -> logging.Logger:
-        """Get or create file logger.
+        """Get the standard library logger for file records.
+        
+        Records propagate to the root logger, where the log pipeline's
+        queue handler writes them to the log file.
         
         Returns:
             Standard library logger for file logging
         """
-        if self._file_logger:
-            return self._file_logger
-        
-        logger = logging.getLogger(f"openclaw.{self.subsystem}")
-        logger.setLevel(logging.DEBUG)
-        
-        # Add file handler if enabled
-        state = get_logging_state()
-        if state.file_logging_enabled and state.file_log_path:
-            log_path = Path(state.file_log_path)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            handler = logging.FileHandler(log_path)
-            handler.setLevel(logging.DEBUG)
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        
-        self._file_logger = logger
+        if self._file_logger is None:
+            self._file_logger = logging.getLogger(f"openclaw.{self.subsystem}")
         return self._file_logger
     
     def _emit(self, level: LogLevel, message: str, meta: Optional[dict] = None) -> None:
@@ -88,16 +82,12 @@ class SubsystemLoggerImpl:
         # Log to file
         if state.file_logging_enabled:
             file_logger = self._get_file_logger()
-            
-            # Map to standard library levels
-            if level == LogLevel.TRACE or level == LogLevel.DEBUG:
-                file_logger.debug(message)
-            elif level == LogLevel.INFO:
-                file_logger.info(message)
-            elif level == LogLevel.WARN:
-                file_logger.warning(message)
-            elif level in (LogLevel.ERROR, LogLevel.FATAL):
-                file_logger.error(message)
+            py_level = _PY_LEVELS[level]
+            if file_logger.isEnabledFor(py_level):
+                extra = {"subsystem": self.subsystem}
+                if meta:
+                    extra["meta"] = meta
+                file_logger.log(py_level, message, extra=extra)
         
         # Check if should log to console
         if not should_log(level, console_settings["level"]):
@@ -115,9 +105,10 @@ class SubsystemLoggerImpl:
         # Write to appropriate stream
         stream = sys.stderr if state.force_console_to_stderr or level >= LogLevel.ERROR else sys.stdout
         
-        if state.raw_console:
-            # Use custom console if provided
-            print(formatted, file=stream)
+        pipeline = get_log_pipeline()
+        if pipeline is not None and pipeline.running:
+            # Written by the pipeline's thread, never blocks the caller
+            pipeline.write_console(formatted, stream)
         else:
             print(formatted, file=stream)
     
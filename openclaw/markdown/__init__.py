@@ -3,6 +3,7 @@
 from .parser import parse_markdown, MarkdownDocument
 from .renderer import render_markdown, render_to_terminal
 from .code_fence import extract_code_blocks, CodeBlock
+from .channel_render import render_channel_markdown, chunk_channel_markdown
 
 __all__ = [
     "parse_markdown",
@@ -11,4 +12,6 @@ __all__ = [
     "render_to_terminal",
     "extract_code_blocks",
     "CodeBlock",
+    "render_channel_markdown",
+    "chunk_channel_markdown",
 ]
@@ -0,0 +1,838 @@
+"""Single-pass Markdown rendering for channel dialects
+
+Parses a reply once into a small AST (blocks of inline nodes) and renders
+it to Telegram HTML, Slack mrkdwn or Discord/standard Markdown. Code spans
+and fences are tokens of their own, so emphasis rules never reach inside
+them, and every piece of text is escaped exactly once for its dialect.
+
+Rendering is chunk-aware: ``chunk_channel_markdown`` splits on block,
+line and inline-node boundaries and re-wraps any entity it has to split,
+so a chunk is always well-formed on its own. Parsed documents and rendered
+output are cached by (text hash, dialect, table mode, limit).
+
+Example:
+    html = render_channel_markdown("**hi** `x*y*`", "telegram")
+    chunks = chunk_channel_markdown(reply, "telegram", limit=4096)
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from html import escape
+from typing import Literal, Union
+
+Dialect = Literal["telegram", "slack", "discord", "markdown"]
+TableMode = Literal["off", "html", "markdown", "bullets", "code"]
+
+DEFAULT_TABLE_MODES: dict[str, str] = {
+    "telegram": "html",
+    "slack": "code",
+    "discord": "markdown",
+    "markdown": "markdown",
+}
+
+# ---------------------------------------------------------------------------
+# AST
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Text:
+    text: str
+    src: str | None = None  # source as written (escapes kept)
+
+
+@dataclass
+class Code:
+    text: str
+    ticks: str = "`"
+
+
+@dataclass
+class Raw:
+    """Token passed through as-is where the dialect allows (e.g. ``<@U123>``)"""
+
+    text: str
+
+
+@dataclass
+class Styled:
+    kind: str  # "bold" | "italic" | "strike"
+    children: list[Inline]
+    delim: str = "**"
+
+
+@dataclass
+class Link:
+    children: list[Inline]
+    url: str
+
+
+Inline = Union[Text, Code, Raw, Styled, Link]
+
+
+@dataclass
+class Line:
+    inlines: list[Inline]
+    prefix: str = ""  # list or quote marker as written
+    bullet: bool = False
+
+
+@dataclass
+class Paragraph:
+    lines: list[Line]
+    blank_before: bool = False
+
+
+@dataclass
+class Heading:
+    level: int
+    inlines: list[Inline]
+    blank_before: bool = False
+
+
+@dataclass
+class CodeBlock:
+    lang: str
+    code: str
+    fence: str = "```"
+    blank_before: bool = False
+
+
+@dataclass
+class Table:
+    header: list[str]
+    rows: list[list[str]]
+    lines: list[str]
+    blank_before: bool = False
+
+
+Block = Union[Paragraph, Heading, CodeBlock, Table]
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+_FENCE = re.compile(r"^\s{0,3}(`{3,}|~{3,})\s*([\w+#.-]*)\s*$")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$")
+_TABLE_SEP = re.compile(r"^\s*\|?\s*:?-{3,}:?\s*(?:\|\s*:?-{3,}:?\s*)*\|?\s*$")
+_LIST = re.compile(r"^(\s*)([-*+]|\d{1,9}[.)])\s+")
+_QUOTE = re.compile(r"^\s*>\s?")
+_LINK = re.compile(r"\[([^\]\n]*)\]\(([^()\s]+)\)")
+_ANGLE = re.compile(r"<(?:[@#!][^<>\s|]*|https?://[^<>\s|]+|mailto:[^<>\s|]+)(?:\|[^<>\n]*)?>")
+_ESCAPABLE = frozenset("\\`*_~[]()#>|<")
+_DELIMS = ("***", "**", "__", "~~", "*", "_")
+_KINDS = {"**": "bold", "__": "bold", "~~": "strike", "*": "italic", "_": "italic"}
+_SPECIAL = re.compile(r"[\\`\[<*_~]")
+
+
+class _Unclosed(Exception):
+    pass
+
+
+def _table_cells(line: str) -> list[str]:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def parse_blocks(text: str) -> list[Block]:
+    """
+    Parse Markdown into blocks (one pass over the lines)
+
+    Args:
+        text: Markdown source
+
+    Returns:
+        Blocks in document order
+    """
+    lines = text.replace("\r\n", "\n").split("\n")
+    blocks: list[Block] = []
+    para: Paragraph | None = None
+    blank = False
+    i, n = 0, len(lines)
+
+    def flush() -> None:
+        nonlocal para
+        if para is not None:
+            blocks.append(para)
+            para = None
+
+    while i < n:
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped:
+            flush()
+            blank = bool(blocks)
+            i += 1
+            continue
+
+        fence = _FENCE.match(line)
+        if fence:
+            flush()
+            marker = fence.group(1)
+            body: list[str] = []
+            i += 1
+            while i < n:
+                closing = lines[i].strip()
+                if len(closing) >= len(marker) and set(closing) == {marker[0]}:
+                    i += 1
+                    break
+                body.append(lines[i])
+                i += 1
+            blocks.append(CodeBlock(fence.group(2), "\n".join(body), marker, blank))
+            blank = False
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            flush()
+            blocks.append(Heading(len(heading.group(1)), parse_inline(heading.group(2)), blank))
+            blank = False
+            i += 1
+            continue
+
+        if "|" in line and i + 1 < n and "|" in lines[i + 1] and _TABLE_SEP.match(lines[i + 1]):
+            flush()
+            table_lines = [line, lines[i + 1]]
+            i += 2
+            while i < n and "|" in lines[i] and lines[i].strip():
+                table_lines.append(lines[i])
+                i += 1
+            blocks.append(Table(
+                header=_table_cells(table_lines[0]),
+                rows=[_table_cells(row) for row in table_lines[2:]],
+                lines=[row.strip() for row in table_lines],
+                blank_before=blank,
+            ))
+            blank = False
+            continue
+
+        prefix, bullet, rest = "", False, line
+        quote = _QUOTE.match(rest)
+        if quote:
+            prefix, rest = quote.group(0), rest[quote.end():]
+        item = _LIST.match(rest)
+        if item:
+            prefix += item.group(0)
+            bullet = item.group(2) in "-*+"
+            rest = rest[item.end():]
+        if para is None:
+            para = Paragraph([], blank)
+            blank = False
+        para.lines.append(Line(parse_inline(rest), prefix, bullet))
+        i += 1
+
+    flush()
+    return blocks
+
+
+def _opener(s: str, i: int) -> str | None:
+    for delim in _DELIMS:
+        if not s.startswith(delim, i):
+            continue
+        after = i + len(delim)
+        if after >= len(s) or s[after].isspace():
+            return None
+        if delim[0] == "_" and i > 0 and s[i - 1].isalnum():
+            return None  # snake_case
+        if s.find(delim, after + 1) == -1:
+            return None
+        return delim
+    return None
+
+
+def _can_close(s: str, i: int, closer: str) -> bool:
+    if i == 0 or s[i - 1].isspace():
+        return False
+    after = i + len(closer)
+    if len(closer) == 1 and s.startswith(closer, after):
+        return False  # "**" inside "*...*" opens bold instead
+    if closer[0] == "_" and after < len(s) and s[after].isalnum():
+        return False
+    return True
+
+
+def _parse_inline(s: str, i: int, closer: str | None) -> tuple[list[Inline], int]:
+    nodes: list[Inline] = []
+    buf: list[str] = []
+    start = i
+    n = len(s)
+
+    def flush(end: int) -> None:
+        if buf:
+            nodes.append(Text("".join(buf), s[start:end]))
+            buf.clear()
+
+    while i < n:
+        c = s[i]
+        if c not in "\\`[<*_~":
+            # Plain run up to the next character that can start a token
+            m = _SPECIAL.search(s, i)
+            j = m.start() if m else n
+            if not buf:
+                start = i
+            buf.append(s[i:j])
+            i = j
+            continue
+
+        if closer and s.startswith(closer, i) and _can_close(s, i, closer):
+            flush(i)
+            return nodes, i + len(closer)
+
+        if c == "\\" and i + 1 < n and s[i + 1] in _ESCAPABLE:
+            if not buf:
+                start = i
+            buf.append(s[i + 1])
+            i += 2
+            continue
+
+        token: Inline | None = None
+        end = i
+        if c == "`":
+            j = i
+            while j < n and s[j] == "`":
+                j += 1
+            ticks = s[i:j]
+            close = s.find(ticks, j)
+            while close != -1 and s.startswith("`", close + len(ticks)):
+                close = s.find(ticks, close + len(ticks) + 1)
+            if close != -1:
+                token, end = Code(s[j:close], ticks), close + len(ticks)
+            else:
+                if not buf:
+                    start = i
+                buf.append(ticks)
+                i = j
+                continue
+        elif c == "[":
+            m = _LINK.match(s, i)
+            if m:
+                token, end = Link(parse_inline(m.group(1)), m.group(2)), m.end()
+        elif c == "<":
+            m = _ANGLE.match(s, i)
+            if m:
+                token, end = Raw(m.group(0)), m.end()
+        else:
+            delim = _opener(s, i)
+            if delim:
+                try:
+                    children, end = _parse_inline(s, i + len(delim), delim)
+                except _Unclosed:
+                    children = []
+                if children and delim == "***":
+                    token = Styled("bold", [Styled("italic", children, "*")], "**")
+                elif children:
+                    token = Styled(_KINDS[delim], children, delim)
+                else:
+                    if not buf:
+                        start = i
+                    buf.append(delim)
+                    i += len(delim)
+                    continue
+
+        if token is not None:
+            flush(i)
+            nodes.append(token)
+            i = end
+            continue
+
+        if not buf:
+            start = i
+        buf.append(c)
+        i += 1
+
+    if closer:
+        raise _Unclosed
+    flush(i)
+    return nodes, i
+
+
+def parse_inline(text: str) -> list[Inline]:
+    """Parse inline Markdown (code, emphasis, links) into nodes"""
+    return _parse_inline(text, 0, None)[0]
+
+
+def _fit(value: str, budget: int, render) -> int:
+    """Longest prefix length (at least 1) whose rendering fits ``budget``"""
+    cut = min(len(value), budget)
+    while cut > 1:
+        length = len(render(value[:cut]))
+        if length <= budget:
+            break
+        # Escaping expands text; shrink in proportion instead of by one
+        cut = max(1, min(cut - 1, cut * budget // length))
+    return cut
+
+
+def _plain(nodes: list[Inline]) -> str:
+    parts = []
+    for node in nodes:
+        if isinstance(node, (Styled, Link)):
+            parts.append(_plain(node.children))
+        else:
+            parts.append(node.text)
+    return "".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+class MarkdownRenderer:
+    """Standard Markdown (also Discord); re-emits the source form"""
+
+    bullet = None  # replacement for "-", "*", "+" list markers
+    html_tables_raw = True  # table_mode "html" keeps the Markdown table
+
+    def __init__(self, table_mode: str = "markdown"):
+        self.table_mode = table_mode
+
+    # -- inline -----------------------------------------------------------
+
+    def text(self, value: str) -> str:
+        return value
+
+    def text_node(self, node: Text) -> str:
+        return node.src if node.src is not None else node.text
+
+    def code(self, node: Code) -> str:
+        return f"{node.ticks}{node.text}{node.ticks}"
+
+    def raw(self, node: Raw) -> str:
+        return node.text
+
+    def wrap(self, node: Styled | Link) -> tuple[str, str]:
+        if isinstance(node, Link):
+            return "[", f"]({node.url})"
+        return node.delim, node.delim
+
+    def inline(self, node: Inline) -> str:
+        if isinstance(node, Text):
+            return self.text_node(node)
+        if isinstance(node, Code):
+            return self.code(node)
+        if isinstance(node, Raw):
+            return self.raw(node)
+        start, end = self.wrap(node)
+        return start + self.inlines(node.children) + end
+
+    def inlines(self, nodes: list[Inline]) -> str:
+        return "".join(self.inline(node) for node in nodes)
+
+    # -- blocks -----------------------------------------------------------
+
+    def prefix(self, line: Line) -> str:
+        if line.bullet and self.bullet:
+            indent = line.prefix[: len(line.prefix) - len(line.prefix.lstrip())]
+            quote = _QUOTE.match(line.prefix)
+            lead = quote.group(0) if quote else indent
+            return self.text(lead) + self.bullet
+        return self.text(line.prefix)
+
+    def heading_wrap(self, block: Heading) -> tuple[str, str]:
+        return "#" * block.level + " ", ""
+
+    def code_block_wrap(self, lang: str, fence: str = "```") -> tuple[str, str]:
+        return f"{fence}{lang}\n", f"\n{fence}"
+
+    def code_text(self, value: str) -> str:
+        return value
+
+    def table_lines(self, block: Table) -> tuple[str, list[str], str, int]:
+        """(open, lines, close, header line count repeated per chunk)"""
+        mode = self.table_mode
+        if mode == "off":
+            return "", [], "", 0
+        if mode == "bullets":
+            lines = [
+                "• " + ", ".join(
+                    f"{self.text(h)}: {self.text(c)}" for h, c in zip(block.header, row)
+                )
+                for row in block.rows
+            ]
+            return "", lines, "", 0
+        if mode == "markdown" or (mode == "html" and self.html_tables_raw):
+            return "", [self.text(line) for line in block.lines], "", 2
+
+        rows = [block.header, *block.rows]
+        cols = max(len(row) for row in rows)
+        rows = [row + [""] * (cols - len(row)) for row in rows]
+        widths = [max(len(row[c]) for row in rows) for c in range(cols)]
+
+        def fmt(row: list[str]) -> str:
+            return self.code_text(" | ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+
+        lines = [fmt(rows[0]), self.code_text("-+-".join("-" * w for w in widths))]
+        lines.extend(fmt(row) for row in rows[1:])
+        start, end = self.code_block_wrap("")
+        return start, lines, end, 2
+
+    def block(self, block: Block) -> str:
+        if isinstance(block, Paragraph):
+            return "\n".join(self.prefix(line) + self.inlines(line.inlines) for line in block.lines)
+        if isinstance(block, Heading):
+            start, end = self.heading_wrap(block)
+            return start + self.inlines(block.inlines) + end
+        if isinstance(block, CodeBlock):
+            start, end = self.code_block_wrap(block.lang, block.fence)
+            return start + self.code_text(block.code) + end
+        start, lines, end, _ = self.table_lines(block)
+        return start + "\n".join(lines) + end if lines else ""
+
+    def render(self, blocks: list[Block]) -> str:
+        parts: list[str] = []
+        for block in blocks:
+            rendered = self.block(block)
+            if not rendered:
+                continue
+            if parts:
+                parts.append("\n\n" if block.blank_before else "\n")
+            parts.append(rendered)
+        return "".join(parts)
+
+    # -- chunking ---------------------------------------------------------
+
+    def chunks(self, blocks: list[Block], limit: int) -> list[str]:
+        """Render into pieces of at most ``limit`` characters"""
+        chunks: list[str] = []
+        current = ""
+        for block in blocks:
+            rendered = self.block(block)
+            if not rendered:
+                continue
+            sep = "\n\n" if block.blank_before else "\n"
+            if current and len(current) + len(sep) + len(rendered) <= limit:
+                current += sep + rendered
+                continue
+            if current:
+                chunks.append(current)
+            if len(rendered) <= limit:
+                current = rendered
+                continue
+            pieces = self.split_block(block, limit)
+            chunks.extend(pieces[:-1])
+            current = pieces[-1] if pieces else ""
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _pack(self, segments: list[tuple[str, str]], limit: int, start: str = "",
+              end: str = "", header: list[str] | None = None) -> list[str]:
+        """
+        Greedily join (joiner, text) segments into wrapped chunks
+
+        The joiner is "\n" for a new line and "" for the continuation of a
+        line that was split; each segment already fits the budget.
+        """
+        head = "\n".join(header or [])
+        chunks: list[str] = []
+        current = head
+        filled = False
+        for joiner, text in segments:
+            piece = (joiner if current else "") + text
+            if filled and len(start) + len(current) + len(piece) + len(end) > limit:
+                chunks.append(start + current + end)
+                current = head
+                piece = ("\n" if current else "") + text
+            current += piece
+            filled = True
+        if filled:
+            chunks.append(start + current + end)
+        return chunks
+
+    def split_block(self, block: Block, limit: int) -> list[str]:
+        """Split one oversized block into well-formed pieces"""
+        segments: list[tuple[str, str]] = []
+
+        if isinstance(block, CodeBlock):
+            start, end = self.code_block_wrap(block.lang, block.fence)
+            budget = max(1, limit - len(start) - len(end))
+            for raw in block.code.split("\n"):
+                pieces = self._split_text(raw, budget, self.code_text) or [""]
+                segments.extend(("\n" if k == 0 else "", p) for k, p in enumerate(pieces))
+            return self._pack(segments, limit, start, end)
+
+        if isinstance(block, Table):
+            start, lines, end, header_count = self.table_lines(block)
+            segments = [("\n", line) for line in lines[header_count:]]
+            return self._pack(segments, limit, start, end, lines[:header_count])
+
+        if isinstance(block, Heading):
+            start, end = self.heading_wrap(block)
+            budget = max(1, limit - len(start) - len(end))
+            return [start + self.inlines(group) + end for group in self.split_inlines(block.inlines, budget)]
+
+        for line in block.lines:
+            prefix = self.prefix(line)
+            rendered = prefix + self.inlines(line.inlines)
+            if len(rendered) <= limit:
+                segments.append(("\n", rendered))
+                continue
+            groups = self.split_inlines(line.inlines, max(1, limit - len(prefix)))
+            segments.extend(
+                ("\n", prefix + self.inlines(g)) if k == 0 else ("", self.inlines(g))
+                for k, g in enumerate(groups)
+            )
+        return self._pack(segments, limit)
+
+    def _split_text(self, value: str, budget: int, render) -> list[str]:
+        """Split raw text so each rendered piece fits, preferring spaces"""
+        pieces = []
+        while value:
+            if len(render(value)) <= budget:
+                pieces.append(render(value))
+                break
+            cut = _fit(value, budget, render)
+            space = value.rfind(" ", 0, cut)
+            if space > cut // 2:
+                cut = space + 1
+            pieces.append(render(value[:cut]))
+            value = value[cut:]
+        return pieces
+
+    def _split_node(self, node: Inline, budget: int) -> list[Inline]:
+        if isinstance(node, (Text, Raw)):
+            return self._split_plain(node.text, budget)
+        if isinstance(node, Code):
+            pieces = []
+            value = node.text
+            while value:
+                cut = _fit(value, budget, lambda v: self.code(Code(v, node.ticks)))
+                pieces.append(Code(value[:cut], node.ticks))
+                value = value[cut:]
+            return pieces
+        start, end = self.wrap(node)
+        inner = budget - len(start) - len(end)
+        if inner < 8:
+            label = _plain(node.children)
+            if isinstance(node, Link):
+                # Link markup alone overflows; keep the URL as plain text
+                label = node.url if label == node.url else f"{label} ({node.url})"
+            return self._split_plain(label, budget)
+        groups = self.split_inlines(node.children, inner)
+        if isinstance(node, Link):
+            return [Link(group, node.url) for group in groups]
+        return [Styled(node.kind, group, node.delim) for group in groups]
+
+    def _split_plain(self, value: str, budget: int) -> list[Inline]:
+        pieces = []
+        while value:
+            cut = _fit(value, budget, self.text)
+            if cut < len(value):
+                space = value.rfind(" ", 0, cut)
+                if space > cut // 2:
+                    cut = space + 1
+            pieces.append(Text(value[:cut]))
+            value = value[cut:]
+        return pieces
+
+    def split_inlines(self, nodes: list[Inline], budget: int) -> list[list[Inline]]:
+        """Group inline nodes so each group renders within ``budget``"""
+        groups: list[list[Inline]] = []
+        current: list[Inline] = []
+        size = 0
+        for node in nodes:
+            length = len(self.inline(node))
+            if size + length <= budget:
+                current.append(node)
+                size += length
+                continue
+            if current:
+                groups.append(current)
+                current, size = [], 0
+            if length <= budget:
+                current, size = [node], length
+                continue
+            pieces = self._split_node(node, budget)
+            groups.extend([piece] for piece in pieces[:-1])
+            current = pieces[-1:]
+            size = len(self.inline(pieces[-1])) if pieces else 0
+        if current:
+            groups.append(current)
+        return groups
+
+
+class TelegramHTMLRenderer(MarkdownRenderer):
+    """Telegram HTML: <b>, <i>, <s>, <code>, <pre>, <a>"""
+
+    bullet = "• "
+    html_tables_raw = False  # no table tags; tables go in <pre>
+    _TAGS = {"bold": "b", "italic": "i", "strike": "s"}
+
+    def text(self, value: str) -> str:
+        return escape(value, quote=False)
+
+    def text_node(self, node: Text) -> str:
+        return escape(node.text, quote=False)
+
+    def code(self, node: Code) -> str:
+        return f"<code>{escape(node.text, quote=False)}</code>"
+
+    def raw(self, node: Raw) -> str:
+        return escape(node.text, quote=False)
+
+    def wrap(self, node: Styled | Link) -> tuple[str, str]:
+        if isinstance(node, Link):
+            return f'<a href="{escape(node.url)}">', "</a>"
+        tag = self._TAGS[node.kind]
+        return f"<{tag}>", f"</{tag}>"
+
+    def heading_wrap(self, block: Heading) -> tuple[str, str]:
+        return "<b>", "</b>"
+
+    def code_block_wrap(self, lang: str, fence: str = "```") -> tuple[str, str]:
+        if lang:
+            return f'<pre><code class="language-{escape(lang)}">', "</code></pre>"
+        return "<pre><code>", "</code></pre>"
+
+    def code_text(self, value: str) -> str:
+        return escape(value, quote=False)
+
+
+class SlackRenderer(MarkdownRenderer):
+    """Slack mrkdwn: *bold*, _italic_, ~strike~, <url|text>"""
+
+    bullet = "• "
+    _MARKS = {"bold": "*", "italic": "_", "strike": "~"}
+
+    def text(self, value: str) -> str:
+        return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+    def text_node(self, node: Text) -> str:
+        return self.text(node.text)
+
+    def prefix(self, line: Line) -> str:
+        # Slack renders "> " quotes itself; keep the marker unescaped
+        if line.bullet:
+            indent = line.prefix[: len(line.prefix) - len(line.prefix.lstrip())]
+            quote = _QUOTE.match(line.prefix)
+            return (quote.group(0) if quote else indent) + self.bullet
+        return line.prefix
+
+    def code(self, node: Code) -> str:
+        return f"`{self.text(node.text)}`"
+
+    def wrap(self, node: Styled | Link) -> tuple[str, str]:
+        if isinstance(node, Link):
+            return f"<{node.url}|", ">"
+        mark = self._MARKS[node.kind]
+        return mark, mark
+
+    def heading_wrap(self, block: Heading) -> tuple[str, str]:
+        return "*", "*"
+
+    def code_block_wrap(self, lang: str, fence: str = "```") -> tuple[str, str]:
+        return "```\n", "\n```"
+
+    def code_text(self, value: str) -> str:
+        return self.text(value)
+
+
+_RENDERERS: dict[str, type[MarkdownRenderer]] = {
+    "telegram": TelegramHTMLRenderer,
+    "slack": SlackRenderer,
+    "discord": MarkdownRenderer,
+    "markdown": MarkdownRenderer,
+}
+
+# ---------------------------------------------------------------------------
+# Cached entry points
+# ---------------------------------------------------------------------------
+
+_CACHE_SIZE = 256
+
+
+class _LRU(OrderedDict):
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def lookup(self, key):
+        value = self.get(key)
+        if value is not None:
+            self.move_to_end(key)
+        return value
+
+    def store(self, key, value):
+        self[key] = value
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+        return value
+
+
+_documents = _LRU(_CACHE_SIZE)
+_rendered = _LRU(_CACHE_SIZE * 2)
+
+
+def _render(text: str, dialect: str, table_mode: str | None, limit: int | None) -> tuple[str, ...]:
+    if dialect not in _RENDERERS:
+        raise ValueError(f"Unknown markdown dialect: {dialect}")
+    table_mode = table_mode or DEFAULT_TABLE_MODES[dialect]
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    key = (digest, dialect, table_mode, limit)
+    cached = _rendered.lookup(key)
+    if cached is not None:
+        return cached
+
+    blocks = _documents.lookup(digest)
+    if blocks is None:
+        blocks = _documents.store(digest, parse_blocks(text))
+
+    renderer = _RENDERERS[dialect](table_mode)
+    if limit:
+        result = tuple(renderer.chunks(blocks, limit))
+    else:
+        result = (renderer.render(blocks),)
+    return _rendered.store(key, result)
+
+
+def render_channel_markdown(
+    text: str,
+    dialect: Dialect,
+    table_mode: TableMode | None = None,
+) -> str:
+    """
+    Render Markdown for a channel
+
+    Args:
+        text: Markdown source
+        dialect: "telegram" (HTML), "slack" (mrkdwn), "discord" or "markdown"
+        table_mode: How tables are shown (defaults per dialect)
+
+    Returns:
+        Rendered text
+    """
+    if not text:
+        return text
+    return _render(text, dialect, table_mode, None)[0]
+
+
+def chunk_channel_markdown(
+    text: str,
+    dialect: Dialect,
+    limit: int,
+    table_mode: TableMode | None = None,
+) -> list[str]:
+    """
+    Render Markdown for a channel, split into messages of at most ``limit``
+
+    Splits only between blocks, lines or inline nodes; an entity that has
+    to be split (long code block, long bold run) is closed and re-opened,
+    so every chunk renders on its own.
+
+    Args:
+        text: Markdown source
+        dialect: Target dialect
+        limit: Maximum rendered characters per chunk
+        table_mode: How tables are shown (defaults per dialect)
+
+    Returns:
+        Rendered chunks
+    """
+    if not text:
+        return []
+    return list(_render(text, dialect, table_mode, limit))
@@ -5,9 +5,10 @@ Matches TypeScript src/telegram/format.ts and src/slack/format.ts
 """
 import re
 from typing import Literal
-from html import escape
 import logging
 
+from .channel_render import render_channel_markdown
+
 logger = logging.getLogger(__name__)
 
 MarkdownTableMode = Literal["off", "html", "markdown", "bullets", "code"]
@@ -18,7 +19,8 @@ def markdown_to_telegram_html(markdown: str, table_mode: MarkdownTableMode = "ht
     Convert Markdown to Telegram HTML
     
     Telegram supports: <b>, <i>, <s>, <code>, <pre>, <a>
-    Matches TypeScript markdownToTelegramHtml()
+    Matches TypeScript markdownToTelegramHtml(). Rendered from a single
+    parse (see channel_render), so code spans are never re-formatted.
     
     Args:
         markdown: Input Markdown text
@@ -27,46 +29,7 @@ def markdown_to_telegram_html(markdown: str, table_mode: MarkdownTableMode = "ht
     Returns:
         Telegram-compatible HTML
     """
-    # Process tables first based on mode
-    if table_mode == "code":
-        markdown = convert_tables_to_code(markdown)
-    elif table_mode == "bullets":
-        markdown = convert_tables_to_bullets(markdown)
-    elif table_mode == "off":
-        markdown = remove_tables(markdown)
-    
-    # Convert Markdown to HTML-like format
-    text = markdown
-    
-    # Code blocks with language
-    text = re.sub(
-        r'```(\w+)?\n(.*?)\n```',
-        lambda m: f'<pre><code class="{m.group(1) or ""}">{escape(m.group(2))}</code></pre>',
-        text,
-        flags=re.DOTALL
-    )
-    
-    # Inline code
-    text = re.sub(r'`([^`]+)`', lambda m: f'<code>{escape(m.group(1))}</code>', text)
-    
-    # Bold
-    text = re.sub(r'\*\*([^\*]+)\*\*', r'<b>\1</b>', text)
-    text = re.sub(r'__([^_]+)__', r'<b>\1</b>', text)
-    
-    # Italic
-    text = re.sub(r'\*([^\*]+)\*', r'<i>\1</i>', text)
-    text = re.sub(r'_([^_]+)_', r'<i>\1</i>', text)
-    
-    # Strikethrough
-    text = re.sub(r'~~([^~]+)~~', r'<s>\1</s>', text)
-    
-    # Links
-    text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2">\1</a>', text)
-    
-    # Clean up any remaining markdown syntax
-    text = sanitize_for_telegram(text)
-    
-    return text
+    return render_channel_markdown(markdown, "telegram", table_mode)
 
 
 def sanitize_for_telegram(html: str) -> str:
@@ -150,30 +113,7 @@ def markdown_to_slack_mrkdwn(markdown: str, table_mode: MarkdownTableMode = "cod
     Slack uses its own flavor of markdown.
     Matches TypeScript src/slack/format.ts
     """
-    # Process tables
-    if table_mode == "code":
-        markdown = convert_tables_to_code(markdown)
-    elif table_mode == "bullets":
-        markdown = convert_tables_to_bullets(markdown)
-    
-    text = markdown
-    
-    # Bold: **text** -> *text*
-    text = re.sub(r'\*\*([^\*]+)\*\*', r'*\1*', text)
-    
-    # Italic: *text* -> _text_
-    text = re.sub(r'(?<!\*)\*([^\*]+)\*(?!\*)', r'_\1_', text)
-    
-    # Code: `code` -> `code` (same)
-    # Code blocks remain the same
-    
-    # Links: [text](url) -> <url|text>
-    text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<\2|\1>', text)
-    
-    # Preserve Slack mentions and channel links
-    # <@user>, <#channel> should not be modified
-    
-    return text
+    return render_channel_markdown(markdown, "slack", table_mode)
 
 
 def markdown_to_discord_markdown(markdown: str, table_mode: MarkdownTableMode = "markdown") -> str:
@@ -183,15 +123,4 @@ def markdown_to_discord_markdown(markdown: str, table_mode: MarkdownTableMode =
     Discord supports standard markdown with some extensions.
     Matches TypeScript src/discord/format.ts
     """
-    # Process tables
-    if table_mode == "code":
-        markdown = convert_tables_to_code(markdown)
-    elif table_mode == "bullets":
-        markdown = convert_tables_to_bullets(markdown)
-    elif table_mode == "off":
-        markdown = remove_tables(markdown)
-    
-    # Discord largely supports standard markdown
-    # Main conversion: ensure code blocks use Discord syntax
-    
-    return markdown
+    return render_channel_markdown(markdown, "discord", table_mode)
\ No newline at end of file
@@ -1,9 +1,19 @@
 """Media handling (images, audio, video)"""
 
+from .attachments import Attachment, AttachmentError, AttachmentStore, get_attachment_store
+from .image_cache import ImagePrepCache, PreparedImage, get_image_prep_cache
 from .loader import MediaLoader, MediaResult, load_media
 from .mime import MediaKind, detect_mime, extension_for_mime, media_kind_from_mime
+from .transcode import TranscodeError, TranscodeService, get_transcode_service
 
 __all__ = [
+    "Attachment",
+    "AttachmentError",
+    "AttachmentStore",
+    "get_attachment_store",
+    "ImagePrepCache",
+    "PreparedImage",
+    "get_image_prep_cache",
     "MediaLoader",
     "MediaResult",
     "load_media",
@@ -11,4 +21,7 @@ __all__ = [
     "detect_mime",
     "extension_for_mime",
     "media_kind_from_mime",
+    "TranscodeError",
+    "TranscodeService",
+    "get_transcode_service",
 ]
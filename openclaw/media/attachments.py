@@ -0,0 +1,712 @@
+"""Content-addressed attachment store
+
+Media passing through the gateway is kept once on local disk, named by the
+SHA-256 of its content:
+
+    <data dir>/media/attachments/ab/ab12cd...
+
+- Downloads stream to a temp file while hashing, so large media never sits
+  in memory. A URL that was already downloaded is served from disk, and
+  concurrent fetches of the same URL share one download. Web URLs are
+  revalidated (ETag / Last-Modified) once their entry is older than the
+  source TTL; platform file URLs are immutable and never revalidated.
+- Sessions hold references on the blobs they use. Once the store grows past
+  its size cap, blobs no session references are removed least recently
+  used first.
+- Platform file references (a Telegram ``file_id``, ...) are remembered per
+  content hash, so sending the same content again reuses the reference
+  instead of uploading the file.
+
+The index (sources, references, platform file ids) is a SQLite database in
+the store directory.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator
+
+import httpx
+
+from .mime import normalize_header_mime
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 256 * 1024
+
+
+class AttachmentError(Exception):
+    """Attachment could not be fetched or stored"""
+    pass
+
+
+@dataclass
+class Attachment:
+    """
+    One stored blob
+
+    Attributes:
+        sha256: Content hash (hex)
+        path: File holding the content
+        size: Size in bytes
+        mime_type: MIME type, if known
+        file_name: Original file name, if known
+    """
+    sha256: str
+    path: Path
+    size: int
+    mime_type: str | None = None
+    file_name: str | None = None
+
+    def read_bytes(self) -> bytes:
+        """Read the whole content"""
+        return self.path.read_bytes()
+
+
+def _default_root() -> Path:
+    from openclaw.config.paths import get_openclaw_data_dir
+
+    return get_openclaw_data_dir() / "media" / "attachments"
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class AttachmentStore:
+    """
+    Deduplicating on-disk media store
+
+    Example:
+        store = get_attachment_store()
+        attachment = await store.fetch(url, session_key="telegram-123")
+        file_id = store.get_platform_file_id(attachment.sha256, "telegram")
+    """
+
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        max_bytes: int = 2 * 1024 * 1024 * 1024,
+        timeout: float = 60.0,
+        source_ttl: float = 300.0,
+    ):
+        """
+        Initialize store
+
+        Args:
+            root: Store directory (default: <data dir>/media/attachments)
+            max_bytes: Size above which unreferenced blobs are collected
+            timeout: Default seconds for a download
+            source_ttl: Seconds a fetched web URL is served without
+                revalidating it
+        """
+        self.root = Path(root) if root is not None else _default_root()
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.source_ttl = source_ttl
+        self._tmp_dir = self.root / "tmp"
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.root / "index.db", check_same_thread=False)
+        self._init_database()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+        # url -> in-flight download
+        self._inflight: dict[str, asyncio.Future[Attachment]] = {}
+        # (path, size, mtime_ns) -> sha256 of local files already hashed
+        self._file_hashes: dict[tuple[str, int, int], str] = {}
+        self._stats = {"hits": 0, "downloads": 0, "revalidated": 0, "deduplicated": 0, "collected": 0}
+
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    sha256 TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mime_type TEXT,
+                    file_name TEXT,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_blobs_accessed ON blobs(accessed_at);
+
+                CREATE TABLE IF NOT EXISTS sources (
+                    source TEXT PRIMARY KEY,
+                    sha256 TEXT,
+                    platform TEXT,
+                    file_id TEXT,
+                    fetched_at REAL,
+                    etag TEXT,
+                    last_modified TEXT
+                );
+
+                CREATE TABLE IF NOT EXISTS refs (
+                    sha256 TEXT NOT NULL,
+                    session_key TEXT NOT NULL,
+                    PRIMARY KEY (sha256, session_key)
+                );
+                CREATE INDEX IF NOT EXISTS idx_refs_session ON refs(session_key);
+
+                CREATE TABLE IF NOT EXISTS platform_refs (
+                    sha256 TEXT NOT NULL,
+                    platform TEXT NOT NULL,
+                    file_id TEXT NOT NULL,
+                    PRIMARY KEY (sha256, platform)
+                );
+            """)
+            # Indexes created before sources were revalidated
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sources)")}
+            for column, kind in (("fetched_at", "REAL"), ("etag", "TEXT"), ("last_modified", "TEXT")):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE sources ADD COLUMN {column} {kind}")
+            self._conn.commit()
+
+    def blob_path(self, sha256: str) -> Path:
+        """File for a content hash"""
+        return self.root / sha256[:2] / sha256
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, sha256: str) -> Attachment | None:
+        """
+        Get a stored blob (and mark it used)
+
+        Args:
+            sha256: Content hash
+
+        Returns:
+            Attachment, or None if not stored
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mime_type, file_name FROM blobs WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+            if row is None:
+                return None
+            path = self.blob_path(sha256)
+            if not path.exists():
+                # Removed behind our back
+                self._forget_blob(sha256, row[0])
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE blobs SET accessed_at = ? WHERE sha256 = ?", (time.time(), sha256)
+            )
+            self._conn.commit()
+        return Attachment(sha256, path, row[0], row[1], row[2])
+
+    def lookup_source(self, source: str) -> Attachment | None:
+        """Stored blob for a URL (or other source key), if already fetched"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256 FROM sources WHERE source = ?", (source,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return self.get(row[0])
+
+    def _source_state(self, source: str) -> tuple[bool, dict[str, str]]:
+        """
+        Whether a source's stored content can be served without asking the
+        server, and the validators to revalidate it with otherwise
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT file_id, fetched_at, etag, last_modified FROM sources WHERE source = ?",
+                (source,),
+            ).fetchone()
+        if row is None:
+            return False, {}
+        file_id, fetched_at, etag, last_modified = row
+        # Platform file URLs (noted with a file_id) never change
+        fresh = bool(file_id) or (fetched_at is not None and time.time() - fetched_at < self.source_ttl)
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return fresh, headers
+
+    def _mark_fetched(self, source: str, etag: str | None, last_modified: str | None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sources SET fetched_at = ?, etag = ?, last_modified = ? WHERE source = ?",
+                (time.time(), etag, last_modified, source),
+            )
+            self._conn.commit()
+
+    async def hash_file(self, path: Path | str) -> str:
+        """
+        SHA-256 of a local file, hashed off the event loop
+
+        Results are remembered per (path, size, mtime) so a file sent
+        repeatedly is hashed once.
+        """
+        path = Path(path)
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        sha256 = self._file_hashes.get(key)
+        if sha256 is None:
+            sha256 = await asyncio.to_thread(_hash_file, path)
+            if len(self._file_hashes) >= 1024:
+                self._file_hashes.clear()
+            self._file_hashes[key] = sha256
+        return sha256
+
+    # ------------------------------------------------------------------
+    # Storing
+    # ------------------------------------------------------------------
+
+    def _commit_blob(
+        self,
+        tmp_path: Path,
+        sha256: str,
+        size: int,
+        mime_type: str | None,
+        file_name: str | None,
+        session_key: str | None,
+        source: str | None = None,
+    ) -> Attachment:
+        path = self.blob_path(sha256)
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM blobs WHERE sha256 = ?", (sha256,)
+            ).fetchone() is not None and path.exists()
+            if exists:
+                tmp_path.unlink(missing_ok=True)
+                self._stats["deduplicated"] += 1
+                self._conn.execute(
+                    "UPDATE blobs SET accessed_at = ?, mime_type = COALESCE(mime_type, ?) WHERE sha256 = ?",
+                    (now, mime_type, sha256),
+                )
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, path)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)",
+                    (sha256, size, mime_type, file_name, now, now),
+                )
+                self._total_bytes += size
+            if session_key:
+                self._conn.execute("INSERT OR IGNORE INTO refs VALUES (?, ?)", (sha256, session_key))
+            if source:
+                self._conn.execute(
+                    "INSERT INTO sources (source, sha256) VALUES (?, ?) "
+                    "ON CONFLICT(source) DO UPDATE SET sha256 = excluded.sha256",
+                    (source, sha256),
+                )
+                row = self._conn.execute(
+                    "SELECT platform, file_id FROM sources WHERE source = ?", (source,)
+                ).fetchone()
+                if row[0] and row[1]:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO platform_refs VALUES (?, ?, ?)", (sha256, row[0], row[1])
+                    )
+            self._conn.commit()
+            over_budget = self._total_bytes > self.max_bytes
+
+        if over_budget:
+            self.collect()
+        return Attachment(sha256, path, size, mime_type, file_name)
+
+    def _new_tmp(self) -> tuple[int, Path]:
+        fd, tmp = tempfile.mkstemp(dir=self._tmp_dir)
+        return fd, Path(tmp)
+
+    async def put_bytes(
+        self,
+        data: bytes,
+        mime_type: str | None = None,
+        file_name: str | None = None,
+        session_key: str | None = None,
+    ) -> Attachment:
+        """
+        Store content held in memory
+
+        Args:
+            data: Content
+            mime_type: MIME type
+            file_name: Original file name
+            session_key: Session to reference the blob from
+
+        Returns:
+            Attachment
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        existing = self.get(sha256)
+        if existing is not None:
+            self._stats["deduplicated"] += 1
+            if session_key:
+                self.add_ref(sha256, session_key)
+            return existing
+
+        def write() -> Path:
+            fd, tmp = self._new_tmp()
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            return tmp
+
+        tmp = await asyncio.to_thread(write)
+        return self._commit_blob(tmp, sha256, len(data), mime_type, file_name, session_key)
+
+    async def put_file(
+        self,
+        path: Path | str,
+        mime_type: str | None = None,
+        session_key: str | None = None,
+    ) -> Attachment:
+        """
+        Copy a local file into the store, hashing while copying
+
+        Args:
+            path: Local file
+            mime_type: MIME type
+            session_key: Session to reference the blob from
+
+        Returns:
+            Attachment
+        """
+        path = Path(path)
+
+        def copy() -> tuple[Path, str, int]:
+            fd, tmp = self._new_tmp()
+            digest = hashlib.sha256()
+            size = 0
+            with open(path, "rb") as src, os.fdopen(fd, "wb") as dst:
+                for block in iter(lambda: src.read(CHUNK_SIZE), b""):
+                    digest.update(block)
+                    dst.write(block)
+                    size += len(block)
+            return tmp, digest.hexdigest(), size
+
+        tmp, sha256, size = await asyncio.to_thread(copy)
+        return self._commit_blob(tmp, sha256, size, mime_type, path.name, session_key)
+
+    async def put_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        mime_type: str | None = None,
+        file_name: str | None = None,
+        session_key: str | None = None,
+        max_bytes: int | None = None,
+        source: str | None = None,
+    ) -> Attachment:
+        """
+        Store content from an async chunk stream
+
+        Args:
+            chunks: Content chunks
+            mime_type: MIME type
+            file_name: Original file name
+            session_key: Session to reference the blob from
+            max_bytes: Abort if the content grows past this size
+            source: URL (or other key) the content came from
+
+        Returns:
+            Attachment
+
+        Raises:
+            AttachmentError: If the content exceeds max_bytes
+        """
+        fd, tmp = self._new_tmp()
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if max_bytes and size > max_bytes:
+                        raise AttachmentError(f"Attachment exceeds size limit: > {max_bytes} bytes")
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return self._commit_blob(tmp, digest.hexdigest(), size, mime_type, file_name, session_key, source)
+
+    async def fetch(
+        self,
+        url: str,
+        session_key: str | None = None,
+        max_bytes: int | None = None,
+        timeout: float | None = None,
+    ) -> Attachment:
+        """
+        Get a URL's content, downloading it only when it is new or changed
+
+        Content is served from disk while the URL's entry is younger than
+        source_ttl (always for platform file URLs); after that the server is
+        asked with a conditional request and the content re-downloaded only
+        if it changed.
+
+        Args:
+            url: HTTP(S) URL
+            session_key: Session to reference the blob from
+            max_bytes: Refuse content larger than this
+            timeout: Seconds for the download
+
+        Returns:
+            Attachment
+
+        Raises:
+            AttachmentError: If the download fails or is too large
+        """
+        cached = self.lookup_source(url)
+        if cached is not None and not (max_bytes and cached.size > max_bytes):
+            fresh, validators = self._source_state(url)
+            if fresh:
+                self._stats["hits"] += 1
+                if session_key:
+                    self.add_ref(cached.sha256, session_key)
+                return cached
+        else:
+            cached, validators = None, {}
+
+        inflight = self._inflight.get(url)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._download(url, max_bytes, timeout or self.timeout, cached, validators)
+            )
+            self._inflight[url] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(url, None))
+        attachment = await asyncio.shield(inflight)
+        if max_bytes and attachment.size > max_bytes:
+            raise AttachmentError(f"Attachment exceeds size limit: {attachment.size} > {max_bytes}")
+        if session_key:
+            self.add_ref(attachment.sha256, session_key)
+        return attachment
+
+    async def _download(
+        self,
+        url: str,
+        max_bytes: int | None,
+        timeout: float,
+        cached: Attachment | None = None,
+        validators: dict[str, str] | None = None,
+    ) -> Attachment:
+        try:
+            async with httpx.AsyncClient(follow_redirects=True, timeout=timeout) as client:
+                async with client.stream("GET", url, headers=validators if cached else None) as response:
+                    etag = response.headers.get("etag")
+                    last_modified = response.headers.get("last-modified")
+                    if cached is not None and response.status_code == 304:
+                        # Unchanged: keep serving the stored content
+                        validators = validators or {}
+                        self._stats["revalidated"] += 1
+                        self._mark_fetched(
+                            url,
+                            etag or validators.get("If-None-Match"),
+                            last_modified or validators.get("If-Modified-Since"),
+                        )
+                        return cached
+                    response.raise_for_status()
+                    self._stats["downloads"] += 1
+                    length = response.headers.get("content-length")
+                    if max_bytes and length and length.isdigit() and int(length) > max_bytes:
+                        raise AttachmentError(
+                            f"Attachment exceeds size limit: {length} > {max_bytes}"
+                        )
+                    file_name = Path(response.url.path).name or None
+                    attachment = await self.put_stream(
+                        response.aiter_bytes(CHUNK_SIZE),
+                        mime_type=normalize_header_mime(response.headers.get("content-type")),
+                        file_name=file_name,
+                        max_bytes=max_bytes,
+                        source=url,
+                    )
+                    self._mark_fetched(url, etag, last_modified)
+                    return attachment
+        except httpx.HTTPError as e:
+            raise AttachmentError(f"Failed to download {url}: {e}") from e
+
+    async def prefetch(self, url: str, session_key: str | None = None) -> None:
+        """Fetch a URL in the background, logging instead of raising"""
+        try:
+            await self.fetch(url, session_key=session_key)
+        except Exception as e:
+            logger.debug(f"Attachment prefetch failed for {url}: {e}")
+
+    # ------------------------------------------------------------------
+    # References
+    # ------------------------------------------------------------------
+
+    def add_ref(self, sha256: str, session_key: str) -> None:
+        """Reference a blob from a session"""
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO refs VALUES (?, ?)", (sha256, session_key))
+            self._conn.commit()
+
+    def release(self, sha256: str, session_key: str) -> None:
+        """Drop one session's reference on a blob"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM refs WHERE sha256 = ? AND session_key = ?", (sha256, session_key)
+            )
+            self._conn.commit()
+
+    def release_session(self, session_key: str) -> int:
+        """
+        Drop all references held by a session
+
+        Returns:
+            Number of references dropped
+        """
+        with self._lock:
+            count = self._conn.execute("DELETE FROM refs WHERE session_key = ?", (session_key,)).rowcount
+            self._conn.commit()
+        return count
+
+    def ref_count(self, sha256: str) -> int:
+        """Number of sessions referencing a blob"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM refs WHERE sha256 = ?", (sha256,)).fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Platform file references
+    # ------------------------------------------------------------------
+
+    def get_platform_file_id(self, sha256: str, platform: str) -> str | None:
+        """File reference a platform already has for this content"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT file_id FROM platform_refs WHERE sha256 = ? AND platform = ?", (sha256, platform)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_platform_file_id(self, sha256: str, platform: str, file_id: str) -> None:
+        """Remember a platform's file reference for this content"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO platform_refs VALUES (?, ?, ?)", (sha256, platform, file_id)
+            )
+            self._conn.commit()
+
+    def forget_platform_file_id(self, sha256: str, platform: str) -> None:
+        """Drop a file reference the platform no longer accepts"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM platform_refs WHERE sha256 = ? AND platform = ?", (sha256, platform)
+            )
+            self._conn.commit()
+
+    def note_source(self, source: str, platform: str, file_id: str) -> None:
+        """
+        Record the platform file reference of inbound media
+
+        The reference is attached to the content once the source is fetched
+        (or right away if it already was).
+
+        Args:
+            source: URL the media will be fetched from
+            platform: Platform name ("telegram", ...)
+            file_id: Platform file reference
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sources (source, platform, file_id) VALUES (?, ?, ?) "
+                "ON CONFLICT(source) DO UPDATE SET platform = excluded.platform, file_id = excluded.file_id",
+                (source, platform, file_id),
+            )
+            row = self._conn.execute("SELECT sha256 FROM sources WHERE source = ?", (source,)).fetchone()
+            if row[0]:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO platform_refs VALUES (?, ?, ?)", (row[0], platform, file_id)
+                )
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Garbage collection
+    # ------------------------------------------------------------------
+
+    def _forget_blob(self, sha256: str, size: int) -> None:
+        self._conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+        self._conn.execute("UPDATE sources SET sha256 = NULL WHERE sha256 = ?", (sha256,))
+        self._total_bytes -= size
+
+    def collect(self, max_bytes: int | None = None) -> int:
+        """
+        Remove unreferenced blobs, least recently used first, until the
+        store fits its size cap
+
+        Args:
+            max_bytes: Size to shrink to (default: the store's cap)
+
+        Returns:
+            Number of blobs removed
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        removed = 0
+        with self._lock:
+            if self._total_bytes <= limit:
+                return 0
+            rows = self._conn.execute("""
+                SELECT sha256, size FROM blobs
+                WHERE sha256 NOT IN (SELECT sha256 FROM refs)
+                ORDER BY accessed_at
+            """).fetchall()
+            for sha256, size in rows:
+                if self._total_bytes <= limit:
+                    break
+                self.blob_path(sha256).unlink(missing_ok=True)
+                self._forget_blob(sha256, size)
+                removed += 1
+            self._conn.commit()
+            self._stats["collected"] += removed
+        if removed:
+            logger.debug(f"Collected {removed} unreferenced attachments")
+        return removed
+
+    def get_stats(self) -> dict:
+        """Store statistics"""
+        with self._lock:
+            blobs = self._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        return {**self._stats, "blobs": blobs, "bytes": self._total_bytes, "max_bytes": self.max_bytes}
+
+    def close(self) -> None:
+        """Close the index"""
+        with self._lock:
+            self._conn.close()
+
+
+# Global store
+_store: AttachmentStore | None = None
+
+
+def get_attachment_store() -> AttachmentStore:
+    """Get global attachment store"""
+    global _store
+    if _store is None:
+        _store = AttachmentStore()
+    return _store
+
+
+def release_session_attachments(session_key: str) -> int:
+    """
+    Drop a deleted session's attachment references
+
+    Does nothing (and creates nothing) if no store exists yet.
+
+    Returns:
+        Number of references dropped
+    """
+    if _store is None and not (_default_root() / "index.db").exists():
+        return 0
+    return get_attachment_store().release_session(session_key)
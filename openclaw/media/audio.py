@@ -9,10 +9,11 @@ This module provides audio processing capabilities including:
 from __future__ import annotations
 
 import logging
-import subprocess
 from pathlib import Path
 from typing import Any
 
+from .transcode import AUDIO_CODECS, TranscodeError, TranscodeService, get_transcode_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,37 +23,60 @@ class AudioProcessingError(Exception):
 
 
 class AudioProcessor:
-    """Audio processing operations using ffmpeg"""
+    """Audio processing operations using ffmpeg
+    
+    All operations run ffmpeg asynchronously through the shared
+    :class:`~openclaw.media.transcode.TranscodeService`, so they never block
+    the event loop and identical conversions are served from its cache.
+    """
     
-    def __init__(self, ffmpeg_path: str = "ffmpeg"):
+    def __init__(self, ffmpeg_path: str = "ffmpeg", transcoder: TranscodeService | None = None):
         """
         Initialize audio processor
         
         Args:
             ffmpeg_path: Path to ffmpeg executable
+            transcoder: Transcode service (default: shared service, or a
+                dedicated one for a custom ffmpeg_path)
         """
         self.ffmpeg_path = ffmpeg_path
+        if transcoder is None:
+            transcoder = get_transcode_service()
+            if transcoder.ffmpeg_path != ffmpeg_path:
+                transcoder = TranscodeService(ffmpeg_path=ffmpeg_path)
+        self.transcoder = transcoder
     
-    def check_ffmpeg(self) -> bool:
+    async def check_ffmpeg(self) -> bool:
         """
         Check if ffmpeg is available
         
         Returns:
             True if ffmpeg is available
         """
+        return await self.transcoder.check_ffmpeg()
+    
+    async def _transcode(
+        self,
+        action: str,
+        source: Any,
+        output_path: Path | str,
+        args: list[str],
+        output_format: str | None = None,
+        timeout: float = 300,
+    ) -> bool:
+        if not await self.check_ffmpeg():
+            raise AudioProcessingError("ffmpeg not available")
         try:
-            result = subprocess.run(
-                [self.ffmpeg_path, "-version"],
-                capture_output=True,
-                timeout=5
+            await self.transcoder.transcode_to_file(
+                source, output_path, output_format=output_format, args=args, timeout=timeout
             )
-            return result.returncode == 0
-        except Exception:
-            return False
+        except TranscodeError as e:
+            raise AudioProcessingError(f"{action} failed: {e}")
+        return True
     
-    def convert_audio(
+    async def convert_audio(
         self,
-        input_path: Path | str,
+        input_path: Path | str | bytes,
         output_path: Path | str,
         output_format: str | None = None,
         bitrate: str = "128k",
@@ -62,7 +86,7 @@ class AudioProcessor:
         Convert audio to different format
         
         Args:
-            input_path: Input audio file
+            input_path: Input audio file (or its bytes)
             output_path: Output audio file
             output_format: Output format (mp3, aac, opus, flac, wav)
             bitrate: Audio bitrate (e.g., "128k", "192k")
@@ -74,63 +98,28 @@ class AudioProcessor:
         Raises:
             AudioProcessingError: If conversion fails
         """
-        if not self.check_ffmpeg():
-            raise AudioProcessingError("ffmpeg not available")
-        
-        input_path = Path(input_path)
         output_path = Path(output_path)
         
         # Determine output format
         if output_format is None:
             output_format = output_path.suffix.lstrip(".")
         
-        # Build ffmpeg command
-        cmd = [
-            self.ffmpeg_path,
-            "-i", str(input_path),
-            "-b:a", bitrate,
-        ]
-        
+        args = ["-b:a", bitrate]
         if sample_rate:
-            cmd.extend(["-ar", str(sample_rate)])
+            args.extend(["-ar", str(sample_rate)])
         
         # Format-specific options
-        if output_format == "mp3":
-            cmd.extend(["-codec:a", "libmp3lame"])
-        elif output_format == "aac":
-            cmd.extend(["-codec:a", "aac"])
-        elif output_format == "opus":
-            cmd.extend(["-codec:a", "libopus"])
-        elif output_format == "flac":
-            cmd.extend(["-codec:a", "flac"])
-        elif output_format == "wav":
-            cmd.extend(["-codec:a", "pcm_s16le"])
+        codec = AUDIO_CODECS.get(output_format)
+        if codec:
+            args.extend(["-codec:a", codec])
         
-        cmd.extend(["-y", str(output_path)])
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=300
-            )
-            
-            if result.returncode != 0:
-                raise AudioProcessingError(
-                    f"ffmpeg error: {result.stderr.decode('utf-8', errors='ignore')}"
-                )
-            
-            logger.info(f"Converted audio: {input_path} -> {output_path}")
-            return True
-            
-        except subprocess.TimeoutExpired:
-            raise AudioProcessingError("Audio conversion timeout")
-        except Exception as e:
-            raise AudioProcessingError(f"Conversion failed: {e}")
+        await self._transcode("Conversion", input_path, output_path, args, output_format)
+        logger.info(f"Converted audio: {_describe(input_path)} -> {output_path}")
+        return True
     
-    def trim_audio(
+    async def trim_audio(
         self,
-        input_path: Path | str,
+        input_path: Path | str | bytes,
         output_path: Path | str,
         start_time: float,
         duration: float | None = None,
@@ -140,7 +129,7 @@ class AudioProcessor:
         Trim audio file
         
         Args:
-            input_path: Input audio file
+            input_path: Input audio file (or its bytes)
             output_path: Output audio file
             start_time: Start time in seconds
             duration: Duration in seconds (mutually exclusive with end_time)
@@ -152,52 +141,26 @@ class AudioProcessor:
         Raises:
             AudioProcessingError: If trimming fails
         """
-        if not self.check_ffmpeg():
-            raise AudioProcessingError("ffmpeg not available")
-        
         if duration is None and end_time is None:
             raise AudioProcessingError("Either duration or end_time must be specified")
         
         if duration is not None and end_time is not None:
             raise AudioProcessingError("Cannot specify both duration and end_time")
         
-        input_path = Path(input_path)
-        output_path = Path(output_path)
-        
-        cmd = [
-            self.ffmpeg_path,
-            "-i", str(input_path),
-            "-ss", str(start_time),
-        ]
-        
+        args = ["-ss", str(start_time)]
         if duration is not None:
-            cmd.extend(["-t", str(duration)])
+            args.extend(["-t", str(duration)])
         else:
-            cmd.extend(["-to", str(end_time)])
+            args.extend(["-to", str(end_time)])
+        args.extend(["-codec", "copy"])
         
-        cmd.extend(["-codec", "copy", "-y", str(output_path)])
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=300
-            )
-            
-            if result.returncode != 0:
-                raise AudioProcessingError(
-                    f"ffmpeg error: {result.stderr.decode('utf-8', errors='ignore')}"
-                )
-            
-            logger.info(f"Trimmed audio: {input_path} -> {output_path}")
-            return True
-            
-        except Exception as e:
-            raise AudioProcessingError(f"Trimming failed: {e}")
+        await self._transcode("Trimming", input_path, output_path, args)
+        logger.info(f"Trimmed audio: {_describe(input_path)} -> {output_path}")
+        return True
     
-    def adjust_volume(
+    async def adjust_volume(
         self,
-        input_path: Path | str,
+        input_path: Path | str | bytes,
         output_path: Path | str,
         volume_db: float,
     ) -> bool:
@@ -205,7 +168,7 @@ class AudioProcessor:
         Adjust audio volume
         
         Args:
-            input_path: Input audio file
+            input_path: Input audio file (or its bytes)
             output_path: Output audio file
             volume_db: Volume adjustment in dB (positive = louder, negative = quieter)
             
@@ -215,38 +178,12 @@ class AudioProcessor:
         Raises:
             AudioProcessingError: If adjustment fails
         """
-        if not self.check_ffmpeg():
-            raise AudioProcessingError("ffmpeg not available")
-        
-        input_path = Path(input_path)
-        output_path = Path(output_path)
-        
-        cmd = [
-            self.ffmpeg_path,
-            "-i", str(input_path),
-            "-filter:a", f"volume={volume_db}dB",
-            "-y", str(output_path)
-        ]
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=300
-            )
-            
-            if result.returncode != 0:
-                raise AudioProcessingError(
-                    f"ffmpeg error: {result.stderr.decode('utf-8', errors='ignore')}"
-                )
-            
-            logger.info(f"Adjusted volume: {input_path} -> {output_path} ({volume_db}dB)")
-            return True
-            
-        except Exception as e:
-            raise AudioProcessingError(f"Volume adjustment failed: {e}")
+        args = ["-filter:a", f"volume={volume_db}dB"]
+        await self._transcode("Volume adjustment", input_path, output_path, args)
+        logger.info(f"Adjusted volume: {_describe(input_path)} -> {output_path} ({volume_db}dB)")
+        return True
     
-    def extract_audio_from_video(
+    async def extract_audio_from_video(
         self,
         input_path: Path | str,
         output_path: Path | str,
@@ -268,48 +205,25 @@ class AudioProcessor:
         Raises:
             AudioProcessingError: If extraction fails
         """
-        if not self.check_ffmpeg():
-            raise AudioProcessingError("ffmpeg not available")
-        
-        input_path = Path(input_path)
-        output_path = Path(output_path)
-        
-        cmd = [
-            self.ffmpeg_path,
-            "-i", str(input_path),
-            "-vn",  # No video
-            "-b:a", bitrate,
-            "-y", str(output_path)
-        ]
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=600
-            )
-            
-            if result.returncode != 0:
-                raise AudioProcessingError(
-                    f"ffmpeg error: {result.stderr.decode('utf-8', errors='ignore')}"
-                )
-            
-            logger.info(f"Extracted audio: {input_path} -> {output_path}")
-            return True
-            
-        except Exception as e:
-            raise AudioProcessingError(f"Audio extraction failed: {e}")
+        args = ["-vn", "-b:a", bitrate]  # No video
+        codec = AUDIO_CODECS.get(audio_format)
+        if codec:
+            args.extend(["-codec:a", codec])
+        
+        await self._transcode("Audio extraction", input_path, output_path, args, audio_format, timeout=600)
+        logger.info(f"Extracted audio: {_describe(input_path)} -> {output_path}")
+        return True
     
-    def concatenate_audio(
+    async def concatenate_audio(
         self,
-        input_paths: list[Path | str],
+        input_paths: list[Path | str | bytes],
         output_path: Path | str,
     ) -> bool:
         """
         Concatenate multiple audio files
         
         Args:
-            input_paths: List of input audio files
+            input_paths: List of input audio files (or their bytes)
             output_path: Output audio file
             
         Returns:
@@ -318,52 +232,28 @@ class AudioProcessor:
         Raises:
             AudioProcessingError: If concatenation fails
         """
-        if not self.check_ffmpeg():
-            raise AudioProcessingError("ffmpeg not available")
-        
         if len(input_paths) < 2:
             raise AudioProcessingError("At least 2 input files required")
         
         output_path = Path(output_path)
-        
-        # Create concat file list
-        concat_file = output_path.parent / "concat_list.txt"
-        with open(concat_file, "w") as f:
-            for input_path in input_paths:
-                f.write(f"file '{Path(input_path).absolute()}'\n")
-        
-        cmd = [
-            self.ffmpeg_path,
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(concat_file),
-            "-c", "copy",
-            "-y", str(output_path)
-        ]
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=600
-            )
-            
-            # Clean up concat file
-            concat_file.unlink()
-            
-            if result.returncode != 0:
-                raise AudioProcessingError(
-                    f"ffmpeg error: {result.stderr.decode('utf-8', errors='ignore')}"
-                )
-            
-            logger.info(f"Concatenated {len(input_paths)} audio files -> {output_path}")
-            return True
-            
-        except Exception as e:
-            # Clean up on error
-            if concat_file.exists():
-                concat_file.unlink()
-            raise AudioProcessingError(f"Concatenation failed: {e}")
+        output_format = output_path.suffix.lstrip(".")
+        
+        # The concat filter needs no list file and accepts mixed inputs
+        streams = "".join(f"[{i}:a]" for i in range(len(input_paths)))
+        args = ["-filter_complex", f"{streams}concat=n={len(input_paths)}:v=0:a=1"]
+        codec = AUDIO_CODECS.get(output_format)
+        if codec:
+            args.extend(["-codec:a", codec])
+        
+        await self._transcode("Concatenation", input_paths, output_path, args, output_format, timeout=600)
+        logger.info(f"Concatenated {len(input_paths)} audio files -> {output_path}")
+        return True
+
+
+def _describe(source: Any) -> str:
+    if isinstance(source, bytes):
+        return f"<{len(source)} bytes>"
+    return str(source)
 
 
 # Convenience functions
@@ -378,11 +268,11 @@ def get_audio_processor() -> AudioProcessor:
     return _default_processor
 
 
-def convert_audio(input_path: Path | str, output_path: Path | str, **kwargs) -> bool:
+async def convert_audio(input_path: Path | str | bytes, output_path: Path | str, **kwargs) -> bool:
     """Convert audio file"""
-    return get_audio_processor().convert_audio(input_path, output_path, **kwargs)
+    return await get_audio_processor().convert_audio(input_path, output_path, **kwargs)
 
 
-def trim_audio(input_path: Path | str, output_path: Path | str, **kwargs) -> bool:
+async def trim_audio(input_path: Path | str | bytes, output_path: Path | str, **kwargs) -> bool:
     """Trim audio file"""
-    return get_audio_processor().trim_audio(input_path, output_path, **kwargs)
+    return await get_audio_processor().trim_audio(input_path, output_path, **kwargs)
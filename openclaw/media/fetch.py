@@ -8,7 +8,9 @@ This module provides utilities for fetching media from various sources including
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import shutil
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -49,48 +51,26 @@ async def fetch_from_url(
     Raises:
         MediaFetchError: If fetch fails
     """
+    from .attachments import AttachmentError, get_attachment_store
+    
     try:
-        import aiohttp
+        # Downloaded once; later fetches of the same URL are read from disk
+        attachment = await get_attachment_store().fetch(url, max_bytes=max_size, timeout=timeout)
+        content = await asyncio.to_thread(attachment.read_bytes)
+        content_type = attachment.mime_type or "application/octet-stream"
+        
+        # Save to file if output path provided
+        if output_path:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(shutil.copyfile, attachment.path, output_path)
+            logger.info(f"Saved media to: {output_path}")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
-                # Check status
-                if response.status != 200:
-                    raise MediaFetchError(f"HTTP {response.status}: {response.reason}")
-                
-                # Get content type
-                content_type = response.headers.get("Content-Type", "application/octet-stream")
-                
-                # Check content length
-                content_length = response.headers.get("Content-Length")
-                if content_length and max_size:
-                    if int(content_length) > max_size:
-                        raise MediaFetchError(
-                            f"File too large: {int(content_length)} bytes (max: {max_size})"
-                        )
-                
-                # Read content
-                content = await response.read()
-                
-                # Check actual size
-                if max_size and len(content) > max_size:
-                    raise MediaFetchError(
-                        f"File too large: {len(content)} bytes (max: {max_size})"
-                    )
-                
-                # Save to file if output path provided
-                if output_path:
-                    output_path = Path(output_path)
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(output_path, "wb") as f:
-                        f.write(content)
-                    logger.info(f"Saved media to: {output_path}")
-                
-                logger.info(f"Fetched {len(content)} bytes from {url}")
-                return content, content_type
-                
-    except aiohttp.ClientError as e:
-        raise MediaFetchError(f"Network error: {e}")
+        logger.info(f"Fetched {len(content)} bytes from {url}")
+        return content, content_type
+    
+    except AttachmentError as e:
+        raise MediaFetchError(str(e))
     except Exception as e:
         logger.error(f"Failed to fetch media: {e}")
         raise MediaFetchError(f"Fetch failed: {e}")
@@ -0,0 +1,267 @@
+"""
+Prepared image cache
+
+Images attached to agent turns are sent again with every request of the
+turn (retries, tool rounds) and of later turns. This cache keeps the
+provider-ready form of each image (decoded, resized to the target size,
+re-encoded where needed, and its base64) so that the work is done once
+per image version instead of once per request.
+
+Entries are keyed by (source, version, max side), where the version is:
+
+- local files: modification time and size
+- HTTP(S) URLs: content hash from the attachment store (which downloads
+  each URL once)
+- data URLs: hash of the URL itself
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import io
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+from .loader import MediaLoader
+from .mime import is_heic_mime
+
+logger = logging.getLogger(__name__)
+
+# Formats every vision provider accepts as-is
+PASSTHROUGH_MIME_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
+
+
+@dataclass
+class PreparedImage:
+    """
+    Provider-ready image
+
+    Attributes:
+        source: Path or URL the image was loaded from
+        mime_type: MIME type of data
+        data: Encoded image (within the target size)
+        width: Width in pixels, if decoded
+        height: Height in pixels, if decoded
+    """
+    source: str
+    mime_type: str
+    data: bytes
+    width: int | None = None
+    height: int | None = None
+
+    @cached_property
+    def base64(self) -> str:
+        """Base64 of data (encoded once)"""
+        return base64.b64encode(self.data).decode("ascii")
+
+    @property
+    def data_url(self) -> str:
+        """data: URL of the image"""
+        return f"data:{self.mime_type};base64,{self.base64}"
+
+
+def _local_path(source: str) -> Path:
+    if source.startswith("file://"):
+        source = source[7:]
+    return Path(source).expanduser()
+
+
+def _fit_image(buffer: bytes, mime_type: str, max_side: int, quality: int) -> tuple[bytes, str, int | None, int | None]:
+    """Resize to fit max_side and re-encode formats providers don't take"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return buffer, mime_type, None, None
+
+    if is_heic_mime(mime_type):
+        try:
+            from pillow_heif import register_heif_opener
+
+            register_heif_opener()
+        except ImportError:
+            logger.debug("pillow-heif not available")
+
+    try:
+        img = Image.open(io.BytesIO(buffer))
+        width, height = img.size
+    except Exception as e:
+        logger.warning(f"Could not decode image ({mime_type}), sending as-is: {e}")
+        return buffer, mime_type, None, None
+
+    if mime_type in PASSTHROUGH_MIME_TYPES and max(width, height) <= max_side:
+        return buffer, mime_type, width, height
+
+    if max(width, height) > max_side:
+        ratio = max_side / max(width, height)
+        img = img.resize(
+            (max(1, int(width * ratio)), max(1, int(height * ratio))),
+            Image.Resampling.LANCZOS,
+        )
+
+    output = io.BytesIO()
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img.save(output, format="PNG", optimize=True)
+        mime_type = "image/png"
+    else:
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.save(output, format="JPEG", quality=quality, optimize=True)
+        mime_type = "image/jpeg"
+
+    logger.debug(f"Prepared image {width}x{height} -> {img.width}x{img.height} ({mime_type})")
+    return output.getvalue(), mime_type, img.width, img.height
+
+
+class ImagePrepCache:
+    """
+    LRU cache of provider-ready images
+
+    Example:
+        cache = get_image_prep_cache()
+        image = await cache.prepare("~/Pictures/chart.png")
+        part = {"type": "image_url", "image_url": {"url": image.data_url}}
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: int = 128 * 1024 * 1024,
+        max_side: int = 2048,
+        quality: int = 85,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum cached images
+            max_bytes: Maximum total size of cached image data
+            max_side: Default longest side of prepared images
+            quality: JPEG quality for re-encoded images
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_side = max_side
+        self.quality = quality
+
+        self._entries: OrderedDict[tuple, PreparedImage] = OrderedDict()
+        self._total_bytes = 0
+        self._inflight: dict[tuple, asyncio.Future[PreparedImage]] = {}
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    async def _version(self, source: str) -> str:
+        """Identify the current content of a source without loading it"""
+        if source.startswith("data:"):
+            return hashlib.sha256(source.encode()).hexdigest()
+
+        if source.startswith(("http://", "https://")):
+            from .attachments import AttachmentError, get_attachment_store
+
+            try:
+                attachment = await get_attachment_store().fetch(source)
+            except AttachmentError as e:
+                raise ValueError(f"Remote image failed to load: {e}") from e
+            return attachment.sha256
+
+        stat = _local_path(source).stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    async def prepare(self, source: str, max_side: int | None = None) -> PreparedImage:
+        """
+        Get the provider-ready form of an image
+
+        Args:
+            source: File path, file:// URL, HTTP(S) URL or data URL
+            max_side: Longest side in pixels (default: cache setting)
+
+        Returns:
+            PreparedImage
+
+        Raises:
+            FileNotFoundError: If a local file doesn't exist
+            ValueError: If the image can't be loaded
+        """
+        source = source.strip()
+        max_side = max_side or self.max_side
+        key = (source, await self._version(source), max_side)
+
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            self._stats["misses"] += 1
+            inflight = asyncio.ensure_future(self._load(source, max_side))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        image = await asyncio.shield(inflight)
+        self._store(key, image)
+        return image
+
+    async def prepare_many(self, sources: list[str], max_side: int | None = None) -> dict[str, PreparedImage]:
+        """
+        Prepare several images concurrently
+
+        Images that fail to load are logged and left out.
+
+        Returns:
+            Source -> PreparedImage
+        """
+        unique = list(dict.fromkeys(sources))
+        results = await asyncio.gather(
+            *(self.prepare(source, max_side) for source in unique), return_exceptions=True
+        )
+        prepared: dict[str, PreparedImage] = {}
+        for source, result in zip(unique, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to prepare image {source[:80]}: {result}")
+            else:
+                prepared[source] = result
+        return prepared
+
+    async def _load(self, source: str, max_side: int) -> PreparedImage:
+        media = await MediaLoader().load(source)
+        mime_type = media.content_type or "image/png"
+        data, mime_type, width, height = await asyncio.to_thread(
+            _fit_image, media.buffer, mime_type, max_side, self.quality
+        )
+        return PreparedImage(source=source, mime_type=mime_type, data=data, width=width, height=height)
+
+    def _store(self, key: tuple, image: PreparedImage) -> None:
+        if key in self._entries:
+            return
+        self._entries[key] = image
+        self._total_bytes += len(image.data)
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted.data)
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop all cached images"""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def get_stats(self) -> dict:
+        """Cache statistics"""
+        return {**self._stats, "entries": len(self._entries), "bytes": self._total_bytes}
+
+
+# Global cache
+_cache: ImagePrepCache | None = None
+
+
+def get_image_prep_cache() -> ImagePrepCache:
+    """Get global prepared image cache"""
+    global _cache
+    if _cache is None:
+        _cache = ImagePrepCache()
+    return _cache
@@ -6,6 +6,7 @@ Matches TypeScript src/web/media.ts
 """
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 import re
@@ -14,7 +15,6 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import httpx
 
 from .mime import (
     MediaKind,
@@ -22,7 +22,6 @@ from .mime import (
     is_heic_file,
     is_heic_mime,
     media_kind_from_mime,
-    normalize_header_mime,
 )
 
 logger = logging.getLogger(__name__)
@@ -90,9 +89,8 @@ class MediaLoader:
             MediaResult
         
         Raises:
-            ValueError: If source is invalid or not allowed
+            ValueError: If source is invalid, not allowed or fails to download
             FileNotFoundError: If file not found
-            httpx.HTTPError: If HTTP request fails
         """
         source = source.strip()
         
@@ -147,38 +145,30 @@ class MediaLoader:
         )
     
     async def _load_http_url(self, url: str) -> MediaResult:
-        """Load from HTTP/HTTPS URL."""
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            buffer = response.content
-            
-            # Check size
-            if self.max_bytes and len(buffer) > self.max_bytes:
-                raise ValueError(
-                    f"Remote media exceeds size limit: {len(buffer)} > {self.max_bytes}"
-                )
-            
-            # Get MIME from header
-            content_type = normalize_header_mime(response.headers.get("content-type"))
-            
-            # Detect from buffer if header missing
-            if not content_type:
-                content_type = detect_mime(buffer=buffer)
-            
-            kind = media_kind_from_mime(content_type)
-            
-            # Extract filename from URL
-            parsed = urlparse(url)
-            file_name = Path(parsed.path).name if parsed.path else None
-            
-            return MediaResult(
-                buffer=buffer,
-                content_type=content_type,
-                kind=kind,
-                file_name=file_name,
-            )
+        """Load from HTTP/HTTPS URL (downloaded once, via the attachment store)."""
+        from .attachments import AttachmentError, get_attachment_store
+        
+        try:
+            attachment = await get_attachment_store().fetch(url, max_bytes=self.max_bytes)
+        except AttachmentError as e:
+            raise ValueError(f"Remote media failed to load: {e}") from e
+        
+        buffer = await asyncio.to_thread(attachment.read_bytes)
+        
+        # MIME from the response header, detected from the buffer if missing
+        content_type = attachment.mime_type or detect_mime(buffer=buffer)
+        kind = media_kind_from_mime(content_type)
+        
+        # Extract filename from URL
+        parsed = urlparse(url)
+        file_name = Path(parsed.path).name if parsed.path else None
+        
+        return MediaResult(
+            buffer=buffer,
+            content_type=content_type,
+            kind=kind,
+            file_name=file_name,
+        )
     
     async def _load_file(self, file_path: str) -> MediaResult:
         """Load from local file."""
@@ -0,0 +1,374 @@
+"""Async ffmpeg transcoding with a content-addressed cache
+
+ffmpeg runs through ``asyncio.create_subprocess_exec`` so a transcode never
+blocks the event loop. Small inputs are streamed through stdin and outputs
+read back from stdout; only large inputs and container formats that need a
+seekable output (mp4/m4a) go through temp files. The number of concurrent
+ffmpeg processes is bounded by the CPU count.
+
+Outputs are cached by a hash of the input content plus the ffmpeg arguments,
+so the same voice note converted for speech-to-text, or the same TTS reply
+re-encoded for Telegram, is only transcoded once.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+MediaSource = Union[bytes, Path, str]
+
+# Encoder per output format
+AUDIO_CODECS = {
+    "mp3": "libmp3lame",
+    "aac": "aac",
+    "m4a": "aac",
+    "opus": "libopus",
+    "ogg": "libopus",
+    "flac": "flac",
+    "wav": "pcm_s16le",
+}
+
+# ffmpeg muxer per output format, where the name differs
+_MUXERS = {"aac": "adts", "m4a": "ipod", "oga": "ogg"}
+
+# Muxers that seek back to write headers and cannot write to a pipe
+_SEEKABLE_OUTPUTS = frozenset({"m4a", "mp4", "mov", "3gp"})
+
+
+class TranscodeError(Exception):
+    """ffmpeg failed or is unavailable"""
+    pass
+
+
+class TranscodeService:
+    """
+    Bounded, cached ffmpeg runner
+
+    Example:
+        service = get_transcode_service()
+        wav = await service.transcode(voice_bytes, "wav", ["-ac", "1", "-ar", "16000"])
+    """
+
+    def __init__(
+        self,
+        ffmpeg_path: str = "ffmpeg",
+        max_parallel: int | None = None,
+        pipe_max_bytes: int = 16 * 1024 * 1024,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        cache_dir: Path | str | None = None,
+        timeout: float = 300.0,
+    ):
+        """
+        Initialize service
+
+        Args:
+            ffmpeg_path: Path to ffmpeg executable
+            max_parallel: Concurrent ffmpeg processes (default: CPU count)
+            pipe_max_bytes: Largest in-memory input streamed through stdin
+            cache_max_bytes: Memory budget for cached outputs
+            cache_dir: Also keep outputs on disk here (survives restarts)
+            timeout: Default seconds before an ffmpeg run is killed
+        """
+        self.ffmpeg_path = ffmpeg_path
+        self.max_parallel = max_parallel or os.cpu_count() or 2
+        self.pipe_max_bytes = pipe_max_bytes
+        self.cache_max_bytes = cache_max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(self.max_parallel)
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cache_bytes = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._available: bool | None = None
+        self._stats = {"hits": 0, "misses": 0, "runs": 0, "failures": 0}
+
+    # ------------------------------------------------------------------
+    # Availability
+    # ------------------------------------------------------------------
+
+    async def check_ffmpeg(self) -> bool:
+        """Check (once) whether ffmpeg can be run"""
+        if self._available is None:
+            if shutil.which(self.ffmpeg_path) is None:
+                self._available = False
+            else:
+                try:
+                    await self._exec([self.ffmpeg_path, "-version"], None, 5.0)
+                    self._available = True
+                except TranscodeError:
+                    self._available = False
+        return self._available
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    async def _digest(self, source: MediaSource) -> str:
+        if isinstance(source, bytes):
+            return hashlib.sha256(source).hexdigest()
+        return await asyncio.to_thread(self._hash_file, Path(source))
+
+    async def _cache_key(self, sources: Sequence[MediaSource], output_format: str, args: Sequence[str]) -> str:
+        digests = [await self._digest(source) for source in sources]
+        material = "\0".join([*digests, output_format, *args])
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _cache_get(self, key: str) -> bytes | None:
+        data = self._cache.get(key)
+        if data is not None:
+            self._cache.move_to_end(key)
+            return data
+        if self.cache_dir is not None:
+            path = self.cache_dir / key
+            if path.exists():
+                data = path.read_bytes()
+                self._cache_put(key, data, persist=False)
+                return data
+        return None
+
+    def _cache_put(self, key: str, data: bytes, persist: bool = True) -> None:
+        if persist and self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp = self.cache_dir / f".{key}.tmp"
+                tmp.write_bytes(data)
+                tmp.replace(self.cache_dir / key)
+            except OSError as e:
+                logger.warning(f"Failed to persist transcode cache entry: {e}")
+
+        # One huge output shouldn't flush everything else
+        if len(data) > self.cache_max_bytes // 4:
+            return
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._cache_bytes -= len(old)
+        self._cache[key] = data
+        self._cache_bytes += len(data)
+        while self._cache_bytes > self.cache_max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= len(evicted)
+
+    # ------------------------------------------------------------------
+    # Running ffmpeg
+    # ------------------------------------------------------------------
+
+    async def _exec(self, cmd: list[str], stdin: bytes | None, timeout: float) -> bytes:
+        """Run a command, feeding stdin and returning stdout"""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise TranscodeError("ffmpeg not available")
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(stdin), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise TranscodeError(f"ffmpeg timed out after {timeout}s")
+        except asyncio.CancelledError:
+            proc.kill()
+            raise
+
+        if proc.returncode != 0:
+            raise TranscodeError(f"ffmpeg error: {stderr.decode('utf-8', errors='ignore').strip()}")
+        return stdout
+
+    async def _run(
+        self,
+        sources: Sequence[MediaSource],
+        output_format: str,
+        args: Sequence[str],
+        input_args: Sequence[str],
+        timeout: float,
+    ) -> bytes:
+        cmd = [self.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-y", *input_args]
+        stdin = None
+        with tempfile.TemporaryDirectory(prefix="openclaw-ffmpeg-") as tmp:
+            tmp_dir = Path(tmp)
+            for i, source in enumerate(sources):
+                if isinstance(source, bytes):
+                    if stdin is None and len(source) <= self.pipe_max_bytes:
+                        stdin = source
+                        cmd.extend(["-i", "pipe:0"])
+                        continue
+                    path = tmp_dir / f"input{i}"
+                    await asyncio.to_thread(path.write_bytes, source)
+                    source = path
+                cmd.extend(["-i", str(source)])
+
+            cmd.extend(args)
+            cmd.extend(["-f", _MUXERS.get(output_format, output_format)])
+            if output_format in _SEEKABLE_OUTPUTS:
+                output_path = tmp_dir / f"output.{output_format}"
+                cmd.append(str(output_path))
+            else:
+                output_path = None
+                cmd.append("pipe:1")
+
+            async with self._semaphore:
+                self._stats["runs"] += 1
+                stdout = await self._exec(cmd, stdin, timeout)
+                if output_path is not None:
+                    return await asyncio.to_thread(output_path.read_bytes)
+                return stdout
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def transcode(
+        self,
+        source: MediaSource | Sequence[MediaSource],
+        output_format: str,
+        args: Sequence[str] = (),
+        input_args: Sequence[str] = (),
+        timeout: float | None = None,
+        cache: bool = True,
+    ) -> bytes:
+        """
+        Transcode media, reusing a cached result when available
+
+        Args:
+            source: Input bytes or file path (or a list of them)
+            output_format: Output format/extension (mp3, ogg, wav, m4a, ...)
+            args: Output options placed before the output (codecs, filters, ...)
+            input_args: Options placed before the inputs (e.g. ``-f concat``)
+            timeout: Seconds before ffmpeg is killed
+            cache: Look up and store the result in the cache
+
+        Returns:
+            Encoded output
+
+        Raises:
+            TranscodeError: If ffmpeg fails, times out or is missing
+        """
+        sources = [source] if isinstance(source, (bytes, Path, str)) else list(source)
+        args = [str(arg) for arg in args]
+        input_args = [str(arg) for arg in input_args]
+        timeout = timeout or self.timeout
+
+        if not cache:
+            self._stats["misses"] += 1
+            return await self._run(sources, output_format, args, input_args, timeout)
+
+        key = await self._cache_key(sources, output_format, [*input_args, "--", *args])
+        data = self._cache_get(key)
+        if data is not None:
+            self._stats["hits"] += 1
+            return data
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                data = await asyncio.shield(inflight)
+                self._stats["hits"] += 1
+                return data
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The run we joined was cancelled by its own caller; run it here
+
+        self._stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await self._run(sources, output_format, args, input_args, timeout)
+            self._cache_put(key, data)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            self._stats["failures"] += 1
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Only joined callers need the exception; avoid "never retrieved"
+                future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def transcode_to_file(
+        self,
+        source: MediaSource | Sequence[MediaSource],
+        output_path: Path | str,
+        output_format: str | None = None,
+        args: Sequence[str] = (),
+        **kwargs,
+    ) -> Path:
+        """
+        Transcode media and write the result to a file
+
+        Args:
+            source: Input bytes or file path (or a list of them)
+            output_path: Destination file
+            output_format: Output format (default: output_path's suffix)
+            args: Output options
+            **kwargs: Passed to :meth:`transcode`
+
+        Returns:
+            The output path
+        """
+        output_path = Path(output_path)
+        output_format = output_format or output_path.suffix.lstrip(".").lower()
+        data = await self.transcode(source, output_format, args, **kwargs)
+        await asyncio.to_thread(output_path.write_bytes, data)
+        return output_path
+
+    async def to_speech_input(self, source: MediaSource) -> bytes:
+        """Convert audio to 16 kHz mono WAV for speech-to-text"""
+        return await self.transcode(source, "wav", ["-vn", "-ac", "1", "-ar", "16000", "-codec:a", "pcm_s16le"])
+
+    async def to_voice_note(self, source: MediaSource, bitrate: str = "32k") -> bytes:
+        """Encode audio as Ogg/Opus, the format chat apps play as a voice note"""
+        return await self.transcode(
+            source, "ogg", ["-vn", "-ac", "1", "-ar", "48000", "-codec:a", "libopus", "-b:a", bitrate]
+        )
+
+    def clear_cache(self) -> None:
+        """Drop in-memory cached outputs"""
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    def get_stats(self) -> dict:
+        """Cache and run statistics"""
+        return {
+            **self._stats,
+            "cached": len(self._cache),
+            "cached_bytes": self._cache_bytes,
+            "max_parallel": self.max_parallel,
+        }
+
+
+# Global service instance
+_service: TranscodeService | None = None
+
+
+def get_transcode_service() -> TranscodeService:
+    """Get global transcode service instance"""
+    global _service
+    if _service is None:
+        _service = TranscodeService()
+    return _service
@@ -3,7 +3,7 @@
 Loads media from URLs or local files with automatic optimization.
 Matches TypeScript src/web/media.ts
 """
-import aiohttp
+import asyncio
 import io
 import logging
 import mimetypes
@@ -40,34 +40,32 @@ async def load_web_media(
         if not _is_safe_url(media_url):
             raise ValueError(f"Unsafe URL blocked by SSRF policy: {media_url}")
     
-    # Download from URL
+    # Download from URL (once; later loads are read from the attachment store)
+    from .attachments import AttachmentError, get_attachment_store
+    
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(media_url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-                if resp.status != 200:
-                    raise ValueError(f"Failed to load media: HTTP {resp.status}")
-                
-                content = await resp.read()
-                content_type = resp.headers.get("Content-Type", "")
-                
-                # Check size limit
-                if max_bytes and len(content) > max_bytes:
-                    # Try to optimize if image
-                    if content_type.startswith("image/"):
-                        logger.info(f"Optimizing image: {len(content)} -> max {max_bytes} bytes")
-                        content = await optimize_image(content, max_bytes, content_type)
-                    else:
-                        raise ValueError(f"Media too large: {len(content)} > {max_bytes}")
-                
-                return {
-                    "data": content,
-                    "mime_type": content_type,
-                    "size": len(content),
-                    "url": media_url,
-                }
-    
-    except aiohttp.ClientError as e:
+        attachment = await get_attachment_store().fetch(media_url, timeout=30)
+    except AttachmentError as e:
         raise ValueError(f"Failed to download media: {e}")
+    
+    content = await asyncio.to_thread(attachment.read_bytes)
+    content_type = attachment.mime_type or ""
+    
+    # Check size limit
+    if max_bytes and len(content) > max_bytes:
+        # Try to optimize if image
+        if content_type.startswith("image/"):
+            logger.info(f"Optimizing image: {len(content)} -> max {max_bytes} bytes")
+            content = await optimize_image(content, max_bytes, content_type)
+        else:
+            raise ValueError(f"Media too large: {len(content)} > {max_bytes}")
+    
+    return {
+        "data": content,
+        "mime_type": content_type,
+        "size": len(content),
+        "url": media_url,
+    }
 
 
 async def _load_local_media(
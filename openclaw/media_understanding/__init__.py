@@ -5,6 +5,7 @@ Matches TypeScript openclaw/src/media-understanding/
 """
 
 from .runner import MediaUnderstandingRunner, analyze_media
+from .cache import MediaUnderstandingCache, get_media_understanding_cache
 from .image import ImageAnalyzer
 from .audio import AudioAnalyzer
 from .video import VideoAnalyzer
@@ -13,6 +14,8 @@ from .types import MediaType, AnalysisResult
 __all__ = [
     "MediaUnderstandingRunner",
     "analyze_media",
+    "MediaUnderstandingCache",
+    "get_media_understanding_cache",
     "ImageAnalyzer",
     "AudioAnalyzer",
     "VideoAnalyzer",
@@ -4,60 +4,62 @@ from __future__ import annotations
 
 from typing import Optional, Any
 
-from .runner import run_media_understanding
-from .types import MediaScope
+from .runner import MediaUnderstandingRunner
+from .types import MediaType
 
 
 async def apply_media_understanding(
     context: dict[str, Any],
     config: Optional[dict] = None,
-    scope: MediaScope = MediaScope.AUTO
+    runner: Optional[MediaUnderstandingRunner] = None,
 ) -> None:
     """Apply media understanding to context.
     
     Automatically processes media in the context and adds
-    descriptions/transcripts.
+    descriptions/transcripts. All items are analyzed concurrently under
+    one deadline, and results are served from the cache when the same
+    media was seen before.
     
     Args:
         context: Message context with media
         config: Optional configuration
-        scope: Processing scope
+        runner: Runner to use (default: one built from config)
     """
     config = config or {}
     
     # Extract media from context
-    media_items = context.get("media", [])
+    media_items = [item for item in context.get("media", []) if item.get("url")]
     if not media_items:
         return
     
-    # Process each media item
-    results = []
-    for item in media_items:
-        media_url = item.get("url")
-        media_type = item.get("type", "image")
-        
-        if not media_url:
-            continue
-        
-        result = await run_media_understanding(
-            media_url=media_url,
-            media_type=media_type,
-            scope=scope,
-            config=config
-        )
-        
-        if result:
-            results.append(result)
-    
-    # Add results to context
-    if results:
-        context["media_understanding"] = [
+    runner = runner or MediaUnderstandingRunner(config)
+    results = await runner.analyze_many(
+        [
             {
-                "url": r.url,
-                "type": r.media_type,
-                "description": r.description,
-                "transcript": r.transcript,
-                "provider": r.provider
+                "path": item["url"],
+                "type": item.get("type", "image"),
+                "content_id": item.get("file_id"),
             }
-            for r in results
-        ]
+            for item in media_items
+        ],
+        prompt=config.get("media_understanding_prompt"),
+        deadline=config.get("media_understanding_deadline", 30.0),
+        concurrency=config.get("media_understanding_concurrency", 4),
+    )
+    
+    # Add results to context
+    entries = []
+    for item, result in zip(media_items, results):
+        if not result.success:
+            continue
+        is_audio = result.media_type == MediaType.AUDIO
+        entries.append({
+            "url": item["url"],
+            "type": result.media_type.value,
+            "description": None if is_audio else result.text,
+            "transcript": result.text if is_audio else None,
+            "provider": result.provider.value,
+        })
+    
+    if entries:
+        context["media_understanding"] = entries
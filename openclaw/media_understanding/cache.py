@@ -0,0 +1,276 @@
+"""Media understanding result cache
+
+Caches analysis results by content hash + media type + provider + prompt,
+so forwarded memes, group chat reposts and retries are analyzed once.
+Entries live in SQLite (so they survive restarts) behind a small in-memory
+LRU, expire after a TTL and are evicted oldest-first past a size budget.
+Failed analyses are never cached.
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .types import AnalysisResult, MediaType, Provider
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+async def media_content_id(source: Path | str | bytes) -> str:
+    """
+    Identify media content for caching
+
+    Local files and raw bytes are hashed; remote URLs are identified by the
+    URL itself.
+
+    Args:
+        source: File path, URL or media bytes
+
+    Returns:
+        Content identifier
+    """
+    if isinstance(source, bytes):
+        return "sha256:" + hashlib.sha256(source).hexdigest()
+    source_str = str(source)
+    if "://" in source_str:
+        return "url:" + source_str
+    path = Path(source_str).expanduser()
+    if path.is_file():
+        return "sha256:" + await asyncio.to_thread(_hash_file, path)
+    return "path:" + source_str
+
+
+def _serialize(result: AnalysisResult) -> str:
+    data = dataclasses.asdict(result)
+    data["media_type"] = result.media_type.value
+    data["provider"] = result.provider.value
+    return json.dumps(data, default=str)
+
+
+def _deserialize(payload: str) -> AnalysisResult:
+    data = json.loads(payload)
+    data["media_type"] = MediaType(data["media_type"])
+    data["provider"] = Provider(data["provider"])
+    return AnalysisResult(**data)
+
+
+class MediaUnderstandingCache:
+    """
+    Persistent cache of successful media analyses
+
+    Example:
+        cache = get_media_understanding_cache()
+        key = cache.make_key(content_id, MediaType.IMAGE, provider="auto", prompt=None)
+        result = cache.get(key)
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        ttl: float = 7 * 24 * 3600,
+        max_entries: int = 10_000,
+        max_bytes: int = 32 * 1024 * 1024,
+        memory_entries: int = 256,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            db_path: SQLite database (default: <data dir>/cache/media_understanding.db,
+                ``":memory:"`` for a non-persistent cache)
+            ttl: Seconds a result stays valid
+            max_entries: Most stored results
+            max_bytes: Most stored result bytes
+            memory_entries: Results also kept in memory
+        """
+        if db_path is None:
+            from openclaw.config.paths import get_openclaw_data_dir
+
+            db_path = get_openclaw_data_dir() / "cache" / "media_understanding.db"
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.db_path = str(db_path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[str, tuple[float, AnalysisResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._init_database()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_accessed_at ON results(accessed_at)
+            """)
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        content_id: str,
+        media_type: MediaType,
+        provider: Provider | str | None,
+        prompt: str | None,
+        options: dict[str, Any] | None = None,
+    ) -> str:
+        """Cache key for one analysis request"""
+        provider_name = provider.value if isinstance(provider, Provider) else (provider or "auto")
+        material = json.dumps(
+            [content_id, media_type.value, provider_name, prompt or "", sorted((options or {}).items())],
+            default=str,
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def get(self, key: str) -> AnalysisResult | None:
+        """Get a cached result, or None if missing or expired"""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None and entry[0] + self.ttl > now:
+            self._memory.move_to_end(key)
+            self._stats["hits"] += 1
+            return dataclasses.replace(entry[1])
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] + self.ttl > now:
+                self._conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+
+        if row is None or row[1] + self.ttl <= now:
+            self._memory.pop(key, None)
+            self._stats["misses"] += 1
+            return None
+
+        try:
+            result = _deserialize(row[0])
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Dropping unreadable media cache entry: {e}")
+            self.delete(key)
+            self._stats["misses"] += 1
+            return None
+
+        self._remember(key, row[1], result)
+        self._stats["hits"] += 1
+        return dataclasses.replace(result)
+
+    def put(self, key: str, result: AnalysisResult) -> None:
+        """Store a successful result"""
+        if not result.success:
+            return
+        now = time.time()
+        payload = _serialize(result)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, payload, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now),
+            )
+            self._conn.commit()
+        self._remember(key, now, result)
+        self._stats["stores"] += 1
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove an entry"""
+        self._memory.pop(key, None)
+        with self._lock:
+            self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _remember(self, key: str, created_at: float, result: AnalysisResult) -> None:
+        self._memory[key] = (created_at, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones past the budgets"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM results WHERE created_at <= ?", (time.time() - self.ttl,)
+            )
+            evicted = cursor.rowcount
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+            if count > self.max_entries or size > self.max_bytes:
+                rows = self._conn.execute(
+                    "SELECT key, size FROM results ORDER BY accessed_at"
+                ).fetchall()
+                stale = []
+                for key, entry_size in rows:
+                    if count <= self.max_entries and size <= self.max_bytes:
+                        break
+                    stale.append((key,))
+                    count -= 1
+                    size -= entry_size
+                self._conn.executemany("DELETE FROM results WHERE key = ?", stale)
+                evicted += len(stale)
+                for (key,) in stale:
+                    self._memory.pop(key, None)
+            self._conn.commit()
+        self._stats["evictions"] += evicted
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        self._memory.clear()
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Cache statistics"""
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+        return {**self._stats, "entries": count, "bytes": size}
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+
+# Global cache instance
+_cache: MediaUnderstandingCache | None = None
+
+
+def get_media_understanding_cache() -> MediaUnderstandingCache:
+    """Get global media understanding cache instance"""
+    global _cache
+    if _cache is None:
+        _cache = MediaUnderstandingCache()
+    return _cache
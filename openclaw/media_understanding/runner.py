@@ -1,11 +1,14 @@
 """Main media understanding runner"""
 from __future__ import annotations
 
+import asyncio
 import logging
 import mimetypes
+import time
 from pathlib import Path
 from typing import Any
 
+from .cache import MediaUnderstandingCache, get_media_understanding_cache, media_content_id
 from .types import MediaType, AnalysisResult, Provider
 from .image import ImageAnalyzer
 from .audio import AudioAnalyzer
@@ -18,17 +21,28 @@ class MediaUnderstandingRunner:
     """
     Main coordinator for media analysis
     
-    Auto-detects media type and routes to appropriate analyzer.
+    Auto-detects media type and routes to appropriate analyzer. Successful
+    results are cached by content, provider and prompt.
     """
     
-    def __init__(self, config: dict[str, Any] | None = None):
+    def __init__(
+        self,
+        config: dict[str, Any] | None = None,
+        cache: MediaUnderstandingCache | None = None,
+    ):
         """
         Initialize media understanding runner
         
         Args:
             config: Optional configuration for providers
+                (``cache_enabled: False`` disables the result cache)
+            cache: Result cache (default: shared persistent cache)
         """
         self.config = config or {}
+        if cache is None and self.config.get("cache_enabled", True):
+            cache = get_media_understanding_cache()
+        self.cache = cache
+        self._inflight: dict[str, asyncio.Future] = {}
         
         # Initialize analyzers
         self.image_analyzer = ImageAnalyzer(config)
@@ -80,6 +94,7 @@ class MediaUnderstandingRunner:
         media_type: MediaType | None = None,
         provider: Provider | None = None,
         prompt: str | None = None,
+        content_id: str | None = None,
         **kwargs
     ) -> AnalysisResult:
         """
@@ -90,19 +105,69 @@ class MediaUnderstandingRunner:
             media_type: Optional media type (auto-detected if None)
             provider: Optional provider (auto-selected if None)
             prompt: Optional prompt for analysis
+            content_id: Stable content identifier, e.g. a channel file_id
+                (default: hash of the file, or the URL)
             **kwargs: Additional provider-specific options
             
         Returns:
             Analysis result
         """
-        import time
-        
-        start_time = time.time()
-        
         # Detect media type if not provided
         if media_type is None:
             media_type = self.detect_media_type(path)
         
+        if self.cache is None:
+            return await self._analyze(path, media_type, provider, prompt, **kwargs)
+        
+        key = self.cache.make_key(
+            content_id or await media_content_id(path), media_type, provider, prompt, kwargs
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"Media understanding cache hit: {path}")
+            cached.duration_ms = 0.0
+            cached.data = {**cached.data, "cached": True}
+            return cached
+        
+        # Identical media in flight (e.g. the same attachment twice in a batch)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The analysis we joined was cancelled by its own caller; retry
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._analyze(path, media_type, provider, prompt, **kwargs)
+            self.cache.put(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            if not future.done():
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Only joined callers need the exception; avoid "never retrieved"
+                    future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+    
+    async def _analyze(
+        self,
+        path: Path | str,
+        media_type: MediaType,
+        provider: Provider | None,
+        prompt: str | None,
+        **kwargs
+    ) -> AnalysisResult:
+        start_time = time.time()
+        
         logger.info(f"Analyzing {media_type.value}: {path}")
         
         try:
@@ -142,6 +207,71 @@ class MediaUnderstandingRunner:
                 error=str(e),
                 duration_ms=(time.time() - start_time) * 1000,
             )
+    
+    async def analyze_many(
+        self,
+        items: list[Path | str | dict[str, Any]],
+        prompt: str | None = None,
+        deadline: float | None = None,
+        concurrency: int = 4,
+    ) -> list[AnalysisResult]:
+        """
+        Analyze several media items concurrently under one deadline
+        
+        Args:
+            items: Paths/URLs, or dicts with ``path`` (or ``url``) and optional
+                ``type``, ``prompt``, ``provider`` and ``content_id``/``file_id``
+            prompt: Default prompt for items without their own
+            deadline: Seconds to wait for the whole batch; unfinished items
+                come back failed with ``error="Timed out"``
+            concurrency: Items analyzed at the same time
+            
+        Returns:
+            Results in item order
+        """
+        if not items:
+            return []
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(item: Path | str | dict[str, Any]) -> AnalysisResult:
+            if not isinstance(item, dict):
+                item = {"path": item}
+            path = item.get("path") or item.get("url")
+            media_type = item.get("type")
+            if isinstance(media_type, str):
+                media_type = MediaType(media_type)
+            provider = item.get("provider")
+            if isinstance(provider, str):
+                provider = Provider(provider)
+            async with semaphore:
+                return await self.analyze(
+                    path,
+                    media_type=media_type,
+                    provider=provider,
+                    prompt=item.get("prompt", prompt),
+                    content_id=item.get("content_id") or item.get("file_id"),
+                )
+        
+        tasks = [asyncio.create_task(run(item)) for item in items]
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+        
+        results = []
+        for item, task in zip(items, tasks):
+            if task in done and not task.cancelled() and task.exception() is None:
+                results.append(task.result())
+                continue
+            path = item.get("path") or item.get("url") if isinstance(item, dict) else item
+            error = "Timed out" if task in pending or task.cancelled() else str(task.exception())
+            results.append(AnalysisResult(
+                media_type=self.detect_media_type(path or ""),
+                provider=Provider.ANTHROPIC,  # Placeholder
+                success=False,
+                error=error,
+            ))
+        return results
 
 
 # Convenience function
@@ -158,23 +158,23 @@ class VideoAnalyzer:
         Returns:
             Audio file path
         """
-        try:
-            import ffmpeg
-            import tempfile
-        except ImportError:
-            raise RuntimeError("ffmpeg-python not installed. Install with: pip install ffmpeg-python")
-        
+        import tempfile
+
+        from openclaw.media.transcode import TranscodeError, get_transcode_service
+
         # Create temp audio file
         with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
             audio_path = Path(f.name)
         
-        # Extract audio
-        (
-            ffmpeg
-            .input(str(video_path))
-            .output(str(audio_path), acodec="libmp3lame", ac=1, ar="16000")
-            .overwrite_output()
-            .run(quiet=True)
-        )
+        # Extract audio (async, cached by content)
+        try:
+            await get_transcode_service().transcode_to_file(
+                video_path,
+                audio_path,
+                args=["-vn", "-codec:a", "libmp3lame", "-ac", "1", "-ar", "16000"],
+            )
+        except TranscodeError as e:
+            audio_path.unlink(missing_ok=True)
+            raise RuntimeError(f"Audio extraction failed: {e}")
         
         return audio_path
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Optional, List
 
 from .types import MemorySearchResult, MemorySource
-from .embeddings import EmbeddingProvider, OpenAIEmbeddingProvider
+from .embeddings import EmbeddingProvider, EmbeddingService, OpenAIEmbeddingProvider
 from .hybrid import merge_hybrid_results, normalize_scores, SearchResult
 
 logger = logging.getLogger(__name__)
@@ -33,6 +33,9 @@ class BuiltinMemoryManager:
         else:
             self.embedder = OpenAIEmbeddingProvider()  # Default
         
+        # Concurrent searches share batched provider calls
+        self.embedding_service = EmbeddingService(self.embedder)
+        
         # Set up database path
         memory_dir = workspace_dir / ".openclaw" / "memory"
         memory_dir.mkdir(parents=True, exist_ok=True)
@@ -373,8 +376,8 @@ class BuiltinMemoryManager:
             Search results
         """
         try:
-            # Generate query embedding
-            query_embedding = await self.embedder.embed_text(query)
+            # Generate query embedding (float32 array -> floats once, not per chunk)
+            query_embedding = (await self.embedding_service.embed(query)).tolist()
             
             # Build source filter
             source_filter = ""
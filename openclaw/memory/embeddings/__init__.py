@@ -1,9 +1,10 @@
 """Embedding providers for memory vector search"""
 
-from .base import EmbeddingProvider, EmbeddingBatch
+from .base import EmbeddingProvider, EmbeddingBatch, as_float32
 from .openai_provider import OpenAIEmbeddingProvider
 from .gemini_provider import GeminiEmbeddingProvider
 from .local_provider import LocalEmbeddingProvider
+from .service import EmbeddingService
 
 __all__ = [
     "EmbeddingProvider",
@@ -11,4 +12,6 @@ __all__ = [
     "OpenAIEmbeddingProvider",
     "GeminiEmbeddingProvider",
     "LocalEmbeddingProvider",
+    "EmbeddingService",
+    "as_float32",
 ]
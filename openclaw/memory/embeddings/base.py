@@ -2,8 +2,24 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
-from typing import List
+from typing import Any, List, Sequence
+
+
+def as_float32(vector: Sequence[float]) -> Any:
+    """
+    Convert an embedding to a float32 array
+    
+    Returns a numpy ``float32`` array when numpy is installed, otherwise a
+    stdlib ``array("f")``. Both are a quarter the size of a list of Python
+    floats and support ``len()``, indexing, iteration and ``tolist()``.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return array("f", vector)
+    return np.asarray(vector, dtype=np.float32)
 
 
 @dataclass
@@ -63,6 +79,24 @@ class EmbeddingProvider(ABC):
         """
         pass
     
+    async def embed_vectors(self, texts: List[str]) -> List[Any]:
+        """
+        Embed texts as float32 arrays
+        
+        Used by :class:`~openclaw.memory.embeddings.service.EmbeddingService`.
+        Providers whose backend already produces arrays override this to skip
+        the round trip through Python lists.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One float32 array per text, in order
+        """
+        result = await self.embed_batch(texts)
+        embeddings = result.embeddings if isinstance(result, EmbeddingBatch) else result
+        return [as_float32(embedding) for embedding in embeddings]
+    
     @abstractmethod
     def get_dimensions(self) -> int:
         """Get embedding dimensions for this model"""
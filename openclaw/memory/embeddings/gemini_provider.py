@@ -1,6 +1,7 @@
 """Gemini embedding provider"""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import List
 
@@ -52,7 +53,9 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
         """Embed single text"""
         client = self._get_client()
         
-        result = client.embed_content(
+        # genai is synchronous; keep the request off the event loop
+        result = await asyncio.to_thread(
+            client.embed_content,
             model=f"models/{self.model}",
             content=text,
             task_type="retrieval_document",
@@ -69,7 +72,8 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
         client = self._get_client()
         
         # Gemini supports batch embedding
-        result = client.embed_content(
+        result = await asyncio.to_thread(
+            client.embed_content,
             model=f"models/{self.model}",
             content=texts,
             task_type="retrieval_document",
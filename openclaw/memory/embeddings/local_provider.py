@@ -1,8 +1,10 @@
 """Local embedding provider using llama.cpp or sentence-transformers"""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
 
 from .base import EmbeddingProvider, EmbeddingBatch
 
@@ -16,6 +18,9 @@ class LocalEmbeddingProvider(EmbeddingProvider):
     Supports:
     - sentence-transformers models
     - llama.cpp embeddings
+    
+    Model loading and inference run on a dedicated worker thread so the
+    event loop stays responsive during a forward pass.
     """
     
     def __init__(
@@ -33,6 +38,7 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         super().__init__(model)
         self.backend = backend
         self._model_instance = None
+        self._executor: ThreadPoolExecutor | None = None
     
     def _load_model(self):
         """Load embedding model"""
@@ -60,14 +66,26 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         
         return self._model_instance
     
+    async def _run(self, fn, *args) -> Any:
+        """Run a blocking call on the model thread"""
+        if self._executor is None:
+            # One worker: the model is used by a single thread at a time
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="openclaw-embed")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+    
+    def _encode(self, texts: List[str]) -> Any:
+        model = self._load_model()
+        # sentence-transformers returns a float32 numpy array
+        return model.encode(texts, convert_to_numpy=True)
+    
+    async def embed_vectors(self, texts: List[str]) -> List[Any]:
+        """Embed texts as float32 arrays (rows of one model output)"""
+        return list(await self._run(self._encode, texts))
+    
     async def embed_text(self, text: str) -> List[float]:
         """Embed single text"""
-        model = self._load_model()
-        
-        # sentence-transformers returns numpy array
-        embedding = model.encode(text, convert_to_numpy=True)
-        
-        return embedding.tolist()
+        embeddings = await self._run(self._encode, [text])
+        return embeddings[0].tolist()
     
     async def embed_batch(
         self,
@@ -75,10 +93,8 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         use_batch_api: bool = False
     ) -> EmbeddingBatch:
         """Embed batch of texts"""
-        model = self._load_model()
-        
         # Batch encode
-        embeddings_array = model.encode(texts, convert_to_numpy=True)
+        embeddings_array = await self._run(self._encode, texts)
         
         # Convert to list
         embeddings = [emb.tolist() for emb in embeddings_array]
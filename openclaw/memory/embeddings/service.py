@@ -0,0 +1,141 @@
+"""Micro-batching embedding service
+
+Concurrent embedding requests (memory searches from many sessions, bulk
+indexing) are collected for a few milliseconds and sent to the provider as
+one batch, so a local model runs one forward pass instead of many and a
+remote API gets one request. Identical texts waiting in the same window or
+already being embedded share one result. Vectors come back as float32
+arrays (see :func:`~openclaw.memory.embeddings.base.as_float32`).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from .base import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingService:
+    """
+    Batches concurrent embedding requests for one provider
+
+    Example:
+        service = EmbeddingService(LocalEmbeddingProvider())
+        vector = await service.embed("what did we decide about the launch?")
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        Initialize service
+
+        Args:
+            provider: Embedding provider
+            max_batch_size: Texts per provider call; a full batch is sent at once
+            max_wait_ms: How long the first request in a batch waits for company
+        """
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._pending: dict[str, asyncio.Future] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._stats = {"requests": 0, "deduplicated": 0, "batches": 0, "texts": 0, "largest_batch": 0}
+
+    async def embed(self, text: str) -> Any:
+        """
+        Embed one text
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            float32 embedding
+        """
+        self._stats["requests"] += 1
+        future = self._pending.get(text) or self._inflight.get(text)
+        if future is not None:
+            self._stats["deduplicated"] += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[text] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.max_wait, self._flush)
+        return await asyncio.shield(future)
+
+    async def embed_many(self, texts: list[str]) -> list[Any]:
+        """
+        Embed several texts (batched together with any concurrent requests)
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 embeddings, in order
+        """
+        return list(await asyncio.gather(*(self.embed(text) for text in texts)))
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        self._inflight.update(batch)
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future]) -> None:
+        texts = list(batch)
+        self._stats["batches"] += 1
+        self._stats["texts"] += len(texts)
+        self._stats["largest_batch"] = max(self._stats["largest_batch"], len(texts))
+        try:
+            vectors = await self.provider.embed_vectors(texts)
+            if len(vectors) != len(texts):
+                raise RuntimeError(f"Provider returned {len(vectors)} embeddings for {len(texts)} texts")
+        except Exception as e:
+            logger.warning(f"Embedding batch of {len(texts)} failed: {e}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Callers that gave up shouldn't trigger "never retrieved"
+                    future.exception()
+        else:
+            for text, vector in zip(texts, vectors):
+                if not batch[text].done():
+                    batch[text].set_result(vector)
+        finally:
+            for text in texts:
+                if self._inflight.get(text) is batch[text]:
+                    del self._inflight[text]
+
+    async def close(self) -> None:
+        """Flush pending requests and wait for running batches"""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Batching statistics"""
+        batches = self._stats["batches"]
+        return {
+            **self._stats,
+            "pending": len(self._pending),
+            "inflight": len(self._inflight),
+            "avg_batch": self._stats["texts"] / batches if batches else 0.0,
+        }
@@ -29,6 +29,8 @@ class MemorySearchResult:
         snippet: Text snippet
         source: Source type (memory | sessions)
         citation: Optional citation string
+        id: Chunk id (indexed backends)
+        text: Full chunk text (indexed backends)
     """
     path: str
     start_line: int
@@ -37,6 +39,8 @@ class MemorySearchResult:
     snippet: str
     source: MemorySource
     citation: str | None = None
+    id: str = ""
+    text: str = ""
 
 
 @dataclass
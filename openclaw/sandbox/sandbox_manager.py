@@ -11,6 +11,13 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# language -> (script file, interpreter)
+_SCRIPTS = {
+    "python": ("script.py", "python"),
+    "javascript": ("script.js", "node"),
+    "bash": ("script.sh", "bash"),
+}
+
 
 class SandboxResult:
     """Result from sandbox execution"""
@@ -35,6 +42,10 @@ class SandboxManager:
     - File system restrictions
     - Network restrictions
     - Resource limits
+    
+    When the Docker Engine socket is reachable, executions run in warm
+    pooled containers (see ``openclaw.agents.sandbox.pool``) instead of a
+    fresh ``docker run`` per call.
     """
     
     def __init__(
@@ -42,10 +53,23 @@ class SandboxManager:
         use_docker: bool = True,
         default_image: str = "python:3.11-slim",
         timeout_sec: int = 30,
+        use_pool: bool = True,
     ):
         self.use_docker = use_docker
         self.default_image = default_image
         self.timeout_sec = timeout_sec
+        self.use_pool = use_pool
+    
+    def _pool_config(self):
+        from openclaw.agents.sandbox import DockerSandboxConfig
+        
+        return DockerSandboxConfig(
+            image=self.default_image,
+            memory="256m",
+            cpus="1",
+            network_mode="none",
+            workspace_access="none",
+        )
     
     async def execute_code(
         self,
@@ -53,6 +77,7 @@ class SandboxManager:
         language: str = "python",
         files: dict[str, bytes] | None = None,
         timeout_sec: int | None = None,
+        session_key: str | None = None,
     ) -> SandboxResult:
         """
         Execute code in sandbox.
@@ -62,6 +87,8 @@ class SandboxManager:
             language: Programming language (python, javascript, bash)
             files: Input files {filename: content}
             timeout_sec: Execution timeout (overrides default)
+            session_key: Keep files between calls of the same session
+                (pooled execution only)
         
         Returns:
             SandboxResult with output and files
@@ -69,10 +96,82 @@ class SandboxManager:
         timeout = timeout_sec or self.timeout_sec
         
         if self.use_docker:
+            if self.use_pool:
+                from openclaw.agents.sandbox.engine import get_docker_engine
+                
+                if get_docker_engine() is not None:
+                    return await self._execute_pooled(
+                        code, language, files, timeout, session_key
+                    )
             return await self._execute_docker(code, language, files, timeout)
         else:
             return await self._execute_local(code, language, files, timeout)
     
+    async def release_session(self, session_key: str) -> None:
+        """
+        Return the pooled containers leased to a session.
+        
+        Call when the session ends so its container (and the files kept
+        between calls) goes back to the pool.
+        
+        Args:
+            session_key: Session passed to ``execute_code``
+        """
+        if not (self.use_docker and self.use_pool):
+            return
+        from openclaw.agents.sandbox.engine import get_docker_engine
+        from openclaw.agents.sandbox.pool import get_sandbox_pool
+        
+        if get_docker_engine() is not None:
+            await get_sandbox_pool().release_session(session_key)
+    
+    async def _execute_pooled(
+        self,
+        code: str,
+        language: str,
+        files: dict[str, bytes] | None,
+        timeout_sec: int,
+        session_key: str | None,
+    ) -> SandboxResult:
+        """Execute in a warm pooled container via the Docker Engine API"""
+        from openclaw.agents.sandbox.pool import get_sandbox_pool
+        
+        if language not in _SCRIPTS:
+            raise ValueError(f"Unsupported language: {language}")
+        code_file, interpreter = _SCRIPTS[language]
+        
+        pool = get_sandbox_pool()
+        container = await pool.acquire(self._pool_config(), session_key=session_key)
+        violated = False
+        try:
+            inputs = dict(files or {})
+            inputs[code_file] = code.encode("utf-8")
+            await pool.engine.put_files(container.container_id, pool.workdir, inputs)
+            
+            result = await pool.exec(container, [interpreter, code_file], timeout=timeout_sec)
+            if result["timed_out"]:
+                return SandboxResult(
+                    stdout="",
+                    stderr=f"Execution timed out after {timeout_sec}s",
+                    exit_code=-1,
+                    files={},
+                )
+            
+            output_files = await pool.engine.get_files(container.container_id, pool.workdir)
+            output_files.pop(code_file, None)
+            return SandboxResult(
+                stdout=result["stdout"],
+                stderr=result["stderr"],
+                exit_code=result["exit_code"],
+                files=output_files,
+            )
+        except BaseException:
+            violated = True
+            raise
+        finally:
+            if violated or not session_key:
+                await pool.release(container, violated=violated)
+    
     async def _execute_docker(
         self,
         code: str,
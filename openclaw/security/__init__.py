@@ -1,16 +1,20 @@
 """Security and permission management."""
 from .tool_policy import (
     TOOL_PROFILES,
+    CompiledToolPolicy,
     SandboxMode,
     ToolPolicy,
     ToolPolicyResolver,
     get_profile_policy,
+    invalidate_tool_policy_cache,
 )
 
 __all__ = [
+    'CompiledToolPolicy',
     'SandboxMode',
     'ToolPolicy',
     'ToolPolicyResolver',
     'TOOL_PROFILES',
     'get_profile_policy',
+    'invalidate_tool_policy_cache',
 ]
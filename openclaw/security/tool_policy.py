@@ -8,10 +8,13 @@ Matches TypeScript src/agents/tool-policy.ts:
   - OWNER_ONLY_TOOL_NAMES
   - normalize / expand / resolve helpers
   - Owner-only tool guard
+  - Compiled per-agent decision tables (``CompiledToolPolicy``)
 """
 from __future__ import annotations
 
 import logging
+import time
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -244,7 +247,8 @@ class ToolPolicy:
     """
     Represents a tool allow/deny policy.
 
-    Deny list takes precedence over allow list.
+    Deny list takes precedence over allow list. Both lists are normalized and
+    group-expanded once, at construction.
     """
 
     def __init__(
@@ -254,36 +258,128 @@ class ToolPolicy:
     ):
         self.allow = allow or []
         self.deny = deny or []
+        self.allow_set: frozenset[str] | None = (
+            None if not self.allow or "*" in self.allow
+            else frozenset(expand_tool_groups(self.allow))
+        )
+        self.deny_set: frozenset[str] = frozenset(expand_tool_groups(self.deny))
 
     def is_allowed(self, tool_name: str) -> bool:
         """Check if a tool is allowed by this policy."""
         normalized = normalize_tool_name(tool_name)
 
         # Deny list takes precedence
-        if normalized in self.deny:
+        if normalized in self.deny_set:
             return False
 
         # If allow list exists, tool must be in it (with group expansion)
-        if self.allow:
-            expanded_allow = expand_tool_groups(self.allow)
-            return normalized in expanded_allow or "*" in self.allow
-
-        # No restrictions
-        return True
+        return self.allow_set is None or normalized in self.allow_set
 
     def __repr__(self) -> str:
         return f"ToolPolicy(allow={self.allow}, deny={self.deny})"
 
 
+# ──────────────────────────────────────────────────────────────────────
+# Compiled decision tables
+# ──────────────────────────────────────────────────────────────────────
+
+# Bumped on config reload; resolvers drop their compiled tables when it moves
+_policy_generation = 0
+
+
+def invalidate_tool_policy_cache() -> None:
+    """Invalidate compiled tool policies in every resolver (config reload)."""
+    global _policy_generation
+    _policy_generation += 1
+
+
+@dataclass(frozen=True)
+class CompiledToolPolicy:
+    """
+    Immutable decision table for one (agent, profile, sandbox) combination.
+
+    The policy chain collapses to a single deny set and the intersection of
+    all allow lists, so a decision is a name normalization plus two set
+    lookups regardless of list sizes.
+    """
+
+    allowed: frozenset[str] | None  # None: no allow list restricts
+    denied: frozenset[str]
+
+    @classmethod
+    def from_policies(cls, policies: list[ToolPolicy]) -> CompiledToolPolicy:
+        allowed: frozenset[str] | None = None
+        denied: frozenset[str] = frozenset()
+        for policy in policies:
+            denied |= policy.deny_set
+            if policy.allow_set is not None:
+                allowed = policy.allow_set if allowed is None else allowed & policy.allow_set
+        return cls(allowed=allowed, denied=denied)
+
+    def is_allowed(self, tool_name: str) -> bool:
+        normalized = normalize_tool_name(tool_name)
+        if normalized in self.denied:
+            return False
+        return self.allowed is None or normalized in self.allowed
+
+
 # ──────────────────────────────────────────────────────────────────────
 # ToolPolicyResolver: config-driven evaluation
 # ──────────────────────────────────────────────────────────────────────
 
 class ToolPolicyResolver:
-    """Resolves and enforces tool policies from config."""
+    """
+    Resolves and enforces tool policies from config.
+
+    Policies are compiled once per (agent, sandbox applied) and config
+    version into a ``CompiledToolPolicy``. The agent's profile is part of
+    its config, so it is covered by the same key. Call ``update_config``
+    (or ``invalidate_tool_policy_cache`` on reload) when the config changes.
+    """
 
     def __init__(self, config: dict):
         self.config = config
+        self.config_version = 0
+        self._compiled: dict[tuple[str, bool], CompiledToolPolicy] = {}
+        self._sandbox_mode: SandboxMode | None = None
+        self._generation = _policy_generation
+        self._decisions = 0
+        self._decision_time = 0.0
+        self._max_decision_time = 0.0
+        self._compiles = 0
+        self._compile_time = 0.0
+
+    def update_config(self, config: dict) -> None:
+        """Replace the config and drop compiled tables."""
+        self.config = config
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop compiled tables (next decision recompiles)."""
+        self.config_version += 1
+        self._compiled.clear()
+        self._sandbox_mode = None
+
+    def compile(self, agent_id: str, is_main_session: bool = True) -> CompiledToolPolicy:
+        """Get (compiling if needed) the decision table for an agent."""
+        if self._generation != _policy_generation:
+            self._generation = _policy_generation
+            self.invalidate()
+
+        if self._sandbox_mode is None:
+            self._sandbox_mode = self._get_sandbox_mode()
+        # Main and non-main sessions share a table unless the sandbox splits them
+        key = (agent_id, self._should_apply_sandbox(self._sandbox_mode, is_main_session))
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            started = time.perf_counter()
+            compiled = CompiledToolPolicy.from_policies(
+                self._get_policies(agent_id, is_main_session)
+            )
+            self._compiled[key] = compiled
+            self._compiles += 1
+            self._compile_time += time.perf_counter() - started
+        return compiled
 
     def is_tool_allowed(
         self,
@@ -298,14 +394,35 @@ class ToolPolicyResolver:
         Returns:
             (allowed, reason_if_denied)
         """
-        policies = self._get_policies(agent_id, is_main_session)
+        started = time.perf_counter()
+        allowed = self.compile(agent_id, is_main_session).is_allowed(tool_name)
 
-        for policy in policies:
-            if not policy.is_allowed(tool_name):
-                return False, f"Tool '{tool_name}' denied by policy"
+        elapsed = time.perf_counter() - started
+        self._decisions += 1
+        self._decision_time += elapsed
+        if elapsed > self._max_decision_time:
+            self._max_decision_time = elapsed
 
+        if not allowed:
+            return False, f"Tool '{tool_name}' denied by policy"
         return True, None
 
+    def get_stats(self) -> dict[str, Any]:
+        """Decision and compile timings (microseconds)."""
+        return {
+            "config_version": self.config_version,
+            "compiled_tables": len(self._compiled),
+            "decisions": self._decisions,
+            "avg_decision_us": (
+                self._decision_time / self._decisions * 1e6 if self._decisions else 0.0
+            ),
+            "max_decision_us": self._max_decision_time * 1e6,
+            "compiles": self._compiles,
+            "avg_compile_us": (
+                self._compile_time / self._compiles * 1e6 if self._compiles else 0.0
+            ),
+        }
+
     def _get_policies(
         self,
         agent_id: str,
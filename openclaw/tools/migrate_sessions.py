@@ -1,7 +1,8 @@
 """
 Session storage migration tool
 
-Migrate from old per-session JSON files to centralized sessions.json format.
+Migrate from old per-session JSON files to centralized sessions.json format,
+and from the JSON session files to a SQLite sessions.db.
 """
 
 import json
@@ -13,7 +14,9 @@ from typing import Dict, List, Optional
 import uuid
 
 from openclaw.agents.session_entry import SessionEntry
-from openclaw.config.sessions.store import save_session_store
+from openclaw.config.sessions.paths import DB_FILENAME, STORE_FILENAME
+from openclaw.config.sessions.sqlite_store import SqliteSessionStore
+from openclaw.config.sessions.store import read_session_store_file, save_session_store
 from openclaw.config.sessions.transcripts import write_transcript_line
 
 logger = logging.getLogger(__name__)
@@ -152,6 +155,123 @@ def migrate_to_centralized_store(
     return stats
 
 
+# JSON files imported into sessions.db: override files -> override kind
+SQLITE_OVERRIDE_FILES = {
+    "session_overrides.json": "model",
+    "session_levels.json": "level",
+}
+
+
+def migrate_to_sqlite_store(
+    sessions_dir: Path,
+    db_path: Optional[Path] = None,
+    backup: bool = True,
+    dry_run: bool = False
+) -> Dict[str, any]:
+    """
+    Import the JSON session files of a directory into a SQLite sessions.db
+    
+    Reads sessions.json (session entries), session_map.json (session key
+    -> session ID, for keys sessions.json does not have) and the model and
+    level override files. Once sessions.db exists it takes over from these
+    files.
+    
+    Args:
+        sessions_dir: Directory holding the JSON files
+        db_path: Database to write (default: sessions_dir/sessions.db)
+        backup: Whether to copy the JSON files to a backup directory
+        dry_run: If True, only analyze without making changes
+        
+    Returns:
+        Dict with migration statistics
+    """
+    db_path = db_path or sessions_dir / DB_FILENAME
+    stats = {
+        "status": "success",
+        "db_path": str(db_path),
+        "sessions": 0,
+        "mapped_keys": 0,
+        "overrides": 0,
+        "errors": 0,
+        "error_details": [],
+    }
+    
+    def read_json(path: Path) -> dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            return data
+        except Exception as e:
+            logger.error(f"Failed to read {path}: {e}")
+            stats["errors"] += 1
+            stats["error_details"].append({"file": str(path), "error": str(e)})
+            return {}
+    
+    sources = [
+        sessions_dir / name
+        for name in (STORE_FILENAME, "session_map.json", *SQLITE_OVERRIDE_FILES)
+        if (sessions_dir / name).exists()
+    ]
+    if not sources:
+        logger.warning(f"No JSON session files found in {sessions_dir}")
+        stats["status"] = "not_found"
+        return stats
+    
+    # Session entries
+    entries: Dict[str, SessionEntry] = {}
+    store_file = sessions_dir / STORE_FILENAME
+    if store_file.exists():
+        entries.update(read_session_store_file(store_file))
+    
+    # Keys only known to SessionManager's session map
+    map_file = sessions_dir / "session_map.json"
+    if map_file.exists():
+        now_ms = int(time.time() * 1000)
+        for key, session_id in read_json(map_file).items():
+            if key not in entries and isinstance(session_id, str):
+                entries[key] = SessionEntry(session_id=session_id, updated_at=now_ms)
+                stats["mapped_keys"] += 1
+    
+    overrides = []
+    for name, kind in SQLITE_OVERRIDE_FILES.items():
+        path = sessions_dir / name
+        if path.exists():
+            overrides.extend(
+                (key, kind, data) for key, data in read_json(path).items() if isinstance(data, dict)
+            )
+    
+    stats["sessions"] = len(entries)
+    stats["overrides"] = len(overrides)
+    logger.info(
+        f"Found {len(entries)} sessions and {len(overrides)} overrides in {sessions_dir}"
+    )
+    
+    if dry_run:
+        logger.info("DRY RUN MODE - no changes will be made")
+        return stats
+    
+    store = SqliteSessionStore(db_path)
+    try:
+        store.upsert_many(entries)
+        for key, kind, data in overrides:
+            store.set_override(key, kind, data)
+    finally:
+        store.close()
+    logger.info(f"Wrote {db_path}")
+    
+    if backup:
+        backup_dir = sessions_dir / "backup_json_format"
+        backup_dir.mkdir(exist_ok=True)
+        for path in sources:
+            shutil.copy2(path, backup_dir / path.name)
+        logger.info(f"Backed up {len(sources)} files to {backup_dir}")
+        stats["backup_dir"] = str(backup_dir)
+    
+    return stats
+
+
 def _parse_timestamp_to_ms(timestamp_str: Optional[str]) -> int:
     """Parse ISO timestamp string to milliseconds since epoch"""
     if not timestamp_str:
@@ -207,7 +327,12 @@ def main():
     parser.add_argument(
         "workspace_dir",
         type=Path,
-        help="Workspace directory containing .sessions/"
+        help="Workspace directory containing .sessions/ (with --sqlite: any directory of JSON session files)"
+    )
+    parser.add_argument(
+        "--sqlite",
+        action="store_true",
+        help="Import sessions.json, session_map.json and override files into a SQLite sessions.db"
     )
     parser.add_argument(
         "--agent-id",
@@ -239,6 +364,9 @@ def main():
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     
+    if args.sqlite:
+        return _main_sqlite(args)
+    
     # Run migration
     logger.info(f"Starting migration for workspace: {args.workspace_dir}")
     
@@ -276,5 +404,40 @@ def main():
     return 0 if stats["errors"] == 0 else 1
 
 
+def _main_sqlite(args) -> int:
+    """Run the SQLite migration from the CLI"""
+    sessions_dir = args.workspace_dir
+    if (sessions_dir / ".sessions").is_dir():
+        sessions_dir = sessions_dir / ".sessions"
+    
+    stats = migrate_to_sqlite_store(
+        sessions_dir=sessions_dir,
+        backup=not args.no_backup,
+        dry_run=args.dry_run
+    )
+    
+    print("\n" + "="*60)
+    print("SQLite Migration Results")
+    print("="*60)
+    print(f"Status: {stats['status']}")
+    print(f"Database: {stats['db_path']}")
+    print(f"Sessions: {stats['sessions']} ({stats['mapped_keys']} from session_map.json)")
+    print(f"Overrides: {stats['overrides']}")
+    print(f"Errors: {stats['errors']}")
+    
+    if stats.get("backup_dir"):
+        print(f"Backup location: {stats['backup_dir']}")
+    
+    for error in stats["error_details"]:
+        print(f"  {error['file']}: {error['error']}")
+    
+    print("="*60)
+    
+    if args.dry_run:
+        print("\nDRY RUN - No changes were made")
+    
+    return 0 if stats["errors"] == 0 else 1
+
+
 if __name__ == "__main__":
     exit(main())
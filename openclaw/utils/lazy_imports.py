@@ -0,0 +1,47 @@
+"""Lazy package exports (PEP 562)
+
+Lets a package ``__init__`` advertise its public names without importing
+the modules behind them, so ``import openclaw`` (and the CLI) doesn't pay
+for provider SDKs, the gateway or pydantic settings until they are used.
+
+Example:
+    # openclaw/agents/__init__.py
+    _EXPORTS = {"AgentRuntime": ".runtime", "Session": ".session"}
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for lazy exports
+
+    Args:
+        package: The package's ``__name__``
+        exports: Public name -> module defining it (relative to package)
+
+    Returns:
+        (``__getattr__``, ``__dir__``) to assign in the package namespace
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,61 @@
+"""
+Tests for smart image loading
+"""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from openclaw.agents import image_loader
+from openclaw.agents.image_loader import (
+    HistoryImageIndex,
+    detect_image_references,
+    detect_images_from_history,
+    smart_load_images,
+)
+from openclaw.agents.session import Message
+
+
+def test_detects_media_attached_paths():
+    refs = detect_image_references("[media attached: /tmp/My Chart.png (image/png) | https://x/y]")
+    assert [r.resolved for r in refs] == ["/tmp/My Chart.png"]
+
+
+def test_history_index_scans_only_new_messages():
+    """Each message is scanned once; results match a full scan"""
+    messages = [
+        Message(role="user", content="look at /tmp/a.png"),
+        Message(role="assistant", content="ok /tmp/ignored.png"),
+    ]
+    index = HistoryImageIndex()
+
+    with patch.object(image_loader, "detect_image_references", wraps=detect_image_references) as scan:
+        assert [r.resolved for r in index.update(messages)] == ["/tmp/a.png"]
+        messages.append(Message(role="user", content="and ./b.jpg, /tmp/a.png"))
+        refs = index.update(messages)
+        assert scan.call_count == 2
+
+    assert [(r.resolved, r.message_index) for r in refs] == [("/tmp/a.png", 0), ("./b.jpg", 2)]
+    dicts = [{"role": m.role, "content": m.content} for m in messages]
+    assert [r.resolved for r in detect_images_from_history(dicts)] == ["/tmp/a.png", "./b.jpg"]
+
+
+def test_history_index_rescans_rewritten_history():
+    """Compacted (replaced) history is scanned from the start"""
+    index = HistoryImageIndex()
+    index.update([Message(role="user", content="/tmp/a.png"), Message(role="user", content="hi")])
+
+    compacted = [Message(role="user", content="summary mentions /tmp/c.png")]
+    assert [(r.resolved, r.message_index) for r in index.update(compacted)] == [("/tmp/c.png", 0)]
+
+
+def test_smart_load_images_with_index(tmp_path):
+    image = tmp_path / "shot.png"
+    image.write_bytes(b"png")
+    history = [Message(role="user", content=f"earlier {image}")]
+
+    result = smart_load_images(
+        current_prompt="what is this?",
+        history_messages=history,
+        history_index=HistoryImageIndex(),
+    )
+    assert result["history_images_by_index"] == {0: [str(image)]}
@@ -0,0 +1,268 @@
+"""
+Tests for the Docker Engine client helpers and warm sandbox pool
+"""
+
+import asyncio
+import struct
+
+from openclaw.agents.sandbox import DockerSandboxConfig, SandboxPool
+from openclaw.agents.sandbox.engine import (
+    build_create_body,
+    demux_stream,
+    make_tar,
+    parse_memory_limit,
+    read_tar,
+)
+
+
+class FakeEngine:
+    """In-memory stand-in for DockerEngineClient"""
+
+    def __init__(self):
+        self.created = []
+        self.removed = []
+        self.commands = []
+        self.reset_ok = True
+        self.timeout_next = False
+        self.images = {"python:3.11-slim"}
+        self.pulled = []
+
+    async def image_exists(self, image):
+        return image in self.images
+
+    async def pull_image(self, image):
+        self.pulled.append(image)
+        self.images.add(image)
+
+    async def create_container(self, body, name=None):
+        container_id = f"c{len(self.created)}"
+        self.created.append((container_id, body))
+        return container_id
+
+    async def start_container(self, container_id):
+        pass
+
+    async def remove_container(self, container_id):
+        self.removed.append(container_id)
+
+    async def exec(self, container_id, cmd, workdir=None, env=None, timeout=None):
+        self.commands.append((container_id, cmd))
+        if cmd[0] == "find":
+            return {"success": self.reset_ok, "exit_code": 0 if self.reset_ok else 1}
+        timed_out = self.timeout_next
+        self.timeout_next = False
+        return {
+            "stdout": "ok",
+            "stderr": "",
+            "exit_code": -1 if timed_out else 0,
+            "success": not timed_out,
+            "timed_out": timed_out,
+        }
+
+    async def put_files(self, container_id, path, files):
+        self.files = dict(files)
+
+    async def get_files(self, container_id, path):
+        return {**self.files, "out.txt": b"result"}
+
+
+def _config(**kwargs):
+    return DockerSandboxConfig(image="python:3.11-slim", network_mode="none", **kwargs)
+
+
+class TestEngineHelpers:
+    """Test request/response helpers"""
+
+    def test_demux_stream(self):
+        def frame(stream, data):
+            return struct.pack(">BxxxI", stream, len(data)) + data
+
+        data = frame(1, b"out1 ") + frame(2, b"err") + frame(1, b"out2")
+        assert demux_stream(data) == (b"out1 out2", b"err")
+
+    def test_parse_memory_limit(self):
+        assert parse_memory_limit("256m") == 256 * 1024**2
+        assert parse_memory_limit("1g") == 1024**3
+        assert parse_memory_limit(None) is None
+
+    def test_build_create_body_maps_limits(self, tmp_path):
+        config = _config(
+            memory="256m",
+            cpus="0.5",
+            ulimits={"nofile": {"soft": 64, "hard": 128}},
+            env={"A": "1"},
+        )
+        body = build_create_body(config, workspace_dir=tmp_path)
+
+        host = body["HostConfig"]
+        assert host["Memory"] == 256 * 1024**2
+        assert host["NanoCpus"] == 500_000_000
+        assert host["NetworkMode"] == "none"
+        assert host["Ulimits"] == [{"Name": "nofile", "Soft": 64, "Hard": 128}]
+        assert host["Binds"] == [f"{tmp_path}:/workspace:rw"]
+        assert body["Env"] == ["A=1"]
+
+    def test_tar_roundtrip_strips_root(self):
+        archive = make_tar({"workspace/a.txt": b"A", "workspace/sub/b.txt": b"B"})
+        assert read_tar(archive) == {"a.txt": b"A", "sub/b.txt": b"B"}
+
+
+class TestSandboxPool:
+    """Test warm pool behavior"""
+
+    async def test_warm_then_acquire_hits_idle(self):
+        engine = FakeEngine()
+        pool = SandboxPool(engine=engine, warm_size=2)
+
+        await pool.warm(_config())
+        assert len(engine.created) == 2
+
+        container = await pool.acquire(_config())
+        assert container.container_id == "c0"
+        assert pool.get_stats()["hits"] == 1
+        await pool.close()
+
+    async def test_profiles_are_separate(self):
+        engine = FakeEngine()
+        pool = SandboxPool(engine=engine, warm_size=1)
+        await pool.warm(_config(memory="256m"))
+
+        container = await pool.acquire(_config(memory="512m"))
+        assert pool.get_stats()["misses"] == 1
+        assert engine.created[-1][0] == container.container_id
+        await pool.close()
+
+    async def test_missing_image_is_pulled_once(self):
+        engine = FakeEngine()
+        pool = SandboxPool(engine=engine, warm_size=2)
+
+        await pool.warm(DockerSandboxConfig(image="node:20-slim"))
+        await pool.warm(_config())
+
+        assert engine.pulled == ["node:20-slim"]
+        assert len(engine.created) == 4
+        await pool.close()
+
+    async def test_release_resets_and_reuses(self):
+        engine = FakeEngine()
+        pool = SandboxPool(engine=engine, warm_size=1)
+
+        container = await pool.acquire(_config())
+        await pool.release(container)
+
+        assert engine.commands[-1][1][0] == "find"
+        assert engine.removed == []
+        again = await pool.acquire(_config())
+        assert again is container
+        await pool.close()
+
+    async def test_session_lease_is_sticky(self):
+        pool = SandboxPool(engine=FakeEngine(), warm_size=0)
+
+        first = await pool.acquire(_config(), session_key="s1")
+        assert await pool.acquire(_config(), session_key="s1") is first
+        assert await pool.acquire(_config(), session_key="s2") is not first
+
+        await pool.release_session("s1")
+        assert pool.get_stats()["leased"] == 1
+        await pool.close()
+
+    async def test_idle_session_lease_is_returned(self):
+        engine = FakeEngine()
+        pool = SandboxPool(engine=engine, warm_size=1, lease_idle_timeout=60)
+        stale = await pool.acquire(_config(), session_key="s1")
+        await pool.exec(stale, ["true"])
+        stale.last_used -= 120
+
+        await pool.acquire(_config(), session_key="s2")
+        await asyncio.gather(*pool._tasks)
+
+        assert pool.get_stats()["leased"] == 1
+        assert stale.session_key is None
+        assert engine.commands[-1] == (stale.container_id, ["find", pool.workdir, "-mindepth", "1", "-delete"])
+        assert await pool.acquire(_config(), session_key="s1") is not stale
+        await pool.close()
+
+    async def test_active_session_lease_is_kept(self):
+        pool = SandboxPool(engine=FakeEngine(), warm_size=0, lease_idle_timeout=60)
+        first = await pool.acquire(_config(), session_key="s1")
+
+        await pool.acquire(_config(), session_key="s2")
+        assert await pool.acquire(_config(), session_key="s1") is first
+        await pool.close()
+
+    async def test_recycle_after_max_executions(self):
+        engine = FakeEngine()
+        pool = SandboxPool(engine=engine, warm_size=0, max_executions=2)
+        container = await pool.acquire(_config())
+
+        await pool.exec(container, ["true"])
+        await pool.exec(container, ["true"])
+        await pool.release(container)
+
+        assert engine.removed == [container.container_id]
+        assert pool.get_stats()["recycled"] == 1
+
+    async def test_timeout_is_a_violation(self):
+        engine = FakeEngine()
+        pool = SandboxPool(engine=engine, warm_size=0)
+        container = await pool.acquire(_config(), session_key="s1")
+
+        engine.timeout_next = True
+        result = await pool.exec(container, ["sleep", "100"], timeout=1)
+        assert result["timed_out"]
+
+        replacement = await pool.acquire(_config(), session_key="s1")
+        assert replacement is not container
+        await pool.close()
+        assert container.container_id in engine.removed
+
+    async def test_failed_reset_recycles(self):
+        engine = FakeEngine()
+        engine.reset_ok = False
+        pool = SandboxPool(engine=engine, warm_size=0)
+
+        container = await pool.acquire(_config())
+        await pool.release(container)
+
+        assert engine.removed == [container.container_id]
+
+
+class TestSandboxManagerPooled:
+    """Test SandboxManager routing through the pool"""
+
+    async def test_execute_code_uses_pool(self, monkeypatch):
+        from openclaw.agents.sandbox import engine as engine_module
+        from openclaw.agents.sandbox import pool as pool_module
+        from openclaw.sandbox.sandbox_manager import SandboxManager
+
+        engine = FakeEngine()
+        pool = SandboxPool(engine=engine, warm_size=0)
+        monkeypatch.setattr(engine_module, "get_docker_engine", lambda: engine)
+        monkeypatch.setattr(pool_module, "get_sandbox_pool", lambda: pool)
+
+        result = await SandboxManager().execute_code("print('ok')", files={"in.txt": b"x"})
+
+        assert result.success
+        assert result.stdout == "ok"
+        assert result.files == {"in.txt": b"x", "out.txt": b"result"}
+        assert engine.files["script.py"] == b"print('ok')"
+        assert ("c0", ["python", "script.py"]) in engine.commands
+        assert pool.get_stats()["leased"] == 0
+
+    async def test_release_session_returns_lease(self, monkeypatch):
+        from openclaw.agents.sandbox import engine as engine_module
+        from openclaw.agents.sandbox import pool as pool_module
+        from openclaw.sandbox.sandbox_manager import SandboxManager
+
+        engine = FakeEngine()
+        pool = SandboxPool(engine=engine, warm_size=0)
+        monkeypatch.setattr(engine_module, "get_docker_engine", lambda: engine)
+        monkeypatch.setattr(pool_module, "get_sandbox_pool", lambda: pool)
+        manager = SandboxManager()
+
+        await manager.execute_code("print('ok')", session_key="s1")
+        assert pool.get_stats()["leased"] == 1
+
+        await manager.release_session("s1")
+        assert pool.get_stats()["leased"] == 0
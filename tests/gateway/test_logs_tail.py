@@ -0,0 +1,169 @@
+"""
+Tests for offset-based log tailing and following
+"""
+
+import os
+
+import pytest
+
+from openclaw.gateway import logs_tail
+from openclaw.gateway.logs_tail import (
+    LogFilter,
+    LogFollower,
+    parse_log_line,
+    read_log_from,
+    tail_log_file,
+)
+from openclaw.logging.levels import LogLevel
+
+
+def _line(i: int, level: str = "INFO", name: str = "openclaw.gateway.server") -> str:
+    return f"2026-01-01 00:00:00,000 - {name} - {level} - message {i}"
+
+
+def _write(path, lines):
+    path.write_text("".join(line + "\n" for line in lines))
+
+
+def test_tail_returns_last_lines(tmp_path):
+    log = tmp_path / "gateway.log"
+    _write(log, [_line(i) for i in range(1000)])
+
+    result = tail_log_file(log, limit=5)
+
+    assert result.lines == [_line(i) for i in range(995, 1000)]
+    assert result.cursor == log.stat().st_size
+    assert result.truncated is True
+
+    everything = tail_log_file(log, limit=5000, max_bytes=10_000_000)
+    assert len(everything.lines) == 1000
+    assert everything.truncated is False
+
+
+def test_tail_spans_multiple_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(logs_tail, "BLOCK_SIZE", 64)
+    log = tmp_path / "gateway.log"
+    lines = [_line(i) for i in range(50)]
+    _write(log, lines)
+
+    result = tail_log_file(log, limit=20)
+
+    assert result.lines == lines[-20:]
+
+
+def test_tail_respects_max_bytes(tmp_path):
+    log = tmp_path / "gateway.log"
+    _write(log, [_line(i) for i in range(1000)])
+
+    result = tail_log_file(log, limit=1000, max_bytes=500)
+
+    assert 0 < len(result.lines) < 20
+    assert result.lines[-1] == _line(999)
+    assert result.truncated is True
+
+
+def test_tail_leaves_partial_line_behind_cursor(tmp_path):
+    log = tmp_path / "gateway.log"
+    log.write_text(_line(1) + "\n" + "partial")
+
+    result = tail_log_file(log, limit=10)
+
+    assert result.lines == [_line(1)]
+    assert result.cursor == len(_line(1)) + 1
+
+
+def test_tail_missing_file(tmp_path):
+    result = tail_log_file(tmp_path / "missing.log")
+    assert result.lines == []
+    assert result.cursor == 0
+
+
+def test_tail_filters_level_and_subsystem(tmp_path):
+    log = tmp_path / "gateway.log"
+    _write(log, [
+        _line(1, "DEBUG"),
+        _line(2, "WARNING"),
+        _line(3, "ERROR", "openclaw.channels.telegram"),
+        _line(4, "INFO", "openclaw.gateway.auth"),
+    ])
+
+    warn = tail_log_file(log, log_filter=LogFilter(min_level=LogLevel.WARN))
+    assert warn.lines == [_line(2, "WARNING"), _line(3, "ERROR", "openclaw.channels.telegram")]
+
+    gateway = tail_log_file(log, log_filter=LogFilter.from_params({"subsystem": "gateway"}))
+    assert len(gateway.lines) == 3
+    assert all("channels" not in line for line in gateway.lines)
+
+
+def test_parse_json_line():
+    level, subsystem = parse_log_line('{"level": "warn", "subsystem": "gateway/auth", "msg": "x"}')
+    assert level == LogLevel.WARN
+    assert subsystem == "gateway/auth"
+
+
+def test_read_from_cursor(tmp_path):
+    log = tmp_path / "gateway.log"
+    _write(log, [_line(1)])
+    cursor = tail_log_file(log).cursor
+
+    with open(log, "a") as f:
+        f.write(_line(2) + "\n" + "incomplete")
+
+    result = read_log_from(log, cursor)
+    assert result.lines == [_line(2)]
+    assert result.reset is False
+
+    # Nothing new until the partial line is finished
+    again = read_log_from(log, result.cursor)
+    assert again.lines == []
+
+
+def test_read_detects_rotation(tmp_path):
+    log = tmp_path / "gateway.log"
+    _write(log, [_line(i) for i in range(10)])
+    first = tail_log_file(log)
+
+    os.rename(log, tmp_path / "gateway.log.1")
+    _write(log, [_line(100)])
+
+    result = read_log_from(log, first.cursor, inode=first.inode)
+    assert result.reset is True
+    assert result.lines == [_line(100)]
+
+
+def test_read_detects_truncation(tmp_path):
+    log = tmp_path / "gateway.log"
+    _write(log, [_line(i) for i in range(10)])
+    cursor = tail_log_file(log).cursor
+
+    _write(log, [_line(42)])
+    result = read_log_from(log, cursor)
+    assert result.reset is True
+    assert result.lines == [_line(42)]
+
+
+@pytest.mark.asyncio
+async def test_follower_pushes_new_lines(tmp_path):
+    log = tmp_path / "gateway.log"
+    _write(log, [_line(1)])
+    events = []
+
+    async def send_event(event, payload):
+        events.append((event, payload))
+
+    start = tail_log_file(log)
+    follower = LogFollower(send_event, log, cursor=start.cursor, inode=start.inode)
+
+    await follower.poll_once()
+    assert events == []
+
+    with open(log, "a") as f:
+        f.write(_line(2, "ERROR") + "\n")
+    await follower.poll_once()
+
+    assert len(events) == 1
+    event, payload = events[0]
+    assert event == "logs.lines"
+    assert payload["lines"] == [_line(2, "ERROR")]
+    assert payload["subscriptionId"] == follower.subscription_id
+    assert follower.cursor == log.stat().st_size
@@ -0,0 +1,135 @@
+"""
+Tests for the session preview index and paged session listing
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from openclaw.agents.session_entry import SessionEntry
+from openclaw.config.sessions import (
+    append_transcript_message,
+    compact_transcript,
+    delete_transcript,
+    get_session_preview_index,
+    load_session_store,
+    read_first_user_message,
+    read_last_message_preview,
+    save_session_store,
+    sorted_session_keys,
+    update_session_store_entry,
+)
+from openclaw.config.sessions import preview_index as preview_index_module
+from openclaw.gateway.session_utils import SessionsListOptions, list_sessions_from_store
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return tmp_path / "sessions.json"
+
+
+def test_append_updates_index_without_rescan(store_path, monkeypatch):
+    """Appends through the transcript helpers keep the index current"""
+    append_transcript_message("s1", store_path, "user", "  first   question ")
+    append_transcript_message("s1", store_path, "assistant", [{"type": "text", "text": "an answer"}])
+
+    def fail_scan(path):
+        raise AssertionError("transcript was rescanned")
+
+    monkeypatch.setattr(preview_index_module, "scan_transcript", fail_scan)
+    assert read_first_user_message("s1", store_path) == "first question"
+    assert read_last_message_preview("s1", store_path) == "an answer"
+    assert get_session_preview_index(store_path).lookup("s1").message_count == 2
+
+
+def test_external_edit_triggers_rescan(store_path):
+    """A transcript changed outside the helpers is rescanned once"""
+    append_transcript_message("s1", store_path, "user", "hello")
+    transcript = store_path.parent / "s1.jsonl"
+    with open(transcript, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "message", "message": {"role": "assistant", "content": "edited"}}) + "\n")
+
+    assert read_last_message_preview("s1", store_path) == "edited"
+
+    # Later appends continue from the rescanned preview
+    append_transcript_message("s1", store_path, "user", "again")
+    assert read_last_message_preview("s1", store_path) == "again"
+    assert read_first_user_message("s1", store_path) == "hello"
+
+
+def test_index_persists_across_instances(store_path):
+    """The SQLite sidecar survives a new index instance"""
+    append_transcript_message("s1", store_path, "user", "persisted")
+    index = get_session_preview_index(store_path)
+    reopened = preview_index_module.SessionPreviewIndex(index.db_path)
+    try:
+        assert reopened._entries["s1"].first_user_message == "persisted"
+    finally:
+        reopened.close()
+
+
+def test_compact_and_delete_discard_preview(store_path):
+    """Compaction and deletion drop the indexed preview"""
+    for i in range(5):
+        append_transcript_message("s1", store_path, "user", f"message {i}")
+
+    result = compact_transcript("s1", store_path, keep_lines=2)
+    assert result["removed_lines"] == 3
+    assert os.path.exists(result["archived_path"])
+    assert read_first_user_message("s1", store_path) == "message 3"
+
+    assert delete_transcript("s1", store_path, archive_first=False)
+    assert read_first_user_message("s1", store_path) is None
+    assert "s1" not in get_session_preview_index(store_path)._entries
+
+
+def test_store_cache_and_atomic_save(store_path):
+    """Loads are cached per file snapshot; saves invalidate the cache"""
+    save_session_store(store_path, {"a": SessionEntry(session_id="a", updated_at=1)})
+    first = load_session_store(store_path)
+    assert load_session_store(store_path) is first
+
+    update_session_store_entry(store_path, "b", {"session_id": "b", "updated_at": 2})
+    second = load_session_store(store_path)
+    assert second is not first
+    assert sorted_session_keys(second) == ["b", "a"]
+    assert not [p for p in os.listdir(store_path.parent) if p.startswith(".sessions.json.")]
+
+
+def test_list_paging_and_active_minutes(store_path, monkeypatch):
+    """Offset and limit page the newest-first order"""
+    now_ms = 10_000_000_000_000
+    store = {
+        f"agent:main:s{i}": SessionEntry(session_id=f"s{i}", updated_at=now_ms - i * 60_000)
+        for i in range(10)
+    }
+    save_session_store(store_path, store)
+    store = load_session_store(store_path)
+
+    page = list_sessions_from_store(str(store_path), store, SessionsListOptions(offset=3, limit=4))
+    assert [row.session_id for row in page.sessions] == ["s3", "s4", "s5", "s6"]
+
+    monkeypatch.setattr(time, "time", lambda: now_ms / 1000)
+    recent = list_sessions_from_store(str(store_path), store, SessionsListOptions(active_minutes=2))
+    assert [row.session_id for row in recent.sessions] == ["s0", "s1", "s2"]
+
+
+def test_list_with_previews(store_path):
+    """Derived titles and last messages come from the index"""
+    save_session_store(store_path, {
+        "agent:main:s1": SessionEntry(session_id="s1", updated_at=2),
+        "agent:main:s2": SessionEntry(session_id="s2", updated_at=1),
+    })
+    append_transcript_message("s1", store_path, "user", "What is new?")
+    append_transcript_message("s1", store_path, "assistant", "Everything")
+
+    result = list_sessions_from_store(
+        str(store_path),
+        load_session_store(store_path),
+        SessionsListOptions(add_derived_titles=True, add_last_message_preview=True),
+    )
+    assert result.sessions[0].derived_title == "What is new?"
+    assert result.sessions[0].last_message_preview == "Everything"
+    assert result.sessions[1].last_message_preview is None
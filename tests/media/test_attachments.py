@@ -0,0 +1,166 @@
+"""
+Tests for the content-addressed attachment store
+
+Downloads go through an httpx mock transport that counts requests.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+
+import httpx
+import pytest
+
+from openclaw.media.attachments import AttachmentError, AttachmentStore
+
+IMAGE = b"\x89PNG\r\n\x1a\n" + b"x" * 4096
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    """Serve IMAGE for any URL and record requested URLs"""
+    seen: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=IMAGE, headers={"content-type": "image/png"})
+
+    real_client = httpx.AsyncClient
+
+    def client(*args, **kwargs):
+        return real_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", client)
+    return seen
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AttachmentStore(tmp_path / "attachments")
+    yield store
+    store.close()
+
+
+async def test_fetch_downloads_once(store, requests):
+    """Repeated and concurrent fetches of a URL share one download"""
+    results = await asyncio.gather(*(store.fetch("https://x.test/a.png") for _ in range(5)))
+    again = await store.fetch("https://x.test/a.png")
+
+    assert requests == ["https://x.test/a.png"]
+    assert {r.sha256 for r in results} == {again.sha256} == {hashlib.sha256(IMAGE).hexdigest()}
+    assert again.read_bytes() == IMAGE
+    assert again.mime_type == "image/png"
+    assert again.file_name == "a.png"
+
+
+async def test_identical_content_is_stored_once(store, requests, tmp_path):
+    """Different sources with the same bytes share one blob"""
+    fetched = await store.fetch("https://x.test/one")
+    local = tmp_path / "copy.png"
+    local.write_bytes(IMAGE)
+    copied = await store.put_file(local)
+    put = await store.put_bytes(IMAGE)
+
+    assert fetched.path == copied.path == put.path
+    assert store.get_stats()["blobs"] == 1
+    assert store.get_stats()["bytes"] == len(IMAGE)
+
+
+async def test_fetch_size_limit(store, requests):
+    """Content over max_bytes is refused and not stored"""
+    with pytest.raises(AttachmentError):
+        await store.fetch("https://x.test/big", max_bytes=100)
+    assert store.get_stats()["blobs"] == 0
+    assert not list((store.root / "tmp").iterdir())
+
+
+async def test_collect_keeps_referenced_blobs(tmp_path):
+    """Unreferenced blobs are collected least recently used first"""
+    store = AttachmentStore(tmp_path / "attachments", max_bytes=350)
+    held = await store.put_bytes(b"a" * 100, session_key="s1")
+    touched = await store.put_bytes(b"b" * 100)
+    idle = await store.put_bytes(b"c" * 100)
+    await asyncio.sleep(0.01)
+    store.get(touched.sha256)
+    newest = await store.put_bytes(b"d" * 100)  # over budget: collect one
+
+    assert store.get(idle.sha256) is None
+    assert all(store.get(a.sha256) for a in (held, touched, newest))
+    assert store.get_stats()["bytes"] == 300
+
+    # Referenced blobs survive even a full collection until released
+    store.collect(max_bytes=0)
+    assert store.get(held.sha256) is not None
+    assert store.ref_count(held.sha256) == 1
+    assert store.release_session("s1") == 1
+    store.collect(max_bytes=0)
+    assert store.get(held.sha256) is None
+    assert store.get_stats()["bytes"] == 0
+    store.close()
+
+
+async def test_platform_file_ids(store, requests):
+    """Inbound file ids attach to the content once fetched"""
+    url = "https://api.telegram.test/file/bot/photos/1.jpg"
+    store.note_source(url, "telegram", "tg-file-1")
+    attachment = await store.fetch(url)
+    assert store.get_platform_file_id(attachment.sha256, "telegram") == "tg-file-1"
+
+    store.forget_platform_file_id(attachment.sha256, "telegram")
+    assert store.get_platform_file_id(attachment.sha256, "telegram") is None
+
+    digest = await store.hash_file(attachment.path)
+    store.set_platform_file_id(digest, "telegram", "tg-file-2")
+    assert store.get_platform_file_id(attachment.sha256, "telegram") == "tg-file-2"
+
+
+async def test_index_survives_restart(tmp_path, requests):
+    """A new store instance serves earlier downloads from disk"""
+    first = AttachmentStore(tmp_path / "attachments")
+    await first.fetch("https://x.test/a.png")
+    first.close()
+
+    second = AttachmentStore(tmp_path / "attachments")
+    await second.fetch("https://x.test/a.png")
+    assert len(requests) == 1
+    assert second.get_stats()["bytes"] == len(IMAGE)
+    second.close()
+
+
+async def test_stale_web_urls_are_revalidated(tmp_path, monkeypatch):
+    """Expired URLs are re-checked; only changed content is downloaded again"""
+    content = {"body": b"v1"}
+    seen: list[str | None] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        etag = f'"{hashlib.sha256(content["body"]).hexdigest()[:8]}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(200, content=content["body"], headers={"etag": etag})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient",
+        lambda *a, **kw: real_client(*a, transport=httpx.MockTransport(handler), **kw),
+    )
+    store = AttachmentStore(tmp_path / "attachments", source_ttl=0)
+    url = "https://x.test/feed.json"
+
+    first = await store.fetch(url)
+    assert (await store.fetch(url)).sha256 == first.sha256
+    content["body"] = b"v2"
+    changed = await store.fetch(url)
+
+    assert changed.read_bytes() == b"v2"
+    assert seen[0] is None and seen[1] == seen[2] is not None
+    assert store.get_stats()["revalidated"] == 1
+
+    # Platform file URLs never change and are not asked again
+    platform_url = "https://api.telegram.test/file/bot/photos/2.jpg"
+    store.note_source(platform_url, "telegram", "tg-file-2")
+    await store.fetch(platform_url)
+    await store.fetch(platform_url)
+    assert len(seen) == 4
+    store.close()
@@ -0,0 +1,66 @@
+"""
+Tests for the prepared image cache
+"""
+from __future__ import annotations
+
+import base64
+import io
+import os
+
+import pytest
+
+from openclaw.media.image_cache import ImagePrepCache
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png(path, size=(100, 100), color="red"):
+    Image.new("RGB", size, color=color).save(path, format="PNG")
+    return path
+
+
+async def test_prepare_is_cached_until_file_changes(tmp_path):
+    """The same file version is loaded and encoded once"""
+    cache = ImagePrepCache()
+    path = _png(tmp_path / "a.png")
+
+    first = await cache.prepare(str(path))
+    second = await cache.prepare(str(path))
+    assert second is first
+    assert first.mime_type == "image/png"
+    assert base64.b64decode(first.base64) == path.read_bytes()
+    assert first.data_url.startswith("data:image/png;base64,")
+    assert cache.get_stats()["misses"] == 1
+
+    _png(path, color="blue")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third = await cache.prepare(str(path))
+    assert third is not first
+    assert third.data == path.read_bytes()
+
+
+async def test_large_images_are_resized(tmp_path):
+    """Images over max_side are downscaled and re-encoded"""
+    cache = ImagePrepCache(max_side=64)
+    path = _png(tmp_path / "big.png", size=(400, 200))
+
+    image = await cache.prepare(str(path))
+    assert (image.width, image.height) == (64, 32)
+    assert image.mime_type == "image/jpeg"
+    assert Image.open(io.BytesIO(image.data)).size == (64, 32)
+
+    # A different target size is a different entry
+    full = await cache.prepare(str(path), max_side=1024)
+    assert (full.width, full.height) == (400, 200)
+
+
+async def test_prepare_many_skips_failures_and_evicts(tmp_path):
+    """Missing files are left out; entries over the limit are evicted"""
+    cache = ImagePrepCache(max_entries=2)
+    paths = [str(_png(tmp_path / f"{i}.png")) for i in range(3)]
+
+    prepared = await cache.prepare_many(paths + [str(tmp_path / "missing.png")])
+    assert set(prepared) == set(paths)
+    assert cache.get_stats()["entries"] == 2
+    assert cache.get_stats()["evictions"] == 1
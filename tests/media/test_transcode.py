@@ -0,0 +1,154 @@
+"""
+Tests for the async ffmpeg transcode service
+
+Uses a stand-in ffmpeg script that echoes its input, so the process
+plumbing, caching and concurrency limits are exercised without ffmpeg.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from openclaw.media.audio import AudioProcessingError, AudioProcessor
+from openclaw.media.transcode import TranscodeError, TranscodeService
+
+FAKE_FFMPEG = textwrap.dedent(
+    """
+    import sys, time
+    args = sys.argv[1:]
+    if args == ["-version"]:
+        sys.exit(0)
+    if "--fail" in args:
+        sys.stderr.write("bad option")
+        sys.exit(1)
+    if "--slow" in args:
+        time.sleep(0.2)
+    data = b""
+    for i, arg in enumerate(args):
+        if arg == "-i":
+            src = args[i + 1]
+            data += sys.stdin.buffer.read() if src == "pipe:0" else open(src, "rb").read()
+    fmt = args[args.index("-f", args.index("-i")) + 1].encode()
+    out = fmt + b":" + data
+    if args[-1] == "pipe:1":
+        sys.stdout.buffer.write(out)
+    else:
+        open(args[-1], "wb").write(out)
+    """
+)
+
+
+@pytest.fixture
+def ffmpeg(tmp_path):
+    script = tmp_path / "ffmpeg"
+    script.write_text(f"#!{sys.executable}\n{FAKE_FFMPEG}")
+    script.chmod(0o755)
+    return str(script)
+
+
+class TestTranscodeService:
+    """Test piping, caching and limits"""
+
+    async def test_pipes_small_input_and_caches(self, ffmpeg):
+        service = TranscodeService(ffmpeg_path=ffmpeg)
+
+        first = await service.transcode(b"voice", "ogg", ["-ac", "1"])
+        second = await service.transcode(b"voice", "ogg", ["-ac", "1"])
+        other = await service.transcode(b"voice", "ogg", ["-ac", "2"])
+
+        assert first == second == b"ogg:voice"
+        assert other == b"ogg:voice"
+        stats = service.get_stats()
+        assert (stats["runs"], stats["hits"]) == (2, 1)
+
+    async def test_file_input_and_seekable_output(self, ffmpeg, tmp_path):
+        service = TranscodeService(ffmpeg_path=ffmpeg, pipe_max_bytes=2)
+        source = tmp_path / "in.wav"
+        source.write_bytes(b"audio")
+
+        assert await service.transcode(source, "m4a") == b"ipod:audio"
+        # Over pipe_max_bytes, bytes go through a temp file
+        assert await service.transcode(b"large", "aac") == b"adts:large"
+
+        out = await service.transcode_to_file(source, tmp_path / "out.mp3")
+        assert out.read_bytes() == b"mp3:audio"
+
+    async def test_concurrent_duplicates_share_one_run(self, ffmpeg):
+        service = TranscodeService(ffmpeg_path=ffmpeg)
+        results = await asyncio.gather(*[service.transcode(b"x", "wav", ["--slow"]) for _ in range(3)])
+
+        assert results == [b"wav:x"] * 3
+        assert service.get_stats()["runs"] == 1
+
+    async def test_joiner_survives_cancelled_leader(self, ffmpeg, monkeypatch):
+        service = TranscodeService(ffmpeg_path=ffmpeg)
+        started, gate = asyncio.Event(), asyncio.Event()
+        run = service._run
+        calls = []
+
+        async def held_run(*args):
+            calls.append(args)
+            started.set()
+            await gate.wait()
+            return await run(*args)
+
+        monkeypatch.setattr(service, "_run", held_run)
+        leader = asyncio.create_task(service.transcode(b"x", "wav"))
+        await started.wait()
+        joiner = asyncio.create_task(service.transcode(b"x", "wav"))
+        await asyncio.sleep(0)  # joiner attaches to the in-flight run
+        assert len(calls) == 1
+        leader.cancel()
+        gate.set()
+
+        assert await joiner == b"wav:x"
+        assert len(calls) == 2
+
+    async def test_parallelism_is_bounded(self, ffmpeg):
+        service = TranscodeService(ffmpeg_path=ffmpeg, max_parallel=1)
+        start = asyncio.get_running_loop().time()
+        await asyncio.gather(*[service.transcode(bytes([i]), "wav", ["--slow"]) for i in range(3)])
+
+        assert asyncio.get_running_loop().time() - start >= 0.6
+
+    async def test_disk_cache_survives_new_service(self, ffmpeg, tmp_path):
+        cache_dir = tmp_path / "cache"
+        await TranscodeService(ffmpeg_path=ffmpeg, cache_dir=cache_dir).transcode(b"tts", "ogg")
+
+        service = TranscodeService(ffmpeg_path="/nonexistent/ffmpeg", cache_dir=cache_dir)
+        assert await service.transcode(b"tts", "ogg") == b"ogg:tts"
+
+    async def test_errors(self, ffmpeg):
+        service = TranscodeService(ffmpeg_path=ffmpeg)
+        with pytest.raises(TranscodeError, match="bad option"):
+            await service.transcode(b"x", "wav", ["--fail"])
+        with pytest.raises(TranscodeError, match="timed out"):
+            await service.transcode(b"x", "wav", ["--slow"], timeout=0.05)
+
+        missing = TranscodeService(ffmpeg_path="/nonexistent/ffmpeg")
+        assert not await missing.check_ffmpeg()
+        with pytest.raises(TranscodeError, match="not available"):
+            await missing.transcode(b"x", "wav")
+
+
+class TestAudioProcessor:
+    """Test AudioProcessor on top of the service"""
+
+    async def test_convert_and_concatenate(self, ffmpeg, tmp_path):
+        processor = AudioProcessor(ffmpeg_path=ffmpeg)
+        source = tmp_path / "in.wav"
+        source.write_bytes(b"a")
+
+        await processor.convert_audio(source, tmp_path / "out.mp3")
+        assert (tmp_path / "out.mp3").read_bytes() == b"mp3:a"
+
+        await processor.concatenate_audio([source, b"b"], tmp_path / "joined.wav")
+        assert (tmp_path / "joined.wav").read_bytes() == b"wav:ab"
+
+    async def test_missing_ffmpeg(self, tmp_path):
+        processor = AudioProcessor(ffmpeg_path="/nonexistent/ffmpeg")
+        with pytest.raises(AudioProcessingError, match="not available"):
+            await processor.adjust_volume(b"a", tmp_path / "out.mp3", 3.0)
@@ -17,6 +17,7 @@ from openclaw.security.tool_policy import (
     normalize_tool_name,
     resolve_tool_profile_policy,
     get_profile_policy,
+    invalidate_tool_policy_cache,
 )
 
 
@@ -253,6 +254,51 @@ class TestToolPolicyResolver:
         allowed, _ = resolver.is_tool_allowed("web_search", "agent", is_main_session=False)
         assert not allowed
 
+    def test_compiled_once_per_agent(self):
+        resolver = ToolPolicyResolver({
+            "tools": {"deny": [f"tool_{i}" for i in range(5000)]},
+            "agents": {"coder": {"tools": {"profile": "coding"}}},
+        })
+        for _ in range(100):
+            assert resolver.is_tool_allowed("bash", "coder")[0]
+            assert not resolver.is_tool_allowed("tool_4999", "coder")[0]
+            assert not resolver.is_tool_allowed("browser", "coder")[0]
+
+        stats = resolver.get_stats()
+        assert stats["compiles"] == 1
+        assert stats["decisions"] == 300
+        assert stats["avg_decision_us"] > 0
+
+    def test_main_sessions_share_table_without_sandbox(self):
+        resolver = ToolPolicyResolver({"tools": {"deny": ["browser"]}})
+        resolver.is_tool_allowed("bash", "main", is_main_session=True)
+        resolver.is_tool_allowed("bash", "main", is_main_session=False)
+        assert resolver.get_stats()["compiles"] == 1
+
+    def test_update_config_recompiles(self):
+        resolver = ToolPolicyResolver({"tools": {"deny": ["browser"]}})
+        assert not resolver.is_tool_allowed("browser", "main")[0]
+
+        resolver.update_config({})
+        assert resolver.is_tool_allowed("browser", "main")[0]
+        assert resolver.config_version == 1
+
+    def test_reload_invalidates_all_resolvers(self):
+        config = {"tools": {"deny": ["browser"]}}
+        resolver = ToolPolicyResolver(config)
+        assert not resolver.is_tool_allowed("browser", "main")[0]
+
+        config["tools"]["deny"] = []
+        assert not resolver.is_tool_allowed("browser", "main")[0]  # still compiled
+
+        invalidate_tool_policy_cache()
+        assert resolver.is_tool_allowed("browser", "main")[0]
+
+    def test_deny_groups_expand(self):
+        resolver = ToolPolicyResolver({"tools": {"deny": ["group:web"]}})
+        assert not resolver.is_tool_allowed("web_fetch", "main")[0]
+
+
 
 class TestGetProfilePolicy:
     def test_ts_profiles(self):
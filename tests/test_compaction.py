@@ -4,7 +4,17 @@ Tests for context compaction
 
 import pytest
 
-from openclaw.agents.compaction import CompactionManager, CompactionStrategy, TokenAnalyzer
+from openclaw.agents.compaction import (
+    CompactionManager,
+    CompactionStrategy,
+    SummaryCompactor,
+    TokenAnalyzer,
+)
+from openclaw.agents.compaction.summarizing import SUMMARY_PREFIX, compaction_tree_path
+from openclaw.agents.providers.base import LLMResponse
+from openclaw.agents.session import Session
+from openclaw.agents.session_tree import CompactionEntry, SessionTree
+from openclaw.agents.summarization import MessageSummarizer
 
 
 class TestTokenAnalyzer:
@@ -148,3 +158,99 @@ class TestCompactionManager:
 
         # System message should always be present
         assert any(m["role"] == "system" for m in result)
+
+
+class _SummaryProvider:
+    """Fake cheap model that records what it was asked to summarize"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def stream(self, messages, max_tokens=None, **kwargs):
+        self.calls.append(messages[-1].content)
+        yield LLMResponse(type="text_delta", content=f"summary #{len(self.calls)}")
+        yield LLMResponse(type="done", content=None)
+
+
+class TestSummaryCompactor:
+    """Test summarization-based compaction"""
+
+    @pytest.fixture
+    def session(self, tmp_path):
+        session = Session("s1", tmp_path)
+        session.add_system_message("You are helpful.")
+        for i in range(20):
+            session.add_user_message(f"question {i} " + "x" * 200)
+            session.add_assistant_message(f"answer {i} " + "y" * 200)
+        return session
+
+    def _compactor(self, provider):
+        return SummaryCompactor(
+            MessageSummarizer(provider),
+            TokenAnalyzer(),
+            max_prompt_tokens=1000,
+            keep_recent_tokens=300,
+            summary_max_tokens=200,
+        )
+
+    def test_prompt_bounded_without_summary(self, session):
+        compactor = self._compactor(_SummaryProvider())
+        analyzer = TokenAnalyzer()
+
+        messages = compactor.build_messages(session)
+
+        assert messages[0].role == "system"
+        assert messages[1].role == "user"
+        assert messages[-1].content.startswith("answer 19")
+        assert analyzer.estimate_messages_tokens([m.to_api_format() for m in messages]) <= 1000
+
+    async def test_summary_runs_in_background_and_persists(self, session):
+        provider = _SummaryProvider()
+        compactor = self._compactor(provider)
+
+        assert compactor.schedule(session) is not None
+        await compactor.wait(session)
+
+        messages = compactor.build_messages(session)
+        assert messages[1].content == f"{SUMMARY_PREFIX}\nsummary #1"
+        assert messages[2].role == "user"
+        assert "question 0" in provider.calls[0]
+
+        tree = SessionTree(compaction_tree_path(session))
+        entries = [e for e in tree.entries if isinstance(e, CompactionEntry)]
+        assert len(entries) == 1
+        assert entries[0].summary == "summary #1"
+        covered = entries[0].covered_messages
+        assert session.messages[covered - 1].role == "assistant"
+        assert entries[0].removed_entries == [m.id for m in session.messages[1:covered]]
+
+    async def test_summary_reused_across_turns_and_restarts(self, session):
+        provider = _SummaryProvider()
+        compactor = self._compactor(provider)
+        compactor.schedule(session)
+        await compactor.wait(session)
+
+        # Nothing new to summarize: no second model call
+        assert compactor.schedule(session) is None
+        assert len(provider.calls) == 1
+
+        # A fresh compactor loads the summary from the session tree
+        restarted = self._compactor(_SummaryProvider())
+        assert restarted.get_summary(session) == "summary #1"
+        assert not restarted.needs_compaction(session)
+
+    async def test_incremental_summary_extends_previous(self, session):
+        provider = _SummaryProvider()
+        compactor = self._compactor(provider)
+        compactor.schedule(session)
+        await compactor.wait(session)
+
+        for i in range(20, 30):
+            session.add_user_message(f"question {i} " + "x" * 200)
+            session.add_assistant_message(f"answer {i} " + "y" * 200)
+        compactor.schedule(session)
+        await compactor.wait(session)
+
+        assert compactor.get_summary(session) == "summary #2"
+        assert "Previous Summary:\nsummary #1" in provider.calls[1]
+        assert "question 0 " not in provider.calls[1]
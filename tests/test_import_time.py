@@ -0,0 +1,53 @@
+"""
+Import-time budget for the CLI and package entry points
+
+Runs ``python -X importtime`` in a subprocess so the measurement starts
+from a cold interpreter. The module checks are deterministic; the time
+budgets are deliberately generous and only catch large regressions
+(e.g. a provider SDK creeping back into the eager import path).
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+PROVIDER_SDKS = ["anthropic", "openai", "google.genai", "boto3", "ollama"]
+
+# Modules that must only load when a command actually needs them
+HEAVY = [*PROVIDER_SDKS, "openclaw.gateway", "openclaw.agents.runtime", "telegram"]
+
+# (entry point, forbidden modules, cumulative budget in microseconds)
+ENTRY_POINTS = [
+    ("openclaw", HEAVY, 1_000_000),
+    ("openclaw.cli.main", HEAVY, 1_500_000),
+    ("openclaw.agents.runtime", PROVIDER_SDKS, 2_000_000),
+]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Return cumulative import time (us) per imported module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module,forbidden,budget_us", ENTRY_POINTS)
+def test_entry_point_import(module, forbidden, budget_us):
+    times = _import_times(module)
+
+    loaded = [name for name in forbidden if name in times]
+    assert loaded == [], f"import {module} pulled in {loaded}"
+    assert times[module] < budget_us, f"import {module} took {times[module] / 1000:.0f} ms"
@@ -0,0 +1,116 @@
+"""
+Tests for the pre-forked agent worker pool
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from openclaw.agents.process_isolation import (
+    AgentProcessConfig,
+    AgentProcessManager,
+    AgentWorkerPool,
+)
+from openclaw.agents.providers.base import LLMProvider, LLMResponse
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="fork start method")
+
+
+class EchoProvider(LLMProvider):
+    """Replies with the worker PID and the last user message"""
+
+    async def stream(self, messages, tools=None, max_tokens=4096, **kwargs):
+        last = [m for m in messages if m.role == "user"][-1].content
+        if last == "slow":
+            await asyncio.sleep(30)
+        if last == "crash":
+            os._exit(1)
+        yield LLMResponse(type="text_delta", content=f"{os.getpid()}:")
+        yield LLMResponse(type="text_delta", content=last)
+        yield LLMResponse(type="done", content="")
+
+    def get_client(self):
+        return None
+
+    @property
+    def provider_name(self):
+        return "echo"
+
+
+FACTORY = f"{__name__}:EchoProvider"
+
+
+def _request(prompt, **kwargs):
+    return {"model": "echo/test", "prompts": [prompt], "provider_factory": FACTORY, **kwargs}
+
+
+async def _turn(pool, request, **kwargs):
+    return [m async for m in pool.run_turn(request, **kwargs)]
+
+
+@pytest.fixture
+async def pool():
+    pool = AgentWorkerPool(size=1, max_turns=2, start_method="fork")
+    await pool.start()
+    yield pool
+    await pool.close()
+
+
+class TestAgentWorkerPool:
+    """Test warm worker turns, recycling and failure handling"""
+
+    async def test_turn_streams_events_then_done(self, pool):
+        messages = await _turn(pool, _request("hello"))
+
+        events = [m["event"] for m in messages if m["type"] == "event"]
+        assert "text_delta" in events
+        assert messages[-1]["type"] == "done"
+        assistant = messages[-1]["messages"][-1]
+        assert assistant["role"] == "assistant"
+        assert assistant["content"].endswith(":hello")
+
+    async def test_worker_is_reused_then_recycled(self, pool):
+        def pid(messages):
+            return messages[-1]["messages"][-1]["content"].split(":")[0]
+
+        first = pid(await _turn(pool, _request("a")))
+        second = pid(await _turn(pool, _request("b")))
+        assert first == second
+
+        # max_turns=2: the next turn lands on a fresh worker
+        third = pid(await _turn(pool, _request("c")))
+        assert third != first
+        assert pool.get_stats()["recycled"] == 1
+
+    async def test_timeout_kills_worker(self, pool):
+        messages = await _turn(pool, _request("slow"), timeout_s=0.5)
+        assert messages[-1]["type"] == "error"
+        assert messages[-1]["error_type"] == "TimeoutError"
+
+        assert (await _turn(pool, _request("ok")))[-1]["type"] == "done"
+
+    async def test_crashed_worker_reports_error(self, pool):
+        messages = await _turn(pool, _request("crash"))
+        assert messages[-1]["error_type"] == "WorkerExited"
+
+        assert (await _turn(pool, _request("ok")))[-1]["type"] == "done"
+
+
+class TestAgentProcessManager:
+    """Test session leases"""
+
+    async def test_session_is_pinned_to_worker(self, pool, tmp_path):
+        manager = AgentProcessManager(pool)
+        config = AgentProcessConfig(
+            session_key="s1", workspace_dir=tmp_path, model="echo/test", provider_factory=FACTORY
+        )
+        pid = await manager.spawn_isolated_agent(config)
+
+        messages = [m async for m in manager.run_turn("s1", ["hi"])]
+        assert messages[-1]["messages"][-1]["content"] == f"{pid}:hi"
+        assert manager.list_processes()[0]["session_key"] == "s1"
+
+        await manager.terminate_agent("s1")
+        assert manager.list_processes() == []
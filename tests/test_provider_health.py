@@ -0,0 +1,232 @@
+"""
+Tests for provider health circuit breakers and hedged requests
+"""
+
+import asyncio
+
+import pytest
+
+from openclaw.agents.auth import AuthProfile, ProfileStore, RotationManager
+from openclaw.agents.failover import (
+    CircuitState,
+    FallbackChain,
+    FallbackManager,
+    HealthConfig,
+    ProviderHealth,
+    ProviderHealthRegistry,
+    hedged_stream,
+)
+from openclaw.agents.providers.base import LLMResponse
+
+
+class TestProviderHealth:
+    """Test circuit breaker state machine"""
+
+    def test_consecutive_failures_open_circuit(self):
+        health = ProviderHealth("m", HealthConfig(consecutive_failures=3, cooldown_seconds=10))
+
+        health.record_failure("boom", now=0)
+        health.record_failure("boom", now=1)
+        assert health.state == CircuitState.CLOSED
+
+        health.record_failure("boom", now=2)
+        assert health.state == CircuitState.OPEN
+        assert not health.allow_request(now=5)
+
+    def test_half_open_allows_single_probe(self):
+        health = ProviderHealth("m", HealthConfig(consecutive_failures=1, cooldown_seconds=10))
+        health.record_failure(now=0)
+
+        assert health.allow_request(now=11)
+        assert health.state == CircuitState.HALF_OPEN
+        assert not health.allow_request(now=11.5)
+
+        health.record_success(0.2, now=12)
+        assert health.state == CircuitState.CLOSED
+        assert health.allow_request(now=12)
+
+    def test_failed_probe_doubles_cooldown(self):
+        health = ProviderHealth("m", HealthConfig(consecutive_failures=1, cooldown_seconds=10))
+        health.record_failure(now=0)
+        assert health.allow_request(now=11)
+
+        health.record_failure(now=11)
+        assert health.state == CircuitState.OPEN
+        assert health.open_until == 31
+        assert not health.allow_request(now=30)
+
+    def test_error_rate_trips_over_window(self):
+        config = HealthConfig(consecutive_failures=100, min_requests=4, error_rate_threshold=0.5)
+        health = ProviderHealth("m", config)
+        for t, ok in enumerate([True, False, True, False]):
+            if ok:
+                health.record_success(1.0, now=t)
+            else:
+                health.record_failure(now=t)
+        assert health.state == CircuitState.OPEN
+
+    def test_old_samples_leave_window(self):
+        health = ProviderHealth("m", HealthConfig(window_seconds=60))
+        health.record_failure(now=0)
+        health.record_success(1.0, now=100)
+        assert health.error_rate() == 0.0
+
+    def test_latency_percentile(self):
+        health = ProviderHealth("m")
+        for i in range(1, 21):
+            health.record_success(float(i), now=i)
+        assert health.latency_percentile(50) == 10.0
+        assert health.latency_percentile(95) == 19.0
+
+
+class TestProviderHealthRegistry:
+    """Test registry and hedge delay"""
+
+    def test_hedge_delay_is_clamped_p95(self):
+        registry = ProviderHealthRegistry(HealthConfig(hedge_min_delay=0.5, hedge_max_delay=5.0))
+        assert registry.hedge_delay("m") == 5.0
+
+        for _ in range(10):
+            registry.record_success("m", 0.1)
+        assert registry.hedge_delay("m") == 0.5
+
+        for _ in range(10):
+            registry.record_success("m", 2.0)
+        assert registry.hedge_delay("m") == 2.0
+
+    def test_unknown_key_is_available(self):
+        registry = ProviderHealthRegistry()
+        assert registry.is_available("never-seen")
+        assert registry.get_status() == {}
+
+
+class TestHealthAwareFallback:
+    """Test FallbackManager and RotationManager integration"""
+
+    def _registry(self):
+        return ProviderHealthRegistry(HealthConfig(consecutive_failures=1, cooldown_seconds=60))
+
+    def test_select_model_skips_open_primary(self):
+        registry = self._registry()
+        registry.record_failure("anthropic/claude")
+        manager = FallbackManager(
+            FallbackChain(primary="anthropic/claude", fallbacks=["openai/gpt-4", "gemini/pro"]),
+            health=registry,
+        )
+
+        assert manager.select_model() == "openai/gpt-4"
+        assert manager.get_current_model() == "openai/gpt-4"
+
+    def test_select_model_uses_primary_when_all_open(self):
+        registry = self._registry()
+        for model in ("a/1", "b/2"):
+            registry.record_failure(model)
+        manager = FallbackManager(FallbackChain(primary="a/1", fallbacks=["b/2"]), health=registry)
+
+        assert manager.select_model() == "a/1"
+
+    def test_next_and_peek_skip_open_models(self):
+        registry = self._registry()
+        registry.record_failure("b/2")
+        manager = FallbackManager(
+            FallbackChain(primary="a/1", fallbacks=["b/2", "c/3"]), health=registry
+        )
+
+        assert manager.peek_next_model() == "c/3"
+        assert manager.current_index == 0
+        assert manager.get_next_model() == "c/3"
+        assert manager.get_status()["health"]["b/2"]["state"] == "open"
+
+    def test_rotation_skips_profile_with_open_circuit(self):
+        registry = self._registry()
+        store = ProfileStore()
+        store.add_profile(AuthProfile(id="p1", provider="openai", api_key="k1"))
+        store.add_profile(AuthProfile(id="p2", provider="openai", api_key="k2"))
+        rotation = RotationManager(store, max_failures=10, health=registry)
+
+        rotation.mark_failure("p1", reason="server error")
+
+        assert rotation.get_next_profile("openai", preferred_id="p1").id == "p2"
+        assert rotation.get_status("openai")["in_cooldown"] == 1
+
+
+async def _stream(items, first_delay=0.0, fail=None):
+    await asyncio.sleep(first_delay)
+    if fail:
+        raise fail
+    for item in items:
+        yield item
+
+
+class TestHedgedStream:
+    """Test hedged streaming"""
+
+    async def test_primary_within_delay_never_starts_backup(self):
+        started = []
+
+        def backup():
+            started.append("backup")
+            return _stream(["b"])
+
+        result = [x async for x in hedged_stream(
+            [("primary", lambda: _stream(["a1", "a2"])), ("backup", backup)], delay=1.0
+        )]
+
+        assert result == [("primary", "a1"), ("primary", "a2")]
+        assert started == []
+
+    async def test_slow_primary_is_hedged(self):
+        result = [x async for x in hedged_stream(
+            [
+                ("primary", lambda: _stream(["a"], first_delay=5)),
+                ("backup", lambda: _stream(["b1", "b2"])),
+            ],
+            delay=0.01,
+        )]
+
+        assert result == [("backup", "b1"), ("backup", "b2")]
+
+    async def test_failed_primary_starts_backup_immediately(self):
+        result = [x async for x in hedged_stream(
+            [
+                ("primary", lambda: _stream([], fail=ConnectionError("down"))),
+                ("backup", lambda: _stream(["b"])),
+            ],
+            delay=10,
+        )]
+
+        assert result == [("backup", "b")]
+
+    async def test_error_response_does_not_win(self):
+        error = LLMResponse(type="error", content="overloaded")
+        result = [x async for x in hedged_stream(
+            [
+                ("primary", lambda: _stream([error])),
+                ("backup", lambda: _stream(["b1", "b2"], first_delay=0.02)),
+            ],
+            delay=0.01,
+        )]
+
+        assert result == [("backup", "b1"), ("backup", "b2")]
+
+    async def test_all_error_responses_yield_last(self):
+        result = [x async for x in hedged_stream(
+            [
+                ("primary", lambda: _stream([LLMResponse(type="error", content="a")])),
+                ("backup", lambda: _stream([LLMResponse(type="error", content="b")])),
+            ],
+            delay=10,
+        )]
+
+        assert [(label, r.content) for label, r in result] == [("backup", "b")]
+
+    async def test_all_failed_raises_last_error(self):
+        with pytest.raises(ValueError):
+            async for _ in hedged_stream(
+                [
+                    ("primary", lambda: _stream([], fail=ConnectionError("down"))),
+                    ("backup", lambda: _stream([], fail=ValueError("also down"))),
+                ],
+                delay=10,
+            ):
+                pass
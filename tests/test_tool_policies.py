@@ -316,3 +316,55 @@ class TestPolicyManager:
 
         log = manager.get_audit_log()
         assert len(log) == 0
+
+
+class TestCompiledPolicies:
+    """Test compiled decision table"""
+
+    def test_table_compiled_once(self):
+        manager = PolicyManager()
+        manager.add_policy(WhitelistPolicy([f"tool_{i}" for i in range(5000)]))
+        manager.add_policy(BlacklistPolicy(["tool_1"]))
+
+        for _ in range(50):
+            assert manager.evaluate("tool_4999", {}, {}) == PolicyDecision.ALLOW
+            assert manager.evaluate("tool_1", {}, {}) == PolicyDecision.DENY
+
+        stats = manager.get_stats()
+        assert stats["compiles"] == 1
+        assert stats["decisions"] == 100
+        assert manager.get_audit_log(limit=1)[0]["policy"] == "blacklist"
+        assert "duration_us" in manager.get_audit_log(limit=1)[0]
+
+    def test_disable_policy_recompiles(self):
+        manager = PolicyManager()
+        blacklist = BlacklistPolicy(["bash"])
+        manager.add_policy(blacklist)
+        assert manager.evaluate("bash", {}, {}) == PolicyDecision.DENY
+
+        blacklist.enabled = False
+        assert manager.evaluate("bash", {}, {}) == PolicyDecision.ALLOW
+
+    def test_denied_call_does_not_consume_rate_limit(self):
+        manager = PolicyManager()
+        manager.add_policy(BlacklistPolicy(["rm"]))
+        manager.add_policy(RateLimitPolicy(max_calls=1, window_seconds=60, per_tool=False))
+
+        assert manager.evaluate("rm", {}, {}) == PolicyDecision.DENY
+        assert manager.evaluate("bash", {}, {}) == PolicyDecision.ALLOW
+        assert manager.evaluate("bash", {}, {}) == PolicyDecision.DENY
+
+    def test_rate_limit_window_slides(self, monkeypatch):
+        import openclaw.agents.tools.policies as policies
+
+        now = [1000.0]
+        monkeypatch.setattr(policies.time, "monotonic", lambda: now[0])
+        policy = RateLimitPolicy(max_calls=2, window_seconds=10)
+
+        assert policy.evaluate("bash", {}, {}) == PolicyDecision.ALLOW
+        now[0] += 5
+        assert policy.evaluate("bash", {}, {}) == PolicyDecision.ALLOW
+        assert policy.evaluate("bash", {}, {}) == PolicyDecision.DENY
+
+        now[0] += 6  # First call left the window
+        assert policy.evaluate("bash", {}, {}) == PolicyDecision.ALLOW
@@ -0,0 +1,234 @@
+"""Unit tests for tool_call_ready streaming and early tool dispatch"""
+import asyncio
+from types import SimpleNamespace
+
+from openclaw.agents.agent_loop import AgentLoop
+from openclaw.agents.events import EventEmitter
+from openclaw.agents.providers.anthropic_provider import AnthropicProvider
+from openclaw.agents.providers.base import LLMProvider, LLMResponse
+from openclaw.agents.providers.openai_provider import OpenAIProvider
+from openclaw.agents.runtime import AgentRuntime
+from openclaw.agents.session import Session
+from openclaw.agents.tools.base import AgentTool, ToolResult
+
+
+class RecordingTool(AgentTool):
+    """Tool that records calls and signals when it has run"""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.description = name
+        self.calls = []
+        self.ran = asyncio.Event()
+
+    def get_schema(self):
+        return {"type": "object", "properties": {}}
+
+    async def execute(self, params):
+        self.calls.append(params)
+        self.ran.set()
+        return ToolResult(success=True, content=f"{self.name} done")
+
+
+def ready(call_id, name, arguments):
+    return LLMResponse(
+        type="tool_call_ready",
+        content=None,
+        tool_calls=[{"id": call_id, "name": name, "arguments": arguments}],
+    )
+
+
+async def collect(stream):
+    return [response async for response in stream]
+
+
+async def test_anthropic_emits_ready_when_block_stops():
+    """A tool_use block is ready at its content_block_stop, before later blocks"""
+    events = [
+        SimpleNamespace(type="content_block_start", index=0,
+                        content_block=SimpleNamespace(type="tool_use", id="t1", name="search")),
+        SimpleNamespace(type="content_block_delta", index=0,
+                        delta=SimpleNamespace(type="input_json_delta", partial_json='{"q": ')),
+        SimpleNamespace(type="content_block_delta", index=0,
+                        delta=SimpleNamespace(type="input_json_delta", partial_json='"cats"}')),
+        SimpleNamespace(type="content_block_stop", index=0),
+        SimpleNamespace(type="content_block_delta", index=1,
+                        delta=SimpleNamespace(type="text_delta", text="more")),
+    ]
+
+    class Stream:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def __aiter__(self):
+            for event in events:
+                yield event
+
+        async def get_final_message(self):
+            block = SimpleNamespace(type="tool_use", id="t1", name="search", input={"q": "cats"})
+            return SimpleNamespace(content=[block], stop_reason="tool_use")
+
+    provider = AnthropicProvider("claude-test", api_key="x")
+    provider._client = SimpleNamespace(messages=SimpleNamespace(stream=lambda **kw: Stream()))
+
+    responses = await collect(provider.stream([]))
+    assert [r.type for r in responses] == ["tool_call_ready", "text_delta", "tool_call", "done"]
+    assert responses[0].tool_calls == [{"id": "t1", "name": "search", "arguments": {"q": "cats"}}]
+
+
+async def test_openai_emits_ready_when_next_call_starts():
+    """Buffered calls are ready once the next call begins (or at finish)"""
+
+    def chunk(index=None, call_id=None, name=None, args=None, finish=None):
+        tool_calls = None
+        if index is not None:
+            function = SimpleNamespace(name=name, arguments=args)
+            tool_calls = [SimpleNamespace(index=index, id=call_id, function=function)]
+        delta = SimpleNamespace(content=None, tool_calls=tool_calls)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish)])
+
+    chunks = [
+        chunk(0, "c1", "search", '{"q": "a"}'),
+        chunk(1, "c2", "fetch", '{"url"'),
+        chunk(1, None, None, ': "u"}'),
+        chunk(finish="tool_calls"),
+    ]
+
+    async def create(**params):
+        async def stream():
+            for c in chunks:
+                yield c
+        return stream()
+
+    provider = OpenAIProvider("gpt-test", api_key="x")
+    provider._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    responses = await collect(provider.stream([]))
+    assert [r.type for r in responses] == ["tool_call_ready", "tool_call_ready", "tool_call", "done"]
+    assert responses[0].tool_calls[0]["id"] == "c1"
+    assert responses[1].tool_calls[0]["arguments"] == {"url": "u"}
+    assert [tc["id"] for tc in responses[2].tool_calls] == ["c1", "c2"]
+
+
+async def test_runtime_starts_ready_tools_while_streaming(tmp_path):
+    """A ready tool runs before the response finishes and only once"""
+    search, fetch = RecordingTool("search"), RecordingTool("fetch")
+    runtime = AgentRuntime(model="openai/gpt-test", api_key="x", enable_context_management=False)
+
+    async def fake_stream(model, messages, tools, max_tokens, hedge=True):
+        if not tools:
+            yield model, LLMResponse(type="text_delta", content="answer")
+            yield model, LLMResponse(type="done", content=None)
+            return
+        yield model, ready("c1", "search", {"q": "a"})
+        # The model is still generating; the search tool must already be running
+        await asyncio.wait_for(search.ran.wait(), timeout=1)
+        calls = [
+            {"id": "c1", "name": "search", "arguments": {"q": "a"}},
+            {"id": "c2", "name": "fetch", "arguments": {"url": "u"}},
+        ]
+        yield model, LLMResponse(type="tool_call", content=None, tool_calls=calls)
+        yield model, LLMResponse(type="done", content=None, finish_reason="tool_use")
+
+    runtime._stream_with_health = fake_stream
+    session = Session("s1", tmp_path)
+    events = await collect(runtime.run_turn(session, "go", tools=[search, fetch]))
+
+    assert search.calls == [{"q": "a"}]
+    assert fetch.calls == [{"url": "u"}]
+    assert len([e for e in events if e.type == "tool_use"]) == 2
+    assert [m.tool_call_id for m in session.messages if m.role == "tool"] == ["c1", "c2"]
+
+
+async def test_agent_loop_starts_ready_tools_while_streaming():
+    """AgentLoop dispatches on tool_call_ready and collects results in order"""
+    search = RecordingTool("search")
+
+    class Provider(LLMProvider):
+        provider_name = "fake"
+
+        def __init__(self):
+            super().__init__("fake")
+            self.rounds = 0
+
+        def get_client(self):
+            return None
+
+        async def stream(self, messages, tools=None, **kwargs):
+            self.rounds += 1
+            if self.rounds == 1:
+                yield ready("c1", "search", {"q": "a"})
+                await asyncio.wait_for(search.ran.wait(), timeout=1)
+                yield ready("c2", "missing", {})
+                yield LLMResponse(type="tool_call", content=None, tool_calls=[
+                    {"id": "c1", "name": "search", "arguments": {"q": "a"}},
+                    {"id": "c2", "name": "missing", "arguments": {}},
+                ])
+            else:
+                yield LLMResponse(type="text_delta", content="answer")
+            yield LLMResponse(type="done", content=None)
+
+    loop = AgentLoop(Provider(), [search], EventEmitter())
+    messages = await loop.agent_loop(["go"])
+
+    assert search.calls == [{"q": "a"}]
+    results = [m for m in messages if m.role == "toolResult"]
+    assert [(m.tool_call_id, m.content) for m in results] == [
+        ("c1", "search done"),
+        ("c2", "Error: Tool 'missing' not found"),
+    ]
+    assert messages[-1].content == "answer"
+
+
+async def test_agent_loop_runs_ready_tools_in_order_and_honours_steering():
+    """A later call waits for the earlier one; steering stops calls not yet started"""
+    order = []
+    release = asyncio.Event()
+
+    class SteeringTool(RecordingTool):
+        async def execute(self, params):
+            order.append(f"{self.name} start")
+            await release.wait()
+            loop.steer("stop")
+            order.append(f"{self.name} end")
+            return ToolResult(success=True, content="done")
+
+    first, second = SteeringTool("first"), RecordingTool("second")
+
+    class Provider(LLMProvider):
+        provider_name = "fake"
+
+        def __init__(self):
+            super().__init__("fake")
+            self.rounds = 0
+
+        def get_client(self):
+            return None
+
+        async def stream(self, messages, tools=None, **kwargs):
+            self.rounds += 1
+            if self.rounds == 1:
+                yield ready("c1", "first", {})
+                yield ready("c2", "second", {})
+                await asyncio.sleep(0.01)
+                # The second call must not overtake the first
+                assert order == ["first start"] and not second.calls
+                release.set()
+                yield LLMResponse(type="tool_call", content=None, tool_calls=[
+                    {"id": "c1", "name": "first", "arguments": {}},
+                    {"id": "c2", "name": "second", "arguments": {}},
+                ])
+            else:
+                yield LLMResponse(type="text_delta", content="ok")
+            yield LLMResponse(type="done", content=None)
+
+    loop = AgentLoop(Provider(), [first, second], EventEmitter())
+    messages = await loop.agent_loop(["go"])
+
+    assert order == ["first start", "first end"]
+    assert second.calls == []
+    assert [m.tool_call_id for m in messages if m.role == "toolResult"] == ["c1"]
@@ -0,0 +1,103 @@
+"""Unit tests for single-pass channel Markdown rendering"""
+from html.parser import HTMLParser
+
+from openclaw.channels.chunker import chunk_text
+from openclaw.markdown.channel_render import chunk_channel_markdown, render_channel_markdown
+from openclaw.markdown.formatter import markdown_to_slack_mrkdwn, markdown_to_telegram_html
+
+
+class _TagBalance(HTMLParser):
+    """Tracks open tags; a well-formed fragment ends with none open"""
+
+    def __init__(self):
+        super().__init__()
+        self.stack = []
+
+    def handle_starttag(self, tag, attrs):
+        self.stack.append(tag)
+
+    def handle_endtag(self, tag):
+        assert self.stack and self.stack[-1] == tag, f"unbalanced </{tag}>"
+        self.stack.pop()
+
+
+def _assert_well_formed(html):
+    parser = _TagBalance()
+    parser.feed(html)
+    parser.close()
+    assert parser.stack == []
+
+
+class TestTelegramHTML:
+    """Test Telegram HTML rendering"""
+
+    def test_inline_formatting(self):
+        html = markdown_to_telegram_html("**bold** *it* ~~gone~~ [docs](https://x.io/?a=1&b=2)")
+        assert html == (
+            '<b>bold</b> <i>it</i> <s>gone</s> <a href="https://x.io/?a=1&amp;b=2">docs</a>'
+        )
+
+    def test_code_spans_are_not_formatted(self):
+        html = markdown_to_telegram_html("use `a**b**_c_ <x>` here")
+        assert html == "use <code>a**b**_c_ &lt;x&gt;</code> here"
+
+    def test_code_block_is_escaped(self):
+        html = markdown_to_telegram_html("```python\nif a < b:\n    x = **y**\n```")
+        assert html == (
+            '<pre><code class="language-python">if a &lt; b:\n    x = **y**</code></pre>'
+        )
+
+    def test_unmatched_markers_stay_literal(self):
+        assert markdown_to_telegram_html("2 * 3 and snake_case_name") == "2 * 3 and snake_case_name"
+        _assert_well_formed(markdown_to_telegram_html("**open *never `closed"))
+
+    def test_table_rendered_as_pre(self):
+        html = markdown_to_telegram_html("| a | b |\n|---|---|\n| 1 | 22 |")
+        assert html.startswith("<pre><code>a | b")
+
+
+class TestSlack:
+    """Test Slack mrkdwn rendering"""
+
+    def test_formatting_and_links(self):
+        text = markdown_to_slack_mrkdwn("**b** *i* [t](https://x.io) <@U123> a < b")
+        assert text == "*b* _i_ <https://x.io|t> <@U123> a &lt; b"
+
+
+class TestChunking:
+    """Test entity-safe chunking"""
+
+    def test_long_bold_run_is_rewrapped(self):
+        text = "intro **" + "word " * 100 + "end** tail"
+        chunks = chunk_channel_markdown(text, "telegram", 120)
+
+        assert all(len(chunk) <= 120 for chunk in chunks)
+        for chunk in chunks:
+            _assert_well_formed(chunk)
+        assert sum(chunk.count("<b>") for chunk in chunks) > 1
+
+    def test_code_block_split_keeps_fences(self):
+        code = "\n".join(f"line {i}" for i in range(100))
+        chunks = chunk_text(f"```\n{code}\n```", 200, mode="markdown")
+
+        assert len(chunks) > 1
+        assert all(len(c) <= 200 and c.startswith("```\n") and c.endswith("\n```") for c in chunks)
+
+    def test_overlong_link_keeps_url_as_text(self):
+        url = "http://e.com/" + "p" * 300
+        for dialect in ("telegram", "slack", "markdown"):
+            chunks = chunk_channel_markdown(f"[x]({url})", dialect, 100)
+
+            assert all(len(chunk) <= 100 for chunk in chunks)
+            assert "".join(chunks) == f"x ({url})"
+
+    def test_blocks_are_packed(self):
+        text = "\n\n".join(f"Paragraph {i} with `code`." for i in range(10))
+        chunks = chunk_channel_markdown(text, "markdown", 100)
+
+        assert "\n\n".join(chunks) == text
+        assert all(len(chunk) <= 100 for chunk in chunks)
+
+    def test_render_is_cached(self):
+        text = "cached **reply**"
+        assert render_channel_markdown(text, "telegram") is render_channel_markdown(text, "telegram")
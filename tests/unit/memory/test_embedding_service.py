@@ -0,0 +1,127 @@
+"""Unit tests for the micro-batching embedding service"""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from openclaw.memory.embeddings.base import EmbeddingBatch, EmbeddingProvider
+from openclaw.memory.embeddings.service import EmbeddingService
+
+
+class CountingProvider(EmbeddingProvider):
+    """Records each batch it is asked to embed"""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__("counting")
+        self.delay = delay
+        self.batches = []
+
+    async def embed_text(self, text):
+        return (await self.embed_batch([text])).embeddings[0]
+
+    async def embed_batch(self, texts, use_batch_api=False):
+        self.batches.append(list(texts))
+        await asyncio.sleep(self.delay)
+        if "boom" in texts:
+            raise RuntimeError("provider down")
+        return EmbeddingBatch(
+            texts=texts,
+            embeddings=[[float(len(t)), 1.0] for t in texts],
+            model=self.model,
+            dimensions=2,
+        )
+
+    def get_dimensions(self):
+        return 2
+
+
+class TestEmbeddingService:
+    """Test batching, deduplication and results"""
+
+    async def test_concurrent_requests_share_one_batch(self):
+        provider = CountingProvider()
+        service = EmbeddingService(provider, max_wait_ms=5)
+
+        vectors = await asyncio.gather(*(service.embed(f"query {i}") for i in range(10)))
+
+        assert len(provider.batches) == 1
+        assert len(provider.batches[0]) == 10
+        assert [v[0] for v in vectors] == [float(len(f"query {i}")) for i in range(10)]
+        # float32 array, not a list of Python floats
+        assert not isinstance(vectors[0], list)
+        assert vectors[0].tolist() == [7.0, 1.0]
+
+    async def test_identical_texts_deduplicated_in_flight(self):
+        provider = CountingProvider(delay=0.05)
+        service = EmbeddingService(provider, max_wait_ms=1)
+
+        first = asyncio.create_task(service.embed("same"))
+        await asyncio.sleep(0.01)  # first batch is now running
+        second, third = await asyncio.gather(service.embed("same"), service.embed("same"))
+
+        assert (await first).tolist() == second.tolist() == third.tolist()
+        assert provider.batches == [["same"]]
+        assert service.get_stats()["deduplicated"] == 2
+
+    async def test_full_batch_is_sent_immediately(self):
+        provider = CountingProvider()
+        service = EmbeddingService(provider, max_batch_size=4, max_wait_ms=10_000)
+
+        vectors = await asyncio.wait_for(service.embed_many([f"t{i}" for i in range(8)]), timeout=1)
+
+        assert len(vectors) == 8
+        assert [len(b) for b in provider.batches] == [4, 4]
+
+    async def test_errors_reach_every_caller(self):
+        service = EmbeddingService(CountingProvider())
+        results = await asyncio.gather(service.embed("boom"), service.embed("ok"), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        # A later request is retried, not served a cached failure
+        assert (await service.embed("ok")).tolist() == [2.0, 1.0]
+
+
+class TestMemorySearchScores:
+    """Test that vector search results stay JSON-serializable"""
+
+    async def test_vector_search_result_round_trips_json(self, tmp_path):
+        from openclaw.agents.tools.memory import MemorySearchTool
+        from openclaw.memory.builtin_manager import BuiltinMemoryManager
+
+        manager = BuiltinMemoryManager("agent", tmp_path, embedding_provider=CountingProvider())
+        manager.db.execute(
+            "INSERT INTO chunks (id, path, source, start_line, end_line, hash, model, text, embedding, updated_at)"
+            " VALUES ('c1', 'MEMORY.md', 'memory', 1, 1, 'h', 'counting', 'notes', ?, 0)",
+            [manager._serialize_embedding([5.0, 1.0])],
+        )
+
+        (result,) = await manager.search("query", use_vector=True, use_hybrid=False)
+        manager.close()
+
+        assert type(result.score) is float
+        data = MemorySearchTool(tmp_path)._result_to_dict(result)
+        assert json.loads(json.dumps(data))["score"] == pytest.approx(result.score)
+
+
+class TestLocalProviderExecutor:
+    """Test that local inference leaves the event loop"""
+
+    async def test_encode_runs_off_loop(self, monkeypatch):
+        from openclaw.memory.embeddings.local_provider import LocalEmbeddingProvider
+
+        provider = LocalEmbeddingProvider()
+        threads = []
+
+        class FakeModel:
+            def encode(self, texts, convert_to_numpy=True):
+                threads.append(threading.current_thread().name)
+                return [_Row([1.0, 2.0]) for _ in texts]
+
+        class _Row(list):
+            def tolist(self):
+                return list(self)
+
+        monkeypatch.setattr(provider, "_load_model", lambda: FakeModel())
+        assert await provider.embed_text("hello") == [1.0, 2.0]
+        assert threads and threads[0].startswith("openclaw-embed")
@@ -0,0 +1,82 @@
+"""Unit tests for the shared provider client registry"""
+import asyncio
+
+import httpx
+import pytest
+
+from openclaw.agents.providers import http_clients
+from openclaw.agents.providers.anthropic_provider import AnthropicProvider
+from openclaw.agents.providers.http_clients import ProviderClientRegistry, ProviderHttpConfig
+from openclaw.agents.providers.ollama_provider import OllamaProvider
+from openclaw.agents.providers.openai_provider import OpenAIProvider
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = ProviderClientRegistry()
+    monkeypatch.setattr(http_clients, "_registry", registry)
+    return registry
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    """Answer every request with 404 and record (method, url)"""
+    seen = []
+    new_client = ProviderClientRegistry._new_http_client
+
+    def mock_client(self, base_url, module=httpx):
+        def handler(request):
+            seen.append((request.method, str(request.url)))
+            return module.Response(404)
+
+        client = new_client(self, base_url, module)
+        client._transport = module.MockTransport(handler)
+        return client
+
+    monkeypatch.setattr(ProviderClientRegistry, "_new_http_client", mock_client)
+    return seen
+
+
+async def test_providers_share_sdk_clients(registry):
+    """Provider instances for one endpoint and key share a client"""
+    first = AnthropicProvider("claude-a", api_key="k1").get_client()
+    assert AnthropicProvider("claude-b", api_key="k1").get_client() is first
+    assert AnthropicProvider("claude-a", api_key="k2").get_client() is not first
+
+    local = OpenAIProvider("m", api_key="k1", base_url="http://localhost:1234/v1").get_client()
+    assert OpenAIProvider("m", api_key="k1").get_client() is not local
+    assert str(local.base_url).startswith("http://localhost:1234/v1")
+
+    assert OllamaProvider("llama3").get_client() is OllamaProvider("mistral").get_client()
+    assert registry.get_stats()["clients"] == 5
+
+
+async def test_warm_and_keepalive_touch_endpoints(registry, requests):
+    """warm() opens a connection per endpoint; keep-alive touches idle ones"""
+    OpenAIProvider("gpt", api_key="k").get_client()
+    OllamaProvider("llama3", base_url="http://ollama.test:11434").get_client()
+
+    assert await registry.warm() == 2
+    assert sorted(requests) == [
+        ("HEAD", "http://ollama.test:11434"),
+        ("HEAD", "https://api.openai.com/v1/"),
+    ]
+
+    registry.config = ProviderHttpConfig(keepalive_interval=0.01)
+    task = registry.start_keepalive()
+    await asyncio.sleep(0.05)
+    assert registry.get_stats()["pings"] >= 2
+    await registry.aclose()
+    assert task.cancelled() or task.done()
+
+
+def test_clients_of_closed_loops_are_replaced(registry):
+    """A client bound to a finished event loop isn't handed out again"""
+
+    async def get():
+        return registry.get_http_client("ollama", "http://localhost:11434")
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+    assert second is not first
+    assert registry.get_stats()["clients"] == 1
@@ -0,0 +1,109 @@
+"""Unit tests for cached API key validation"""
+import sqlite3
+
+import pytest
+
+from openclaw.auth.persistent_api_keys import PersistentAPIKeyStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PersistentAPIKeyStore(tmp_path / "api_keys.db", flush_interval=60)
+    yield store
+    store.close()
+
+
+def count_selects(store):
+    statements = []
+    store._conn.set_trace_callback(statements.append)
+    return statements
+
+
+class TestValidationCache:
+    """Test in-memory validation and invalidation"""
+
+    def test_repeat_validation_skips_database(self, store):
+        raw_key = store.create_key("app", ["read"])
+        statements = count_selects(store)
+
+        for _ in range(5):
+            assert store.validate_key(raw_key).name == "app"
+
+        assert sum("SELECT" in s for s in statements) == 1
+        assert not any("UPDATE" in s for s in statements)
+
+    def test_revoke_and_update_take_effect_immediately(self, store):
+        raw_key = store.create_key("app", ["read"])
+        api_key = store.validate_key(raw_key)
+
+        store.update_key(api_key.key_id, permissions=["read", "admin"])
+        assert store.validate_key(raw_key).has_permission("admin")
+
+        store.revoke_key(api_key.key_id)
+        assert store.validate_key(raw_key) is None
+
+    def test_unknown_key_then_created(self, store):
+        assert store.validate_key("clb_nope") is None
+        raw_key = store.create_key("app", ["read"])
+        assert store.validate_key(raw_key) is not None
+
+    def test_uses_wal(self, store):
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestLastUsed:
+    """Test coalesced last_used_at writes"""
+
+    def test_flush_writes_batch(self, store, tmp_path):
+        raw_a = store.create_key("a", ["read"])
+        raw_b = store.create_key("b", ["read"])
+        for raw in (raw_a, raw_b, raw_a):
+            store.validate_key(raw)
+
+        assert store.flush() == 2
+        with sqlite3.connect(tmp_path / "api_keys.db") as conn:
+            used = conn.execute("SELECT last_used_at FROM api_keys").fetchall()
+        assert all(row[0] for row in used)
+
+    def test_list_keys_includes_pending(self, store):
+        raw_key = store.create_key("app", ["read"])
+        store.validate_key(raw_key)
+        assert store.list_keys()[0].last_used_at is not None
+
+
+class TestRateLimit:
+    """Test per-key token buckets"""
+
+    def test_rate_limit_enforced_per_key(self, store):
+        limited = store.validate_key(store.create_key("limited", ["read"], rate_limit=3))
+        unlimited = store.validate_key(store.create_key("free", ["read"]))
+
+        assert [store.check_rate_limit(limited) for _ in range(4)] == [True, True, True, False]
+        assert all(store.check_rate_limit(unlimited) for _ in range(100))
+
+    def test_bucket_refills(self, store, monkeypatch):
+        api_key = store.validate_key(store.create_key("limited", ["read"], rate_limit=60))
+        clock = [1000.0]
+        monkeypatch.setattr("openclaw.auth.persistent_api_keys.time.monotonic", lambda: clock[0])
+
+        while store.check_rate_limit(api_key):
+            pass
+        clock[0] += 1.0  # 60/min -> one token per second
+        assert store.check_rate_limit(api_key)
+        assert not store.check_rate_limit(api_key)
+
+    def test_auth_middleware_enforces_key_limit(self, store):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from openclaw.auth.middleware import setup_auth_middleware
+
+        app = FastAPI()
+        app.get("/ping")(lambda: {"ok": True})
+        setup_auth_middleware(app, enable_rate_limiting=False, api_key_manager=store)
+        client = TestClient(app)
+        headers = {"x-api-key": store.create_key("limited", ["read"], rate_limit=2)}
+
+        codes = [client.get("/ping", headers=headers).status_code for _ in range(3)]
+        assert codes == [200, 200, 429]
+        assert client.get("/ping", headers={"x-api-key": "clb_unknown"}).status_code == 401
@@ -0,0 +1,156 @@
+"""Unit tests for the pooled browser contexts"""
+import pytest
+
+from openclaw.browser.controller import BrowserController
+from openclaw.browser.pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+        self.routes = []
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def close(self):
+        self.closed = True
+        for page in self.pages:
+            page.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        pass
+
+
+class FakeRoute:
+    def __init__(self, resource_type):
+        self.request = type("Request", (), {"resource_type": resource_type})()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+@pytest.fixture
+async def pool():
+    pool = BrowserPool(browser=FakeBrowser(), warm_size=2, max_contexts=2, max_pages_per_context=2)
+    yield pool
+    await pool.close()
+
+
+class TestBrowserPool:
+    """Test context leasing, limits and reaping"""
+
+    async def test_sessions_get_isolated_warm_contexts(self, pool):
+        await pool.start()
+        assert pool.get_stats()["idle"] == 2
+
+        a = await pool.acquire("a")
+        b = await pool.acquire("b")
+
+        assert a.context is not b.context
+        assert await pool.acquire("a") is a
+        assert pool.get_stats()["hits"] == 2
+
+    async def test_release_closes_context(self, pool):
+        lease = await pool.acquire("a")
+        await pool.release("a")
+
+        assert lease.context.closed
+        assert (await pool.acquire("a")).context is not lease.context
+
+    async def test_page_limit(self, pool):
+        lease = await pool.acquire("a")
+        await pool.new_page(lease)
+        await pool.new_page(lease)
+
+        with pytest.raises(RuntimeError, match="Page limit"):
+            await pool.new_page(lease)
+
+    async def test_exhausted_pool_reaps_idle_sessions(self, pool):
+        await pool.acquire("a")
+        await pool.acquire("b")
+        with pytest.raises(RuntimeError, match="exhausted"):
+            await pool.acquire("c")
+
+        pool.idle_timeout = 0
+        lease = await pool.acquire("c")
+        assert lease.session_key == "c"
+        assert pool.get_stats()["reaped"] == 2
+
+    async def test_resource_blocking(self, pool):
+        lease = await pool.acquire("a")
+        assert lease.context.routes == []
+
+        await pool.acquire("a", block_resources=["image", "font"])
+        _, handler = lease.context.routes[0]
+
+        image, script = FakeRoute("image"), FakeRoute("script")
+        await handler(image)
+        await handler(script)
+        assert (image.outcome, script.outcome) == ("abort", "continue")
+
+        with pytest.raises(ValueError):
+            await pool.acquire("a", block_resources=["script"])
+
+
+class TestPooledController:
+    """Test BrowserController on a pooled context"""
+
+    async def test_controller_leases_and_releases(self, pool):
+        controller = BrowserController(session_key="s1", pool=pool)
+        await controller.start()
+
+        assert pool.get_stats()["leased"] == 1
+        await controller.create_page("second")
+        with pytest.raises(RuntimeError, match="Page limit"):
+            await controller.create_page("third")
+
+        await controller.stop()
+        assert pool.get_stats()["leased"] == 0
+
+    async def test_reaped_context_is_re_leased(self, pool):
+        controller = BrowserController(session_key="s1", pool=pool)
+        await controller.start()
+        first = controller._context
+
+        pool.idle_timeout = 0
+        await pool.reap_idle()
+        pool.idle_timeout = 600
+
+        page = await controller.create_page("next")
+        assert controller._context is not first
+        assert page in controller._context.pages
@@ -0,0 +1,120 @@
+"""Unit tests for accessibility tree indexes and incremental snapshots"""
+from openclaw.browser.role_snapshots import AccessibilityTree, AXNode
+from openclaw.browser.snapshot_diff import SnapshotEngine
+
+
+def _node(node_id, role, name="", children=(), backend=None, parent=None, **props):
+    return {
+        "nodeId": node_id,
+        "role": {"value": role},
+        "name": {"value": name},
+        "childIds": list(children),
+        "parentId": parent,
+        "backendDOMNodeId": backend,
+        "properties": [{"name": k, "value": {"value": v}} for k, v in props.items()],
+    }
+
+
+def _page(button_name="Submit", extra=False, **button_props):
+    children = ["2", "3", "4"] + (["6"] if extra else [])
+    nodes = [
+        _node("1", "RootWebArea", "Example", children, backend=1),
+        _node("2", "heading", "Welcome", backend=2, parent="1"),
+        _node("3", "button", button_name, ["5"], backend=3, parent="1", **button_props),
+        _node("4", "generic", "", backend=4, parent="1"),
+        _node("5", "StaticText", button_name, backend=5, parent="3"),
+    ]
+    if extra:
+        nodes.append(_node("6", "link", "More", backend=6, parent="1"))
+    return AccessibilityTree([AXNode(n) for n in nodes])
+
+
+class FakeCDP:
+    """Serves a fixed AX tree and a page-controlled mutation version"""
+
+    def __init__(self, tree_nodes):
+        self.tree_nodes = tree_nodes
+        self.version = "doc:0"
+        self.url = "https://example.com/"
+        self.fetches = 0
+
+    async def execute_command(self, method, params=None):
+        if method == "Runtime.evaluate":
+            return {"result": {"value": [self.url, self.version]}}
+        if method == "Accessibility.getFullAXTree":
+            self.fetches += 1
+            return {"nodes": self.tree_nodes}
+        raise AssertionError(method)
+
+
+class TestAccessibilityTreeIndex:
+    """Test indexed lookups"""
+
+    def test_find_by_role_is_case_insensitive(self):
+        tree = _page()
+        assert [n.name for n in tree.find_by_role("BUTTON")] == ["Submit"]
+
+    def test_find_by_name(self):
+        tree = _page()
+        assert len(tree.find_by_name("Submit", exact=True)) == 2
+        assert [n.role for n in tree.find_by_name("welc")] == ["heading"]
+
+    def test_find_interactive(self):
+        assert [n.role for n in _page(extra=True).find_interactive()] == ["button", "link"]
+
+
+class TestSnapshotEngine:
+    """Test diffing, refs and relevance caps"""
+
+    def test_first_snapshot_is_full(self):
+        diff = SnapshotEngine().update(_page(), url="https://example.com/")
+
+        assert diff.full
+        roles = [n.role for n in diff.nodes]
+        # Unnamed generic and the duplicate StaticText are dropped
+        assert roles == ["RootWebArea", "heading", "button"]
+        assert '[e3] button "Submit"' in diff.format()
+
+    def test_diff_reports_only_changes_with_stable_refs(self):
+        engine = SnapshotEngine()
+        engine.update(_page(), url="u")
+
+        diff = engine.update(_page(extra=True, disabled=True), url="u")
+
+        assert not diff.full
+        assert [n.format() for n in diff.added] == ['[e4] link "More"']
+        assert [n.format() for n in diff.changed] == ['[e3] button "Submit" (disabled)']
+        assert diff.removed == []
+
+        diff = engine.update(_page(), url="u")
+        assert [n.ref for n in diff.removed] == ["e4"]
+        assert diff.format().splitlines()[-1] == '- [e4] link "More"'
+
+    def test_navigation_starts_over(self):
+        engine = SnapshotEngine()
+        engine.update(_page(), url="a")
+        assert engine.update(_page(), url="b").full
+
+    def test_cap_keeps_most_relevant(self):
+        diff = SnapshotEngine(max_nodes=2).update(_page(extra=True), url="u")
+
+        assert [n.role for n in diff.nodes] == ["button", "link"]
+        assert diff.omitted == 2
+
+    async def test_unchanged_page_skips_tree_fetch(self):
+        raw = [
+            _node("1", "RootWebArea", "Example", ["2"], backend=1),
+            _node("2", "button", "Go", backend=2, parent="1"),
+        ]
+        cdp = FakeCDP(raw)
+        engine = SnapshotEngine()
+
+        assert (await engine.snapshot(cdp)).full
+        diff = await engine.snapshot(cdp)
+        assert diff.unchanged
+        assert cdp.fetches == 1
+
+        cdp.version = "doc:1"
+        await engine.snapshot(cdp)
+        assert cdp.fetches == 2
+        assert engine.get_stats()["fetches_skipped"] == 1
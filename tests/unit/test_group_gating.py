@@ -0,0 +1,79 @@
+"""Unit tests for compiled group gating"""
+import pytest
+
+from openclaw.auto_reply.monitor.group_gating import (
+    GroupGatingMode,
+    check_group_gating,
+    compile_group_gate,
+    get_group_gating_stats,
+    reset_group_gating_stats,
+    should_process_group_message,
+)
+from openclaw.auto_reply.monitor.mentions import detect_mentions
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_group_gating_stats()
+    yield
+    reset_group_gating_stats()
+
+
+NAMES = ["Claw", "claw_bot", "helper-bot"]
+KEYWORDS = ["Hey Claw", "OPENCLAW"]
+
+
+@pytest.mark.parametrize(
+    "text, process, reason",
+    [
+        ("@claw what's up", True, "mentioned"),
+        ("thanks @CLAW_BOT!", True, "mentioned"),
+        ("email me at x@claw.io", True, "mentioned"),
+        ("@clawdia is not the bot", False, "no_mention_or_keyword"),
+        ("@helper-bot can't be mentioned as one token", False, "no_mention_or_keyword"),
+        ("hey claw, summarize this", True, "keyword_match"),
+        ("I use openclaw daily", True, "keyword_match"),
+        ("just chatting about lunch", False, "no_mention_or_keyword"),
+        ("", False, "no_mention_or_keyword"),
+    ],
+)
+def test_mentions_and_keywords(text, process, reason):
+    result = check_group_gating(text, is_group=True, agent_names=NAMES, activation_keywords=KEYWORDS)
+    assert (result.should_process, result.reason) == (process, reason)
+
+
+def test_modes_and_direct_messages():
+    assert check_group_gating("hi", is_group=False).reason == "not_group"
+    assert check_group_gating("@claw", True, mode=GroupGatingMode.NEVER, agent_names=NAMES).should_process is False
+    assert check_group_gating("anything", True, mode=GroupGatingMode.ALWAYS).should_process is True
+    # No names or keywords configured: nothing activates the bot
+    assert check_group_gating("@claw", True).should_process is False
+
+
+def test_gate_compiled_once_per_config():
+    first = compile_group_gate(GroupGatingMode.MENTIONS, NAMES, KEYWORDS)
+    assert compile_group_gate(GroupGatingMode.MENTIONS, list(NAMES), list(KEYWORDS)) is first
+    assert compile_group_gate(GroupGatingMode.MENTIONS, NAMES, ["other"]) is not first
+
+
+def test_config_helper_and_reject_rate():
+    config = {"agent_names": ["claw"], "activation_keywords": ["help"]}
+    decisions = [
+        should_process_group_message(text, True, config)
+        for text in ["@claw hi", "lunch?", "ok", "need help", "lol"]
+    ]
+
+    assert decisions == [True, False, False, True, False]
+    stats = get_group_gating_stats()
+    assert stats["checked"] == 5
+    assert stats["rejected"] == 3
+    assert stats["reject_rate"] == pytest.approx(0.6)
+    assert stats["by_reason"]["mentioned"] == 1
+
+
+def test_detect_mentions_resolves_agent_names():
+    mentions = detect_mentions("@CLAW and @someone", ["claw", "Claw"])
+    assert [(m.full_match, m.agent_id, m.is_mention) for m in mentions] == [
+        ("@CLAW", "claw", True),
+        ("@someone", None, False),
+    ]
@@ -0,0 +1,151 @@
+"""
+Tests for the Unix domain socket IPC queue and gateway supervisor
+"""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from openclaw.gateway.supervisor import GatewaySupervisor, shard_index
+from openclaw.ipc.message_queue import Message, MessageQueueBackend, create_message_queue
+from openclaw.ipc.unix_socket import (
+    UnixSocketMessageQueue,
+    encode_frame,
+    read_frame,
+)
+
+
+def _msg(type_, sender, recipient, **payload):
+    return Message(type=type_, sender=sender, recipient=recipient,
+                   payload=payload, timestamp=time.time())
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return tmp_path / "q.sock"
+
+
+async def test_frame_roundtrip():
+    reader = asyncio.StreamReader()
+    reader.feed_data(encode_frame({"a": 1}) + encode_frame({"b": [1, 2]}))
+    reader.feed_eof()
+    assert await read_frame(reader) == {"a": 1}
+    assert await read_frame(reader) == {"b": [1, 2]}
+    assert await read_frame(reader) is None
+
+
+async def test_factory_creates_unix_queue(socket_path):
+    queue = create_message_queue(MessageQueueBackend.UNIX, "test", socket_path=socket_path)
+    assert isinstance(queue, UnixSocketMessageQueue)
+
+
+async def test_client_to_hub_and_back(socket_path):
+    hub = UnixSocketMessageQueue("test", socket_path=socket_path, listen=True)
+    client = UnixSocketMessageQueue("test", socket_path=socket_path, node_id="w1")
+    try:
+        await hub.start()
+        await client.wait_connected(timeout=5)
+
+        await client.send(_msg("ping", "w1", "hub", n=1))
+        received = await hub.receive(timeout=5)
+        assert received.type == "ping"
+        assert received.sender == "w1"
+        assert received.payload == {"n": 1}
+
+        await hub.send(_msg("pong", "hub", "w1"))
+        back = await client.receive(timeout=5)
+        assert back.type == "pong"
+    finally:
+        await client.close()
+        await hub.close()
+    assert not socket_path.exists()
+
+
+async def test_request_reply_between_nodes(socket_path):
+    hub = UnixSocketMessageQueue("test", socket_path=socket_path, listen=True)
+    a = UnixSocketMessageQueue("test", socket_path=socket_path, node_id="a")
+    b = UnixSocketMessageQueue("test", socket_path=socket_path, node_id="b")
+
+    async def responder():
+        message = await b.receive(timeout=5)
+        await b.reply(message, {"answer": message.payload["x"] * 2})
+
+    try:
+        await hub.start()
+        await a.wait_connected(timeout=5)
+        await b.wait_connected(timeout=5)
+        while len(hub.peers()) < 2:
+            await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(responder())
+        reply = await a.request(_msg("double", "a", "b", x=21), timeout=5)
+        await task
+
+        assert reply.payload == {"answer": 42}
+        assert reply.type == "double.reply"
+    finally:
+        await a.close()
+        await b.close()
+        await hub.close()
+
+
+async def test_client_reconnects_after_hub_restart(socket_path):
+    hub = UnixSocketMessageQueue("test", socket_path=socket_path, listen=True)
+    client = UnixSocketMessageQueue(
+        "test", socket_path=socket_path, node_id="w1", reconnect_initial=0.01
+    )
+    try:
+        await hub.start()
+        await client.wait_connected(timeout=5)
+        await hub.close()
+
+        hub = UnixSocketMessageQueue("test", socket_path=socket_path, listen=True)
+        await hub.start()
+        for _ in range(500):
+            if "w1" in hub.peers():
+                break
+            await asyncio.sleep(0.01)
+        await client.send(_msg("hello", "w1", "hub"))
+        received = await hub.receive(timeout=5)
+        assert received.type == "hello"
+    finally:
+        await client.close()
+        await hub.close()
+
+
+async def test_send_without_hub_raises(socket_path):
+    client = UnixSocketMessageQueue("test", socket_path=socket_path, connect_timeout=0.1)
+    try:
+        with pytest.raises(ConnectionError):
+            await client.send(_msg("x", "", "hub"))
+    finally:
+        await client.close()
+
+
+def test_shard_index_is_stable():
+    assert shard_index("telegram", 1) == 0
+    assert shard_index("telegram:work", 4) == shard_index("telegram:work", 4)
+    assert {shard_index(f"acct-{i}", 4) for i in range(100)} == {0, 1, 2, 3}
+
+
+async def test_supervisor_restarts_crashed_worker(socket_path):
+    class FakeSupervisor(GatewaySupervisor):
+        def worker_command(self, index):
+            return [sys.executable, "-c", "import sys; sys.exit(3)"]
+
+    supervisor = FakeSupervisor(1, socket_path=socket_path)
+    supervisor.restart_backoff_max = 0.01
+    try:
+        await supervisor.start()
+        worker = supervisor.workers[0]
+        # First restart happens after the initial 1s backoff
+        for _ in range(300):
+            if worker.restarts >= 1:
+                break
+            await asyncio.sleep(0.01)
+        assert worker.restarts >= 1
+        assert worker.last_exit_code == 3
+    finally:
+        await supervisor.stop()
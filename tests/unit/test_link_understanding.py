@@ -0,0 +1,154 @@
+"""Unit tests for the link understanding service"""
+import asyncio
+
+import httpx
+import pytest
+
+from openclaw.link_understanding.fetch import parse_html
+from openclaw.link_understanding.service import LinkUnderstandingService
+
+PAGE = (
+    "<html><head><title> Example  Page </title>"
+    '<meta property="og:description" content="An example">'
+    "<script>var x = 1;</script></head>"
+    "<body><h1>Hello</h1><p>World of   links</p><style>p {}</style></body></html>"
+)
+
+
+def make_service(handler, **kwargs) -> LinkUnderstandingService:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return LinkUnderstandingService(client=client, **kwargs)
+
+
+class TestParseHtml:
+    """Test single-pass HTML extraction"""
+
+    def test_extracts_title_description_and_text(self):
+        title, description, text = parse_html(PAGE)
+        assert title == "Example Page"
+        assert description == "An example"
+        assert text == "Hello World of links"
+
+    def test_og_title_fallback_and_truncation(self):
+        html = '<meta property="og:title" content="OG"><p>' + "word " * 100 + "</p>"
+        title, _, text = parse_html(html, max_text=20)
+        assert title == "OG"
+        assert len(text) == 23 and text.endswith("...")
+
+
+class TestLinkUnderstandingService:
+    """Test concurrency, caching and limits"""
+
+    async def test_fetch_many_runs_concurrently(self):
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            return httpx.Response(200, html=PAGE)
+
+        service = make_service(handler)
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        contents = await service.fetch_many(urls + urls[:1])
+
+        assert [c.url for c in contents] == urls
+        assert all(c.title == "Example Page" for c in contents)
+        assert peak == 4
+
+    async def test_cache_hit_and_shared_inflight(self):
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, html=PAGE)
+
+        service = make_service(handler)
+        url = "https://example.com/"
+        await asyncio.gather(service.fetch(url), service.fetch(url))
+        await service.fetch(url)
+
+        assert calls == 1
+        assert service.get_stats()["hits"] == 1
+
+    async def test_etag_revalidation(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, html=PAGE, headers={"etag": '"v1"'})
+
+        service = make_service(handler)
+        url = "https://example.com/"
+        first = await service.fetch(url)
+        service._cache[url].expires_at = 0
+
+        second = await service.fetch(url)
+        assert second is first
+        assert seen == [None, '"v1"']
+        assert service.get_stats()["revalidated"] == 1
+
+    async def test_max_age_zero_is_revalidated_and_no_store_skipped(self):
+        seen = []
+
+        def handler(request):
+            seen.append((request.url.path, request.headers.get("if-none-match")))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"cache-control": "max-age=0"})
+            cache_control = "no-store" if request.url.path == "/private" else "max-age=0"
+            return httpx.Response(
+                200, html=PAGE, headers={"etag": '"v1"', "cache-control": cache_control}
+            )
+
+        service = make_service(handler)
+        for url in ("https://example.com/", "https://example.com/private"):
+            await service.fetch(url)
+            await service.fetch(url)
+
+        assert seen == [("/", None), ("/", '"v1"'), ("/private", None), ("/private", None)]
+        assert "https://example.com/private" not in service._cache
+
+    async def test_body_read_stops_at_byte_cap(self):
+        def handler(request):
+            body = b"<title>Big</title><p>" + b"x" * 10_000 + b"</p>"
+            return httpx.Response(200, content=body, headers={"content-type": "text/html"})
+
+        service = make_service(handler, max_bytes=100)
+        content = await service.fetch("https://example.com/")
+
+        assert content.title == "Big"
+        assert content.text.count("x") <= 100
+
+    async def test_deadline_and_errors(self):
+        async def handler(request):
+            if request.url.path == "/slow":
+                await asyncio.sleep(1)
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, html=PAGE)
+
+        service = make_service(handler)
+        fast, slow, missing = await service.fetch_many(
+            ["https://example.com/fast", "https://example.com/slow", "https://example.com/missing"],
+            deadline=0.2,
+        )
+
+        assert fast.error is None
+        assert slow.error == "Timed out"
+        assert "404" in missing.error
+
+    async def test_skips_non_text_content(self):
+        def handler(request):
+            return httpx.Response(200, content=b"\x89PNG", headers={"content-type": "image/png"})
+
+        service = make_service(handler)
+        content = await service.fetch("https://example.com/a.png")
+        assert content.description == "image/png content"
+        assert content.text is None
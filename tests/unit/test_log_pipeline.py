@@ -0,0 +1,184 @@
+"""Unit tests for the non-blocking log pipeline"""
+import io
+import json
+import logging
+import threading
+
+import pytest
+
+from openclaw.logging.pipeline import (
+    LogPipeline,
+    LogSampler,
+    install_log_pipeline,
+    shutdown_log_pipeline,
+)
+
+
+@pytest.fixture
+def root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    shutdown_log_pipeline()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+        self.messages = []
+
+    def emit(self, record):
+        self.threads.append(threading.current_thread())
+        self.messages.append(self.format(record))
+
+
+class TestLogPipeline:
+    """Test queued writing, formatting and rotation"""
+
+    def test_writes_json_lines_off_thread(self, root_logger, tmp_path):
+        log_file = tmp_path / "gateway.log"
+        pipeline = install_log_pipeline(log_file=log_file, console=False)
+        recorder = RecordingHandler()
+        pipeline.handlers.append(recorder)
+        pipeline._listener.handlers += (recorder,)
+
+        logging.getLogger("openclaw.test").info("turn %s took %d ms", "abc", 12, extra={"session": "s1"})
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            logging.getLogger("openclaw.test").exception("failed")
+        shutdown_log_pipeline()
+
+        first, second = read_records(log_file)
+        assert first["message"] == "turn abc took 12 ms"
+        assert first["session"] == "s1"
+        assert (first["level"], first["name"]) == ("info", "openclaw.test")
+        assert "ValueError: bad" in second["exception"]
+        assert recorder.threads and threading.current_thread() not in recorder.threads
+
+    def test_mutable_args_rendered_at_call_time(self, root_logger, tmp_path):
+        log_file = tmp_path / "gateway.log"
+        install_log_pipeline(log_file=log_file, console=False)
+
+        items = ["a"]
+        logging.getLogger("openclaw.test").info("items=%s", items)
+        items.append("b")
+        shutdown_log_pipeline()
+
+        assert read_records(log_file)[0]["message"] == "items=['a']"
+
+    def test_rotates_by_size(self, root_logger, tmp_path):
+        log_file = tmp_path / "gateway.log"
+        install_log_pipeline(log_file=log_file, console=False, max_bytes=500, backup_count=2)
+
+        for i in range(50):
+            logging.getLogger("openclaw.test").info("line %d", i)
+        shutdown_log_pipeline()
+
+        assert (tmp_path / "gateway.log.1").exists()
+        assert not (tmp_path / "gateway.log.3").exists()
+        assert read_records(log_file)[-1]["message"] == "line 49"
+
+    def test_shared_file_reopened_after_rotation(self, root_logger, tmp_path):
+        log_file = tmp_path / "gateway.log"
+        pipeline = install_log_pipeline(log_file=log_file, console=False, rotate=False)
+
+        logging.getLogger("openclaw.test").info("before")
+        pipeline.queue.join()
+        log_file.rename(tmp_path / "gateway.log.1")
+        logging.getLogger("openclaw.test").info("after")
+        shutdown_log_pipeline()
+
+        assert [r["message"] for r in read_records(tmp_path / "gateway.log.1")] == ["before"]
+        assert [r["message"] for r in read_records(log_file)] == ["after"]
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        blocked = threading.Event()
+
+        class SlowHandler(logging.Handler):
+            def emit(self, record):
+                blocked.wait(5)
+
+        pipeline = LogPipeline([SlowHandler()], queue_size=2)
+        pipeline.start()
+        record = logging.LogRecord("x", logging.INFO, __file__, 1, "msg", (), None)
+        for _ in range(10):
+            pipeline.queue_handler.handle(record)
+        assert pipeline.dropped > 0
+
+        blocked.set()
+        pipeline.stop()
+
+    def test_subsystem_console_lines_are_queued(self, root_logger, monkeypatch):
+        from openclaw.logging.state import set_logging_state
+        from openclaw.logging.subsystem import create_subsystem_logger
+
+        monkeypatch.setattr("openclaw.logging.state._LOGGING_STATE.file_logging_enabled", False)
+        set_logging_state(console_style="compact")
+        stdout = io.StringIO()
+        monkeypatch.setattr("sys.stdout", stdout)
+        install_log_pipeline(console=False)
+
+        create_subsystem_logger("gateway/auth").info("ready")
+        shutdown_log_pipeline()
+
+        assert stdout.getvalue().strip().endswith("ready")
+
+    def test_subsystem_records_written_once(self, root_logger, tmp_path, monkeypatch):
+        from openclaw.logging.state import set_logging_state
+        from openclaw.logging.subsystem import create_subsystem_logger
+
+        set_logging_state(console_style="compact")
+        stdout, stderr = io.StringIO(), io.StringIO()
+        monkeypatch.setattr("sys.stdout", stdout)
+        monkeypatch.setattr("sys.stderr", stderr)
+        log_file = tmp_path / "gateway.log"
+        install_log_pipeline(log_file=log_file)
+
+        create_subsystem_logger("gateway/auth").warn("denied", {"user": "u1"})
+        shutdown_log_pipeline()
+
+        (record,) = read_records(log_file)
+        assert (record["message"], record["subsystem"]) == ("denied", "gateway/auth")
+        assert record["meta"] == {"user": "u1"}
+        # The pipeline's console handler leaves subsystem lines to the logger
+        assert stdout.getvalue().count("denied") == 1
+        assert "denied" not in stderr.getvalue()
+
+
+class TestLogSampler:
+    """Test rate-limited hot path logging"""
+
+    def test_one_record_per_interval_with_suppressed_count(self, caplog, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr("openclaw.logging.pipeline.time.monotonic", lambda: clock[0])
+        sampler = LogSampler(logging.getLogger("openclaw.test.sampler"), interval=1.0)
+
+        with caplog.at_level(logging.DEBUG, logger="openclaw.test.sampler"):
+            emitted = [sampler.debug("chan", "delta %d", i) for i in range(5)]
+            clock[0] += 1.5
+            sampler.debug("chan", "delta %d", 5)
+            sampler.debug("other", "delta %d", 6)
+
+        assert emitted == [True, False, False, False, False]
+        assert [r.getMessage() for r in caplog.records] == [
+            "delta 0",
+            "delta 5 (+4 suppressed)",
+            "delta 6",
+        ]
+
+    def test_disabled_level_is_free(self, monkeypatch):
+        logger = logging.getLogger("openclaw.test.quiet")
+        logger.setLevel(logging.INFO)
+        sampler = LogSampler(logger)
+
+        assert sampler.debug("chan", "delta %s", object()) is False
+        assert sampler._next_at == {}
+        logger.setLevel(logging.NOTSET)
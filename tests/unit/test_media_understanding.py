@@ -0,0 +1,166 @@
+"""Unit tests for the media understanding cache and batched analysis"""
+import asyncio
+import sqlite3
+
+import pytest
+
+from openclaw.media_understanding.apply import apply_media_understanding
+from openclaw.media_understanding.cache import MediaUnderstandingCache
+from openclaw.media_understanding.runner import MediaUnderstandingRunner
+from openclaw.media_understanding.types import AnalysisResult, MediaType, Provider
+
+
+class FakeAnalyzer:
+    def __init__(self, media_type: MediaType, delay: float = 0.0):
+        self.media_type = media_type
+        self.delay = delay
+        self.calls = []
+        self.fail = False
+        # Set when an analysis starts; analyses wait for gate if one is set
+        self.started = asyncio.Event()
+        self.gate: asyncio.Event | None = None
+
+    async def analyze(self, path, provider=None, prompt=None, **kwargs):
+        self.calls.append(str(path))
+        self.started.set()
+        if self.gate is not None:
+            await self.gate.wait()
+        if "slow" in str(path):
+            await asyncio.sleep(1)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            return AnalysisResult(media_type=self.media_type, provider=Provider.OPENAI, success=False, error="boom")
+        return AnalysisResult(media_type=self.media_type, provider=Provider.OPENAI, text=f"{prompt}:{path}")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = MediaUnderstandingCache(db_path=tmp_path / "mu.db")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def runner(cache):
+    runner = MediaUnderstandingRunner(cache=cache)
+    runner.image_analyzer = FakeAnalyzer(MediaType.IMAGE, delay=0.05)
+    runner.audio_analyzer = FakeAnalyzer(MediaType.AUDIO)
+    return runner
+
+
+class TestMediaUnderstandingCache:
+    """Test keyed caching, persistence and eviction"""
+
+    async def test_same_bytes_are_analyzed_once(self, runner, tmp_path):
+        first = tmp_path / "meme.png"
+        repost = tmp_path / "forwarded.png"
+        first.write_bytes(b"same image")
+        repost.write_bytes(b"same image")
+
+        a = await runner.analyze(first, prompt="describe")
+        b = await runner.analyze(repost, prompt="describe")
+        c = await runner.analyze(repost, prompt="count people")
+
+        assert b.text == a.text and b.data["cached"]
+        assert not c.data.get("cached")
+        assert len(runner.image_analyzer.calls) == 2
+
+    async def test_failures_are_not_cached(self, runner):
+        runner.image_analyzer.fail = True
+        await runner.analyze("https://x.test/a.png")
+        runner.image_analyzer.fail = False
+        result = await runner.analyze("https://x.test/a.png")
+
+        assert result.success
+        assert len(runner.image_analyzer.calls) == 2
+
+    async def test_persists_across_instances(self, runner, tmp_path):
+        await runner.analyze("https://x.test/a.png", content_id="file-1")
+
+        reopened = MediaUnderstandingCache(db_path=tmp_path / "mu.db")
+        fresh = MediaUnderstandingRunner(cache=reopened)
+        fresh.image_analyzer = FakeAnalyzer(MediaType.IMAGE)
+        result = await fresh.analyze("https://other.test/b.png", media_type=MediaType.IMAGE, content_id="file-1")
+
+        assert result.data["cached"] and fresh.image_analyzer.calls == []
+        reopened.close()
+
+    def test_ttl_and_size_eviction(self, tmp_path):
+        cache = MediaUnderstandingCache(db_path=tmp_path / "mu.db", max_entries=2)
+        result = AnalysisResult(media_type=MediaType.IMAGE, provider=Provider.OPENAI, text="x")
+        for key in ("a", "b", "c"):
+            cache.put(key, result)
+
+        assert cache.get("a") is None
+        assert cache.get("c").text == "x"
+
+        cache.ttl = 0
+        assert cache.get("c") is None
+        cache.close()
+
+
+class TestBatchedAnalysis:
+    """Test concurrent analysis with a shared deadline"""
+
+    async def test_items_run_concurrently_in_order(self, runner):
+        items = [f"https://x.test/{i}.png" for i in range(4)]
+        start = asyncio.get_running_loop().time()
+        results = await runner.analyze_many(items, prompt="p")
+
+        assert asyncio.get_running_loop().time() - start < 0.15
+        assert [r.text for r in results] == [f"p:{url}" for url in items]
+
+    async def test_deadline_and_duplicates(self, runner):
+        results = await runner.analyze_many(
+            ["https://x.test/a.png", "https://x.test/slow.png", "https://x.test/a.png"],
+            deadline=0.3,
+        )
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "Timed out"
+        assert runner.image_analyzer.calls.count("https://x.test/a.png") == 1
+
+    async def _leader_and_joiner(self, runner, url):
+        """Start an analysis held at the analyzer, then join it"""
+        analyzer = runner.image_analyzer
+        analyzer.gate = asyncio.Event()
+        leader = asyncio.create_task(runner.analyze(url, prompt="p"))
+        await analyzer.started.wait()
+        joiner = asyncio.create_task(runner.analyze(url, prompt="p"))
+        await asyncio.sleep(0)  # joiner attaches to the in-flight analysis
+        assert analyzer.calls == [url]
+        return leader, joiner
+
+    async def test_joiner_survives_cancelled_leader(self, runner):
+        url = "https://x.test/shared.png"
+        leader, joiner = await self._leader_and_joiner(runner, url)
+        leader.cancel()
+        runner.image_analyzer.gate.set()
+
+        assert (await joiner).text == f"p:{url}"
+        assert runner.image_analyzer.calls == [url, url]
+
+    async def test_joiner_receives_leader_error(self, runner, monkeypatch):
+        def locked(key, result):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(runner.cache, "put", locked)
+        leader, joiner = await self._leader_and_joiner(runner, "https://x.test/shared.png")
+        runner.image_analyzer.gate.set()
+
+        for task in (leader, joiner):
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                await asyncio.wait_for(task, timeout=1)
+
+    async def test_apply_adds_descriptions_and_transcripts(self, runner):
+        context = {
+            "media": [
+                {"url": "https://x.test/a.png", "type": "image"},
+                {"url": "https://x.test/v.ogg", "type": "audio", "file_id": "voice-1"},
+            ]
+        }
+        await apply_media_understanding(context, runner=runner)
+
+        image, audio = context["media_understanding"]
+        assert image["description"] and image["transcript"] is None
+        assert audio["transcript"] and audio["type"] == "audio"
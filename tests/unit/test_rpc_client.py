@@ -76,3 +76,17 @@ async def test_call_error():
         
         with pytest.raises(GatewayRPCError, match="Method not found"):
             await client.call("unknown.method")
+
+
+@pytest.mark.asyncio
+async def test_tail_logs_returns_lines_and_cursor_variant_returns_result():
+    """tail_logs keeps returning lines; tail_logs_from exposes the cursor"""
+    client = GatewayRPCClient()
+    result = {"lines": ["a", "b"], "cursor": 42, "size": 42, "truncated": False, "reset": False}
+    client.call = AsyncMock(return_value=result)
+    
+    assert await client.tail_logs(limit=2) == ["a", "b"]
+    assert await client.tail_logs_from(cursor=10, level="warn") == result
+    client.call.assert_called_with(
+        "logs.tail", {"limit": 200, "maxBytes": 250000, "cursor": 10, "level": "warn"}
+    )
@@ -0,0 +1,197 @@
+"""Unit tests for the SQLite session store"""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from openclaw.agents.session import SessionManager
+from openclaw.agents.session_entry import SessionEntry
+from openclaw.agents.sessions.level_overrides import SessionLevelOverrides
+from openclaw.agents.sessions.model_overrides import SessionModelOverrides
+from openclaw.config.sessions import (
+    SessionStoreBusyError,
+    SqliteSessionStore,
+    get_sqlite_session_store,
+    load_session_store,
+    save_session_store,
+    sqlite_store,
+    update_session_store,
+    update_session_store_entry,
+)
+from openclaw.config.sessions.sqlite_store import close_sqlite_session_stores
+from openclaw.tools.migrate_sessions import migrate_to_sqlite_store
+
+
+@pytest.fixture(autouse=True)
+def _close_stores():
+    yield
+    close_sqlite_session_stores()
+
+
+def test_upsert_update_and_query(tmp_path):
+    """Rows are upserted, merged and found through the indexed columns"""
+    store = SqliteSessionStore(tmp_path / "sessions.db")
+    store.upsert("agent:main:a", SessionEntry(session_id="a", updated_at=1, channel="telegram"))
+    store.upsert("agent:work:b", SessionEntry(session_id="b", updated_at=2, label="Inbox"))
+    store.update("agent:main:a", {"spawned_by": "agent:work:b"})
+
+    assert store.get("agent:main:a").spawned_by == "agent:work:b"
+    assert [k for k, _ in store.query(agent_id="main")] == ["agent:main:a"]
+    assert [k for k, _ in store.query(channel="telegram")] == ["agent:main:a"]
+    assert [k for k, _ in store.query(label="Inbox")] == ["agent:work:b"]
+    assert [k for k, _ in store.query(spawned_by="agent:work:b")] == ["agent:main:a"]
+    # update() bumps updated_at, so "a" is now the newest
+    assert [k for k, _ in store.query(limit=1)] == ["agent:main:a"]
+    assert store.delete("agent:work:b")
+    assert not store.delete("agent:work:b")
+    store.close()
+
+
+def test_store_functions_use_sibling_db(tmp_path):
+    """load/save/update_session_store switch to sessions.db when it exists"""
+    store_path = tmp_path / "sessions.json"
+    get_sqlite_session_store(tmp_path / "sessions.db")
+
+    save_session_store(store_path, {"k1": SessionEntry(session_id="s1", updated_at=1)})
+    assert not store_path.exists()
+
+    first = load_session_store(store_path)
+    assert load_session_store(store_path) is first
+
+    update_session_store_entry(store_path, "k2", {"session_id": "s2"})
+    second = load_session_store(store_path)
+    assert second is not first
+    assert set(second) == {"k1", "k2"}
+
+    def mutator(store):
+        del store["k1"]
+        store["k2"].label = "renamed"
+
+    update_session_store(store_path, mutator)
+    assert {k: e.label for k, e in load_session_store(store_path).items()} == {"k2": "renamed"}
+
+
+def test_writes_visible_across_connections(tmp_path):
+    """Another connection (as in another gateway process) sees committed rows"""
+    db_path = tmp_path / "sessions.db"
+    store_path = tmp_path / "sessions.json"
+    get_sqlite_session_store(db_path)
+    assert load_session_store(store_path) == {}
+
+    other = SqliteSessionStore(db_path)
+    other.update("agent:main:x", {"session_id": "x"})
+    assert set(load_session_store(store_path)) == {"agent:main:x"}
+    other.close()
+
+
+def test_concurrent_writers_do_not_lose_updates(tmp_path):
+    """Read-modify-write transactions from several connections serialize"""
+    db_path = tmp_path / "sessions.db"
+    SqliteSessionStore(db_path).upsert("counter", SessionEntry(session_id="c", updated_at=0, compaction_count=0))
+
+    errors = []
+
+    def worker():
+        store = SqliteSessionStore(db_path)
+        try:
+            for _ in range(20):
+                def bump(entries):
+                    entries["counter"].compaction_count += 1
+                store.apply(bump)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            store.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert SqliteSessionStore(db_path).get("counter").compaction_count == 80
+
+
+def test_busy_write_lock_is_retried(tmp_path):
+    """A writer waits out another connection's write lock instead of failing"""
+    db_path = tmp_path / "sessions.db"
+    store = SqliteSessionStore(db_path, busy_timeout_ms=0)
+    holder = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+    holder.execute("BEGIN IMMEDIATE")
+    threading.Timer(0.05, holder.execute, args=("COMMIT",)).start()
+
+    store.update("agent:main:x", {"session_id": "x"})
+
+    assert store.get("agent:main:x").session_id == "x"
+    holder.close()
+    store.close()
+
+
+def test_busy_write_lock_raises_typed_error(tmp_path, monkeypatch):
+    """A write lock held through every retry surfaces as SessionStoreBusyError"""
+    monkeypatch.setattr(sqlite_store, "_BUSY_RETRY_DELAYS", (0, 0))
+    db_path = tmp_path / "sessions.db"
+    store = SqliteSessionStore(db_path, busy_timeout_ms=0)
+    holder = sqlite3.connect(db_path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+
+    with pytest.raises(SessionStoreBusyError):
+        store.update("agent:main:x", {"session_id": "x"})
+
+    holder.execute("ROLLBACK")
+    holder.close()
+    store.close()
+
+
+def test_session_manager_and_overrides_use_db(tmp_path):
+    """SessionManager and the override managers write rows instead of JSON"""
+    db = get_sqlite_session_store(tmp_path / ".sessions" / "sessions.db")
+    manager = SessionManager(tmp_path, agent_id="main")
+    session = manager.get_or_create_session(session_key="agent:main:dm:u1")
+
+    assert not (tmp_path / ".sessions" / "session_map.json").exists()
+    assert db.session_ids("main") == {"agent:main:dm:u1": session.session_id}
+    assert SessionManager(tmp_path).get_session_key_for_id(session.session_id) == "agent:main:dm:u1"
+
+    models = SessionModelOverrides(tmp_path / ".sessions" / "session_overrides.json")
+    models.set_override("agent:main:dm:u1", model="gpt-4")
+    levels = SessionLevelOverrides(session_store=db)
+    levels.set_override("agent:main:dm:u1", think_level="high")
+
+    reloaded = SessionModelOverrides(tmp_path / ".sessions" / "session_overrides.json")
+    assert reloaded.get_override("agent:main:dm:u1").model == "gpt-4"
+    assert SessionLevelOverrides(session_store=db).get_override("agent:main:dm:u1").think_level == "high"
+
+    manager.delete_session(session.session_id)
+    assert db.session_ids() == {}
+    assert db.get_overrides("model") == {}
+
+
+def test_migrate_to_sqlite_store(tmp_path):
+    """JSON session files are imported into sessions.db"""
+    (tmp_path / "sessions.json").write_text(json.dumps({
+        "agent:main:main": {"sessionId": "s1", "updatedAt": 5, "label": "Main"},
+    }))
+    (tmp_path / "session_map.json").write_text(json.dumps({
+        "agent:main:main": "ignored",
+        "agent:main:dm:u1": "s2",
+    }))
+    (tmp_path / "session_levels.json").write_text(json.dumps({
+        "agent:main:main": {"think_level": "low", "verbose_level": None, "reasoning_level": None},
+    }))
+
+    assert migrate_to_sqlite_store(tmp_path, dry_run=True)["sessions"] == 2
+    assert not (tmp_path / "sessions.db").exists()
+
+    stats = migrate_to_sqlite_store(tmp_path)
+    assert stats["errors"] == 0
+    assert stats["mapped_keys"] == 1
+    assert (tmp_path / "backup_json_format" / "sessions.json").exists()
+
+    store = load_session_store(tmp_path / "sessions.json")
+    assert store["agent:main:main"].label == "Main"
+    assert store["agent:main:dm:u1"].session_id == "s2"
+    assert SessionLevelOverrides(tmp_path / "session_levels.json").get_override("agent:main:main").think_level == "low"
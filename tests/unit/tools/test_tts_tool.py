@@ -0,0 +1,142 @@
+"""Unit tests for the TTS cache and streaming synthesis"""
+import asyncio
+
+import pytest
+
+from openclaw.agents.tools.tts import TTSTool
+from openclaw.agents.tools.tts_providers.base import TTSProvider
+from openclaw.agents.tools.tts_providers.service import TTSService, split_sentences
+
+
+class FakeProvider(TTSProvider):
+    name = "fake"
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+        self.calls = []
+        # Set when a synthesis starts; syntheses wait for gate if one is set
+        self.started = asyncio.Event()
+        self.gate: asyncio.Event | None = None
+
+    async def synthesize(self, text, output_path, voice, **kwargs):
+        output_path.write_bytes(await self.synthesize_bytes(text, voice, **kwargs))
+        return {}
+
+    async def synthesize_bytes(self, text, voice, **kwargs):
+        self.calls.append(text)
+        self.started.set()
+        if self.gate is not None:
+            await self.gate.wait()
+        await asyncio.sleep(self.delay)
+        return f"[{voice}:{text}]".encode()
+
+    async def list_voices(self):
+        return []
+
+    def get_default_voice(self):
+        return "v1"
+
+
+@pytest.fixture
+def provider():
+    return FakeProvider()
+
+
+@pytest.fixture
+def service(tmp_path, provider):
+    return TTSService(cache_dir=tmp_path / "tts", providers={"fake": provider})
+
+
+def test_split_sentences_merges_short_ones():
+    text = "Hi. How are you doing today? I am fine, thanks for asking.\nOk."
+    assert split_sentences(text) == [
+        "Hi. How are you doing today?",
+        "I am fine, thanks for asking. Ok.",
+    ]
+
+
+class TestTTSService:
+    """Test caching and sentence streaming"""
+
+    async def test_repeated_text_is_synthesized_once(self, service, provider):
+        first = await service.synthesize("Good  morning!", provider="fake")
+        second = await service.synthesize("Good morning!", provider="fake")
+
+        assert first.audio == second.audio == b"[v1:Good morning!]"
+        assert (first.cached, second.cached) == (False, True)
+        assert provider.calls == ["Good morning!"]
+
+    async def test_joiner_survives_cancelled_leader(self, service, provider):
+        provider.gate = asyncio.Event()
+        leader = asyncio.create_task(service.synthesize("Shared line", provider="fake"))
+        await provider.started.wait()
+        joiner = asyncio.create_task(service.synthesize("Shared line", provider="fake"))
+        await asyncio.sleep(0)  # joiner attaches to the in-flight synthesis
+        assert provider.calls == ["Shared line"]
+        leader.cancel()
+        provider.gate.set()
+
+        assert (await joiner).audio == b"[v1:Shared line]"
+        assert provider.calls == ["Shared line", "Shared line"]
+
+    async def test_key_includes_voice_and_options(self, service, provider):
+        await service.synthesize("Hello there", provider="fake")
+        await service.synthesize("Hello there", provider="fake", voice="v2")
+        await service.synthesize("Hello there", provider="fake", speed=1.5)
+        assert len(provider.calls) == 3
+
+    async def test_cache_persists_on_disk(self, service, tmp_path):
+        await service.synthesize("Heartbeat check complete", provider="fake")
+
+        fresh_provider = FakeProvider()
+        fresh = TTSService(cache_dir=tmp_path / "tts", providers={"fake": fresh_provider})
+        result = await fresh.synthesize("Heartbeat check complete", provider="fake")
+        assert result.cached and fresh_provider.calls == []
+
+    async def test_stream_yields_first_sentence_early(self, tmp_path):
+        provider = FakeProvider(delay=0.05)
+        service = TTSService(cache_dir=tmp_path, providers={"fake": provider}, lookahead=1)
+        text = "This is the first sentence. This is the second sentence. And this is the third one."
+
+        stream = service.stream(text, provider="fake")
+        first = await stream.__anext__()
+        assert first == b"[v1:This is the first sentence.]"
+        # Only the lookahead sentence has been requested so far
+        assert len(provider.calls) == 2
+
+        rest = [chunk async for chunk in stream]
+        assert len(rest) == 2
+
+        # The whole text and each sentence are now cached
+        again = [chunk async for chunk in service.stream(text, provider="fake")]
+        assert again == [b"".join([first, *rest])]
+        assert len(provider.calls) == 3
+
+    async def test_disk_budget_evicts_oldest(self, tmp_path, provider):
+        service = TTSService(cache_dir=tmp_path, providers={"fake": provider}, max_cache_bytes=60)
+        for i in range(5):
+            await service.synthesize(f"Announcement number {i}", provider="fake")
+        assert service.get_stats()["disk_bytes"] <= 60
+
+
+class TestTTSTool:
+    """Test the tool on top of the service"""
+
+    async def test_writes_file_and_reports_cache(self, service, tmp_path, monkeypatch):
+        monkeypatch.setattr("openclaw.agents.tools.tts.get_tts_service", lambda: service)
+        tool = TTSTool()
+        output = tmp_path / "out" / "speech.mp3"
+
+        params = {"text": "Reminder: stand-up in five minutes.", "provider": "fake", "output_path": str(output)}
+        first = await tool.execute(params)
+        second = await tool.execute(params)
+
+        assert first.success and not first.metadata["cached"]
+        assert second.success and second.metadata["cached"]
+        assert output.read_bytes() == b"[v1:Reminder: stand-up in five minutes.]"
+
+    async def test_unknown_provider(self, tmp_path):
+        result = await TTSTool().execute({"text": "hi", "provider": "nope", "output_path": str(tmp_path / "x.mp3")})
+        assert not result.success
+        assert "Unknown provider" in result.error